@@ -5,7 +5,18 @@ warnings.filterwarnings("ignore", message=".*conflict with protected namespace.*
 ### INIT VARIABLES ###
 import threading
 import os
-from typing import Callable, List, Optional, Dict, Union, Any, Literal, get_args
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    List,
+    Optional,
+    Dict,
+    Union,
+    Any,
+    Literal,
+    get_args,
+)
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.caching.caching import Cache, DualCache, RedisCache, InMemoryCache
 from litellm.types.llms.bedrock import COHERE_EMBEDDING_INPUT_TYPES
@@ -288,12 +299,32 @@ disable_end_user_cost_tracking: Optional[bool] = None
 priority_reservation: Optional[Dict[str, float]] = None
 #### RELIABILITY ####
 REPEATED_STREAMING_CHUNK_LIMIT = 100  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
+#### LOGGING WORKER ####
+logging_worker_max_workers: int = 16  # threads running sync logging callbacks
+logging_worker_max_queue_size: int = 10000  # logging events waiting for a worker
+logging_worker_overflow_policy: Literal["drop", "block"] = (
+    "drop"  # if the queue is full - drop the logging event, or wait for space
+)
+logging_worker_block_timeout: float = 1.0  # max. seconds to wait for space, if "block"
+logging_worker_exit_flush_timeout: float = (
+    5.0  # max. seconds to wait for queued logging events at interpreter exit
+)
 
 #### Networking settings ####
 request_timeout: float = 6000  # time in seconds
 force_ipv4: bool = (
     False  # when True, litellm will force ipv4 for all LLM requests. Some users have seen httpx ConnectionError when using ipv6.
 )
+http2: bool = (
+    False  # opt-in HTTP/2 for LLM API requests, requires `pip install 'httpx[http2]'`
+)
+httpx_max_connections_per_host: Optional[int] = (
+    None  # max. connections per LLM API endpoint, for clients created with an api_base
+)
+httpx_client_pool_max_size: int = 200  # max. number of pooled httpx clients
+httpx_client_pool_ttl: Optional[float] = (
+    3600  # evict pooled httpx clients not used for this many seconds
+)
 module_level_aclient = AsyncHTTPHandler(
     timeout=request_timeout, client_alias="module level aclient"
 )
@@ -322,39 +353,14 @@ output_parse_pii: bool = False
 #############################################
 
 
-def get_model_cost_map(url: str):
-    if (
-        os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) == True
-        or os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) == "True"
-    ):
-        import importlib.resources
-        import json
-
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
-        ) as f:
-            content = json.load(f)
-            return content
-
-    try:
-        response = httpx.get(
-            url, timeout=5
-        )  # set a 5 second timeout for the get request
-        response.raise_for_status()  # Raise an exception if the request is unsuccessful
-        content = response.json()
-        return content
-    except Exception:
-        import importlib.resources
-        import json
-
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
-        ) as f:
-            content = json.load(f)
-            return content
-
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_model_cost_map,
+    load_model_cost_map,
+    refresh_model_cost_map_in_background,
+)
 
-model_cost = get_model_cost_map(url=model_cost_map_url)
+# doesn't wait for the network - the remote map is fetched in the background, after `add_known_models`
+model_cost, _model_cost_map_needs_refresh = load_model_cost_map(url=model_cost_map_url)
 custom_prompt_dict: Dict[str, dict] = {}
 
 
@@ -429,8 +435,10 @@ anyscale_models: List = []
 cerebras_models: List = []
 
 
-def add_known_models():
-    for key, value in model_cost.items():
+def add_known_models(model_cost_map: Optional[dict] = None):
+    if model_cost_map is None:
+        model_cost_map = model_cost
+    for key, value in model_cost_map.items():
         if value.get("litellm_provider") == "openai":
             open_ai_chat_completion_models.append(key)
         elif value.get("litellm_provider") == "text-completion-openai":
@@ -534,6 +542,10 @@ def add_known_models():
 
 
 add_known_models()
+if _model_cost_map_needs_refresh:
+    refresh_model_cost_map_in_background(
+        url=model_cost_map_url, loaded_model_cost=model_cost
+    )
 # known openai compatible endpoints - we'll eventually move this list to the model_prices_and_context_window.json dictionary
 openai_compatible_endpoints: List = [
     "api.perplexity.ai",
@@ -1010,137 +1022,247 @@ ALL_LITELLM_RESPONSE_TYPES = [
 
 from .types.utils import ImageObject
 from .llms.custom_llm import CustomLLM
-from .llms.huggingface_restapi import HuggingfaceConfig
-from .llms.anthropic.chat.handler import AnthropicConfig
-from .llms.anthropic.experimental_pass_through.transformation import (
-    AnthropicExperimentalPassThroughConfig,
-)
-from .llms.groq.stt.transformation import GroqSTTConfig
-from .llms.anthropic.completion import AnthropicTextConfig
-from .llms.databricks.chat import DatabricksConfig, DatabricksEmbeddingConfig
-from .llms.predibase import PredibaseConfig
-from .llms.replicate import ReplicateConfig
-from .llms.cohere.completion import CohereConfig
-from .llms.clarifai import ClarifaiConfig
-from .llms.AI21.completion import AI21Config
-from .llms.AI21.chat import AI21ChatConfig
-from .llms.together_ai.chat import TogetherAIConfig
-from .llms.cloudflare import CloudflareConfig
-from .llms.palm import PalmConfig
-from .llms.gemini import GeminiConfig
-from .llms.nlp_cloud import NLPCloudConfig
-from .llms.aleph_alpha import AlephAlphaConfig
-from .llms.petals import PetalsConfig
-from .llms.vertex_ai_and_google_ai_studio.gemini.vertex_and_google_ai_studio_gemini import (
-    VertexGeminiConfig,
-    GoogleAIStudioGeminiConfig,
-    VertexAIConfig,
-)
-
-from .llms.vertex_ai_and_google_ai_studio.vertex_embeddings.transformation import (
-    VertexAITextEmbeddingConfig,
-)
 
-vertexAITextEmbeddingConfig = VertexAITextEmbeddingConfig()
-
-from .llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.anthropic.transformation import (
-    VertexAIAnthropicConfig,
-)
-from .llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.llama3.transformation import (
-    VertexAILlama3Config,
-)
-from .llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.ai21.transformation import (
-    VertexAIAi21Config,
-)
-
-from .llms.sagemaker.sagemaker import SagemakerConfig
-from .llms.ollama import OllamaConfig
-from .llms.ollama_chat import OllamaChatConfig
-from .llms.maritalk import MaritTalkConfig
-from .llms.bedrock.chat.invoke_handler import (
-    AmazonCohereChatConfig,
-    AmazonConverseConfig,
-    bedrock_tool_name_mappings,
-)
-from .llms.bedrock.chat.converse_handler import (
-    BEDROCK_CONVERSE_MODELS,
-)
-from .llms.bedrock.common_utils import (
-    AmazonTitanConfig,
-    AmazonAI21Config,
-    AmazonAnthropicConfig,
-    AmazonAnthropicClaude3Config,
-    AmazonCohereConfig,
-    AmazonLlamaConfig,
-    AmazonMistralConfig,
-    AmazonBedrockGlobalConfig,
-)
-from .llms.bedrock.image.amazon_stability1_transformation import AmazonStabilityConfig
-from .llms.bedrock.image.amazon_stability3_transformation import AmazonStability3Config
-from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
-from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
-    AmazonTitanMultimodalEmbeddingG1Config,
-)
-from .llms.bedrock.embed.amazon_titan_v2_transformation import (
-    AmazonTitanV2Config,
-)
-from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
-from .llms.OpenAI.openai import (
-    OpenAIConfig,
-    OpenAITextCompletionConfig,
-    MistralEmbeddingConfig,
-    DeepInfraConfig,
-)
-from .llms.groq.chat.transformation import GroqChatConfig
-from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
-from .llms.mistral.mistral_chat_transformation import MistralConfig
-from .llms.OpenAI.chat.o1_transformation import (
-    OpenAIO1Config,
-)
-
-openAIO1Config = OpenAIO1Config()
-from .llms.OpenAI.chat.gpt_transformation import (
-    OpenAIGPTConfig,
-)
-
-openAIGPTConfig = OpenAIGPTConfig()
-from .llms.OpenAI.chat.gpt_audio_transformation import (
-    OpenAIGPTAudioConfig,
-)
-
-openAIGPTAudioConfig = OpenAIGPTAudioConfig()
+### PROVIDER CONFIGS ###
+# imported on first use (see `__getattr__` below) - keeps `import litellm` fast
+if TYPE_CHECKING:
+    from .llms.huggingface_restapi import HuggingfaceConfig
+    from .llms.anthropic.chat.handler import AnthropicConfig
+    from .llms.anthropic.experimental_pass_through.transformation import (
+        AnthropicExperimentalPassThroughConfig,
+    )
+    from .llms.groq.stt.transformation import GroqSTTConfig
+    from .llms.anthropic.completion import AnthropicTextConfig
+    from .llms.databricks.chat import DatabricksConfig, DatabricksEmbeddingConfig
+    from .llms.predibase import PredibaseConfig
+    from .llms.replicate import ReplicateConfig
+    from .llms.cohere.completion import CohereConfig
+    from .llms.clarifai import ClarifaiConfig
+    from .llms.AI21.completion import AI21Config
+    from .llms.AI21.chat import AI21ChatConfig
+    from .llms.together_ai.chat import TogetherAIConfig
+    from .llms.cloudflare import CloudflareConfig
+    from .llms.palm import PalmConfig
+    from .llms.gemini import GeminiConfig
+    from .llms.nlp_cloud import NLPCloudConfig
+    from .llms.aleph_alpha import AlephAlphaConfig
+    from .llms.petals import PetalsConfig
+    from .llms.vertex_ai_and_google_ai_studio.gemini.vertex_and_google_ai_studio_gemini import (
+        VertexGeminiConfig,
+        GoogleAIStudioGeminiConfig,
+        VertexAIConfig,
+    )
+    from .llms.vertex_ai_and_google_ai_studio.vertex_embeddings.transformation import (
+        VertexAITextEmbeddingConfig,
+    )
+
+    vertexAITextEmbeddingConfig: VertexAITextEmbeddingConfig
+    from .llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.anthropic.transformation import (
+        VertexAIAnthropicConfig,
+    )
+    from .llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.llama3.transformation import (
+        VertexAILlama3Config,
+    )
+    from .llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.ai21.transformation import (
+        VertexAIAi21Config,
+    )
+    from .llms.sagemaker.sagemaker import SagemakerConfig
+    from .llms.ollama import OllamaConfig
+    from .llms.ollama_chat import OllamaChatConfig
+    from .llms.maritalk import MaritTalkConfig
+    from .llms.bedrock.chat.invoke_handler import (
+        AmazonCohereChatConfig,
+        AmazonConverseConfig,
+        bedrock_tool_name_mappings,
+    )
+    from .llms.bedrock.chat.converse_handler import (
+        BEDROCK_CONVERSE_MODELS,
+    )
+    from .llms.bedrock.common_utils import (
+        AmazonTitanConfig,
+        AmazonAI21Config,
+        AmazonAnthropicConfig,
+        AmazonAnthropicClaude3Config,
+        AmazonCohereConfig,
+        AmazonLlamaConfig,
+        AmazonMistralConfig,
+        AmazonBedrockGlobalConfig,
+    )
+    from .llms.bedrock.image.amazon_stability1_transformation import (
+        AmazonStabilityConfig,
+    )
+    from .llms.bedrock.image.amazon_stability3_transformation import (
+        AmazonStability3Config,
+    )
+    from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
+    from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
+        AmazonTitanMultimodalEmbeddingG1Config,
+    )
+    from .llms.bedrock.embed.amazon_titan_v2_transformation import (
+        AmazonTitanV2Config,
+    )
+    from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
+    from .llms.OpenAI.openai import (
+        OpenAIConfig,
+        OpenAITextCompletionConfig,
+        MistralEmbeddingConfig,
+        DeepInfraConfig,
+    )
+    from .llms.groq.chat.transformation import GroqChatConfig
+    from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
+    from .llms.mistral.mistral_chat_transformation import MistralConfig
+    from .llms.OpenAI.chat.o1_transformation import (
+        OpenAIO1Config,
+    )
+
+    openAIO1Config: OpenAIO1Config
+    from .llms.OpenAI.chat.gpt_transformation import (
+        OpenAIGPTConfig,
+    )
+
+    openAIGPTConfig: OpenAIGPTConfig
+    from .llms.OpenAI.chat.gpt_audio_transformation import (
+        OpenAIGPTAudioConfig,
+    )
+
+    openAIGPTAudioConfig: OpenAIGPTAudioConfig
+    from .llms.nvidia_nim.chat import NvidiaNimConfig
+    from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
+
+    nvidiaNimConfig: NvidiaNimConfig
+    nvidiaNimEmbeddingConfig: NvidiaNimEmbeddingConfig
+    from .llms.cerebras.chat import CerebrasConfig
+    from .llms.sambanova.chat import SambanovaConfig
+    from .llms.fireworks_ai.chat.fireworks_ai_transformation import FireworksAIConfig
+    from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
+        FireworksAIEmbeddingConfig,
+    )
+    from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
+    from .llms.xai.chat.xai_transformation import XAIChatConfig
+    from .llms.volcengine import VolcEngineConfig
+    from .llms.text_completion_codestral import MistralTextCompletionConfig
+    from .llms.AzureOpenAI.azure import (
+        AzureOpenAIError,
+        AzureOpenAIAssistantsAPIConfig,
+    )
+    from .llms.AzureOpenAI.chat.gpt_transformation import AzureOpenAIConfig
+    from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
+    from .llms.deepseek.chat.transformation import DeepSeekChatConfig
+    from .llms.lm_studio.chat.transformation import LMStudioChatConfig
+    from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
+    from .llms.perplexity.chat.transformation import PerplexityChatConfig
+    from .llms.AzureOpenAI.chat.o1_transformation import AzureOpenAIO1Config
+    from .llms.watsonx.completion.handler import IBMWatsonXAIConfig
+    from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
+
+_lazy_imports: Dict[str, str] = {
+    "HuggingfaceConfig": ".llms.huggingface_restapi",
+    "AnthropicConfig": ".llms.anthropic.chat.handler",
+    "AnthropicExperimentalPassThroughConfig": ".llms.anthropic.experimental_pass_through.transformation",
+    "GroqSTTConfig": ".llms.groq.stt.transformation",
+    "AnthropicTextConfig": ".llms.anthropic.completion",
+    "DatabricksConfig": ".llms.databricks.chat",
+    "DatabricksEmbeddingConfig": ".llms.databricks.chat",
+    "PredibaseConfig": ".llms.predibase",
+    "ReplicateConfig": ".llms.replicate",
+    "CohereConfig": ".llms.cohere.completion",
+    "ClarifaiConfig": ".llms.clarifai",
+    "AI21Config": ".llms.AI21.completion",
+    "AI21ChatConfig": ".llms.AI21.chat",
+    "TogetherAIConfig": ".llms.together_ai.chat",
+    "CloudflareConfig": ".llms.cloudflare",
+    "PalmConfig": ".llms.palm",
+    "GeminiConfig": ".llms.gemini",
+    "NLPCloudConfig": ".llms.nlp_cloud",
+    "AlephAlphaConfig": ".llms.aleph_alpha",
+    "PetalsConfig": ".llms.petals",
+    "VertexGeminiConfig": ".llms.vertex_ai_and_google_ai_studio.gemini.vertex_and_google_ai_studio_gemini",
+    "GoogleAIStudioGeminiConfig": ".llms.vertex_ai_and_google_ai_studio.gemini.vertex_and_google_ai_studio_gemini",
+    "VertexAIConfig": ".llms.vertex_ai_and_google_ai_studio.gemini.vertex_and_google_ai_studio_gemini",
+    "VertexAITextEmbeddingConfig": ".llms.vertex_ai_and_google_ai_studio.vertex_embeddings.transformation",
+    "VertexAIAnthropicConfig": ".llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.anthropic.transformation",
+    "VertexAILlama3Config": ".llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.llama3.transformation",
+    "VertexAIAi21Config": ".llms.vertex_ai_and_google_ai_studio.vertex_ai_partner_models.ai21.transformation",
+    "SagemakerConfig": ".llms.sagemaker.sagemaker",
+    "OllamaConfig": ".llms.ollama",
+    "OllamaChatConfig": ".llms.ollama_chat",
+    "MaritTalkConfig": ".llms.maritalk",
+    "AmazonCohereChatConfig": ".llms.bedrock.chat.invoke_handler",
+    "AmazonConverseConfig": ".llms.bedrock.chat.invoke_handler",
+    "bedrock_tool_name_mappings": ".llms.bedrock.chat.invoke_handler",
+    "BEDROCK_CONVERSE_MODELS": ".llms.bedrock.chat.converse_handler",
+    "AmazonTitanConfig": ".llms.bedrock.common_utils",
+    "AmazonAI21Config": ".llms.bedrock.common_utils",
+    "AmazonAnthropicConfig": ".llms.bedrock.common_utils",
+    "AmazonAnthropicClaude3Config": ".llms.bedrock.common_utils",
+    "AmazonCohereConfig": ".llms.bedrock.common_utils",
+    "AmazonLlamaConfig": ".llms.bedrock.common_utils",
+    "AmazonMistralConfig": ".llms.bedrock.common_utils",
+    "AmazonBedrockGlobalConfig": ".llms.bedrock.common_utils",
+    "AmazonStabilityConfig": ".llms.bedrock.image.amazon_stability1_transformation",
+    "AmazonStability3Config": ".llms.bedrock.image.amazon_stability3_transformation",
+    "AmazonTitanG1Config": ".llms.bedrock.embed.amazon_titan_g1_transformation",
+    "AmazonTitanMultimodalEmbeddingG1Config": ".llms.bedrock.embed.amazon_titan_multimodal_transformation",
+    "AmazonTitanV2Config": ".llms.bedrock.embed.amazon_titan_v2_transformation",
+    "BedrockCohereEmbeddingConfig": ".llms.bedrock.embed.cohere_transformation",
+    "OpenAIConfig": ".llms.OpenAI.openai",
+    "OpenAITextCompletionConfig": ".llms.OpenAI.openai",
+    "MistralEmbeddingConfig": ".llms.OpenAI.openai",
+    "DeepInfraConfig": ".llms.OpenAI.openai",
+    "GroqChatConfig": ".llms.groq.chat.transformation",
+    "AzureAIStudioConfig": ".llms.azure_ai.chat.transformation",
+    "MistralConfig": ".llms.mistral.mistral_chat_transformation",
+    "OpenAIO1Config": ".llms.OpenAI.chat.o1_transformation",
+    "OpenAIGPTConfig": ".llms.OpenAI.chat.gpt_transformation",
+    "OpenAIGPTAudioConfig": ".llms.OpenAI.chat.gpt_audio_transformation",
+    "NvidiaNimConfig": ".llms.nvidia_nim.chat",
+    "NvidiaNimEmbeddingConfig": ".llms.nvidia_nim.embed",
+    "CerebrasConfig": ".llms.cerebras.chat",
+    "SambanovaConfig": ".llms.sambanova.chat",
+    "FireworksAIConfig": ".llms.fireworks_ai.chat.fireworks_ai_transformation",
+    "FireworksAIEmbeddingConfig": ".llms.fireworks_ai.embed.fireworks_ai_transformation",
+    "JinaAIEmbeddingConfig": ".llms.jina_ai.embedding.transformation",
+    "XAIChatConfig": ".llms.xai.chat.xai_transformation",
+    "VolcEngineConfig": ".llms.volcengine",
+    "MistralTextCompletionConfig": ".llms.text_completion_codestral",
+    "AzureOpenAIError": ".llms.AzureOpenAI.azure",
+    "AzureOpenAIAssistantsAPIConfig": ".llms.AzureOpenAI.azure",
+    "AzureOpenAIConfig": ".llms.AzureOpenAI.chat.gpt_transformation",
+    "HostedVLLMChatConfig": ".llms.hosted_vllm.chat.transformation",
+    "DeepSeekChatConfig": ".llms.deepseek.chat.transformation",
+    "LMStudioChatConfig": ".llms.lm_studio.chat.transformation",
+    "LmStudioEmbeddingConfig": ".llms.lm_studio.embed.transformation",
+    "PerplexityChatConfig": ".llms.perplexity.chat.transformation",
+    "AzureOpenAIO1Config": ".llms.AzureOpenAI.chat.o1_transformation",
+    "IBMWatsonXAIConfig": ".llms.watsonx.completion.handler",
+    "IBMWatsonXChatConfig": ".llms.watsonx.chat.transformation",
+}
+# module-level config instances, created on first use
+_lazy_instances: Dict[str, str] = {
+    "vertexAITextEmbeddingConfig": "VertexAITextEmbeddingConfig",
+    "openAIO1Config": "OpenAIO1Config",
+    "openAIGPTConfig": "OpenAIGPTConfig",
+    "openAIGPTAudioConfig": "OpenAIGPTAudioConfig",
+    "nvidiaNimConfig": "NvidiaNimConfig",
+    "nvidiaNimEmbeddingConfig": "NvidiaNimEmbeddingConfig",
+}
 
-from .llms.nvidia_nim.chat import NvidiaNimConfig
-from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
 
-nvidiaNimConfig = NvidiaNimConfig()
-nvidiaNimEmbeddingConfig = NvidiaNimEmbeddingConfig()
+def __getattr__(name: str) -> Any:
+    """
+    Import provider configs on first use.
+    """
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+    elif name in _lazy_instances:
+        value = __getattr__(_lazy_instances[name])()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # another thread might've set it first - keep a single instance
+    return globals().setdefault(name, value)
 
-from .llms.cerebras.chat import CerebrasConfig
-from .llms.sambanova.chat import SambanovaConfig
-from .llms.AI21.chat import AI21ChatConfig
-from .llms.fireworks_ai.chat.fireworks_ai_transformation import FireworksAIConfig
-from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
-    FireworksAIEmbeddingConfig,
-)
-from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
-from .llms.xai.chat.xai_transformation import XAIChatConfig
-from .llms.volcengine import VolcEngineConfig
-from .llms.text_completion_codestral import MistralTextCompletionConfig
-from .llms.AzureOpenAI.azure import (
-    AzureOpenAIError,
-    AzureOpenAIAssistantsAPIConfig,
-)
 
-from .llms.AzureOpenAI.chat.gpt_transformation import AzureOpenAIConfig
-from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
-from .llms.deepseek.chat.transformation import DeepSeekChatConfig
-from .llms.lm_studio.chat.transformation import LMStudioChatConfig
-from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
-from .llms.perplexity.chat.transformation import PerplexityChatConfig
-from .llms.AzureOpenAI.chat.o1_transformation import AzureOpenAIO1Config
-from .llms.watsonx.completion.handler import IBMWatsonXAIConfig
-from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
 from .main import *  # type: ignore
 from .integrations import *
 from .exceptions import (
@@ -1176,7 +1298,11 @@ from .realtime_api.main import _arealtime
 from .fine_tuning.main import *
 from .files.main import *
 from .scheduler import *
-from .cost_calculator import response_cost_calculator, cost_per_token
+from .cost_calculator import (
+    response_cost_calculator,
+    cost_per_token,
+    bulk_cost_per_token,
+)
 
 ### ADAPTERS ###
 from .types.adapter import AdapterItem
@@ -0,0 +1,93 @@
+"""
+Canonical, incremental hashing of cache key params
+
+The default `Cache.get_cache_key` builds one large string from `str(value)` of each param, then hashes it.
+For large prompts (e.g. base64 images), building that string is expensive, and `str()` isn't canonical - the same dict with different key order gives a different cache key.
+
+This walks each param value and feeds a deterministic byte encoding of it into the hash object, without building an intermediate string:
+- dicts are hashed in sorted key order
+- every value is prefixed with a type tag (+ length for str / bytes / containers), so different values can't produce the same byte stream
+- integral floats are hashed like ints (e.g. `temperature=1` == `temperature=1.0`)
+"""
+
+import hashlib
+from collections.abc import Mapping
+from typing import Any, Iterable, Tuple
+
+from pydantic import BaseModel
+
+from litellm.types.caching import CacheKeyHashAlgorithm
+
+
+def get_hash_object(algorithm: CacheKeyHashAlgorithm) -> Any:
+    """
+    Returns a new hash object, with `update(bytes)` and `hexdigest()`
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    elif algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    elif algorithm == "xxhash":
+        try:
+            import xxhash
+        except ImportError:
+            raise Exception("Missing xxhash. Run `pip install xxhash`")
+        return xxhash.xxh3_128()
+    raise ValueError(
+        "Invalid cache key hash algorithm={}. Supported - sha256, blake2b, xxhash".format(
+            algorithm
+        )
+    )
+
+
+def _update_hash_with_value(hash_object: Any, value: Any) -> None:
+    if value is None:
+        hash_object.update(b"N")
+    elif value is True:
+        hash_object.update(b"T")
+    elif value is False:
+        hash_object.update(b"F")
+    elif isinstance(value, str):
+        encoded_value = value.encode("utf-8", errors="surrogatepass")
+        hash_object.update(b"s%d:" % len(encoded_value))
+        hash_object.update(encoded_value)
+    elif isinstance(value, int):
+        hash_object.update(b"i%d;" % value)
+    elif isinstance(value, float):
+        if value.is_integer():
+            hash_object.update(b"i%d;" % int(value))
+        else:
+            hash_object.update(b"f" + repr(value).encode() + b";")
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        hash_object.update(b"b%d:" % len(value))
+        hash_object.update(value)
+    elif isinstance(value, Mapping):
+        hash_object.update(b"d%d:" % len(value))
+        for key in sorted(value.keys(), key=str):
+            _update_hash_with_value(hash_object, str(key))
+            _update_hash_with_value(hash_object, value[key])
+    elif isinstance(value, (list, tuple)):
+        hash_object.update(b"l%d:" % len(value))
+        for item in value:
+            _update_hash_with_value(hash_object, item)
+    elif isinstance(value, (set, frozenset)):
+        hash_object.update(b"l%d:" % len(value))
+        for item in sorted(value, key=repr):
+            _update_hash_with_value(hash_object, item)
+    elif isinstance(value, BaseModel):
+        _update_hash_with_value(hash_object, value.model_dump())
+    else:
+        _update_hash_with_value(hash_object, str(value))
+
+
+def get_canonical_cache_key_hash(
+    params: Iterable[Tuple[str, Any]], algorithm: CacheKeyHashAlgorithm = "sha256"
+) -> str:
+    """
+    Hash (param name, param value) pairs. The result doesn't depend on the order of the params, or of keys in dict values.
+    """
+    hash_object = get_hash_object(algorithm=algorithm)
+    for param, value in sorted(params, key=lambda item: item[0]):
+        _update_hash_with_value(hash_object, param)
+        _update_hash_with_value(hash_object, value)
+    return hash_object.hexdigest()
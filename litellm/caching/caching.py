@@ -40,6 +40,7 @@ from litellm.types.rerank import RerankRequest
 from litellm.types.utils import all_litellm_params
 
 from .base_cache import BaseCache
+from .cache_key_hasher import get_canonical_cache_key_hash, get_hash_object
 from .disk_cache import DiskCache
 from .dual_cache import DualCache
 from .in_memory_cache import InMemoryCache
@@ -47,6 +48,7 @@ from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_semantic_cache import RedisSemanticCache
 from .s3_cache import S3Cache
+from .single_flight import SingleFlight
 
 
 def print_verbose(print_statement):
@@ -113,6 +115,9 @@ class Cache:
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model="text-embedding-ada-002",
+        single_flight: bool = False,
+        single_flight_timeout: float = 60.0,
+        cache_key_hash_algorithm: Optional[CacheKeyHashAlgorithm] = None,
         **kwargs,
     ):
         """
@@ -153,6 +158,9 @@ class Cache:
 
             # Common Cache Args
             supported_call_types (list, optional): List of call types to cache for. Defaults to cache == on for all call types.
+            single_flight (bool, optional): If True, concurrent identical non-streaming acompletion / aembedding calls share one LLM API call. Defaults to False.
+            single_flight_timeout (float, optional): Max. time (seconds) a request waits for the in-flight call, before making its own. Defaults to 60.
+            cache_key_hash_algorithm (str, optional): If set ("sha256", "blake2b" or "xxhash"), cache keys are hashed incrementally from a canonical encoding of the params, instead of from `str()` of each param. Changes cache keys. Defaults to None.
             **kwargs: Additional keyword arguments for redis.Redis() cache
 
         Raises:
@@ -233,6 +241,20 @@ class Cache:
         if self.namespace is not None and isinstance(self.cache, RedisCache):
             self.cache.namespace = self.namespace
 
+        self.cache_key_hash_algorithm = cache_key_hash_algorithm
+        if self.cache_key_hash_algorithm is not None:
+            get_hash_object(algorithm=self.cache_key_hash_algorithm)  # validate
+        self._relevant_args_for_cache_key: Optional[Set[str]] = None
+
+        self.single_flight: Optional[SingleFlight] = None
+        if single_flight is True:
+            self.single_flight = SingleFlight(
+                timeout=single_flight_timeout,
+                redis_cache=(
+                    self.cache if isinstance(self.cache, RedisCache) else None
+                ),
+            )
+
     def get_cache_key(self, **kwargs) -> str:
         """
         Get the cache key for the given arguments.
@@ -243,7 +265,6 @@ class Cache:
         Returns:
             str: The cache key generated from the arguments, or None if no cache key could be generated.
         """
-        cache_key = ""
         # verbose_logger.debug("\nGetting Cache key. Kwargs: %s", kwargs)
 
         preset_cache_key = self._get_preset_cache_key_from_kwargs(**kwargs)
@@ -251,13 +272,42 @@ class Cache:
             verbose_logger.debug("\nReturning preset cache key: %s", preset_cache_key)
             return preset_cache_key
 
-        combined_kwargs = self._get_relevant_args_to_use_for_cache_key()
+        cache_key_params = self._get_cache_key_params(kwargs)
+        if self.cache_key_hash_algorithm is not None:
+            hashed_cache_key = get_canonical_cache_key_hash(
+                params=cache_key_params, algorithm=self.cache_key_hash_algorithm
+            )
+        else:
+            cache_key = "".join(
+                f"{str(param)}: {str(param_value)}"
+                for param, param_value in cache_key_params
+            )
+            verbose_logger.debug("\nCreated cache key: %s", cache_key)
+            hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
+        hashed_cache_key = self._add_redis_namespace_to_cache_key(
+            hashed_cache_key, **kwargs
+        )
+        self._set_preset_cache_key_in_kwargs(
+            preset_cache_key=hashed_cache_key, **kwargs
+        )
+        return hashed_cache_key
+
+    def _get_cache_key_params(self, kwargs: dict) -> List[Tuple[str, Any]]:
+        """
+        Get the (param, value) pairs from kwargs, that make up the cache key
+        """
+        if self._relevant_args_for_cache_key is None:
+            self._relevant_args_for_cache_key = (
+                self._get_relevant_args_to_use_for_cache_key()
+            )
+        combined_kwargs = self._relevant_args_for_cache_key
         litellm_param_kwargs = all_litellm_params
+        cache_key_params: List[Tuple[str, Any]] = []
         for param in kwargs:
             if param in combined_kwargs:
                 param_value: Optional[str] = self._get_param_value(param, kwargs)
                 if param_value is not None:
-                    cache_key += f"{str(param)}: {str(param_value)}"
+                    cache_key_params.append((param, param_value))
             elif (
                 param not in litellm_param_kwargs
             ):  # check if user passed in optional param - e.g. top_k
@@ -266,18 +316,8 @@ class Cache:
                 ):  # feature flagged for now
                     if kwargs[param] is None:
                         continue  # ignore None params
-                    param_value = kwargs[param]
-                    cache_key += f"{str(param)}: {str(param_value)}"
-
-        verbose_logger.debug("\nCreated cache key: %s", cache_key)
-        hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
-        hashed_cache_key = self._add_redis_namespace_to_cache_key(
-            hashed_cache_key, **kwargs
-        )
-        self._set_preset_cache_key_in_kwargs(
-            preset_cache_key=hashed_cache_key, **kwargs
-        )
-        return hashed_cache_key
+                    cache_key_params.append((param, kwargs[param]))
+        return cache_key_params
 
     def _get_param_value(
         self,
@@ -45,6 +45,7 @@ from litellm.caching.caching import (
 from litellm.litellm_core_utils.logging_utils import (
     _assemble_complete_response_from_streaming_chunks,
 )
+from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
 from litellm.types.rerank import RerankResponse
 from litellm.types.utils import (
     CallTypes,
@@ -89,6 +90,10 @@ class LLMCachingHandler:
         self.request_kwargs = request_kwargs
         self.original_function = original_function
         self.start_time = start_time
+        self._single_flight_key: Optional[str] = (
+            None  # set if this request is the single-flight leader for its cache key
+        )
+        self._cache_write_task: Optional[asyncio.Task] = None
         pass
 
     async def _async_get_cache(
@@ -143,6 +148,12 @@ class LLMCachingHandler:
                     kwargs=kwargs,
                     args=args,
                 )
+                if cached_result is None:
+                    cached_result = await self._async_wait_for_single_flight(
+                        call_type=call_type,
+                        kwargs=kwargs,
+                        args=args,
+                    )
 
                 if cached_result is not None and not isinstance(cached_result, list):
                     verbose_logger.debug("Cache Hit!")
@@ -286,10 +297,13 @@ class LLMCachingHandler:
                         is_async=False,
                     )
 
-                    threading.Thread(
-                        target=logging_obj.success_handler,
-                        args=(cached_result, start_time, end_time, cache_hit),
-                    ).start()
+                    GLOBAL_LOGGING_WORKER.submit(
+                        logging_obj.success_handler,
+                        cached_result,
+                        start_time,
+                        end_time,
+                        cache_hit,
+                    )
                     cache_key = litellm.cache._get_preset_cache_key_from_kwargs(
                         **kwargs
                     )
@@ -455,10 +469,9 @@ class LLMCachingHandler:
                 cached_result, start_time, end_time, cache_hit
             )
         )
-        threading.Thread(
-            target=logging_obj.success_handler,
-            args=(cached_result, start_time, end_time, cache_hit),
-        ).start()
+        GLOBAL_LOGGING_WORKER.submit(
+            logging_obj.success_handler, cached_result, start_time, end_time, cache_hit
+        )
 
     async def _retrieve_from_cache(
         self, call_type: str, kwargs: Dict[str, Any], args: Tuple[Any, ...]
@@ -513,6 +526,93 @@ class LLMCachingHandler:
                 cached_result = litellm.cache.get_cache(**new_kwargs)
         return cached_result
 
+    def _is_single_flight_supported(
+        self, call_type: str, kwargs: Dict[str, Any]
+    ) -> bool:
+        """
+        Single-flight is only used for non-streaming acompletion / aembedding (single input) calls
+        """
+        if litellm.cache is None or litellm.cache.single_flight is None:
+            return False
+        if kwargs.get("stream", False) is True:
+            return False
+        if call_type == CallTypes.acompletion.value:
+            return True
+        if call_type == CallTypes.aembedding.value and not isinstance(
+            kwargs.get("input"), list
+        ):
+            return True
+        return False
+
+    async def _async_wait_for_single_flight(
+        self, call_type: str, kwargs: Dict[str, Any], args: Tuple[Any, ...]
+    ) -> Optional[Any]:
+        """
+        Called on a cache miss.
+
+        - If an identical request is in flight, wait for it and return its response (handled like a cached result)
+        - Else this request becomes the leader and None is returned. The leader must call `release_single_flight` once its LLM API call completes / fails.
+        """
+        if litellm.cache is None or litellm.cache.single_flight is None:
+            return None
+        new_kwargs = kwargs.copy()
+        new_kwargs.update(convert_args_to_kwargs(self.original_function, args))
+        if not self._is_single_flight_supported(
+            call_type=call_type, kwargs=new_kwargs
+        ) or not litellm.cache.should_use_cache(**new_kwargs):
+            return None
+
+        single_flight = litellm.cache.single_flight
+        cache_key = litellm.cache.get_cache_key(**new_kwargs)
+        leader_future = single_flight.join(key=cache_key)
+        if leader_future is not None:
+            verbose_logger.debug("Single flight - waiting on in-flight request")
+            return await single_flight.wait(leader_future)
+
+        self._single_flight_key = cache_key
+        try:
+            if await single_flight.acquire_distributed_lock(key=cache_key) is False:
+                # another instance is making this call - wait for it to write the response to the cache
+                verbose_logger.debug("Single flight - waiting on another instance")
+                cached_result = await single_flight.wait_for_distributed_leader(
+                    key=cache_key,
+                    get_cached_result=lambda: self._retrieve_from_cache(
+                        call_type=call_type, kwargs=kwargs, args=args
+                    ),
+                )
+                if cached_result is not None:
+                    self.release_single_flight(result=cached_result)
+                    return cached_result
+        except BaseException:
+            # e.g. cancelled while waiting - don't leave local waiters on an abandoned leader
+            self.release_single_flight(result=None)
+            raise
+        return None
+
+    def release_single_flight(self, result: Optional[Any] = None) -> None:
+        """
+        Share the leader's response with requests waiting on the same cache key.
+
+        result: None if the request failed - waiting requests then make their own call.
+        """
+        if (
+            self._single_flight_key is None
+            or litellm.cache is None
+            or litellm.cache.single_flight is None
+        ):
+            return
+        single_flight = litellm.cache.single_flight
+        cache_key = self._single_flight_key
+        self._single_flight_key = None
+        single_flight.release(key=cache_key, result=result)
+        if single_flight.redis_cache is not None:
+            asyncio.create_task(
+                single_flight.release_distributed_lock(
+                    key=cache_key,
+                    after=self._cache_write_task if result is not None else None,
+                )
+            )
+
     def _convert_cached_result_to_model_response(
         self,
         cached_result: Any,
@@ -709,7 +809,7 @@ class LLMCachingHandler:
                         litellm.cache.cache, S3Cache
                     )  # s3 doesn't support bulk writing. Exclude.
                 ):
-                    asyncio.create_task(
+                    self._cache_write_task = asyncio.create_task(
                         litellm.cache.async_add_cache_pipeline(result, **new_kwargs)
                     )
                 elif isinstance(litellm.cache.cache, S3Cache):
@@ -719,13 +819,15 @@ class LLMCachingHandler:
                         kwargs=new_kwargs,
                     ).start()
                 else:
-                    asyncio.create_task(
+                    self._cache_write_task = asyncio.create_task(
                         litellm.cache.async_add_cache(
                             result.model_dump_json(), **new_kwargs
                         )
                     )
             else:
-                asyncio.create_task(litellm.cache.async_add_cache(result, **new_kwargs))
+                self._cache_write_task = asyncio.create_task(
+                    litellm.cache.async_add_cache(result, **new_kwargs)
+                )
 
     def sync_set_cache(
         self,
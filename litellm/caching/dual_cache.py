@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
+from litellm.types.caching import RedisPipelineIncrementOperation
 
 from .base_cache import BaseCache
 from .in_memory_cache import InMemoryCache
@@ -373,6 +374,41 @@ class DualCache(BaseCache):
         except Exception as e:
             raise e  # don't log if exception is raised
 
+    async def async_increment_cache_pipeline(
+        self,
+        increment_list: List[RedisPipelineIncrementOperation],
+        parent_otel_span: Optional[Span] = None,
+        local_only: bool = False,
+    ) -> List[float]:
+        """
+        Increment multiple counters - e.g. all tpm / rpm counters for a request.
+
+        Redis is updated in 1 round-trip, instead of 1+ per counter.
+
+        Returns - the incremented value of each counter, in the order of `increment_list`
+        """
+        try:
+            results: List[float] = []
+            if self.in_memory_cache is not None:
+                for increment_op in increment_list:
+                    results.append(
+                        await self.in_memory_cache.async_increment(
+                            increment_op["key"],
+                            increment_op["increment_value"],
+                            ttl=increment_op["ttl"],
+                        )
+                    )
+
+            if self.redis_cache is not None and local_only is False:
+                results = await self.redis_cache.async_increment_multi(
+                    increment_list=increment_list,
+                    parent_otel_span=parent_otel_span,
+                )
+
+            return results
+        except Exception as e:
+            raise e  # don't log if exception is raised
+
     async def async_set_cache_sadd(
         self, key, value: List, local_only: bool = False, **kwargs
     ) -> None:
@@ -8,9 +8,12 @@ Has 4 methods:
     - async_get_cache
 """
 
+import heapq
 import json
+import sys
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base_cache import BaseCache
 
@@ -22,51 +25,162 @@ class InMemoryCache(BaseCache):
         default_ttl: Optional[
             int
         ] = 600,  # default ttl is 10 minutes. At maximum litellm rate limiting logic requires objects to be in memory for 1 minute
+        max_size_in_bytes: Optional[int] = None,
+        store_decoded_values: bool = False,
+        evict_least_recently_used: bool = False,
     ):
         """
         max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Use 200 items as a default
+        max_size_in_bytes [Optional[int]]: Maximum (approximate) size of cached values in bytes. If set, unexpired items are evicted (least recently used first) to stay under it. Not enforced if None.
+        evict_least_recently_used [bool]: If True, unexpired items are evicted (least recently used first) when the cache is over `max_size_in_memory`. If False, only expired items are evicted for it - the item limit is soft, and live items (e.g. rate limit counters) are never dropped.
+        store_decoded_values [bool]: If True, json strings are decoded once on write, instead of on every read. Reads then return the same (shared) object.
         """
         self.max_size_in_memory = (
             max_size_in_memory or 200
         )  # set an upper bound of 200 items in-memory
         self.default_ttl = default_ttl or 600
+        self.max_size_in_bytes = max_size_in_bytes
+        self.store_decoded_values = store_decoded_values
+        self.evict_least_recently_used = evict_least_recently_used
 
-        # in-memory cache
-        self.cache_dict: dict = {}
+        # in-memory cache - ordered least -> most recently used
+        self.cache_dict = OrderedDict()
         self.ttl_dict: dict = {}
+        self.expiration_heap: List[Tuple[float, Any]] = []  # (expiry time, key)
 
-    def evict_cache(self):
+        # only tracked if max_size_in_bytes is set
+        self.item_sizes: Dict[Any, int] = {}
+        self.current_size_in_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def cache_dict(self) -> "OrderedDict[Any, Any]":
+        return self._cache_dict
+
+    @cache_dict.setter
+    def cache_dict(self, value: dict):
+        self._cache_dict = (
+            value if isinstance(value, OrderedDict) else OrderedDict(value)
+        )
+
+    @staticmethod
+    def _get_size_in_bytes(value: Any) -> int:
+        """
+        Approximate - exact for str / bytes, size of the json encoding for other objects.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        if not isinstance(value, str):
+            try:
+                value = json.dumps(value, default=str)
+            except Exception:
+                return sys.getsizeof(value)
+        return len(value.encode("utf-8", errors="ignore"))
+
+    def _remove_key(self, key):
+        self.cache_dict.pop(key, None)
+        self.ttl_dict.pop(key, None)
+        if key in self.item_sizes:
+            self.current_size_in_bytes -= self.item_sizes.pop(key)
+
+    def _evict_expired(self):
+        current_time = time.time()
+        while self.expiration_heap and self.expiration_heap[0][0] <= current_time:
+            expiry, key = heapq.heappop(self.expiration_heap)
+            # skip stale heap entries - key was removed, or re-set with a new ttl
+            if self.ttl_dict.get(key) == expiry:
+                self._remove_key(key)
+                self.expirations += 1
+
+    def _evict_least_recently_used(self):
+        key = next(iter(self.cache_dict))
+        self._remove_key(key)
+        self.evictions += 1
+
+    def _is_over_size_in_bytes(self, incoming_size_in_bytes: int = 0) -> bool:
+        return (
+            self.max_size_in_bytes is not None
+            and self.current_size_in_bytes + incoming_size_in_bytes
+            > self.max_size_in_bytes
+        )
+
+    def _is_over_capacity(self, incoming_size_in_bytes: int = 0) -> bool:
+        if len(self.cache_dict) >= self.max_size_in_memory:
+            return True
+        return self._is_over_size_in_bytes(
+            incoming_size_in_bytes=incoming_size_in_bytes
+        )
+
+    def _compact_expiration_heap(self):
+        """
+        Repeated writes to the same key leave stale heap entries behind - rebuild the heap when they dominate.
+        """
+        if len(self.expiration_heap) > 2 * len(self.ttl_dict) + 100:
+            self.expiration_heap = [
+                (expiry, key) for key, expiry in self.ttl_dict.items()
+            ]
+            heapq.heapify(self.expiration_heap)
+
+    def evict_cache(self, incoming_size_in_bytes: int = 0):
         """
         Eviction policy:
-        - check if any items in ttl_dict are expired -> remove them from ttl_dict and cache_dict
+        - remove expired items (O(log n) per item, via the expiration heap)
+        - if still over `max_size_in_bytes`, or over `max_size_in_memory` and `evict_least_recently_used` is set, remove least recently used items (O(1) per item)
 
 
         This guarantees the following:
-        - 1. When item ttl not set: At minimumm each item will remain in memory for 5 minutes
-        - 2. When ttl is set: the item will remain in memory for at least that amount of time
-        - 3. the size of in-memory cache is bounded
+        - 1. When item ttl not set: the item will remain in memory for at most `default_ttl`
+        - 2. When ttl is set: the item will remain in memory for at most that amount of time
+        - 3. if `max_size_in_bytes` is set, the size of in-memory cache is bounded by bytes
+        - 4. if `evict_least_recently_used` is set, the size of in-memory cache is bounded by item count
 
         """
-        for key in list(self.ttl_dict.keys()):
-            if time.time() > self.ttl_dict[key]:
-                self.cache_dict.pop(key, None)
-                self.ttl_dict.pop(key, None)
-
-                # de-reference the removed item
-                # https://www.geeksforgeeks.org/diagnosing-and-fixing-memory-leaks-in-python/
-                # One of the most common causes of memory leaks in Python is the retention of objects that are no longer being used.
-                # This can occur when an object is referenced by another object, but the reference is never removed.
+        self._evict_expired()
+        while len(self.cache_dict) > 0 and (
+            self._is_over_size_in_bytes(incoming_size_in_bytes=incoming_size_in_bytes)
+            or (
+                self.evict_least_recently_used
+                and len(self.cache_dict) >= self.max_size_in_memory
+            )
+        ):
+            self._evict_least_recently_used()
 
     def set_cache(self, key, value, **kwargs):
-        if len(self.cache_dict) >= self.max_size_in_memory:
+        if self.store_decoded_values and isinstance(value, (str, bytes, bytearray)):
+            try:
+                value = json.loads(value)
+            except Exception:
+                pass
+
+        size_in_bytes = 0
+        if self.max_size_in_bytes is not None:
+            size_in_bytes = self._get_size_in_bytes(value)
+            if size_in_bytes > self.max_size_in_bytes:
+                # item can never fit - don't evict everything else for it
+                self._remove_key(key)
+                return
+
+        self._remove_key(key)
+        if self._is_over_capacity(incoming_size_in_bytes=size_in_bytes):
             # only evict when cache is full
-            self.evict_cache()
+            self.evict_cache(incoming_size_in_bytes=size_in_bytes)
 
         self.cache_dict[key] = value
         if "ttl" in kwargs and kwargs["ttl"] is not None:
-            self.ttl_dict[key] = time.time() + kwargs["ttl"]
+            expiry = time.time() + kwargs["ttl"]
         else:
-            self.ttl_dict[key] = time.time() + self.default_ttl
+            expiry = time.time() + self.default_ttl
+        self.ttl_dict[key] = expiry
+        heapq.heappush(self.expiration_heap, (expiry, key))
+        self._compact_expiration_heap()
+
+        if self.max_size_in_bytes is not None:
+            self.item_sizes[key] = size_in_bytes
+            self.current_size_in_bytes += size_in_bytes
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -93,14 +207,23 @@ class InMemoryCache(BaseCache):
         if key in self.cache_dict:
             if key in self.ttl_dict:
                 if time.time() > self.ttl_dict[key]:
-                    self.cache_dict.pop(key, None)
+                    self._remove_key(key)
+                    self.expirations += 1
+                    self.misses += 1
                     return None
+            self.cache_dict.move_to_end(key)
+            self.hits += 1
             original_cached_response = self.cache_dict[key]
+            if self.store_decoded_values or not isinstance(
+                original_cached_response, (str, bytes, bytearray)
+            ):
+                return original_cached_response
             try:
                 cached_response = json.loads(original_cached_response)
             except Exception:
                 cached_response = original_cached_response
             return cached_response
+        self.misses += 1
         return None
 
     def batch_get_cache(self, keys: list, **kwargs):
@@ -135,13 +258,29 @@ class InMemoryCache(BaseCache):
 
         return value
 
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self.cache_dict),
+            "size_in_bytes": (
+                self.current_size_in_bytes
+                if self.max_size_in_bytes is not None
+                else None
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
     def flush_cache(self):
         self.cache_dict.clear()
         self.ttl_dict.clear()
+        self.expiration_heap.clear()
+        self.item_sizes.clear()
+        self.current_size_in_bytes = 0
 
     async def disconnect(self):
         pass
 
     def delete_cache(self, key):
-        self.cache_dict.pop(key, None)
-        self.ttl_dict.pop(key, None)
+        self._remove_key(key)
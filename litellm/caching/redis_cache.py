@@ -15,7 +15,7 @@ import json
 import time
 import traceback
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
@@ -40,6 +40,24 @@ else:
     Span = Any
 
 
+# INCRBYFLOAT + set the ttl if the key has none, in 1 round-trip. Returns the new value.
+_INCREMENT_WITH_TTL_SCRIPT = """
+local result = redis.call("incrbyfloat", KEYS[1], ARGV[1])
+if ARGV[2] ~= "" and redis.call("ttl", KEYS[1]) == -1 then
+    redis.call("expire", KEYS[1], ARGV[2])
+end
+return result
+"""
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
+
 class RedisCache(BaseCache):
     # if users don't provider one, use the default litellm cache
 
@@ -543,14 +561,16 @@ class RedisCache(BaseCache):
         _used_ttl = self.get_ttl(ttl=ttl)
         try:
             async with _redis_client as redis_client:
-                result = await redis_client.incrbyfloat(name=key, amount=value)
-
-                if _used_ttl is not None:
-                    # check if key already has ttl, if not -> set ttl
-                    current_ttl = await redis_client.ttl(key)
-                    if current_ttl == -1:
-                        # Key has no expiration
-                        await redis_client.expire(key, _used_ttl)
+                # increment + set ttl (if key has none) in 1 round-trip
+                result = float(
+                    await redis_client.eval(
+                        _INCREMENT_WITH_TTL_SCRIPT,
+                        1,
+                        key,
+                        value,
+                        self._get_ttl_script_arg(_used_ttl),
+                    )  # type: ignore
+                )
 
                 ## LOGGING ##
                 end_time = time.time()
@@ -588,6 +608,86 @@ class RedisCache(BaseCache):
             )
             raise e
 
+    @staticmethod
+    def _get_ttl_script_arg(ttl: Optional[float]) -> str:
+        """
+        Redis `EXPIRE` only accepts whole seconds. Empty string = don't set a ttl.
+        """
+        if ttl is None:
+            return ""
+        return str(max(int(ttl), 1))
+
+    async def async_increment_multi(
+        self,
+        increment_list: List[RedisPipelineIncrementOperation],
+        parent_otel_span: Optional[Span] = None,
+    ) -> List[float]:
+        """
+        Increment multiple counters in 1 round-trip - e.g. all rate limit counters for a request.
+
+        Each counter is incremented + gets its ttl set (only if it has none) atomically, so a counter never gets stuck without a ttl.
+
+        Unlike `async_increment_pipeline`, an existing ttl is not reset - i.e. fixed-window counters expire at the end of their window.
+
+        Returns the new value of each counter, in the order of `increment_list`.
+        """
+        if len(increment_list) == 0:
+            return []
+
+        from redis.asyncio import Redis
+
+        _redis_client: Redis = self.init_async_client()  # type: ignore
+        start_time = time.time()
+        try:
+            async with _redis_client as redis_client:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for increment_op in increment_list:
+                        pipe.eval(
+                            _INCREMENT_WITH_TTL_SCRIPT,
+                            1,
+                            self.check_and_fix_namespace(key=increment_op["key"]),
+                            increment_op["increment_value"],
+                            self._get_ttl_script_arg(
+                                self.get_ttl(ttl=increment_op["ttl"])
+                            ),
+                        )  # type: ignore
+                    results = await pipe.execute()
+
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            asyncio.create_task(
+                self.service_logger_obj.async_service_success_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    call_type="async_increment_multi",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+            return [float(result) for result in results]
+        except Exception as e:
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            asyncio.create_task(
+                self.service_logger_obj.async_service_failure_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    error=e,
+                    call_type="async_increment_multi",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+            verbose_logger.error(
+                "LiteLLM Redis Caching: async_increment_multi() - Got exception from REDIS %s",
+                str(e),
+            )
+            raise e
+
     async def flush_cache_buffer(self):
         print_verbose(
             f"flushing to redis....reached size of buffer {len(self.redis_batch_writing_buffer)}"
@@ -866,6 +966,111 @@ class RedisCache(BaseCache):
         async with _redis_client as redis_client:
             await redis_client.delete(*keys)
 
+    async def async_zadd(
+        self, key: str, mapping: dict, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Add members to a sorted set - `mapping` is {member: score}
+        """
+        _redis_client = self.init_async_client()
+        key = self.check_and_fix_namespace(key=key)
+        async with _redis_client as redis_client:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.zadd(key, mapping)
+                if ttl is not None:
+                    pipe.expire(key, timedelta(seconds=ttl))
+                await pipe.execute()
+
+    async def async_zrange(self, key: str, start: int, end: int) -> List[str]:
+        """
+        Return members of a sorted set between `start` and `end` (inclusive), lowest score first
+        """
+        _redis_client = self.init_async_client()
+        key = self.check_and_fix_namespace(key=key)
+        async with _redis_client as redis_client:
+            response = await redis_client.zrange(key, start, end)
+        return [m.decode("utf-8") if isinstance(m, bytes) else m for m in response]
+
+    async def async_zrem(self, key: str, *members: str) -> int:
+        _redis_client = self.init_async_client()
+        key = self.check_and_fix_namespace(key=key)
+        async with _redis_client as redis_client:
+            return await redis_client.zrem(key, *members)
+
+    async def async_zcard(self, key: str) -> int:
+        _redis_client = self.init_async_client()
+        key = self.check_and_fix_namespace(key=key)
+        async with _redis_client as redis_client:
+            return await redis_client.zcard(key)
+
+    async def async_acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        """
+        Set `key` to `token` only if it doesn't exist yet. Returns True if the lock was acquired.
+
+        The lock expires after `ttl` seconds, so a crashed holder can't block other instances forever.
+        """
+        _redis_client = self.init_async_client()
+        key = self.check_and_fix_namespace(key=key)
+        async with _redis_client as redis_client:
+            response = await redis_client.set(
+                name=key,
+                value=json.dumps(token),
+                nx=True,
+                px=max(int(ttl * 1000), 1),
+            )
+        return bool(response)
+
+    async def async_release_lock(self, key: str, token: str) -> bool:
+        """
+        Delete `key` only if it still holds `token` - i.e. don't release a lock that expired and was acquired by someone else.
+        """
+        _redis_client = self.init_async_client()
+        key = self.check_and_fix_namespace(key=key)
+        async with _redis_client as redis_client:
+            response = await redis_client.eval(
+                _RELEASE_LOCK_SCRIPT, 1, key, json.dumps(token)  # type: ignore
+            )
+        return bool(response)
+
+    async def async_increment_hash_pipeline(
+        self, increments: Dict[str, Dict[str, float]]
+    ) -> None:
+        """
+        Increment fields of hashes, in 1 pipeline - `increments` is {key: {field: increment}}
+        """
+        if len(increments) == 0:
+            return
+        _redis_client = self.init_async_client()
+        async with _redis_client as redis_client:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                for key, field_increments in increments.items():
+                    key = self.check_and_fix_namespace(key=key)
+                    for field, increment in field_increments.items():
+                        pipe.hincrbyfloat(key, field, increment)
+                await pipe.execute()
+
+    async def async_pop_hashes(self, keys: List[str]) -> List[Dict[str, str]]:
+        """
+        Get and delete hashes, in 1 transaction - no increments are lost between the read and the delete
+        """
+        _redis_client = self.init_async_client()
+        async with _redis_client as redis_client:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                for key in keys:
+                    key = self.check_and_fix_namespace(key=key)
+                    pipe.hgetall(key)
+                    pipe.delete(key)
+                results = await pipe.execute()
+        return [
+            {
+                (k.decode("utf-8") if isinstance(k, bytes) else k): (
+                    v.decode("utf-8") if isinstance(v, bytes) else v
+                )
+                for k, v in (hash_value or {}).items()
+            }
+            for hash_value in results[::2]
+        ]
+
     def client_list(self) -> List:
         client_list: List = self.redis_client.client_list()  # type: ignore
         return client_list
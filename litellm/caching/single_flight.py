@@ -0,0 +1,184 @@
+"""
+Single-flight (request coalescing) for cacheable LLM API calls
+
+When identical, cacheable requests arrive at the same time, they'd all miss the cache and all call the LLM API.
+
+With single-flight, only the first request (the "leader") for a cache key calls the LLM API. Concurrent requests for the same cache key wait for the leader, and are served its response as a cache hit.
+
+- In-process: requests for the same cache key share an `asyncio.Future`
+- Across instances (if the cache is a `RedisCache`): the leader holds a redis lock on the cache key. Other instances poll the cache until the leader's response is written, or the lock is released.
+
+If the leader fails or takes longer than `timeout`, waiting requests make their own LLM API call.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.caching.redis_cache import RedisCache
+
+
+class SingleFlight:
+    def __init__(
+        self,
+        timeout: float = 60.0,
+        redis_cache: Optional[RedisCache] = None,
+        redis_poll_interval: float = 0.05,
+    ):
+        """
+        timeout: max. time (seconds) a request waits for the leader, before making its own call. Also the ttl of the redis lock.
+        redis_cache: if set, requests are coalesced across instances via a redis lock.
+        redis_poll_interval: how often (seconds) other instances check the cache while the redis lock is held.
+        """
+        self.timeout = timeout
+        self.redis_cache = redis_cache
+        self.redis_poll_interval = redis_poll_interval
+        self._in_flight: Dict[str, Tuple[asyncio.Future, float]] = (
+            {}
+        )  # cache key -> (leader's future, start time)
+        self._redis_lock_tokens: Dict[str, str] = {}
+
+    @staticmethod
+    def _get_lock_key(key: str) -> str:
+        return "litellm:single_flight:{}".format(key)
+
+    def join(self, key: str) -> Optional[asyncio.Future]:
+        """
+        Returns the leader's future, if a request for `key` is already in flight.
+
+        Else the caller becomes the leader and None is returned - the caller MUST call `release(key, ...)` when done.
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            future, start_time = in_flight
+            # a leader that never released (e.g. cancelled request) is abandoned after `timeout`
+            if not future.done() and time.monotonic() - start_time < self.timeout:
+                return future
+        self._in_flight[key] = (
+            asyncio.get_running_loop().create_future(),
+            time.monotonic(),
+        )
+        return None
+
+    def is_in_flight(self, key: str) -> bool:
+        in_flight = self._in_flight.get(key)
+        return in_flight is not None and not in_flight[0].done()
+
+    async def wait(self, future: asyncio.Future) -> Optional[Any]:
+        """
+        Wait for the leader's response.
+
+        Returns a new decoded copy of the response for every waiter, or None if the leader failed / timed out.
+        """
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(future), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            return None
+        if result is None:
+            return None
+        return json.loads(result)
+
+    def release(self, key: str, result: Optional[Any] = None) -> None:
+        """
+        Wake up requests waiting on `key`.
+
+        result: the leader's response (`BaseModel`, or json serializable). None if the leader failed - waiters then make their own call.
+        """
+        in_flight = self._in_flight.pop(key, None)
+        if in_flight is None or in_flight[0].done():
+            return
+        serialized_result: Optional[str] = None
+        if result is not None:
+            try:
+                if hasattr(result, "model_dump_json"):
+                    serialized_result = result.model_dump_json()
+                else:
+                    serialized_result = json.dumps(result)
+            except Exception as e:
+                verbose_logger.debug(
+                    "LiteLLM Single Flight: unable to share response - {}".format(
+                        str(e)
+                    )
+                )
+        in_flight[0].set_result(serialized_result)
+
+    async def acquire_distributed_lock(self, key: str) -> bool:
+        """
+        Returns True if this instance should call the LLM API for `key`.
+
+        Always True if no redis cache is set. Fails open if redis is unavailable.
+        """
+        if self.redis_cache is None:
+            return True
+        token = str(uuid.uuid4())
+        try:
+            acquired = await self.redis_cache.async_acquire_lock(
+                key=self._get_lock_key(key), token=token, ttl=self.timeout
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "LiteLLM Single Flight: error acquiring redis lock - {}".format(str(e))
+            )
+            return True
+        if acquired:
+            self._redis_lock_tokens[key] = token
+        return acquired
+
+    async def release_distributed_lock(
+        self, key: str, after: Optional[Awaitable] = None
+    ) -> None:
+        """
+        Release the redis lock for `key`, once `after` (e.g. the cache write) completes.
+        """
+        token = self._redis_lock_tokens.pop(key, None)
+        if token is None or self.redis_cache is None:
+            return
+        try:
+            if after is not None:
+                await after
+        except Exception:
+            pass
+        try:
+            await self.redis_cache.async_release_lock(
+                key=self._get_lock_key(key), token=token
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "LiteLLM Single Flight: error releasing redis lock - {}".format(str(e))
+            )
+
+    async def wait_for_distributed_leader(
+        self,
+        key: str,
+        get_cached_result: Callable[[], Awaitable[Optional[Any]]],
+    ) -> Optional[Any]:
+        """
+        Poll the cache while another instance holds the lock for `key`.
+
+        Returns the cached result, or None if the lock was released / expired without a cached response.
+        """
+        if self.redis_cache is None:
+            return None
+        end_time = time.monotonic() + self.timeout
+        while time.monotonic() < end_time:
+            await asyncio.sleep(self.redis_poll_interval)
+            try:
+                cached_result = await get_cached_result()
+                if cached_result is not None:
+                    return cached_result
+                lock_value = await self.redis_cache.async_get_cache(
+                    key=self._get_lock_key(key)
+                )
+            except Exception as e:
+                verbose_logger.debug(
+                    "LiteLLM Single Flight: error polling redis - {}".format(str(e))
+                )
+                return None
+            if lock_value is None:
+                return await get_cached_result()
+        return None
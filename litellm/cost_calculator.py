@@ -18,6 +18,7 @@ from litellm.litellm_core_utils.llm_cost_calc.google import (
 from litellm.litellm_core_utils.llm_cost_calc.google import (
     cost_router as google_cost_router,
 )
+from litellm.litellm_core_utils.llm_cost_calc.cost_table import bulk_cost_per_token
 from litellm.litellm_core_utils.llm_cost_calc.utils import _generic_cost_per_character
 from litellm.llms.anthropic.cost_calculation import (
     cost_per_token as anthropic_cost_per_token,
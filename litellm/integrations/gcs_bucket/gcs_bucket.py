@@ -1,4 +1,5 @@
 import asyncio
+import gzip
 import json
 import os
 import uuid
@@ -32,6 +33,7 @@ else:
 IAM_AUTH_KEY = "IAM_AUTH"
 GCS_DEFAULT_BATCH_SIZE = 2048
 GCS_DEFAULT_FLUSH_INTERVAL_SECONDS = 20
+GCS_DEFAULT_MAX_CONCURRENT_UPLOADS = 10
 
 
 class GCSBucketLogger(GCSBucketBase):
@@ -47,6 +49,14 @@ class GCSBucketLogger(GCSBucketBase):
         self.flush_interval = int(
             os.getenv("GCS_FLUSH_INTERVAL", GCS_DEFAULT_FLUSH_INTERVAL_SECONDS)
         )
+        # bulk mode - each flush writes 1 newline-delimited json object per bucket / service account
+        self.bulk_upload = os.getenv("GCS_BULK_UPLOAD", "false").lower() == "true"
+        self.bulk_upload_gzip = (
+            os.getenv("GCS_BULK_UPLOAD_GZIP", "false").lower() == "true"
+        )
+        self.max_concurrent_uploads = int(
+            os.getenv("GCS_MAX_CONCURRENT_UPLOADS", GCS_DEFAULT_MAX_CONCURRENT_UPLOADS)
+        )
         asyncio.create_task(self.periodic_flush())
         self.flush_lock = asyncio.Lock()
         super().__init__(
@@ -123,35 +133,61 @@ class GCSBucketLogger(GCSBucketBase):
 
         Instead, we
             - collect the logs to flush every `GCS_FLUSH_INTERVAL` seconds
+            - group them by bucket + service account - the logging config and auth headers are resolved once per group
             - during async_send_batch, we make 1 POST request per log to GCS Bucket
+              (or 1 POST request per group, if `GCS_BULK_UPLOAD=true`)
+            - uploads run concurrently, at most `GCS_MAX_CONCURRENT_UPLOADS` at a time
 
         """
         if not self.log_queue:
             return
 
         try:
-            for log_item in self.log_queue:
-                logging_payload = log_item["payload"]
-                kwargs = log_item["kwargs"]
-                response_obj = log_item.get("response_obj", None) or {}
+            log_groups = await self._group_log_queue_items(self.log_queue)
+            semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
 
-                gcs_logging_config: GCSLoggingConfig = (
-                    await self.get_gcs_logging_config(kwargs)
-                )
+            async def _upload(coro):
+                async with semaphore:
+                    await coro
+
+            uploads = []
+            for gcs_logging_config, log_items in log_groups:
                 headers = await self.construct_request_headers(
                     vertex_instance=gcs_logging_config["vertex_instance"],
                     service_account_json=gcs_logging_config["path_service_account"],
                 )
                 bucket_name = gcs_logging_config["bucket_name"]
-                object_name = self._get_object_name(
-                    kwargs, logging_payload, response_obj
-                )
-                await self._log_json_data_on_gcs(
-                    headers=headers,
-                    bucket_name=bucket_name,
-                    object_name=object_name,
-                    logging_payload=logging_payload,
-                )
+                if self.bulk_upload:
+                    uploads.append(
+                        self._log_bulk_data_on_gcs(
+                            headers=headers,
+                            bucket_name=bucket_name,
+                            log_items=log_items,
+                        )
+                    )
+                    continue
+                for log_item in log_items:
+                    response_obj = log_item.get("response_obj", None) or {}
+                    object_name = self._get_object_name(
+                        log_item["kwargs"], log_item["payload"], response_obj
+                    )
+                    uploads.append(
+                        self._log_json_data_on_gcs(
+                            headers=headers,
+                            bucket_name=bucket_name,
+                            object_name=object_name,
+                            logging_payload=log_item["payload"],
+                        )
+                    )
+
+            results = await asyncio.gather(
+                *[_upload(upload) for upload in uploads], return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    verbose_logger.exception(
+                        f"GCS Bucket batch logging error: {str(result)}"
+                    )
 
             # Clear the queue after processing
             self.log_queue.clear()
@@ -159,6 +195,42 @@ class GCSBucketLogger(GCSBucketBase):
         except Exception as e:
             verbose_logger.exception(f"GCS Bucket batch logging error: {str(e)}")
 
+    async def _group_log_queue_items(
+        self, log_queue: List[GCSLogQueueItem]
+    ) -> List[Tuple[GCSLoggingConfig, List[GCSLogQueueItem]]]:
+        """
+        Group queued logs by the bucket + service account they're logged to, preserving order
+        """
+        log_groups: Dict[
+            Tuple[str, Optional[str]], Tuple[GCSLoggingConfig, List[GCSLogQueueItem]]
+        ] = {}
+        # logs with the same dynamic params share a logging config
+        logging_configs: Dict[Tuple[Optional[str], Optional[str]], GCSLoggingConfig] = (
+            {}
+        )
+        for log_item in log_queue:
+            kwargs = log_item["kwargs"]
+            standard_callback_dynamic_params = (
+                kwargs.get("standard_callback_dynamic_params", None) or {}
+            )
+            dynamic_params_key = (
+                standard_callback_dynamic_params.get("gcs_bucket_name", None),
+                standard_callback_dynamic_params.get("gcs_path_service_account", None),
+            )
+            gcs_logging_config = logging_configs.get(dynamic_params_key)
+            if gcs_logging_config is None:
+                gcs_logging_config = await self.get_gcs_logging_config(kwargs)
+                logging_configs[dynamic_params_key] = gcs_logging_config
+
+            group_key = (
+                gcs_logging_config["bucket_name"],
+                gcs_logging_config["path_service_account"],
+            )
+            if group_key not in log_groups:
+                log_groups[group_key] = (gcs_logging_config, [])
+            log_groups[group_key][1].append(log_item)
+        return list(log_groups.values())
+
     def _get_object_name(
         self, kwargs: Dict, logging_payload: StandardLoggingPayload, response_obj: Any
     ) -> str:
@@ -212,6 +284,56 @@ class GCSBucketLogger(GCSBucketBase):
         """
         json_logged_payload = json.dumps(logging_payload, default=str)
 
+        await self._upload_object_to_gcs(
+            headers=headers,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            data=json_logged_payload,
+        )
+
+    async def _log_bulk_data_on_gcs(
+        self,
+        headers: Dict[str, str],
+        bucket_name: str,
+        log_items: List[GCSLogQueueItem],
+    ):
+        """
+        Write the logs as 1 newline-delimited json object (gzipped if `GCS_BULK_UPLOAD_GZIP=true`)
+        """
+        ndjson_logged_payload = "\n".join(
+            json.dumps(log_item["payload"], default=str) for log_item in log_items
+        )
+        object_name = self._get_bulk_object_name()
+        data: Union[str, bytes] = ndjson_logged_payload
+        content_type = "application/x-ndjson"
+        if self.bulk_upload_gzip:
+            data = gzip.compress(ndjson_logged_payload.encode("utf-8"))
+            content_type = "application/gzip"
+
+        await self._upload_object_to_gcs(
+            headers={**headers, "Content-Type": content_type},
+            bucket_name=bucket_name,
+            object_name=object_name,
+            data=data,
+        )
+
+    def _get_bulk_object_name(self) -> str:
+        """
+        Get the object name to use for a batch of logs
+        """
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        object_name = f"{current_date}/batch-{uuid.uuid4().hex}.ndjson"
+        if self.bulk_upload_gzip:
+            object_name += ".gz"
+        return object_name
+
+    async def _upload_object_to_gcs(
+        self,
+        headers: Dict[str, str],
+        bucket_name: str,
+        object_name: str,
+        data: Union[str, bytes],
+    ):
         bucket_name, object_name = self._handle_folders_in_bucket_name(
             bucket_name=bucket_name,
             object_name=object_name,
@@ -220,7 +342,7 @@ class GCSBucketLogger(GCSBucketBase):
         response = await self.async_httpx_client.post(
             headers=headers,
             url=f"https://storage.googleapis.com/upload/storage/v1/b/{bucket_name}/o?uploadType=media&name={object_name}",
-            data=json_logged_payload,
+            data=data,  # type: ignore
         )
 
         if response.status_code != 200:
@@ -1,20 +1,39 @@
 #### What this does ####
-#    On success + failure, log events to Supabase
+#    On success + failure, log events to s3
+#
+#    Logs are queued in-memory and uploaded by a background flush loop - never on the request path
+#    - `s3_log_format="json"` (default) - 1 object per log, at `<s3_path>/<date>/<logging id>.json`
+#    - `s3_log_format="ndjson" | "ndjson.gz" | "parquet"` - each flush writes 1 object per hour the logs were
+#      started in (at most `s3_batch_size` logs each), at `<s3_path>/<date>/<hour>/batch-<uuid>.<format>`
+#    - uploads run concurrently (at most `s3_max_concurrent_uploads` at a time), and are retried
 
-import datetime
-import os
-import subprocess
-import sys
-import traceback
+import asyncio
+import atexit
+import gzip
+import io
+import json
+import threading
+import time
 import uuid
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
+from litellm.integrations.custom_batch_logger import CustomBatchLogger
+from litellm.litellm_core_utils.asyncify import asyncify
+from litellm.types.integrations.s3 import S3LogFormat, S3LogQueueItem, S3UploadObject
 from litellm.types.utils import StandardLoggingPayload
 
+S3_LOG_FORMATS = ("json", "ndjson", "ndjson.gz", "parquet")
+S3_DEFAULT_BATCH_SIZE = 512
+S3_DEFAULT_FLUSH_INTERVAL_SECONDS = 10
+S3_DEFAULT_MAX_CONCURRENT_UPLOADS = 10
+S3_UPLOAD_ATTEMPTS = 3
+S3_UPLOAD_RETRY_BACKOFF_SECONDS = 0.5  # doubled on every retry
+S3_EXIT_FLUSH_WAIT_SECONDS = 5  # max. time to wait for a running flush, at exit
 
-class S3Logger:
+
+class S3Logger(CustomBatchLogger):
     # Class variables or attributes
     def __init__(
         self,
@@ -29,6 +48,10 @@ class S3Logger:
         s3_aws_secret_access_key=None,
         s3_aws_session_token=None,
         s3_config=None,
+        s3_log_format: S3LogFormat = "json",
+        s3_batch_size: Optional[int] = None,
+        s3_flush_interval: Optional[int] = None,
+        s3_max_concurrent_uploads: Optional[int] = None,
         **kwargs,
     ):
         import boto3
@@ -61,10 +84,38 @@ class S3Logger:
                 )
                 s3_config = litellm.s3_callback_params.get("s3_config")
                 s3_path = litellm.s3_callback_params.get("s3_path")
+                s3_log_format = litellm.s3_callback_params.get(
+                    "s3_log_format", s3_log_format
+                )
+                s3_batch_size = litellm.s3_callback_params.get(
+                    "s3_batch_size", s3_batch_size
+                )
+                s3_flush_interval = litellm.s3_callback_params.get(
+                    "s3_flush_interval", s3_flush_interval
+                )
+                s3_max_concurrent_uploads = litellm.s3_callback_params.get(
+                    "s3_max_concurrent_uploads", s3_max_concurrent_uploads
+                )
                 # done reading litellm.s3_callback_params
 
+            if s3_log_format not in S3_LOG_FORMATS:
+                raise ValueError(
+                    f"Invalid s3_log_format={s3_log_format}. Supported formats = {S3_LOG_FORMATS}"
+                )
+            if s3_log_format == "parquet":
+                try:
+                    import pyarrow  # noqa: F401
+                except ImportError:
+                    raise ImportError(
+                        "Missing pyarrow, required for s3_log_format='parquet'. Run `pip install pyarrow`"
+                    )
+
             self.bucket_name = s3_bucket_name
             self.s3_path = s3_path
+            self.s3_log_format: S3LogFormat = s3_log_format
+            self.max_concurrent_uploads = int(
+                s3_max_concurrent_uploads or S3_DEFAULT_MAX_CONCURRENT_UPLOADS
+            )
             verbose_logger.debug(f"s3 logger using endpoint url {s3_endpoint_url}")
             # Create an S3 client with custom endpoint URL
             self.s3_client = boto3.client(
@@ -84,6 +135,19 @@ class S3Logger:
             print_verbose(f"Got exception on init s3 client {str(e)}")
             raise e
 
+        super().__init__(
+            batch_size=int(s3_batch_size or S3_DEFAULT_BATCH_SIZE),
+            flush_interval=int(s3_flush_interval or S3_DEFAULT_FLUSH_INTERVAL_SECONDS),
+        )
+        self.log_queue: List[S3LogQueueItem] = []
+        # logs are queued from the logging threads + event loops, flushed on `_flush_loop`
+        self._log_queue_lock = threading.Lock()
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._upload_limiter: Optional[Any] = None
+
+    #### LOGGING ####
     async def _async_log_event(
         self, kwargs, response_obj, start_time, end_time, print_verbose
     ):
@@ -94,32 +158,6 @@ class S3Logger:
             verbose_logger.debug(
                 f"s3 Logging - Enters logging function for model {kwargs}"
             )
-
-            # construct payload to send to s3
-            # follows the same params as langfuse.py
-            litellm_params = kwargs.get("litellm_params", {})
-            metadata = (
-                litellm_params.get("metadata", {}) or {}
-            )  # if litellm_params['metadata'] == None
-
-            # Clean Metadata before logging - never log raw metadata
-            # the raw metadata can contain circular references which leads to infinite recursion
-            # we clean out all extra litellm metadata params before logging
-            clean_metadata = {}
-            if isinstance(metadata, dict):
-                for key, value in metadata.items():
-                    # clean litellm metadata before logging
-                    if key in [
-                        "headers",
-                        "endpoint",
-                        "caching_groups",
-                        "previous_models",
-                    ]:
-                        continue
-                    else:
-                        clean_metadata[key] = value
-
-            # Ensure everything in the payload is converted to str
             payload: Optional[StandardLoggingPayload] = kwargs.get(
                 "standard_logging_object", None
             )
@@ -127,43 +165,303 @@ class S3Logger:
             if payload is None:
                 return
 
-            s3_file_name = litellm.utils.get_logging_id(start_time, payload) or ""
-            s3_object_key = (
-                (self.s3_path.rstrip("/") + "/" if self.s3_path else "")
-                + start_time.strftime("%Y-%m-%d")
-                + "/"
-                + s3_file_name
-            )  # we need the s3 key to include the time, so we log cache hits too
-            s3_object_key += ".json"
-
-            s3_object_download_filename = (
-                "time-"
-                + start_time.strftime("%Y-%m-%dT%H-%M-%S-%f")
-                + "_"
-                + payload["id"]
-                + ".json"
+            # Add to logging queue - this will be flushed periodically
+            self._add_to_log_queue(
+                S3LogQueueItem(payload=payload, start_time=start_time)
             )
+        except Exception as e:
+            verbose_logger.exception(f"s3 Layer Error - {str(e)}")
+            pass
 
-            import json
+    def _add_to_log_queue(self, log_item: S3LogQueueItem):
+        with self._log_queue_lock:
+            self.log_queue.append(log_item)
+            queue_size = len(self.log_queue)
+        flush_loop = self._get_flush_loop()
+        if queue_size >= self.batch_size:
+            flush_loop.call_soon_threadsafe(self._start_flush)
 
-            payload_str = json.dumps(payload)
+    #### FLUSHING ####
+    def _get_flush_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Event loop the queue is flushed on - runs in a daemon thread, started on the first log.
 
-            print_verbose(f"\ns3 Logger - Logging payload = {payload_str}")
+        Logs are queued from sync (logging thread) + async code, so flushing can't rely on the caller's event loop.
+        """
+        if self._flush_loop is not None:
+            return self._flush_loop
+        with self._log_queue_lock:
+            if self._flush_loop is None:
+                flush_loop = asyncio.new_event_loop()
+                self._flush_thread = threading.Thread(
+                    target=self._run_flush_loop,
+                    args=(flush_loop,),
+                    name="litellm-s3-logger",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+                atexit.register(self._flush_on_exit)
+                self._flush_loop = flush_loop
+        return self._flush_loop
 
-            response = self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_object_key,
-                Body=payload_str,
-                ContentType="application/json",
-                ContentLanguage="en",
-                ContentDisposition=f'inline; filename="{s3_object_download_filename}"',
-                CacheControl="private, immutable, max-age=31536000, s-maxage=0",
+    def _run_flush_loop(self, flush_loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(flush_loop)
+        flush_loop.create_task(self.periodic_flush())
+        try:
+            flush_loop.run_forever()
+        finally:
+            # stopped by `stop_flush_loop`
+            tasks = asyncio.all_tasks(flush_loop)
+            for task in tasks:
+                task.cancel()
+            flush_loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True)
             )
+            flush_loop.close()
+
+    def stop_flush_loop(self):
+        """
+        Stop the flush loop and its thread, without flushing - e.g. when discarding the logger
+        """
+        atexit.unregister(self._flush_on_exit)
+        with self._log_queue_lock:
+            flush_loop, self._flush_loop = self._flush_loop, None
+            flush_thread, self._flush_thread = self._flush_thread, None
+        if flush_loop is None:
+            return
+        flush_loop.call_soon_threadsafe(flush_loop.stop)
+        if flush_thread is not None:
+            flush_thread.join(timeout=S3_EXIT_FLUSH_WAIT_SECONDS)
+
+    def _start_flush(self):
+        """
+        Start flushing the queue, unless a flush is running. Call on `_flush_loop`.
+        """
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush_queue())
+
+    async def flush_queue(self):
+        if self.flush_lock is None:
+            self.flush_lock = asyncio.Lock()
+
+        async with self.flush_lock:
+            # swap the queue - logs queued while uploading go to the next flush
+            with self._log_queue_lock:
+                log_queue, self.log_queue = self.log_queue, []
+            if log_queue:
+                verbose_logger.debug(
+                    "s3 Logger: Flushing batch of %s events", len(log_queue)
+                )
+                await self.async_send_batch(log_queue)
+            self.last_flush_time = time.time()
+
+    async def _wait_for_flush_task(self):
+        flush_task = self._flush_task
+        if flush_task is not None and not flush_task.done():
+            await asyncio.wait({flush_task})
+
+    def _flush_on_exit(self):
+        """
+        Upload the queued logs when the process exits - sequentially, as worker threads can't be started anymore
+
+        A flush already running on `_flush_loop` holds logs swapped out of the queue - give it `S3_EXIT_FLUSH_WAIT_SECONDS` to finish first.
+        """
+        flush_loop = self._flush_loop
+        if flush_loop is not None and flush_loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._wait_for_flush_task(), flush_loop
+                ).result(timeout=S3_EXIT_FLUSH_WAIT_SECONDS)
+            except Exception as e:
+                verbose_logger.error(
+                    "s3 Layer Error - running flush did not finish at exit - %s",
+                    str(e),
+                )
+        with self._log_queue_lock:
+            log_queue, self.log_queue = self.log_queue, []
+        for upload in self._get_s3_upload_objects(log_queue):
+            try:
+                self._upload_to_s3(upload)
+            except Exception as e:
+                verbose_logger.error(
+                    "s3 Layer Error - failed to upload %s - %s", upload["key"], str(e)
+                )
+
+    async def async_send_batch(self, log_queue: Optional[List[S3LogQueueItem]] = None):
+        """
+        Upload the logs to s3 - concurrently, at most `max_concurrent_uploads` at a time
+        """
+        if log_queue is None:
+            with self._log_queue_lock:
+                log_queue, self.log_queue = self.log_queue, []
+        if not log_queue:
+            return
 
-            print_verbose(f"Response from s3:{str(response)}")
+        try:
+            import anyio
 
-            print_verbose(f"s3 Layer Logging - final response object: {response_obj}")
-            return response
+            if self._upload_limiter is None:
+                self._upload_limiter = anyio.CapacityLimiter(
+                    self.max_concurrent_uploads
+                )
+            uploads = self._get_s3_upload_objects(log_queue)
+            results = await asyncio.gather(
+                *[
+                    asyncify(self._upload_to_s3, limiter=self._upload_limiter)(upload)
+                    for upload in uploads
+                ],
+                return_exceptions=True,
+            )
+            for upload, result in zip(uploads, results):
+                if isinstance(result, Exception):
+                    verbose_logger.error(
+                        "s3 Layer Error - failed to upload %s - %s",
+                        upload["key"],
+                        str(result),
+                    )
         except Exception as e:
             verbose_logger.exception(f"s3 Layer Error - {str(e)}")
-            pass
+
+    def _upload_to_s3(self, upload: S3UploadObject):
+        """
+        Blocking upload, retried with exponential backoff - runs in a worker thread
+        """
+        extra_args: Dict[str, Any] = {}
+        if upload["content_disposition"] is not None:
+            extra_args["ContentDisposition"] = upload["content_disposition"]
+        for attempt in range(S3_UPLOAD_ATTEMPTS):
+            try:
+                response = self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=upload["key"],
+                    Body=upload["body"],
+                    ContentType=upload["content_type"],
+                    ContentLanguage="en",
+                    CacheControl="private, immutable, max-age=31536000, s-maxage=0",
+                    **extra_args,
+                )
+                print_verbose(f"Response from s3:{str(response)}")
+                return response
+            except Exception as e:
+                if attempt == S3_UPLOAD_ATTEMPTS - 1:
+                    raise e
+                verbose_logger.debug(
+                    "s3 Logger: upload of %s failed, retrying - %s",
+                    upload["key"],
+                    str(e),
+                )
+                time.sleep(S3_UPLOAD_RETRY_BACKOFF_SECONDS * 2**attempt)
+
+    #### OBJECTS ####
+    def _get_s3_key_prefix(self) -> str:
+        return self.s3_path.rstrip("/") + "/" if self.s3_path else ""
+
+    def _get_s3_upload_objects(
+        self, log_queue: List[S3LogQueueItem]
+    ) -> List[S3UploadObject]:
+        if self.s3_log_format == "json":
+            return [self._get_json_upload_object(log_item) for log_item in log_queue]
+
+        # 1 object per hour the logs were started in, of at most `batch_size` logs
+        partitions: Dict[str, List[S3LogQueueItem]] = {}
+        for log_item in log_queue:
+            partition = log_item["start_time"].strftime("%Y-%m-%d/%H")
+            partitions.setdefault(partition, []).append(log_item)
+
+        uploads: List[S3UploadObject] = []
+        for partition, log_items in partitions.items():
+            for i in range(0, len(log_items), self.batch_size):
+                uploads.append(
+                    self._get_batch_upload_object(
+                        partition=partition,
+                        log_items=log_items[i : i + self.batch_size],
+                    )
+                )
+        return uploads
+
+    def _get_json_upload_object(self, log_item: S3LogQueueItem) -> S3UploadObject:
+        payload = log_item["payload"]
+        start_time = log_item["start_time"]
+
+        s3_file_name = litellm.utils.get_logging_id(start_time, payload) or ""
+        s3_object_key = (
+            self._get_s3_key_prefix()
+            + start_time.strftime("%Y-%m-%d")
+            + "/"
+            + s3_file_name
+        )  # we need the s3 key to include the time, so we log cache hits too
+        s3_object_key += ".json"
+
+        s3_object_download_filename = (
+            "time-"
+            + start_time.strftime("%Y-%m-%dT%H-%M-%S-%f")
+            + "_"
+            + payload["id"]
+            + ".json"
+        )
+
+        payload_str = json.dumps(payload)
+        print_verbose(f"\ns3 Logger - Logging payload = {payload_str}")
+
+        return S3UploadObject(
+            key=s3_object_key,
+            body=payload_str,
+            content_type="application/json",
+            content_disposition=f'inline; filename="{s3_object_download_filename}"',
+        )
+
+    def _get_batch_upload_object(
+        self, partition: str, log_items: List[S3LogQueueItem]
+    ) -> S3UploadObject:
+        s3_object_key = (
+            f"{self._get_s3_key_prefix()}{partition}/batch-{uuid.uuid4().hex}"
+            f".{self.s3_log_format}"
+        )
+        payloads = [log_item["payload"] for log_item in log_items]
+
+        if self.s3_log_format == "parquet":
+            return S3UploadObject(
+                key=s3_object_key,
+                body=_get_parquet_body(payloads),
+                content_type="application/vnd.apache.parquet",
+                content_disposition=None,
+            )
+
+        ndjson_body = "".join(
+            json.dumps(payload, default=str) + "\n" for payload in payloads
+        )
+        if self.s3_log_format == "ndjson.gz":
+            return S3UploadObject(
+                key=s3_object_key,
+                body=gzip.compress(ndjson_body.encode("utf-8")),
+                content_type="application/gzip",
+                content_disposition=None,
+            )
+        return S3UploadObject(
+            key=s3_object_key,
+            body=ndjson_body,
+            content_type="application/x-ndjson",
+            content_disposition=None,
+        )
+
+
+def _get_parquet_body(payloads: List[StandardLoggingPayload]) -> bytes:
+    """
+    1 row per payload. Nested fields (messages, response, metadata, ...) are stored as json strings.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = []
+    for payload in payloads:
+        row = {}
+        for key, value in payload.items():
+            if value is None or isinstance(value, (str, bool, int, float)):
+                row[key] = value
+            else:
+                row[key] = json.dumps(value, default=str)
+        rows.append(row)
+
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pylist(rows), buffer)
+    return buffer.getvalue()
@@ -4,6 +4,7 @@ import httpx
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.model_registry import GLOBAL_MODEL_REGISTRY
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 from ..types.router import LiteLLM_Params
@@ -12,9 +13,10 @@ from ..types.router import LiteLLM_Params
 def _is_non_openai_azure_model(model: str) -> bool:
     try:
         model_name = model.split("/", 1)[1]
-        if (
-            model_name in litellm.cohere_chat_models
-            or f"mistral/{model_name}" in litellm.mistral_chat_models
+        if GLOBAL_MODEL_REGISTRY.contains(
+            model_name, "cohere_chat_models"
+        ) or GLOBAL_MODEL_REGISTRY.contains(
+            f"mistral/{model_name}", "mistral_chat_models"
         ):
             return True
     except Exception:
@@ -37,7 +39,9 @@ def handle_cohere_chat_model_custom_llm_provider(
     """
 
     if custom_llm_provider:
-        if custom_llm_provider == "cohere" and model in litellm.cohere_chat_models:
+        if custom_llm_provider == "cohere" and GLOBAL_MODEL_REGISTRY.contains(
+            model, "cohere_chat_models"
+        ):
             return model, "cohere_chat"
 
     if "/" in model:
@@ -45,14 +49,14 @@ def handle_cohere_chat_model_custom_llm_provider(
         if (
             _custom_llm_provider
             and _custom_llm_provider == "cohere"
-            and _model in litellm.cohere_chat_models
+            and GLOBAL_MODEL_REGISTRY.contains(_model, "cohere_chat_models")
         ):
             return _model, "cohere_chat"
 
     return model, custom_llm_provider
 
 
-def get_llm_provider(  # noqa: PLR0915
+def get_llm_provider(
     model: str,
     custom_llm_provider: Optional[str] = None,
     api_base: Optional[str] = None,
@@ -67,6 +71,47 @@ def get_llm_provider(  # noqa: PLR0915
     Raises Error - if unable to map model to a provider
 
     Return model, custom_llm_provider, dynamic_api_key, api_base
+
+    Results are memoized by (model, custom_llm_provider, api_base) - except for calls with an api_key / litellm_params,
+    and results which read api keys / api bases from the environment.
+    """
+    cache_key: Optional[tuple] = None
+    if (
+        api_key is None
+        and litellm_params is None
+        and isinstance(model, str)
+        and isinstance(custom_llm_provider, (str, type(None)))
+        and isinstance(api_base, (str, type(None)))
+    ):
+        cache_key = (model, custom_llm_provider, api_base)
+        cached_result = GLOBAL_MODEL_REGISTRY.get_cached_llm_provider(cache_key)
+        if cached_result is not None:
+            return cached_result
+    generation = GLOBAL_MODEL_REGISTRY.generation
+
+    result, cacheable = _get_llm_provider(
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+        api_base=api_base,
+        api_key=api_key,
+        litellm_params=litellm_params,
+    )
+    if cache_key is not None and cacheable:
+        GLOBAL_MODEL_REGISTRY.set_cached_llm_provider(
+            key=cache_key, value=result, generation=generation
+        )
+    return result
+
+
+def _get_llm_provider(  # noqa: PLR0915
+    model: str,
+    custom_llm_provider: Optional[str] = None,
+    api_base: Optional[str] = None,
+    api_key: Optional[str] = None,
+    litellm_params: Optional[LiteLLM_Params] = None,
+) -> Tuple[Tuple[str, str, Optional[str], Optional[str]], bool]:
+    """
+    Returns ((model, custom_llm_provider, dynamic_api_key, api_base), True if the result can be memoized)
     """
     try:
         ## IF LITELLM PARAMS GIVEN ##
@@ -85,7 +130,7 @@ def get_llm_provider(  # noqa: PLR0915
         if model.split("/", 1)[0] == "azure":
             if _is_non_openai_azure_model(model):
                 custom_llm_provider = "openai"
-                return model, custom_llm_provider, dynamic_api_key, api_base
+                return (model, custom_llm_provider, dynamic_api_key, api_base), True
 
         ### Handle cases when custom_llm_provider is set to cohere/command-r-plus but it should use cohere_chat route
         model, custom_llm_provider = handle_cohere_chat_model_custom_llm_provider(
@@ -98,24 +143,28 @@ def get_llm_provider(  # noqa: PLR0915
             ):  # handle scenario where model="azure/*" and custom_llm_provider="azure"
                 model = model.replace("{}/".format(custom_llm_provider), "")
 
-            return model, custom_llm_provider, dynamic_api_key, api_base
+            return (model, custom_llm_provider, dynamic_api_key, api_base), True
 
         if api_key and api_key.startswith("os.environ/"):
             dynamic_api_key = get_secret_str(api_key)
         # check if llm provider part of model name
+        model_prefix = model.split("/", 1)[0]
         if (
-            model.split("/", 1)[0] in litellm.provider_list
-            and model.split("/", 1)[0] not in litellm.model_list
+            GLOBAL_MODEL_REGISTRY.contains(model_prefix, "provider_list")
+            and not GLOBAL_MODEL_REGISTRY.contains(model_prefix, "model_list")
             and len(model.split("/"))
             > 1  # handle edge case where user passes in `litellm --model mistral` https://github.com/BerriAI/litellm/issues/1351
         ):
-            return _get_openai_compatible_provider_info(
-                model=model,
-                api_base=api_base,
-                api_key=api_key,
-                dynamic_api_key=dynamic_api_key,
+            return (
+                _get_openai_compatible_provider_info(
+                    model=model,
+                    api_base=api_base,
+                    api_key=api_key,
+                    dynamic_api_key=dynamic_api_key,
+                ),
+                model_prefix in _PROVIDERS_WITHOUT_ENV_DEFAULTS,
             )
-        elif model.split("/", 1)[0] in litellm.provider_list:
+        elif GLOBAL_MODEL_REGISTRY.contains(model_prefix, "provider_list"):
             custom_llm_provider = model.split("/", 1)[0]
             model = model.split("/", 1)[1]
             if api_base is not None and not isinstance(api_base, str):
@@ -128,7 +177,7 @@ def get_llm_provider(  # noqa: PLR0915
                         dynamic_api_key
                     )
                 )
-            return model, custom_llm_provider, dynamic_api_key, api_base
+            return (model, custom_llm_provider, dynamic_api_key, api_base), True
         # check if api base is a known openai compatible endpoint
         if api_base:
             for endpoint in litellm.openai_compatible_endpoints:
@@ -192,59 +241,37 @@ def get_llm_provider(  # noqa: PLR0915
                                 dynamic_api_key
                             )
                         )
-                    return model, custom_llm_provider, dynamic_api_key, api_base  # type: ignore
+                    # api key read from the environment - not memoized
+                    return (model, custom_llm_provider, dynamic_api_key, api_base), False  # type: ignore
 
         # check if model in known model provider list  -> for huggingface models, raise exception as they don't have a fixed provider (can be togetherai, anyscale, baseten, runpod, et.)
+        cacheable = True
+        known_provider = GLOBAL_MODEL_REGISTRY.get_model_provider(model)
         ## openai - chatcompletion + text completion
         if (
-            model in litellm.open_ai_chat_completion_models
+            known_provider == "openai"
             or "ft:gpt-3.5-turbo" in model
             or "ft:gpt-4" in model  # catches ft:gpt-4-0613, ft:gpt-4o
-            or model in litellm.openai_image_generation_models
         ):
             custom_llm_provider = "openai"
-        elif model in litellm.open_ai_text_completion_models:
-            custom_llm_provider = "text-completion-openai"
-        ## anthropic
-        elif model in litellm.anthropic_models:
-            custom_llm_provider = "anthropic"
-        ## cohere
-        elif model in litellm.cohere_models or model in litellm.cohere_embedding_models:
-            custom_llm_provider = "cohere"
-        ## cohere chat models
-        elif model in litellm.cohere_chat_models:
-            custom_llm_provider = "cohere_chat"
+        ## text-completion-openai, anthropic, cohere, cohere chat models
+        elif known_provider in (
+            "text-completion-openai",
+            "anthropic",
+            "cohere",
+            "cohere_chat",
+        ):
+            custom_llm_provider = known_provider
         ## replicate
-        elif model in litellm.replicate_models or (":" in model and len(model) > 64):
+        elif known_provider == "replicate" or (":" in model and len(model) > 64):
             model_parts = model.split(":")
             if (
                 len(model_parts) > 1 and len(model_parts[1]) == 64
             ):  ## checks if model name has a 64 digit code - e.g. "meta/llama-2-70b-chat:02e509c789964a7ea8736978a43525956ef40397be9033abf9fd2badfe68c9e3"
                 custom_llm_provider = "replicate"
-            elif model in litellm.replicate_models:
+            elif known_provider == "replicate":
                 custom_llm_provider = "replicate"
-        ## openrouter
-        elif model in litellm.openrouter_models:
-            custom_llm_provider = "openrouter"
-        ## maritalk
-        elif model in litellm.maritalk_models:
-            custom_llm_provider = "maritalk"
-        ## vertex - text + chat + language (gemini) models
-        elif (
-            model in litellm.vertex_chat_models
-            or model in litellm.vertex_code_chat_models
-            or model in litellm.vertex_text_models
-            or model in litellm.vertex_code_text_models
-            or model in litellm.vertex_language_models
-            or model in litellm.vertex_embedding_models
-            or model in litellm.vertex_vision_models
-            or model in litellm.vertex_ai_image_models
-        ):
-            custom_llm_provider = "vertex_ai"
-        ## ai21
-        elif model in litellm.ai21_models:
-            custom_llm_provider = "ai21"
-        elif model in litellm.ai21_chat_models:
+        elif known_provider == "ai21_chat":
             custom_llm_provider = "ai21_chat"
             api_base = (
                 api_base
@@ -252,30 +279,11 @@ def get_llm_provider(  # noqa: PLR0915
                 or "https://api.ai21.com/studio/v1"
             )  # type: ignore
             dynamic_api_key = api_key or get_secret("AI21_API_KEY")
-        ## aleph_alpha
-        elif model in litellm.aleph_alpha_models:
-            custom_llm_provider = "aleph_alpha"
-        ## baseten
-        elif model in litellm.baseten_models:
-            custom_llm_provider = "baseten"
-        ## nlp_cloud
-        elif model in litellm.nlp_cloud_models:
-            custom_llm_provider = "nlp_cloud"
-        ## petals
-        elif model in litellm.petals_models:
-            custom_llm_provider = "petals"
-        ## bedrock
-        elif (
-            model in litellm.bedrock_models or model in litellm.bedrock_embedding_models
-        ):
-            custom_llm_provider = "bedrock"
-        elif model in litellm.watsonx_models:
-            custom_llm_provider = "watsonx"
-        # openai embeddings
-        elif model in litellm.open_ai_embedding_models:
-            custom_llm_provider = "openai"
-        elif model in litellm.empower_models:
-            custom_llm_provider = "empower"
+            cacheable = False
+        ## openrouter, maritalk, vertex, ai21, aleph_alpha, baseten, nlp_cloud, petals, bedrock, watsonx, openai embeddings, empower
+        ## - see `MODEL_PROVIDER_LISTS` for the order the model lists are checked in
+        elif known_provider is not None:
+            custom_llm_provider = known_provider
         elif model == "*":
             custom_llm_provider = "openai"
         if not custom_llm_provider:
@@ -307,7 +315,7 @@ def get_llm_provider(  # noqa: PLR0915
                     dynamic_api_key
                 )
             )
-        return model, custom_llm_provider, dynamic_api_key, api_base
+        return (model, custom_llm_provider, dynamic_api_key, api_base), cacheable
     except Exception as e:
         if isinstance(e, litellm.exceptions.BadRequestError):
             raise e
@@ -327,6 +335,50 @@ def get_llm_provider(  # noqa: PLR0915
             )
 
 
+# providers `_get_openai_compatible_provider_info` returns as-is - no api base / api key read from the environment
+_PROVIDERS_WITHOUT_ENV_DEFAULTS = frozenset(
+    [
+        "openai",
+        "openai_like",
+        "custom_openai",
+        "text-completion-openai",
+        "cohere",
+        "cohere_chat",
+        "clarifai",
+        "anthropic",
+        "replicate",
+        "huggingface",
+        "openrouter",
+        "vertex_ai",
+        "vertex_ai_beta",
+        "palm",
+        "gemini",
+        "baseten",
+        "azure",
+        "azure_text",
+        "sagemaker",
+        "sagemaker_chat",
+        "bedrock",
+        "vllm",
+        "nlp_cloud",
+        "petals",
+        "oobabooga",
+        "ollama",
+        "ollama_chat",
+        "maritalk",
+        "cloudflare",
+        "xinference",
+        "watsonx",
+        "watsonx_text",
+        "triton",
+        "predibase",
+        "databricks",
+        "text-completion-codestral",
+        "custom",
+    ]
+)
+
+
 def _get_openai_compatible_provider_info(  # noqa: PLR0915
     model: str,
     api_base: Optional[str],
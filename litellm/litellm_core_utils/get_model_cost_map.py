@@ -0,0 +1,236 @@
+"""
+Loads the model cost map (`litellm.model_cost`).
+
+On `import litellm`, the model cost map is loaded without blocking on the network:
+1. the on-disk cache of the remote map, if it was refreshed within `LITELLM_MODEL_COST_MAP_CACHE_TTL` seconds (default 3600)
+2. otherwise the on-disk cache / the backup map shipped with litellm, while the remote map is fetched in a background thread
+
+The remote map is fetched with the ETag of the cached copy (`If-None-Match`) - an unchanged map isn't downloaded again.
+
+- `LITELLM_LOCAL_MODEL_COST_MAP=True` - only use the backup map, never fetch the remote map
+- `LITELLM_MODEL_COST_MAP_CACHE_DIR` - directory for the on-disk cache. Defaults to `$XDG_CACHE_HOME/litellm` / `~/.cache/litellm`
+"""
+
+import hashlib
+import importlib.resources
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Optional, Tuple
+
+import httpx
+
+from litellm._logging import verbose_logger
+
+DEFAULT_MODEL_COST_MAP_CACHE_TTL = 3600  # seconds
+MODEL_COST_MAP_FETCH_TIMEOUT = 5  # seconds
+
+
+def _use_local_model_cost_map() -> bool:
+    return os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", "") == "True"
+
+
+def get_backup_model_cost_map() -> dict:
+    with importlib.resources.open_text(
+        "litellm", "model_prices_and_context_window_backup.json"
+    ) as f:
+        content = json.load(f)
+        return content
+
+
+def _get_cache_ttl() -> float:
+    try:
+        return float(
+            os.getenv(
+                "LITELLM_MODEL_COST_MAP_CACHE_TTL", DEFAULT_MODEL_COST_MAP_CACHE_TTL
+            )
+        )
+    except ValueError:
+        return DEFAULT_MODEL_COST_MAP_CACHE_TTL
+
+
+def _get_cache_file_path(url: str) -> str:
+    cache_dir = os.getenv("LITELLM_MODEL_COST_MAP_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "litellm",
+        )
+    url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, "model_cost_map_{}.json".format(url_hash))
+
+
+def _read_cached_model_cost_map(
+    url: str,
+) -> Tuple[Optional[dict], Optional[str], Optional[float]]:
+    """
+    Returns (model cost map, etag, seconds since the cache was refreshed) - all None if there's no cached copy of `url`.
+    """
+    cache_file_path = _get_cache_file_path(url)
+    try:
+        with open(cache_file_path, "r") as f:
+            cached = json.load(f)
+        age = time.time() - os.path.getmtime(cache_file_path)
+        return cached["model_cost"], cached.get("etag"), age
+    except Exception:
+        return None, None, None
+
+
+def _write_cached_model_cost_map(url: str, model_cost: dict, etag: Optional[str]):
+    cache_file_path = _get_cache_file_path(url)
+    try:
+        cache_dir = os.path.dirname(cache_file_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # write + rename, so other processes never read a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"url": url, "etag": etag, "model_cost": model_cost}, f)
+            os.replace(tmp_path, cache_file_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        # e.g. read-only file system - the cache is optional
+        verbose_logger.debug(
+            "LiteLLM: unable to write model cost map cache to {} - {}".format(
+                cache_file_path, str(e)
+            )
+        )
+
+
+def _touch_cached_model_cost_map(url: str):
+    try:
+        os.utime(_get_cache_file_path(url))
+    except Exception:
+        pass
+
+
+def _fetch_model_cost_map(url: str, etag: Optional[str]) -> Optional[dict]:
+    """
+    Fetch the remote model cost map, and update the on-disk cache.
+
+    Returns None if the remote map is unchanged (HTTP 304). Raises on errors.
+    """
+    headers = {}
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    response = httpx.get(url, timeout=MODEL_COST_MAP_FETCH_TIMEOUT, headers=headers)
+    if response.status_code == 304:
+        _touch_cached_model_cost_map(url)
+        return None
+    response.raise_for_status()  # Raise an exception if the request is unsuccessful
+    content = response.json()
+    _write_cached_model_cost_map(
+        url=url, model_cost=content, etag=response.headers.get("etag")
+    )
+    return content
+
+
+def get_model_cost_map(url: str) -> dict:
+    """
+    Fetch the model cost map from `url`.
+
+    Falls back to the on-disk cache, then to the backup map shipped with litellm.
+    """
+    if _use_local_model_cost_map():
+        return get_backup_model_cost_map()
+
+    cached_model_cost, etag, _ = _read_cached_model_cost_map(url)
+    try:
+        content = _fetch_model_cost_map(url=url, etag=etag)
+        if content is not None:
+            return content
+    except Exception:
+        pass
+    if cached_model_cost is not None:
+        return cached_model_cost
+    return get_backup_model_cost_map()
+
+
+def load_model_cost_map(url: str) -> Tuple[dict, bool]:
+    """
+    Load the model cost map on `import litellm` - without waiting for the network.
+
+    Returns (model cost map, True if the remote map should be fetched with `refresh_model_cost_map_in_background`).
+    """
+    if _use_local_model_cost_map():
+        return get_backup_model_cost_map(), False
+
+    cached_model_cost, _, age = _read_cached_model_cost_map(url)
+    if cached_model_cost is None:
+        return get_backup_model_cost_map(), True
+    return cached_model_cost, age is None or age >= _get_cache_ttl()
+
+
+def refresh_model_cost_map_in_background(url: str, loaded_model_cost: dict):
+    """
+    Fetch the remote model cost map in a background thread, and replace `litellm.model_cost` (loaded as `loaded_model_cost`) with it.
+    """
+    threading.Thread(
+        target=_refresh_model_cost_map,
+        args=(url, loaded_model_cost),
+        name="litellm-model-cost-map-refresh",
+        daemon=True,
+    ).start()
+
+
+def _refresh_model_cost_map(url: str, loaded_model_cost: dict):
+    # read the map as it was loaded, before the cache is overwritten with the fetched map
+    cached_model_cost, etag, _ = _read_cached_model_cost_map(url)
+    original_model_cost = (
+        cached_model_cost
+        if cached_model_cost is not None
+        else get_backup_model_cost_map()
+    )
+    try:
+        content = _fetch_model_cost_map(url=url, etag=etag)
+    except Exception as e:
+        verbose_logger.debug(
+            "LiteLLM: unable to fetch model cost map from {} - {}".format(url, str(e))
+        )
+        return
+    if content is not None:
+        _apply_model_cost_map(
+            model_cost=content,
+            loaded_model_cost=loaded_model_cost,
+            original_model_cost=original_model_cost,
+        )
+
+
+def _apply_model_cost_map(
+    model_cost: dict, loaded_model_cost: dict, original_model_cost: dict
+):
+    """
+    Replace `litellm.model_cost` (loaded as `loaded_model_cost`) with a newer map.
+
+    Models added / changed since - e.g. via `litellm.register_model` - are kept.
+    """
+    import litellm
+    from litellm.litellm_core_utils.model_info_cache import GLOBAL_MODEL_INFO_CACHE
+
+    current_model_cost = litellm.model_cost
+    if current_model_cost is not loaded_model_cost:
+        # `litellm.model_cost` was replaced since - keep it
+        return
+    # `register_model` updates entries in place - compare against the map as it was loaded
+    updated_model_cost = dict(model_cost)
+    for key, value in current_model_cost.items():
+        if key not in updated_model_cost or original_model_cost.get(key) != value:
+            updated_model_cost[key] = value
+
+    new_models = {
+        key: value
+        for key, value in updated_model_cost.items()
+        if key not in current_model_cost
+    }
+    litellm.model_cost = updated_model_cost
+    litellm.add_known_models(model_cost_map=new_models)
+    # drop model info resolved against the previous map
+    GLOBAL_MODEL_INFO_CACHE.invalidate()
+    verbose_logger.debug(
+        "LiteLLM: updated model cost map, {} new models".format(len(new_models))
+    )
@@ -0,0 +1,378 @@
+# What is this?
+## Compiled pricing table for `litellm.model_cost` + bulk cost calculation for usage records (e.g. spend log backfills)
+
+"""
+`ModelCostTable` compiles `litellm.model_cost` into:
+- the pricing of each model - only the cost keys, as floats
+- the resolved model cost key of each (model, custom_llm_provider, region_name) - the same lookup order as
+  `cost_calculator.cost_per_token` (region, provider/model, model, model without prefix, fine-tuned models, azure aliases)
+- a NumPy matrix of the pricing (one row per model), used by `bulk_cost_per_token`
+
+The table is recompiled when `litellm.model_cost` is replaced, or when models are added to it.
+`register_model` calls `invalidate()` - call it after changing the pricing of an existing model in place.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import litellm
+from litellm.litellm_core_utils.llm_cost_calc.google import (
+    models_without_dynamic_pricing,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# pricing keys compiled into the table - the column order of the NumPy matrix
+PRICING_KEYS: Tuple[str, ...] = (
+    "input_cost_per_token",
+    "output_cost_per_token",
+    "input_cost_per_token_above_128k_tokens",
+    "output_cost_per_token_above_128k_tokens",
+    "input_cost_per_character",
+    "output_cost_per_character",
+    "input_cost_per_character_above_128k_tokens",
+    "output_cost_per_character_above_128k_tokens",
+    "input_cost_per_audio_token",
+    "output_cost_per_audio_token",
+    "cache_read_input_token_cost",
+    "cache_creation_input_token_cost",
+    "input_cost_per_image",
+    "input_cost_per_image_above_128k_tokens",
+    "input_cost_per_second",
+    "output_cost_per_second",
+)
+_ABOVE_128K_KEYS = tuple(
+    key for key in PRICING_KEYS if key.endswith("_above_128k_tokens")
+)
+
+# fuzzy matched fine-tuned OpenAI models - e.g. 'ft:gpt-3.5-turbo:my-org:custom_suffix:id'
+FINE_TUNED_MODEL_PREFIXES: Tuple[str, ...] = (
+    "ft:gpt-3.5-turbo",
+    "ft:gpt-4-0613",
+    "ft:gpt-4o-2024-05-13",
+    "ft:davinci-002",
+    "ft:babbage-002",
+)
+
+ABOVE_128K_TOKENS = 128000
+DEFAULT_RESOLVED_MODEL_CACHE_SIZE = 4096
+
+
+class ModelCostTable:
+    def __init__(
+        self, resolved_model_cache_size: int = DEFAULT_RESOLVED_MODEL_CACHE_SIZE
+    ):
+        self.resolved_model_cache_size = resolved_model_cache_size
+        self._lock = threading.Lock()
+        # the `litellm.model_cost` (+ its length) the table was compiled from
+        self._model_cost: Optional[dict] = None
+        self._model_cost_length = 0
+        self._pricing: Dict[str, Dict[str, float]] = {}
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional["np.ndarray"] = None
+        self._resolved_models: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+
+    def _is_stale(self) -> bool:
+        model_cost = litellm.model_cost
+        return (
+            model_cost is not self._model_cost
+            or len(model_cost) != self._model_cost_length
+        )
+
+    def _compile(self):
+        if not self._is_stale():
+            return
+        with self._lock:
+            model_cost = litellm.model_cost
+            pricing: Dict[str, Dict[str, float]] = {}
+            for model, model_info in list(model_cost.items()):
+                if not isinstance(model_info, dict):
+                    continue
+                model_pricing: Dict[str, float] = {}
+                for key in PRICING_KEYS:
+                    value = model_info.get(key)
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        model_pricing[key] = float(value)
+                if model in models_without_dynamic_pricing:
+                    for key in _ABOVE_128K_KEYS:
+                        model_pricing.pop(key, None)
+                pricing[model] = model_pricing
+            self._pricing = pricing
+            self._rows = {model: row for row, model in enumerate(pricing)}
+            self._matrix = None
+            self._resolved_models.clear()
+            self._model_cost = model_cost
+            self._model_cost_length = len(model_cost)
+
+    def invalidate(self):
+        """
+        Recompile the table on next use.
+        """
+        with self._lock:
+            self._model_cost = None
+            self._matrix = None
+            self._resolved_models.clear()
+
+    def _resolve_model(
+        self, model: str, custom_llm_provider: Optional[str], region_name: Optional[str]
+    ) -> Optional[str]:
+        pricing = self._pricing
+        candidates: List[str] = []
+        if custom_llm_provider is not None:
+            if region_name is not None:
+                candidates.append(f"{custom_llm_provider}/{region_name}/{model}")
+            candidates.append(f"{custom_llm_provider}/{model}")
+        candidates.append(model)
+        model_parts = model.split("/", 1)
+        model_without_prefix = model_parts[1] if len(model_parts) > 1 else model
+        candidates.append(model_without_prefix)
+        for candidate in candidates:
+            if candidate in pricing:
+                return candidate
+        for prefix in FINE_TUNED_MODEL_PREFIXES:
+            if prefix in model and prefix in pricing:
+                return prefix
+        for aliases in (litellm.azure_llms, litellm.azure_embedding_models):
+            alias = aliases.get(model)
+            if alias is not None and alias in pricing:
+                return alias
+        return None
+
+    def resolve_model(
+        self,
+        model: str,
+        custom_llm_provider: Optional[str] = None,
+        region_name: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Returns the `litellm.model_cost` key priced for `model` - None if the model isn't mapped
+        """
+        self._compile()
+        cache_key = (model, custom_llm_provider, region_name)
+        try:
+            return self._resolved_models[cache_key]
+        except KeyError:
+            pass
+        resolved_model = self._resolve_model(
+            model=model,
+            custom_llm_provider=custom_llm_provider,
+            region_name=region_name,
+        )
+        with self._lock:
+            if len(self._resolved_models) >= self.resolved_model_cache_size:
+                self._resolved_models.popitem(last=False)
+            self._resolved_models[cache_key] = resolved_model
+        return resolved_model
+
+    def get_pricing(
+        self,
+        model: str,
+        custom_llm_provider: Optional[str] = None,
+        region_name: Optional[str] = None,
+    ) -> Optional[Dict[str, float]]:
+        """
+        Returns the pricing of `model` - {pricing key: cost}, only the keys set for the model. None if the model isn't mapped
+        """
+        resolved_model = self.resolve_model(
+            model=model,
+            custom_llm_provider=custom_llm_provider,
+            region_name=region_name,
+        )
+        if resolved_model is None:
+            return None
+        return self._pricing[resolved_model]
+
+    def _get_matrix(self) -> "np.ndarray":
+        import numpy as np
+
+        self._compile()
+        matrix = self._matrix
+        if matrix is not None:
+            return matrix
+        with self._lock:
+            # one row per model + a last row of NaNs, for models that aren't mapped
+            matrix = np.full((len(self._pricing) + 1, len(PRICING_KEYS)), np.nan)
+            columns = {key: column for column, key in enumerate(PRICING_KEYS)}
+            for row, model_pricing in enumerate(self._pricing.values()):
+                for key, value in model_pricing.items():
+                    matrix[row, columns[key]] = value
+            self._matrix = matrix
+            return matrix
+
+    def _get_rows(
+        self,
+        models: Sequence[str],
+        custom_llm_provider: Optional[Sequence[Optional[str]]],
+    ) -> "np.ndarray":
+        import numpy as np
+
+        self._compile()
+        unknown_row = len(self._pricing)
+        rows: Dict[Tuple[str, Optional[str]], int] = {}
+        providers: Sequence[Optional[str]] = (
+            custom_llm_provider
+            if custom_llm_provider is not None
+            else [None] * len(models)
+        )
+        if len(providers) != len(models):
+            raise ValueError(
+                "custom_llm_provider must have one entry per model. len(models)={}, len(custom_llm_provider)={}".format(
+                    len(models), len(providers)
+                )
+            )
+
+        def _get_row(key: Tuple[str, Optional[str]]) -> int:
+            row = rows.get(key)
+            if row is None:
+                resolved_model = self.resolve_model(
+                    model=key[0], custom_llm_provider=key[1]
+                )
+                row = (
+                    self._rows[resolved_model]
+                    if resolved_model is not None
+                    else unknown_row
+                )
+                rows[key] = row
+            return row
+
+        return np.fromiter(
+            (_get_row(key) for key in zip(models, providers)),
+            dtype=np.intp,
+            count=len(models),
+        )
+
+
+GLOBAL_MODEL_COST_TABLE = ModelCostTable()
+
+
+def _as_array(values: Any, length: int) -> "np.ndarray":
+    import numpy as np
+
+    if values is None:
+        return np.zeros(length)
+    array = np.asarray(values, dtype=np.float64)
+    if array.shape != (length,):
+        raise ValueError(
+            "usage arrays must have one entry per model. expected shape=({},), got shape={}".format(
+                length, array.shape
+            )
+        )
+    return array
+
+
+def bulk_cost_per_token(
+    model: Sequence[str],
+    prompt_tokens: Any,
+    completion_tokens: Any,
+    custom_llm_provider: Optional[Sequence[Optional[str]]] = None,
+    cache_read_input_tokens: Any = None,
+    cache_creation_input_tokens: Any = None,
+    prompt_audio_tokens: Any = None,
+    completion_audio_tokens: Any = None,
+    prompt_characters: Any = None,
+    completion_characters: Any = None,
+    prompt_images: Any = None,
+    cost_table: Optional[ModelCostTable] = None,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Calculates the prompt + completion cost of many usage records at once, with NumPy.
+
+    Input:
+        - model: the model of each record - e.g. "gpt-4o", "anthropic/claude-3-5-sonnet-20240620"
+        - prompt_tokens, completion_tokens: array-like, the number of tokens of each record
+        - custom_llm_provider: optional, the provider of each record
+        - cache_read_input_tokens: optional, the cached prompt tokens (included in prompt_tokens) - priced at 'cache_read_input_token_cost'
+        - cache_creation_input_tokens: optional, the prompt tokens written to the cache - priced at 'cache_creation_input_token_cost'
+        - prompt_audio_tokens, completion_audio_tokens: optional, priced at 'input/output_cost_per_audio_token'
+        - prompt_characters, completion_characters: optional, NaN for records without character counts. Priced per character, for models with character pricing (vertex ai)
+        - prompt_images: optional, the number of images in each prompt - priced at 'input_cost_per_image'
+
+    Prompts / completions above 128k tokens use the '_above_128k_tokens' pricing, if the model has it.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] - prompt_cost_in_usd, completion_cost_in_usd. NaN for models not in the model cost map.
+    """
+    import numpy as np
+
+    cost_table = cost_table or GLOBAL_MODEL_COST_TABLE
+    num_records = len(model)
+    prompt_tokens = _as_array(prompt_tokens, num_records)
+    completion_tokens = _as_array(completion_tokens, num_records)
+    cache_read_input_tokens = _as_array(cache_read_input_tokens, num_records)
+    cache_creation_input_tokens = _as_array(cache_creation_input_tokens, num_records)
+    prompt_audio_tokens = _as_array(prompt_audio_tokens, num_records)
+    completion_audio_tokens = _as_array(completion_audio_tokens, num_records)
+    prompt_images = _as_array(prompt_images, num_records)
+    if prompt_characters is None:
+        prompt_characters = np.full(num_records, np.nan)
+    if completion_characters is None:
+        completion_characters = np.full(num_records, np.nan)
+    prompt_characters = _as_array(prompt_characters, num_records)
+    completion_characters = _as_array(completion_characters, num_records)
+
+    rows = cost_table._get_rows(models=model, custom_llm_provider=custom_llm_provider)
+    matrix = cost_table._get_matrix()
+    pricing = {key: matrix[rows, column] for column, key in enumerate(PRICING_KEYS)}
+
+    def _rate(key: str, above_128k: Optional["np.ndarray"] = None) -> "np.ndarray":
+        rate = pricing[key]
+        if above_128k is not None:
+            rate_above_128k = pricing[key + "_above_128k_tokens"]
+            rate = np.where(
+                above_128k & ~np.isnan(rate_above_128k), rate_above_128k, rate
+            )
+        return rate
+
+    def _cost(count: "np.ndarray", rate: "np.ndarray") -> "np.ndarray":
+        # pricing the model doesn't have costs 0
+        return count * np.nan_to_num(rate)
+
+    unknown_model = rows == len(matrix) - 1
+    prompt_above_128k = prompt_tokens > ABOVE_128K_TOKENS
+    completion_above_128k = completion_tokens > ABOVE_128K_TOKENS
+
+    ## CALCULATE INPUT COST
+    prompt_cost = (
+        _cost(
+            prompt_tokens - cache_read_input_tokens,
+            _rate("input_cost_per_token", prompt_above_128k),
+        )
+        + _cost(cache_read_input_tokens, _rate("cache_read_input_token_cost"))
+        + _cost(cache_creation_input_tokens, _rate("cache_creation_input_token_cost"))
+        + _cost(prompt_audio_tokens, _rate("input_cost_per_audio_token"))
+        + _cost(prompt_images, _rate("input_cost_per_image", prompt_above_128k))
+    )
+    ### character pricing - 1 token = 4 characters
+    input_cost_per_character = _rate(
+        "input_cost_per_character", prompt_characters * 4 > ABOVE_128K_TOKENS
+    )
+    use_character_pricing = ~np.isnan(prompt_characters) & ~np.isnan(
+        input_cost_per_character
+    )
+    prompt_cost = np.where(
+        use_character_pricing,
+        np.nan_to_num(prompt_characters) * np.nan_to_num(input_cost_per_character),
+        prompt_cost,
+    )
+
+    ## CALCULATE OUTPUT COST
+    completion_cost = _cost(
+        completion_tokens, _rate("output_cost_per_token", completion_above_128k)
+    ) + _cost(completion_audio_tokens, _rate("output_cost_per_audio_token"))
+    output_cost_per_character = _rate(
+        "output_cost_per_character", completion_characters * 4 > ABOVE_128K_TOKENS
+    )
+    use_character_pricing = ~np.isnan(completion_characters) & ~np.isnan(
+        output_cost_per_character
+    )
+    completion_cost = np.where(
+        use_character_pricing,
+        np.nan_to_num(completion_characters) * np.nan_to_num(output_cost_per_character),
+        completion_cost,
+    )
+
+    prompt_cost[unknown_model] = np.nan
+    completion_cost[unknown_model] = np.nan
+    return prompt_cost, completion_cost
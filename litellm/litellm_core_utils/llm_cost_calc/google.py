@@ -80,12 +80,12 @@ def cost_per_character(
     Raises:
         Exception if model requires >128k pricing, but model cost not mapped
     """
-    model_info = litellm.get_model_info(
+    model_info = litellm.utils._get_cached_model_info(
         model=model, custom_llm_provider=custom_llm_provider
     )
 
     ## GET MODEL INFO
-    model_info = litellm.get_model_info(
+    model_info = litellm.utils._get_cached_model_info(
         model=model, custom_llm_provider=custom_llm_provider
     )
 
@@ -209,7 +209,7 @@ def cost_per_token(
         Exception if model requires >128k pricing, but model cost not mapped
     """
     ## GET MODEL INFO
-    model_info = litellm.get_model_info(
+    model_info = litellm.utils._get_cached_model_info(
         model=model, custom_llm_provider=custom_llm_provider
     )
 
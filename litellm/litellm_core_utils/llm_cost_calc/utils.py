@@ -36,7 +36,7 @@ def _generic_cost_per_character(
     """
     args = locals()
     ## GET MODEL INFO
-    model_info = litellm.get_model_info(
+    model_info = litellm.utils._get_cached_model_info(
         model=model, custom_llm_provider=custom_llm_provider
     )
 
@@ -0,0 +1,213 @@
+"""
+Runs sync logging callbacks (`Logging.success_handler`, `Logging.failure_handler`) on a bounded pool of worker threads.
+
+Starting a new thread per logged call means thousands of short-lived threads per second at high load, all competing
+with request handling for the GIL. Instead, logging events are put on a bounded queue, drained by a fixed number of
+workers.
+
+- `litellm.logging_worker_max_workers` - number of worker threads
+- `litellm.logging_worker_max_queue_size` - max. logging events waiting for a worker
+- `litellm.logging_worker_overflow_policy` - if the queue is full:
+    - "drop" (default) - drop the event
+    - "block" - wait up to `litellm.logging_worker_block_timeout` seconds for space, then drop the event
+- `litellm.logging_worker_exit_flush_timeout` - max. seconds to wait for queued events at interpreter exit
+
+Use `get_metrics()` for the queue depth, dropped events and callback latency.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import litellm
+from litellm._logging import verbose_logger
+
+
+class _LoggingEvent:
+    __slots__ = ("fn", "args", "kwargs")
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: dict):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+
+class LoggingWorker:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        block_timeout: Optional[float] = None,
+    ):
+        """
+        Unset params are read from the `litellm.logging_worker_*` settings, when the first event is submitted.
+        """
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        self._queue: Optional[queue.Queue] = None
+        self._lock = threading.Lock()
+        self._num_workers = 0
+
+        ## METRICS
+        self._submitted = 0
+        self._processed = 0
+        self._dropped = 0
+        self._failed = 0
+        self._total_callback_latency = 0.0
+        self._max_callback_latency = 0.0
+
+    def _get_queue(self) -> queue.Queue:
+        _queue = self._queue
+        if _queue is not None:
+            return _queue
+        with self._lock:
+            if self._queue is None:
+                if self.max_workers is None:
+                    self.max_workers = litellm.logging_worker_max_workers
+                if self.max_queue_size is None:
+                    self.max_queue_size = litellm.logging_worker_max_queue_size
+                if self.overflow_policy is None:
+                    self.overflow_policy = litellm.logging_worker_overflow_policy
+                if self.block_timeout is None:
+                    self.block_timeout = litellm.logging_worker_block_timeout
+                _queue = queue.Queue(maxsize=self.max_queue_size)
+                for i in range(self.max_workers):
+                    threading.Thread(
+                        target=self._worker_loop,
+                        args=(_queue,),
+                        name="litellm-logging-worker-{}".format(i),
+                        daemon=True,
+                    ).start()
+                self._num_workers = self.max_workers
+                self._queue = _queue
+            return self._queue
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> bool:
+        """
+        Run `fn(*args, **kwargs)` on a worker thread.
+
+        Returns False if the event was dropped, because the queue is full.
+        """
+        return self._put(_LoggingEvent(fn=fn, args=args, kwargs=kwargs))
+
+    def _put(self, event: _LoggingEvent) -> bool:
+        _queue = self._get_queue()
+        try:
+            if self.overflow_policy == "block":
+                _queue.put(event, timeout=self.block_timeout)
+            else:
+                _queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            verbose_logger.debug(
+                "LiteLLM Logging Worker: queue full ({} events), dropping logging event - {}".format(
+                    self.max_queue_size, getattr(event.fn, "__qualname__", event.fn)
+                )
+            )
+            return False
+        with self._lock:
+            self._submitted += 1
+        return True
+
+    def _worker_loop(self, _queue: queue.Queue):
+        # 1 event per `get()` - a burst of events is spread over all workers
+        while True:
+            event: _LoggingEvent = _queue.get()
+            try:
+                self._run_callback(event.fn, event.args, event.kwargs)
+            finally:
+                _queue.task_done()
+
+    def _run_callback(self, fn: Callable, args: tuple, kwargs: dict):
+        start_time = time.perf_counter()
+        failed = False
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            failed = True
+            verbose_logger.exception(
+                "LiteLLM Logging Worker: logging callback raised an exception - {}".format(
+                    str(e)
+                )
+            )
+        latency = time.perf_counter() - start_time
+        with self._lock:
+            self._processed += 1
+            if failed:
+                self._failed += 1
+            self._total_callback_latency += latency
+            if latency > self._max_callback_latency:
+                self._max_callback_latency = latency
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued logging events are processed.
+
+        Returns False if `timeout` (seconds) passed first.
+        """
+        _queue = self._queue
+        if _queue is None:
+            return True
+        end_time = None if timeout is None else time.monotonic() + timeout
+        with _queue.all_tasks_done:
+            while _queue.unfinished_tasks:
+                if end_time is None:
+                    _queue.all_tasks_done.wait()
+                else:
+                    remaining = end_time - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    _queue.all_tasks_done.wait(remaining)
+        return True
+
+    def get_metrics(self) -> dict:
+        _queue = self._queue
+        with self._lock:
+            return {
+                "queue_depth": _queue.qsize() if _queue is not None else 0,
+                "max_queue_size": self.max_queue_size,
+                "workers": self._num_workers,
+                "submitted": self._submitted,
+                "processed": self._processed,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "avg_callback_latency_ms": (
+                    self._total_callback_latency / self._processed * 1000
+                    if self._processed > 0
+                    else 0.0
+                ),
+                "max_callback_latency_ms": self._max_callback_latency * 1000,
+            }
+
+    def _reset_after_fork(self):
+        # worker threads don't survive a fork - start new ones on the next submit
+        self._lock = threading.Lock()
+        self._queue = None
+        self._num_workers = 0
+
+
+GLOBAL_LOGGING_WORKER = LoggingWorker()
+
+
+def _flush_on_exit():
+    # workers are daemon threads - finish logging queued events before the interpreter exits, without hanging on a stuck callback
+    if GLOBAL_LOGGING_WORKER.flush(timeout=litellm.logging_worker_exit_flush_timeout):
+        return
+    verbose_logger.warning(
+        "LiteLLM Logging Worker: exiting with {} logging events still queued".format(
+            GLOBAL_LOGGING_WORKER.get_metrics()["queue_depth"]
+        )
+    )
+
+
+atexit.register(_flush_on_exit)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=GLOBAL_LOGGING_WORKER._reset_after_fork)
@@ -0,0 +1,119 @@
+"""
+Memoized `get_model_info` results
+
+`get_model_info` tries several `litellm.model_cost` keys (provider-prefixed, stripped vertex versions, fine-tuned model
+names) and builds a new `ModelInfo` on every call - it runs for cost calculation, context window checks and the
+`supports_*` helpers, on every request.
+
+The cache keeps the resolved `ModelInfo` of each (model, custom_llm_provider) as a read-only mapping, shared by all
+callers. Cached results are dropped when:
+- `litellm.model_cost` is replaced, or models are added to it
+- the model / provider lists change (`GLOBAL_MODEL_REGISTRY`)
+- `invalidate()` is called - by `register_model`, and when the model cost map is refreshed
+"""
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+import litellm
+from litellm.litellm_core_utils.model_registry import GLOBAL_MODEL_REGISTRY
+
+DEFAULT_MODEL_INFO_CACHE_SIZE = 4096
+
+_Snapshot = Tuple[Any, int, int, int]
+
+
+class ModelInfoCache:
+    def __init__(self, max_size: int = DEFAULT_MODEL_INFO_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, Optional[str]], Mapping[str, Any]]" = (
+            OrderedDict()
+        )
+        # (`litellm.model_cost`, its length, model registry generation, generation) the cached results were computed against
+        self._snapshot: Optional[_Snapshot] = None
+        # bumped by `invalidate()` - results computed before aren't cached
+        self.generation = 0
+
+    def _get_snapshot(self) -> "_Snapshot":
+        model_cost = litellm.model_cost
+        return (
+            model_cost,
+            len(model_cost),
+            # bumped when `get_llm_provider` sees changed model lists - not re-checked here, it's on the hot path
+            GLOBAL_MODEL_REGISTRY.generation,
+            self.generation,
+        )
+
+    def _is_current(self, snapshot: "_Snapshot") -> bool:
+        cached_snapshot = self._snapshot
+        return (
+            cached_snapshot is not None
+            and cached_snapshot[0] is snapshot[0]
+            and cached_snapshot[1:] == snapshot[1:]
+        )
+
+    def get(
+        self, model: str, custom_llm_provider: Optional[str]
+    ) -> Tuple[Optional[Mapping[str, Any]], "_Snapshot"]:
+        """
+        Returns (cached model info - None on a miss, snapshot to pass to `set`)
+        """
+        snapshot = self._get_snapshot()
+        if not self._is_current(snapshot):
+            return None, snapshot
+        key = (model, custom_llm_provider)
+        model_info = self._cache.get(key)
+        if model_info is not None:
+            try:
+                self._cache.move_to_end(key)
+            except KeyError:  # evicted by another thread
+                pass
+        return model_info, snapshot
+
+    def set(
+        self,
+        model: str,
+        custom_llm_provider: Optional[str],
+        model_info: Mapping[str, Any],
+        snapshot: "_Snapshot",
+    ) -> Mapping[str, Any]:
+        """
+        Cache `model_info` - computed against `snapshot`. Returns the read-only, shared model info
+        """
+        shared_model_info = MappingProxyType(dict(model_info))
+        with self._lock:
+            current_snapshot = self._get_snapshot()
+            if (
+                current_snapshot[0] is not snapshot[0]
+                or current_snapshot[1] != snapshot[1]
+                or current_snapshot[3] != snapshot[3]
+            ):
+                # the model cost map changed / was invalidated while the model info was computed
+                return shared_model_info
+            # computing the model info can refresh the model registry - cache against the refreshed lists
+            snapshot = current_snapshot
+            if not self._is_current(snapshot):
+                # the first result computed against changed models - drop the older results
+                self._cache.clear()
+                self._snapshot = snapshot
+            if len(self._cache) >= self.max_size:
+                self._cache.popitem(last=False)
+            self._cache[(model, custom_llm_provider)] = shared_model_info
+        return shared_model_info
+
+    def invalidate(self):
+        """
+        Drop all cached model info.
+
+        Call after changing a model in `litellm.model_cost` in place - e.g. `litellm.model_cost["gpt-4"]["max_tokens"] = ...`
+        """
+        with self._lock:
+            self._cache.clear()
+            self._snapshot = None
+            self.generation += 1
+
+
+GLOBAL_MODEL_INFO_CACHE = ModelInfoCache()
@@ -0,0 +1,187 @@
+"""
+Indexed view of litellm's model / provider lists (`litellm.anthropic_models`, `litellm.provider_list`, ...)
+
+`model in litellm.open_ai_chat_completion_models` scans a list of several hundred models - and provider resolution
+checks ~30 of these lists in a row. The registry keeps:
+- a frozenset per list - `contains(model, "anthropic_models")` is O(1)
+- a model -> provider map, built in the order `get_llm_provider` checks the lists
+- the memoized results of `get_llm_provider`, keyed by (model, custom_llm_provider, api_base)
+
+The lists stay the source of truth - `add_known_models`, `register_model` and user code still append to them.
+An index is rebuilt when its list changes (a different list object, or a different length), and
+`invalidate()` drops all of them - e.g. after `register_model`.
+"""
+
+import operator
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import litellm
+
+# (provider, litellm model lists) - in the order `get_llm_provider` checks them
+MODEL_PROVIDER_LISTS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("openai", ("open_ai_chat_completion_models", "openai_image_generation_models")),
+    ("text-completion-openai", ("open_ai_text_completion_models",)),
+    ("anthropic", ("anthropic_models",)),
+    ("cohere", ("cohere_models", "cohere_embedding_models")),
+    ("cohere_chat", ("cohere_chat_models",)),
+    ("replicate", ("replicate_models",)),
+    ("openrouter", ("openrouter_models",)),
+    ("maritalk", ("maritalk_models",)),
+    (
+        "vertex_ai",
+        (
+            "vertex_chat_models",
+            "vertex_code_chat_models",
+            "vertex_text_models",
+            "vertex_code_text_models",
+            "vertex_language_models",
+            "vertex_embedding_models",
+            "vertex_vision_models",
+            "vertex_ai_image_models",
+        ),
+    ),
+    ("ai21", ("ai21_models",)),
+    ("ai21_chat", ("ai21_chat_models",)),
+    ("aleph_alpha", ("aleph_alpha_models",)),
+    ("baseten", ("baseten_models",)),
+    ("nlp_cloud", ("nlp_cloud_models",)),
+    ("petals", ("petals_models",)),
+    ("bedrock", ("bedrock_models", "bedrock_embedding_models")),
+    ("watsonx", ("watsonx_models",)),
+    ("openai", ("open_ai_embedding_models",)),
+    ("empower", ("empower_models",)),
+]
+
+# other lists the result of `get_llm_provider` depends on
+PROVIDER_LOOKUP_LISTS: Tuple[str, ...] = (
+    "provider_list",
+    "model_list",
+    "openai_compatible_endpoints",
+    "mistral_chat_models",
+)
+
+DEFAULT_PROVIDER_CACHE_SIZE = 4096
+
+
+def _get_list_names() -> List[str]:
+    list_names: List[str] = []
+    for _, provider_list_names in MODEL_PROVIDER_LISTS:
+        list_names.extend(provider_list_names)
+    list_names.extend(PROVIDER_LOOKUP_LISTS)
+    return list_names
+
+
+class ModelRegistry:
+    def __init__(self, provider_cache_size: int = DEFAULT_PROVIDER_CACHE_SIZE):
+        self.provider_cache_size = provider_cache_size
+        self._lock = threading.Lock()
+        # list name -> (list, length when indexed, index)
+        self._indexes: Dict[str, Tuple[Any, int, FrozenSet[str]]] = {}
+        self._model_to_provider: Dict[str, str] = {}
+        # the lists (+ their lengths) the model -> provider map + provider cache were built from
+        self._snapshot_lists: Optional[Tuple[Any, ...]] = None
+        self._snapshot_lengths: List[int] = []
+        self._provider_cache: (
+            "OrderedDict[tuple, Tuple[str, str, Optional[str], Optional[str]]]"
+        ) = OrderedDict()
+        self._get_lists = operator.attrgetter(*_get_list_names())
+        # bumped whenever the indexes are rebuilt - results computed against older lists aren't cached
+        self.generation = 0
+
+    def _get_index(self, list_name: str) -> FrozenSet[str]:
+        models = getattr(litellm, list_name, None)
+        if models is None:
+            return frozenset()
+        index = self._indexes.get(list_name)
+        if index is not None and index[0] is models and index[1] == len(models):
+            return index[2]
+        with self._lock:
+            length = len(models)
+            # `provider_list` holds `LlmProviders` members - index their string values
+            new_index = frozenset(getattr(model, "value", model) for model in models)
+            self._indexes[list_name] = (models, length, new_index)
+            return new_index
+
+    def contains(self, model: Any, *list_names: str) -> bool:
+        """
+        `model in litellm.<list_name>` for any of `list_names`
+        """
+        model = getattr(model, "value", model)
+        try:
+            for list_name in list_names:
+                if model in self._get_index(list_name):
+                    return True
+        except TypeError:  # unhashable model
+            return any(model in getattr(litellm, name, []) for name in list_names)
+        return False
+
+    def _is_stale(self) -> bool:
+        # runs on every `get_llm_provider` call - compare the lists in C, not in a python loop
+        if self._snapshot_lists is None:
+            return True
+        lists = self._get_lists(litellm)
+        return (
+            not all(map(operator.is_, lists, self._snapshot_lists))
+            or list(map(len, lists)) != self._snapshot_lengths
+        )
+
+    def _refresh(self):
+        if not self._is_stale():
+            return
+        with self._lock:
+            lists = self._get_lists(litellm)
+            model_to_provider: Dict[str, str] = {}
+            for provider, provider_list_names in MODEL_PROVIDER_LISTS:
+                for list_name in provider_list_names:
+                    for model in getattr(litellm, list_name, None) or []:
+                        # first match wins - same as the if / elif chain in `get_llm_provider`
+                        model_to_provider.setdefault(model, provider)
+            self._model_to_provider = model_to_provider
+            self._provider_cache.clear()
+            self._snapshot_lists = lists
+            self._snapshot_lengths = list(map(len, lists))
+            self.generation += 1
+
+    def get_model_provider(self, model: str) -> Optional[str]:
+        """
+        Returns the provider of a known model name (no provider prefix) - e.g. 'claude-3-opus-20240229' -> 'anthropic'
+        """
+        self._refresh()
+        return self._model_to_provider.get(model)
+
+    def get_cached_llm_provider(
+        self, key: tuple
+    ) -> Optional[Tuple[str, str, Optional[str], Optional[str]]]:
+        self._refresh()
+        return self._provider_cache.get(key)
+
+    def set_cached_llm_provider(
+        self,
+        key: tuple,
+        value: Tuple[str, str, Optional[str], Optional[str]],
+        generation: int,
+    ):
+        with self._lock:
+            if generation != self.generation:
+                return
+            if len(self._provider_cache) >= self.provider_cache_size:
+                self._provider_cache.popitem(last=False)
+            self._provider_cache[key] = value
+
+    def invalidate(self):
+        """
+        Drop all indexes and memoized `get_llm_provider` results.
+
+        Call after changing a model list in place without changing its length - e.g. `litellm.anthropic_models[0] = ...`
+        """
+        with self._lock:
+            self._indexes = {}
+            self._model_to_provider = {}
+            self._snapshot_lists = None
+            self._provider_cache.clear()
+            self.generation += 1
+
+
+GLOBAL_MODEL_REGISTRY = ModelRegistry()
@@ -0,0 +1,185 @@
+"""
+Fast-path chunk decoders for `CustomStreamWrapper`.
+
+Most chunks in a stream are plain text deltas. A decoder turns such a chunk into a lightweight `StreamChunk`,
+which `CustomStreamWrapper` converts into the returned response object - skipping the provider if/else chain,
+the intermediate `Delta`/`StreamingChoices` objects and `return_processed_chunk_logic` in `chunk_creator`.
+
+A decoder returns None for any chunk it doesn't handle (empty deltas, tool calls, usage, finish reasons, etc.).
+These chunks go through `chunk_creator` as before.
+
+The decoder is resolved once per stream, when the `CustomStreamWrapper` is created:
+1. Decoders registered via `register_stream_chunk_decoder(custom_llm_provider, decoder)`
+2. `OpenAIStreamChunkDecoder` - openai / azure + openai-compatible providers
+3. `GenericStreamChunkDecoder` - every other provider (decodes `GenericStreamingChunk` dicts)
+"""
+
+from typing import Any, Dict, Optional
+
+from openai.types.chat import ChatCompletionChunk
+
+import litellm
+from litellm.types.utils import GenericStreamingChunk as GChunk
+
+# output of these providers is post-processed per chunk (special token handling) - no fast path
+_PROVIDERS_WITHOUT_FAST_PATH = {"huggingface", "sagemaker"}
+
+_OPENAI_STREAMING_PROVIDERS = {"openai", "azure", "custom_openai"}
+
+_stream_chunk_decoders: Dict[str, "BaseStreamChunkDecoder"] = {}
+
+
+class StreamChunk:
+    """
+    Lightweight representation of a text-only streaming chunk.
+    """
+
+    __slots__ = (
+        "text",
+        "index",
+        "id",
+        "system_fingerprint",
+        "model",
+        "delta_params",
+        "provider_specific_fields",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        index: int = 0,
+        id: Optional[str] = None,
+        system_fingerprint: Optional[str] = None,
+        model: Optional[str] = None,
+        delta_params: Optional[Dict[str, Any]] = None,
+        provider_specific_fields: Optional[Dict[str, Any]] = None,
+    ):
+        self.text = text
+        self.index = index
+        self.id = id  # set for openai-compatible chunks, None otherwise
+        self.system_fingerprint = system_fingerprint
+        self.model = model
+        self.delta_params = delta_params  # passed to `Delta`, in addition to the text
+        self.provider_specific_fields = (
+            provider_specific_fields  # set as attributes on the returned response
+        )
+
+
+class BaseStreamChunkDecoder:
+    def decode(self, chunk: Any) -> Optional[StreamChunk]:
+        """
+        Returns a `StreamChunk` for a chunk with non-empty text content, and nothing else to process.
+
+        Returns None if the chunk needs the full `CustomStreamWrapper.chunk_creator` logic.
+        """
+        raise NotImplementedError
+
+
+class GenericStreamChunkDecoder(BaseStreamChunkDecoder):
+    """
+    Decodes `GenericStreamingChunk` dicts - returned by anthropic, bedrock, vertex ai, etc.
+    """
+
+    def decode(self, chunk: Any) -> Optional[StreamChunk]:
+        if not isinstance(chunk, dict):
+            return None
+        text = chunk.get("text")
+        if (
+            not isinstance(text, str)
+            or len(text) == 0
+            or chunk.get("is_finished") is not False
+            or "finish_reason" not in chunk
+            or chunk["finish_reason"]
+            or "usage" not in chunk
+            or chunk["usage"] is not None
+            or chunk.get("tool_use") is not None
+        ):
+            return None
+        for key in chunk:
+            if key not in GChunk.__annotations__:
+                return None
+        return StreamChunk(
+            text=text,
+            provider_specific_fields=chunk.get("provider_specific_fields"),
+        )
+
+
+class OpenAIStreamChunkDecoder(GenericStreamChunkDecoder):
+    """
+    Decodes `ChatCompletionChunk`'s from the openai sdk - returned by openai, azure and openai-compatible providers.
+    """
+
+    def decode(self, chunk: Any) -> Optional[StreamChunk]:
+        if isinstance(chunk, dict):
+            return super().decode(chunk)
+        if not isinstance(chunk, ChatCompletionChunk):
+            return None
+        if len(chunk.choices) != 1 or chunk.usage is not None or chunk.model_extra:
+            return None
+        choice = chunk.choices[0]
+        if (
+            choice.finish_reason is not None
+            or choice.logprobs is not None
+            or choice.model_extra
+        ):
+            return None
+        delta = choice.delta
+        if (
+            delta is None
+            or not isinstance(delta.content, str)
+            or len(delta.content) == 0
+            or delta.tool_calls is not None
+            or delta.function_call is not None
+            or getattr(delta, "refusal", None) is not None
+            or delta.model_extra
+        ):
+            return None
+        return StreamChunk(
+            text=delta.content,
+            index=choice.index,
+            id=chunk.id,
+            system_fingerprint=chunk.system_fingerprint,
+            model=chunk.model,
+            delta_params=(
+                {"refusal": None} if hasattr(delta, "refusal") else None
+            ),  # kept in the response, same as `chunk_creator`
+            provider_specific_fields={"citations": None},
+        )
+
+
+_GENERIC_STREAM_CHUNK_DECODER = GenericStreamChunkDecoder()
+_OPENAI_STREAM_CHUNK_DECODER = OpenAIStreamChunkDecoder()
+
+
+def register_stream_chunk_decoder(
+    custom_llm_provider: str, decoder: Optional[BaseStreamChunkDecoder]
+) -> None:
+    """
+    Use `decoder` for all new streams of `custom_llm_provider`.
+
+    Pass `decoder=None` to go back to the default decoder.
+    """
+    if decoder is None:
+        _stream_chunk_decoders.pop(custom_llm_provider, None)
+    else:
+        _stream_chunk_decoders[custom_llm_provider] = decoder
+
+
+def get_stream_chunk_decoder(
+    custom_llm_provider: Optional[str],
+) -> Optional[BaseStreamChunkDecoder]:
+    """
+    Returns the decoder for `custom_llm_provider`, or None if its chunks always need the full `chunk_creator` logic.
+    """
+    if custom_llm_provider is None:
+        return None
+    if custom_llm_provider in _stream_chunk_decoders:
+        return _stream_chunk_decoders[custom_llm_provider]
+    if custom_llm_provider in _PROVIDERS_WITHOUT_FAST_PATH:
+        return None
+    if (
+        custom_llm_provider in _OPENAI_STREAMING_PROVIDERS
+        or custom_llm_provider in litellm.openai_compatible_providers
+    ):
+        return _OPENAI_STREAM_CHUNK_DECODER
+    return _GENERIC_STREAM_CHUNK_DECODER
@@ -1,10 +1,8 @@
 import asyncio
 import json
-import threading
 import time
 import traceback
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, List, Optional
 
 import httpx
@@ -29,17 +27,23 @@ from ..exceptions import OpenAIError
 from .core_helpers import map_finish_reason, process_response_headers
 from .default_encoding import encoding
 from .exception_mapping_utils import exception_type
+from .logging_worker import GLOBAL_LOGGING_WORKER
 from .rules import Rules
-
-MAX_THREADS = 100
-
-# Create a ThreadPoolExecutor
-executor = ThreadPoolExecutor(max_workers=MAX_THREADS)
+from .streaming_chunk_decoders import (
+    BaseStreamChunkDecoder,
+    StreamChunk,
+    get_stream_chunk_decoder,
+)
 
 
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
+    """
+    `args` are %-formatted into `print_statement` only if verbose logging is on - keeps repr's of chunks off the hot path.
+    """
     try:
         if litellm.set_verbose:
+            if args:
+                print_statement = print_statement % args
             print(print_statement)  # noqa
     except Exception:
         pass
@@ -111,6 +115,9 @@ class CustomStreamWrapper:
             []
         )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
+        self.chunk_decoder: Optional[BaseStreamChunkDecoder] = get_stream_chunk_decoder(
+            custom_llm_provider=custom_llm_provider
+        )  # fast path for plain text chunks - see `stream_chunk_creator`
 
     def __iter__(self):
         return self
@@ -163,27 +170,25 @@ class CustomStreamWrapper:
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
         if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
-            # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
-
-            # Extract the relevant content from the chunks
-            last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
-
-            # Check if all extracted contents are identical
-            if all(content == last_contents[0] for content in last_contents):
-                if (
-                    last_contents[0] is not None
-                    and isinstance(last_contents[0], str)
-                    and len(last_contents[0]) > 2
-                ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
-                    # All last n chunks are identical
-                    raise litellm.InternalServerError(
-                        message="The model is repeating the same chunk = {}.".format(
-                            last_contents[0]
-                        ),
-                        model="",
-                        llm_provider="",
-                    )
+            # Compare the last n chunks, newest first - stops at the first chunk that differs (usually the 2nd one)
+            last_content = self.chunks[-1].choices[0].delta.content
+            if (
+                last_content is None
+                or not isinstance(last_content, str)
+                or len(last_content) <= 2
+            ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
+                return
+            for i in range(2, litellm.REPEATED_STREAMING_CHUNK_LIMIT + 1):
+                if self.chunks[-i].choices[0].delta.content != last_content:
+                    return
+            # All last n chunks are identical
+            raise litellm.InternalServerError(
+                message="The model is repeating the same chunk = {}.".format(
+                    last_content
+                ),
+                model="",
+                llm_provider="",
+            )
 
     def check_special_tokens(self, chunk: str, finish_reason: Optional[str]):
         """
@@ -266,10 +271,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -309,10 +314,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -440,7 +445,7 @@ class CustomStreamWrapper:
     def handle_cohere_chat_chunk(self, chunk):
         chunk = chunk.decode("utf-8")
         data_json = json.loads(chunk)
-        print_verbose(f"chunk: {chunk}")
+        print_verbose("chunk: %s", chunk)
         try:
             text = ""
             is_finished = False
@@ -464,7 +469,7 @@ class CustomStreamWrapper:
         is_finished = False
         finish_reason = ""
         text = ""
-        print_verbose(f"chunk: {chunk}")
+        print_verbose("chunk: %s", chunk)
         if "data: [DONE]" in chunk:
             text = ""
             is_finished = True
@@ -484,7 +489,10 @@ class CustomStreamWrapper:
                         is_finished = True
                         finish_reason = data_json["choices"][0]["finish_reason"]
                 print_verbose(
-                    f"text: {text}; is_finished: {is_finished}; finish_reason: {finish_reason}"
+                    "text: %s; is_finished: %s; finish_reason: %s",
+                    text,
+                    is_finished,
+                    finish_reason,
                 )
                 return {
                     "text": text,
@@ -527,7 +535,7 @@ class CustomStreamWrapper:
 
     def handle_openai_chat_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             str_line = chunk
             text = ""
             is_finished = False
@@ -570,7 +578,7 @@ class CustomStreamWrapper:
 
     def handle_azure_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -591,7 +599,7 @@ class CustomStreamWrapper:
 
     def handle_openai_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -655,7 +663,7 @@ class CustomStreamWrapper:
 
     def handle_cloudlfare_stream(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             chunk = chunk.decode("utf-8")
             str_line = chunk
             text = ""
@@ -666,7 +674,7 @@ class CustomStreamWrapper:
                 return {"text": text, "is_finished": True, "finish_reason": "stop"}
             elif str_line.startswith("data:"):
                 data_json = json.loads(str_line[5:])
-                print_verbose(f"delta content: {data_json}")
+                print_verbose("delta content: %s", data_json)
                 text = data_json["response"]
                 return {
                     "text": text,
@@ -705,7 +713,7 @@ class CustomStreamWrapper:
                     "finish_reason": finish_reason,
                 }
             elif json_chunk["response"]:
-                print_verbose(f"delta content: {json_chunk}")
+                print_verbose("delta content: %s", json_chunk)
                 text = json_chunk["response"]
                 return {
                     "text": text,
@@ -740,7 +748,7 @@ class CustomStreamWrapper:
                     "finish_reason": finish_reason,
                 }
             elif "message" in json_chunk:
-                print_verbose(f"delta content: {json_chunk}")
+                print_verbose("delta content: %s", json_chunk)
                 text = json_chunk["message"]["content"]
                 return {
                     "text": text,
@@ -770,7 +778,7 @@ class CustomStreamWrapper:
                         "completion_tokens": 0,
                     }
             else:
-                print_verbose(f"chunk: {chunk} (Type: {type(chunk)})")
+                print_verbose("chunk: %s (Type: %s)", chunk, type(chunk))
                 raise ValueError(
                     f"Unable to parse response. Original response: {chunk}"
                 )
@@ -808,7 +816,7 @@ class CustomStreamWrapper:
                         "completion_tokens": 0,
                     }
             else:
-                print_verbose(f"chunk: {chunk} (Type: {type(chunk)})")
+                print_verbose("chunk: %s (Type: %s)", chunk, type(chunk))
                 raise ValueError(
                     f"Unable to parse response. Original response: {chunk}"
                 )
@@ -886,12 +894,12 @@ class CustomStreamWrapper:
             # pop model keyword
             chunk.pop("model", None)
 
+        if self.response_id is not None:
+            chunk["id"] = self.response_id  # don't generate a new id per chunk
         model_response = ModelResponse(
             stream=True, model=_model, stream_options=self.stream_options, **chunk
         )
-        if self.response_id is not None:
-            model_response.id = self.response_id
-        else:
+        if self.response_id is None:
             self.response_id = model_response.id  # type: ignore
         if self.system_fingerprint is not None:
             model_response.system_fingerprint = self.system_fingerprint
@@ -932,7 +940,10 @@ class CustomStreamWrapper:
     ):
 
         print_verbose(
-            f"completion_obj: {completion_obj}, model_response.choices[0]: {model_response.choices[0]}, response_obj: {response_obj}"
+            "completion_obj: %s, model_response.choices[0]: %s, response_obj: %s",
+            completion_obj,
+            model_response.choices[0],
+            response_obj,
         )
         if (
             "content" in completion_obj
@@ -955,7 +966,9 @@ class CustomStreamWrapper:
                 chunk=completion_obj["content"],
                 finish_reason=model_response.choices[0].finish_reason,
             )  # filter out bos/eos tokens from openai-compatible hf endpoints
-            print_verbose(f"hold - {hold}, model_response_str - {model_response_str}")
+            print_verbose(
+                "hold - %s, model_response_str - %s", hold, model_response_str
+            )
             if hold is False:
                 ## check if openai/azure chunk
                 original_chunk = response_obj.get("original_chunk", None)
@@ -971,11 +984,11 @@ class CustomStreamWrapper:
                                     choice_json.pop(
                                         "finish_reason", None
                                     )  # for mistral etc. which return a value in their last chunk (not-openai compatible).
-                                    print_verbose(f"choice_json: {choice_json}")
+                                    print_verbose("choice_json: %s", choice_json)
                                     choices.append(StreamingChoices(**choice_json))
                             except Exception:
                                 choices.append(StreamingChoices())
-                        print_verbose(f"choices in streaming: {choices}")
+                        print_verbose("choices in streaming: %s", choices)
                         setattr(model_response, "choices", choices)
                     else:
                         return
@@ -987,7 +1000,7 @@ class CustomStreamWrapper:
                         "citations",
                         getattr(original_chunk, "citations", None),
                     )
-                    print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+                    print_verbose("self.sent_first_chunk: %s", self.sent_first_chunk)
                     if self.sent_first_chunk is False:
                         model_response.choices[0].delta["role"] = "assistant"
                         self.sent_first_chunk = True
@@ -998,7 +1011,8 @@ class CustomStreamWrapper:
                         _initial_delta.pop("role", None)
                         model_response.choices[0].delta = Delta(**_initial_delta)
                     print_verbose(
-                        f"model_response.choices[0].delta: {model_response.choices[0].delta}"
+                        "model_response.choices[0].delta: %s",
+                        model_response.choices[0].delta,
                     )
                 else:
                     ## else
@@ -1011,7 +1025,7 @@ class CustomStreamWrapper:
                     _index: Optional[int] = completion_obj.get("index")
                     if _index is not None:
                         model_response.choices[0].index = _index
-                print_verbose(f"returning model_response: {model_response}")
+                print_verbose("returning model_response: %s", model_response)
                 return model_response
             else:
                 return
@@ -1063,10 +1077,50 @@ class CustomStreamWrapper:
                 self.chunks.append(model_response)
             return
 
+    def stream_chunk_creator(self, stream_chunk: StreamChunk) -> ModelResponse:
+        """
+        Builds the response for a plain text chunk, returned by `self.chunk_decoder`.
+
+        Same output as `chunk_creator`, for a text chunk after the first one.
+        """
+        self.safety_checker()
+        if stream_chunk.id is not None:  # openai-compatible chunk
+            self.response_id = stream_chunk.id
+            self.system_fingerprint = stream_chunk.system_fingerprint
+            if self.custom_llm_provider == "azure" and stream_chunk.model is not None:
+                # for azure, we need to pass the model from the orignal chunk
+                self.model = stream_chunk.model
+        model_response = self.model_response_creator(
+            chunk={
+                "choices": [
+                    StreamingChoices(
+                        index=stream_chunk.index,
+                        delta=Delta(
+                            content=stream_chunk.text,
+                            **(stream_chunk.delta_params or {}),
+                        ),
+                    )
+                ]
+            }
+        )
+        model_response.model = self.model
+        if stream_chunk.provider_specific_fields is not None:
+            for key, value in stream_chunk.provider_specific_fields.items():
+                setattr(model_response, key, value)
+        return model_response
+
     def chunk_creator(self, chunk):  # type: ignore  # noqa: PLR0915
-        model_response = self.model_response_creator()
-        response_obj: dict = {}
         try:
+            if (
+                self.chunk_decoder is not None
+                and self.sent_first_chunk is True
+                and self.received_finish_reason is None
+            ):
+                stream_chunk = self.chunk_decoder.decode(chunk)
+                if stream_chunk is not None:
+                    return self.stream_chunk_creator(stream_chunk=stream_chunk)
+            model_response = self.model_response_creator()
+            response_obj: dict = {}
             # return this for all models
             completion_obj = {"content": ""}
             from litellm.types.utils import GenericStreamingChunk as GChunk
@@ -1289,19 +1343,19 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "ollama":
                 response_obj = self.handle_ollama_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "ollama_chat":
                 response_obj = self.handle_ollama_chat_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "cloudflare":
                 response_obj = self.handle_cloudlfare_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "watsonx":
@@ -1312,13 +1366,13 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "triton":
                 response_obj = self.handle_triton_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "text-completion-openai":
                 response_obj = self.handle_openai_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if response_obj["usage"] is not None:
@@ -1332,7 +1386,7 @@ class CustomStreamWrapper:
                     chunk
                 )
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if "usage" in response_obj is not None:
@@ -1344,7 +1398,7 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "azure_text":
                 response_obj = self.handle_azure_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "cached_response":
@@ -1363,7 +1417,7 @@ class CustomStreamWrapper:
                 completion_obj["content"] = response_obj["text"]
                 if response_obj["tool_calls"] is not None:
                     completion_obj["tool_calls"] = response_obj["tool_calls"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if hasattr(chunk, "id"):
                     model_response.id = chunk.id
                     self.response_id = chunk.id
@@ -1380,7 +1434,7 @@ class CustomStreamWrapper:
                 if response_obj is None:
                     return
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     if response_obj["finish_reason"] == "error":
                         raise Exception(
@@ -1424,7 +1478,9 @@ class CustomStreamWrapper:
 
             model_response.model = self.model
             print_verbose(
-                f"model_response finish reason 3: {self.received_finish_reason}; response_obj={response_obj}"
+                "model_response finish reason 3: %s; response_obj=%s",
+                self.received_finish_reason,
+                response_obj,
             )
             ## FUNCTION CALL PARSING
             if (
@@ -1476,7 +1532,7 @@ class CustomStreamWrapper:
                                             ):
                                                 t.function.arguments = ""
                             _json_delta = delta.model_dump()
-                            print_verbose(f"_json_delta: {_json_delta}")
+                            print_verbose("_json_delta: %s", _json_delta)
                             if "role" not in _json_delta or _json_delta["role"] is None:
                                 _json_delta["role"] = (
                                     "assistant"  # mistral's api returns role as None
@@ -1512,10 +1568,10 @@ class CustomStreamWrapper:
                                 if original_chunk.choices[0].delta is None
                                 else dict(original_chunk.choices[0].delta)
                             )
-                            print_verbose(f"original delta: {delta}")
+                            print_verbose("original delta: %s", delta)
                             model_response.choices[0].delta = Delta(**delta)
                             print_verbose(
-                                f"new delta: {model_response.choices[0].delta}"
+                                "new delta: %s", model_response.choices[0].delta
                             )
                         except Exception:
                             model_response.choices[0].delta = Delta()
@@ -1527,9 +1583,11 @@ class CustomStreamWrapper:
                         return model_response
                     return
             print_verbose(
-                f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
+                "model_response.choices[0].delta: %s; completion_obj: %s",
+                model_response.choices[0].delta,
+                completion_obj,
             )
-            print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+            print_verbose("self.sent_first_chunk: %s", self.sent_first_chunk)
 
             ## CHECK FOR TOOL USE
             if "tool_calls" in completion_obj and len(completion_obj["tool_calls"]) > 0:
@@ -1647,18 +1705,19 @@ class CustomStreamWrapper:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
                     print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                        "PROCESSED CHUNK PRE CHUNK CREATOR: %s; custom_llm_provider: %s",
+                        chunk,
+                        self.custom_llm_provider,
                     )
                     response: Optional[ModelResponse] = self.chunk_creator(chunk=chunk)
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    print_verbose("PROCESSED CHUNK POST CHUNK CREATOR: %s", response)
 
                     if response is None:
                         continue
                     ## LOGGING
-                    threading.Thread(
-                        target=self.run_success_logging_and_cache_storage,
-                        args=(response, cache_hit),
-                    ).start()  # log response
+                    GLOBAL_LOGGING_WORKER.submit(
+                        self.run_success_logging_and_cache_storage, response, cache_hit
+                    )  # log response
                     choice = response.choices[0]
                     if isinstance(choice, StreamingChoices):
                         self.response_uptil_now += choice.delta.get("content", "") or ""
@@ -1704,10 +1763,9 @@ class CustomStreamWrapper:
                     )
 
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler,
-                    args=(response, None, None, cache_hit),
-                ).start()  # log response
+                GLOBAL_LOGGING_WORKER.submit(
+                    self.logging_obj.success_handler, response, None, None, cache_hit
+                )  # log response
 
                 if self.sent_stream_usage is False and self.send_stream_usage is True:
                     self.sent_stream_usage = True
@@ -1720,17 +1778,18 @@ class CustomStreamWrapper:
                     usage = calculate_total_usage(chunks=self.chunks)
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
-                threading.Thread(
-                    target=self.run_success_logging_and_cache_storage,
-                    args=(processed_chunk, cache_hit),
-                ).start()  # log response
+                GLOBAL_LOGGING_WORKER.submit(
+                    self.run_success_logging_and_cache_storage,
+                    processed_chunk,
+                    cache_hit,
+                )  # log response
                 return processed_chunk
         except Exception as e:
             traceback_exception = traceback.format_exc()
             # LOG FAILURE - handle streaming failure logging in the _next_ object, remove `handle_failure` once it's deprecated
-            threading.Thread(
-                target=self.logging_obj.failure_handler, args=(e, traceback_exception)
-            ).start()
+            GLOBAL_LOGGING_WORKER.submit(
+                self.logging_obj.failure_handler, e, traceback_exception
+            )
             if isinstance(e, OpenAIError):
                 raise e
             else:
@@ -1807,19 +1866,19 @@ class CustomStreamWrapper:
                         continue
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
-                    print_verbose(f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}")
+                    print_verbose("PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk)
 
                     processed_chunk: Optional[ModelResponse] = self.chunk_creator(
                         chunk=chunk
                     )
                     print_verbose(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        "PROCESSED ASYNC CHUNK POST CHUNK CREATOR: %s", processed_chunk
                     )
                     if processed_chunk is None:
                         continue
                     ## LOGGING
                     ## LOGGING
-                    executor.submit(
+                    GLOBAL_LOGGING_WORKER.submit(
                         self.logging_obj.success_handler,
                         result=processed_chunk,
                         start_time=None,
@@ -1861,7 +1920,7 @@ class CustomStreamWrapper:
 
                         # Create a new object without the removed attribute
                         processed_chunk = self.model_response_creator(chunk=obj_dict)
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    print_verbose("final returned processed chunk: %s", processed_chunk)
                     return processed_chunk
                 raise StopAsyncIteration
             else:  # temporary patch for non-aiohttp async calls
@@ -1874,20 +1933,23 @@ class CustomStreamWrapper:
                     else:
                         chunk = next(self.completion_stream)
                     if chunk is not None and chunk != b"":
-                        print_verbose(f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}")
+                        print_verbose("PROCESSED CHUNK PRE CHUNK CREATOR: %s", chunk)
                         processed_chunk: Optional[ModelResponse] = self.chunk_creator(
                             chunk=chunk
                         )
                         print_verbose(
-                            f"PROCESSED CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                            "PROCESSED CHUNK POST CHUNK CREATOR: %s", processed_chunk
                         )
                         if processed_chunk is None:
                             continue
                         ## LOGGING
-                        threading.Thread(
-                            target=self.logging_obj.success_handler,
-                            args=(processed_chunk, None, None, cache_hit),
-                        ).start()  # log processed_chunk
+                        GLOBAL_LOGGING_WORKER.submit(
+                            self.logging_obj.success_handler,
+                            processed_chunk,
+                            None,
+                            None,
+                            cache_hit,
+                        )  # log processed_chunk
                         asyncio.create_task(
                             self.logging_obj.async_success_handler(
                                 processed_chunk, cache_hit=cache_hit
@@ -1921,10 +1983,9 @@ class CustomStreamWrapper:
                         getattr(complete_streaming_response, "usage"),
                     )
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler,
-                    args=(response, None, None, cache_hit),
-                ).start()  # log response
+                GLOBAL_LOGGING_WORKER.submit(
+                    self.logging_obj.success_handler, response, None, None, cache_hit
+                )  # log response
                 asyncio.create_task(
                     self.logging_obj.async_success_handler(
                         response, cache_hit=cache_hit
@@ -1938,10 +1999,13 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler,
-                    args=(processed_chunk, None, None, cache_hit),
-                ).start()  # log response
+                GLOBAL_LOGGING_WORKER.submit(
+                    self.logging_obj.success_handler,
+                    processed_chunk,
+                    None,
+                    None,
+                    cache_hit,
+                )  # log response
                 asyncio.create_task(
                     self.logging_obj.async_success_handler(
                         processed_chunk, cache_hit=cache_hit
@@ -1956,10 +2020,9 @@ class CustomStreamWrapper:
             )
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                GLOBAL_LOGGING_WORKER.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
                 asyncio.create_task(
                     self.logging_obj.async_failure_handler(e, traceback_exception)
@@ -1969,10 +2032,9 @@ class CustomStreamWrapper:
             traceback_exception = traceback.format_exc()
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                GLOBAL_LOGGING_WORKER.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
                 asyncio.create_task(
                     self.logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
@@ -26,7 +26,7 @@ def get_modified_max_tokens(
             return None
 
         ## MODEL INFO
-        _model_info = litellm.get_model_info(model=model)
+        _model_info = litellm.utils._get_cached_model_info(model=model)
 
         max_output_tokens = litellm.get_max_tokens(
             model=base_model
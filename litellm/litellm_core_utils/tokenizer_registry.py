@@ -0,0 +1,241 @@
+"""
+Process-wide registry of tokenizers used by `token_counter`, `encode` and `decode`.
+
+Loading a huggingface tokenizer means parsing a multi-MB json file, so tokenizers are
+cached per model *family* (e.g. every `claude-2*` model shares one tokenizer) in a
+bounded LRU.
+
+Tokenizers are looked up in the following order:
+1. In-memory LRU cache
+2. Local json files - `CUSTOM_TOKENIZER_DIR` (if set) + `litellm/llms/tokenizers`
+3. Huggingface hub - `Tokenizer.from_pretrained`
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from tokenizers import Tokenizer
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.default_encoding import encoding
+from litellm.litellm_core_utils.model_registry import GLOBAL_MODEL_REGISTRY
+
+DEFAULT_TOKENIZER_CACHE_SIZE = 32
+DEFAULT_MODEL_FAMILY_CACHE_SIZE = 1024
+
+OPENAI_TOKENIZER_FAMILY = "openai"
+ANTHROPIC_TOKENIZER_FAMILY = "anthropic"
+OPENAI_TOKENIZER = {"type": "openai_tokenizer", "tokenizer": encoding}
+
+# family -> huggingface hub identifier
+HUGGINGFACE_TOKENIZER_FAMILIES: Dict[str, str] = {
+    "cohere_command_r": "Xenova/c4ai-command-r-v01-tokenizer",
+    "llama_2": "hf-internal-testing/llama-tokenizer",
+    "llama_3": "Xenova/llama-3-tokenizer",
+}
+
+_BUNDLED_TOKENIZER_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "llms", "tokenizers"
+)
+
+
+def _local_tokenizer_filename(identifier: str) -> str:
+    """
+    'Xenova/llama-3-tokenizer' -> 'Xenova--llama-3-tokenizer.json'
+    """
+    return identifier.replace("/", "--") + ".json"
+
+
+def get_tokenizer_family(model: str) -> str:
+    """
+    Map a model name to the key its tokenizer is cached under.
+
+    Mirrors the selection order previously used in `litellm.utils._select_tokenizer`.
+    """
+    if "command-r" in model and GLOBAL_MODEL_REGISTRY.contains(model, "cohere_models"):
+        return "cohere_command_r"
+    elif "claude-3" not in model and GLOBAL_MODEL_REGISTRY.contains(
+        model, "anthropic_models"
+    ):
+        return ANTHROPIC_TOKENIZER_FAMILY
+    elif "llama-2" in model.lower() or "replicate" in model.lower():
+        return "llama_2"
+    elif "llama-3" in model.lower():
+        return "llama_3"
+    elif GLOBAL_MODEL_REGISTRY.contains(
+        model,
+        "open_ai_chat_completion_models",
+        "open_ai_text_completion_models",
+        "open_ai_embedding_models",
+    ):
+        return OPENAI_TOKENIZER_FAMILY
+    # unknown model - try it as a huggingface hub identifier
+    return "huggingface/{}".format(model)
+
+
+class TokenizerRegistry:
+    """
+    Thread-safe, bounded LRU of tokenizers keyed by tokenizer family.
+
+    Values are the `{"type": ..., "tokenizer": ...}` dicts returned by `_select_tokenizer`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TOKENIZER_CACHE_SIZE,
+        local_tokenizer_dirs: Optional[List[str]] = None,
+    ):
+        self.max_size = max_size
+        self.local_tokenizer_dirs = local_tokenizer_dirs
+        self._tokenizers: "OrderedDict[str, dict]" = OrderedDict()
+        self._model_to_family: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._family_locks: Dict[str, threading.Lock] = {}
+
+    def _get_local_tokenizer_dirs(self) -> List[str]:
+        if self.local_tokenizer_dirs is not None:
+            return self.local_tokenizer_dirs
+        dirs = []
+        custom_dir = os.getenv("CUSTOM_TOKENIZER_DIR")
+        if custom_dir:
+            dirs.append(custom_dir)
+        dirs.append(_BUNDLED_TOKENIZER_DIR)
+        return dirs
+
+    def _load_huggingface_tokenizer(self, identifier: str) -> Tokenizer:
+        """
+        Load from a local json file if one exists, else from the huggingface hub.
+        """
+        filename = _local_tokenizer_filename(identifier)
+        for _dir in self._get_local_tokenizer_dirs():
+            path = os.path.join(_dir, filename)
+            if os.path.isfile(path):
+                verbose_logger.debug("loading tokenizer=%s from %s", identifier, path)
+                return Tokenizer.from_file(path)
+        return Tokenizer.from_pretrained(identifier)
+
+    def _load_tokenizer(self, family: str) -> Optional[dict]:
+        """
+        Returns None if `family` is an unknown model, that isn't on the huggingface hub either.
+        """
+        if family == OPENAI_TOKENIZER_FAMILY:
+            return OPENAI_TOKENIZER
+        elif family == ANTHROPIC_TOKENIZER_FAMILY:
+            return {
+                "type": "huggingface_tokenizer",
+                "tokenizer": Tokenizer.from_file(
+                    os.path.join(_BUNDLED_TOKENIZER_DIR, "anthropic_tokenizer.json")
+                ),
+            }
+        elif family in HUGGINGFACE_TOKENIZER_FAMILIES:
+            return {
+                "type": "huggingface_tokenizer",
+                "tokenizer": self._load_huggingface_tokenizer(
+                    HUGGINGFACE_TOKENIZER_FAMILIES[family]
+                ),
+            }
+
+        identifier = family[len("huggingface/") :]
+        try:
+            return {
+                "type": "huggingface_tokenizer",
+                "tokenizer": self._load_huggingface_tokenizer(identifier),
+            }
+        except Exception:
+            return None
+
+    def _get_family(self, model: str) -> str:
+        with self._lock:
+            family = self._model_to_family.get(model)
+            if family is not None:
+                self._model_to_family.move_to_end(model)
+                return family
+        family = get_tokenizer_family(model)
+        with self._lock:
+            self._model_to_family[model] = family
+            if len(self._model_to_family) > DEFAULT_MODEL_FAMILY_CACHE_SIZE:
+                self._model_to_family.popitem(last=False)
+        return family
+
+    def _get_from_cache(self, family: str) -> Optional[dict]:
+        with self._lock:
+            tokenizer_json = self._tokenizers.get(family)
+            if tokenizer_json is not None:
+                self._tokenizers.move_to_end(family)
+            return tokenizer_json
+
+    def get_tokenizer(self, model: str) -> dict:
+        family = self._get_family(model)
+        tokenizer_json = self._get_from_cache(family)
+        if tokenizer_json is not None:
+            return tokenizer_json
+
+        # only one thread loads a given family, others wait on it
+        with self._lock:
+            family_lock = self._family_locks.setdefault(family, threading.Lock())
+        with family_lock:
+            tokenizer_json = self._get_from_cache(family)
+            if tokenizer_json is not None:
+                return tokenizer_json
+            tokenizer_json = self._load_tokenizer(family)
+            if tokenizer_json is None:
+                # fall back to the openai tokenizer - remember it for the model, instead of caching a copy of it per unknown model
+                with self._lock:
+                    self._model_to_family[model] = OPENAI_TOKENIZER_FAMILY
+                    self._family_locks.pop(family, None)
+                family = OPENAI_TOKENIZER_FAMILY
+                tokenizer_json = OPENAI_TOKENIZER
+            with self._lock:
+                self._tokenizers[family] = tokenizer_json
+                while len(self._tokenizers) > self.max_size:
+                    evicted_family, _ = self._tokenizers.popitem(last=False)
+                    self._family_locks.pop(evicted_family, None)
+        return tokenizer_json
+
+    def preload(
+        self, models: Iterable[str], background: bool = True
+    ) -> Optional[threading.Thread]:
+        """
+        Warm the cache for the given models.
+
+        If `background=True`, loading happens in a daemon thread, which is returned.
+        """
+        _models = list(dict.fromkeys(m for m in models if isinstance(m, str)))
+
+        def _preload():
+            for model in _models:
+                try:
+                    self.get_tokenizer(model=model)
+                except Exception as e:
+                    verbose_logger.debug(
+                        "Failed to preload tokenizer for model=%s - %s", model, str(e)
+                    )
+
+        if background is False:
+            _preload()
+            return None
+        thread = threading.Thread(
+            target=_preload, name="litellm-tokenizer-preload", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def cached_families(self) -> List[str]:
+        with self._lock:
+            return list(self._tokenizers.keys())
+
+    def clear(self):
+        with self._lock:
+            self._tokenizers.clear()
+            self._model_to_family.clear()
+            self._family_locks.clear()
+
+
+tokenizer_registry = TokenizerRegistry()
+
+
+def preload_tokenizers(models: Iterable[str], background: bool = True):
+    return tokenizer_registry.preload(models=models, background=background)
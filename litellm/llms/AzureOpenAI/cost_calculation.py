@@ -7,7 +7,7 @@ from typing import Optional, Tuple
 
 from litellm._logging import verbose_logger
 from litellm.types.utils import Usage
-from litellm.utils import get_model_info
+from litellm.utils import _get_cached_model_info
 
 
 def cost_per_token(
@@ -24,7 +24,7 @@ def cost_per_token(
         Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
     """
     ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider="azure")
+    model_info = _get_cached_model_info(model=model, custom_llm_provider="azure")
     cached_tokens: Optional[int] = None
     ## CALCULATE INPUT COST
     non_cached_text_tokens = usage.prompt_tokens
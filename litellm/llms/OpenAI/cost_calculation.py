@@ -7,7 +7,7 @@ from typing import Literal, Optional, Tuple
 
 from litellm._logging import verbose_logger
 from litellm.types.utils import CallTypes, Usage
-from litellm.utils import get_model_info
+from litellm.utils import _get_cached_model_info
 
 
 def cost_router(call_type: CallTypes) -> Literal["cost_per_token", "cost_per_second"]:
@@ -29,7 +29,7 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
         Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
     """
     ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider="openai")
+    model_info = _get_cached_model_info(model=model, custom_llm_provider="openai")
 
     ## CALCULATE INPUT COST
     ### Non-cached text tokens
@@ -84,7 +84,7 @@ def cost_per_second(
     Calculates the cost per second for a given model, prompt tokens, and completion tokens.
     """
     ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider="openai")
+    model_info = _get_cached_model_info(model=model, custom_llm_provider="openai")
     prompt_cost = 0.0
     completion_cost = 0.0
     ## Speech / Audio cost calculation
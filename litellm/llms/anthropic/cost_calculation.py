@@ -6,7 +6,7 @@ Helper util for handling anthropic-specific cost calculation
 from typing import Tuple
 
 from litellm.types.utils import Usage
-from litellm.utils import get_model_info
+from litellm.utils import _get_cached_model_info
 
 
 def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
@@ -21,7 +21,7 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
         Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
     """
     ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider="anthropic")
+    model_info = _get_cached_model_info(model=model, custom_llm_provider="anthropic")
 
     ## CALCULATE INPUT COST
     ### Cost of processing (non-cache hit + cache hit) + Cost of cache-writing (cache writing)
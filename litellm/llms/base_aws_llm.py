@@ -8,6 +8,11 @@ from pydantic import BaseModel
 
 from litellm._logging import verbose_logger
 from litellm.caching.caching import DualCache, InMemoryCache
+from litellm.secret_managers.credential_refresh_manager import (
+    credential_refresh_manager,
+    get_credential_key,
+    get_expiry_timestamp,
+)
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 from .base import BaseLLM
@@ -37,6 +42,10 @@ class AwsAuthError(Exception):
         )  # Call the base class constructor with the parameters it needs
 
 
+def _get_sts_credentials_expiry(sts_response: dict) -> Optional[float]:
+    return get_expiry_timestamp(sts_response["Credentials"].get("Expiration"))
+
+
 class BaseAWSLLM(BaseLLM):
     def __init__(self) -> None:
         self.iam_cache = DualCache()
@@ -158,16 +167,9 @@ class BaseAWSLLM(BaseLLM):
             else:
                 sts_endpoint = aws_sts_endpoint
 
-            iam_creds_cache_key = json.dumps(
-                {
-                    "aws_web_identity_token": aws_web_identity_token,
-                    "aws_role_name": aws_role_name,
-                    "aws_session_name": aws_session_name,
-                }
-            )
-
-            iam_creds_dict = self.iam_cache.get_cache(iam_creds_cache_key)
-            if iam_creds_dict is None:
+            def _assume_role_with_web_identity(
+                current: Optional[dict],
+            ) -> Tuple[dict, Optional[float]]:
                 oidc_token = get_secret(aws_web_identity_token)
 
                 if oidc_token is None:
@@ -201,16 +203,24 @@ class BaseAWSLLM(BaseLLM):
                     "region_name": aws_region_name,
                 }
 
-                self.iam_cache.set_cache(
-                    key=iam_creds_cache_key,
-                    value=json.dumps(iam_creds_dict),
-                    ttl=3600 - 60,
-                )
-
                 if sts_response["PackedPolicySize"] > 75:
                     verbose_logger.warning(
                         f"The policy size is greater than 75% of the allowed size, PackedPolicySize: {sts_response['PackedPolicySize']}"
                     )
+                return iam_creds_dict, _get_sts_credentials_expiry(sts_response)
+
+            # refreshed in the background, ahead of expiry
+            iam_creds_dict = credential_refresh_manager.get_credential(
+                key=get_credential_key(
+                    "bedrock_web_identity",
+                    aws_web_identity_token,
+                    aws_role_name,
+                    aws_session_name,
+                    aws_region_name,
+                    sts_endpoint,
+                ),
+                refresh_fn=_assume_role_with_web_identity,
+            )
 
             session = boto3.Session(**iam_creds_dict)
 
@@ -218,19 +228,34 @@ class BaseAWSLLM(BaseLLM):
 
             return iam_creds
         elif aws_role_name is not None and aws_session_name is not None:
-            sts_client = boto3.client(
-                "sts",
-                aws_access_key_id=aws_access_key_id,  # [OPTIONAL]
-                aws_secret_access_key=aws_secret_access_key,  # [OPTIONAL]
-            )
 
-            sts_response = sts_client.assume_role(
-                RoleArn=aws_role_name, RoleSessionName=aws_session_name
-            )
+            def _assume_role(current: Optional[dict]) -> Tuple[dict, Optional[float]]:
+                sts_client = boto3.client(
+                    "sts",
+                    aws_access_key_id=aws_access_key_id,  # [OPTIONAL]
+                    aws_secret_access_key=aws_secret_access_key,  # [OPTIONAL]
+                )
 
-            # Extract the credentials from the response and convert to Session Credentials
-            sts_credentials = sts_response["Credentials"]
+                sts_response = sts_client.assume_role(
+                    RoleArn=aws_role_name, RoleSessionName=aws_session_name
+                )
+                return sts_response["Credentials"], _get_sts_credentials_expiry(
+                    sts_response
+                )
+
+            # refreshed in the background, ahead of expiry
+            sts_credentials = credential_refresh_manager.get_credential(
+                key=get_credential_key(
+                    "bedrock_assume_role",
+                    aws_access_key_id,
+                    aws_secret_access_key,
+                    aws_role_name,
+                    aws_session_name,
+                ),
+                refresh_fn=_assume_role,
+            )
 
+            # Convert to Session Credentials
             credentials = Credentials(
                 access_key=sts_credentials["AccessKeyId"],
                 secret_key=sts_credentials["SecretAccessKey"],
@@ -174,7 +174,9 @@ class BedrockConverseLLM(BaseAWSLLM):
                     timeout = httpx.Timeout(timeout)
                 _params["timeout"] = timeout
             client = get_async_httpx_client(
-                params=_params, llm_provider=litellm.LlmProviders.BEDROCK
+                params=_params,
+                llm_provider=litellm.LlmProviders.BEDROCK,
+                api_base=api_base,
             )
         else:
             client = client  # type: ignore
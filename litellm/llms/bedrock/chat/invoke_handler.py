@@ -186,7 +186,7 @@ async def make_call(
     try:
         if client is None:
             client = get_async_httpx_client(
-                llm_provider=litellm.LlmProviders.BEDROCK
+                llm_provider=litellm.LlmProviders.BEDROCK, api_base=api_base
             )  # Create a new client if none provided
 
         response = await client.post(
@@ -970,7 +970,7 @@ class BedrockLLM(BaseAWSLLM):
                 if isinstance(timeout, float) or isinstance(timeout, int):
                     timeout = httpx.Timeout(timeout)
                 _params["timeout"] = timeout
-            client = get_async_httpx_client(params=_params, llm_provider=litellm.LlmProviders.BEDROCK)  # type: ignore
+            client = get_async_httpx_client(params=_params, llm_provider=litellm.LlmProviders.BEDROCK, api_base=api_base)  # type: ignore
         else:
             client = client  # type: ignore
 
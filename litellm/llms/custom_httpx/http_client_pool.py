@@ -0,0 +1,324 @@
+"""
+Pool of shared httpx clients (`AsyncHTTPHandler` / `HTTPHandler`), used by `get_async_httpx_client` and `_get_httpx_client`.
+
+Re-using a client keeps its connections (and TLS sessions) to the LLM API warm. Clients are keyed by
+(client type, provider, endpoint, ssl config, force_ipv4, http2, client params) - so a change to e.g.
+`litellm.ssl_verify` results in a new client, instead of re-using one with the old config.
+
+- `litellm.httpx_client_pool_max_size` - max. number of pooled clients. The least recently used client is evicted first.
+- `litellm.httpx_client_pool_ttl` - evict clients not used for this many seconds.
+
+Evicted clients are closed (`aclose()` for async clients) once nothing references them anymore - i.e. no caller
+holds on to the client, and none of its connections is serving a request. Until then they're 'retired', and
+checked again on later pool operations.
+
+Use `get_metrics()` for pool hits / evictions, and the connection utilisation of each pooled client.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+import httpx
+
+import litellm
+from litellm._logging import verbose_logger
+
+# references to a client, held by the pool itself - see `_PooledClient.get_reference_count`
+_POOL_REFERENCES = 2  # `_PooledClient.handler` + the `sys.getrefcount` argument
+
+
+class _PooledClient:
+    __slots__ = ("key", "handler", "created_at", "last_used_at", "hits")
+
+    def __init__(self, key: tuple, handler: Any):
+        self.key = key
+        self.handler = handler
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+        self.hits = 0
+
+    def get_reference_count(self) -> Optional[int]:
+        """
+        Returns the number of references to the client outside the pool (callers holding on to it, in-flight requests).
+
+        Returns None if the interpreter doesn't expose reference counts.
+        """
+        if not hasattr(sys, "getrefcount"):
+            return None
+        return sys.getrefcount(self.handler) - _POOL_REFERENCES
+
+    def get_connection_usage(self) -> Tuple[int, int, int, Optional[int]]:
+        """
+        Returns (open connections, active connections, queued requests, max. connections) of the client's connection pool.
+        """
+        transport = getattr(getattr(self.handler, "client", None), "_transport", None)
+        pool = getattr(transport, "_pool", None)
+        try:
+            connections = pool.connections  # type: ignore
+            open_connections = 0
+            active_connections = 0
+            for connection in connections:
+                if connection.is_closed():
+                    continue
+                open_connections += 1
+                if not connection.is_idle():
+                    active_connections += 1
+            return (
+                open_connections,
+                active_connections,
+                len(getattr(pool, "_requests", [])),
+                getattr(pool, "_max_connections", None),
+            )
+        except Exception:
+            # custom / mocked transport - no connection pool to inspect
+            return 0, 0, 0, None
+
+    def can_close(self) -> bool:
+        reference_count = self.get_reference_count()
+        if reference_count is None or reference_count > 0:
+            return False
+        _, active_connections, queued_requests, _ = self.get_connection_usage()
+        return active_connections == 0 and queued_requests == 0
+
+
+class HTTPClientPool:
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Unset params are read from the `litellm.httpx_client_pool_*` settings.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._clients: "OrderedDict[tuple, _PooledClient]" = OrderedDict()
+        self._retired: List[_PooledClient] = []
+        self._close_tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+        ## METRICS
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._closed = 0
+
+    def _get_max_size(self) -> int:
+        if self.max_size is not None:
+            return self.max_size
+        return litellm.httpx_client_pool_max_size
+
+    def _get_ttl(self) -> Optional[float]:
+        if self.ttl is not None:
+            return self.ttl
+        return litellm.httpx_client_pool_ttl
+
+    def get_client(self, key: tuple, create_client: Callable[[], Any]) -> Any:
+        """
+        Returns the pooled client for `key`. If there's none, creates one with `create_client()` and adds it to the pool.
+        """
+        current_time = time.monotonic()
+        with self._lock:
+            pooled_client = self._clients.get(key)
+            if pooled_client is not None:
+                ttl = self._get_ttl()
+                if ttl is None or current_time - pooled_client.last_used_at < ttl:
+                    self._clients.move_to_end(key)
+                    pooled_client.last_used_at = current_time
+                    pooled_client.hits += 1
+                    self._hits += 1
+                    return pooled_client.handler
+                self._evict(pooled_client)
+
+            self._misses += 1
+            pooled_client = _PooledClient(key=key, handler=create_client())
+            self._clients[key] = pooled_client
+            self._evict_idle_clients(current_time=current_time)
+            while len(self._clients) > max(self._get_max_size(), 1):
+                _, least_recently_used = next(iter(self._clients.items()))
+                self._evict(least_recently_used)
+            self._close_retired_clients()
+            return pooled_client.handler
+
+    def _evict_idle_clients(self, current_time: float):
+        ttl = self._get_ttl()
+        if ttl is None:
+            return
+        # clients are ordered by last use - stop at the first one used within the ttl
+        for pooled_client in list(self._clients.values()):
+            if current_time - pooled_client.last_used_at < ttl:
+                break
+            self._evict(pooled_client)
+
+    def _evict(self, pooled_client: _PooledClient):
+        self._clients.pop(pooled_client.key, None)
+        self._evictions += 1
+        self._retired.append(pooled_client)
+
+    def _close_retired_clients(self):
+        still_in_use = []
+        for pooled_client in self._retired:
+            if pooled_client.can_close():
+                self._close(pooled_client.handler)
+            elif pooled_client.get_reference_count() is None:
+                # can't tell if the client is still in use - leave it to the garbage collector
+                pass
+            else:
+                still_in_use.append(pooled_client)
+        self._retired = still_in_use
+
+    def _close(self, handler: Any):
+        try:
+            close_result = handler.close()
+        except Exception as e:
+            verbose_logger.debug(
+                "LiteLLM HTTP Client Pool: error closing evicted client - {}".format(
+                    str(e)
+                )
+            )
+            return
+        if not asyncio.iscoroutine(close_result):
+            self._closed += 1
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop to run `aclose()` on - the connections are released when the client is garbage collected
+            close_result.close()
+            return
+        self._closed += 1
+        task = loop.create_task(self._aclose(close_result))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def _aclose(self, close_coroutine):
+        try:
+            await close_coroutine
+        except Exception as e:
+            verbose_logger.debug(
+                "LiteLLM HTTP Client Pool: error closing evicted client - {}".format(
+                    str(e)
+                )
+            )
+
+    def close_retired_clients(self):
+        """
+        Close evicted clients, which are no longer in use.
+        """
+        with self._lock:
+            self._close_retired_clients()
+
+    def clear(self):
+        """
+        Evict all pooled clients. Clients still in use are closed once they're no longer referenced.
+        """
+        with self._lock:
+            for pooled_client in list(self._clients.values()):
+                self._evict(pooled_client)
+            self._close_retired_clients()
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            self._close_retired_clients()
+            clients: List[Dict[str, Any]] = []
+            total_open_connections = 0
+            total_active_connections = 0
+            for pooled_client in self._clients.values():
+                (
+                    open_connections,
+                    active_connections,
+                    queued_requests,
+                    max_connections,
+                ) = pooled_client.get_connection_usage()
+                total_open_connections += open_connections
+                total_active_connections += active_connections
+                clients.append(
+                    {
+                        # keys from `get_client_pool_key` start with (client type, provider, endpoint)
+                        "client_type": pooled_client.key[0],
+                        "llm_provider": (
+                            pooled_client.key[1] if len(pooled_client.key) > 1 else None
+                        ),
+                        "endpoint": (
+                            pooled_client.key[2] if len(pooled_client.key) > 2 else None
+                        ),
+                        "hits": pooled_client.hits,
+                        "references": pooled_client.get_reference_count(),
+                        "open_connections": open_connections,
+                        "active_connections": active_connections,
+                        "queued_requests": queued_requests,
+                        "max_connections": max_connections,
+                        "utilization": (
+                            active_connections / max_connections
+                            if max_connections
+                            else 0.0
+                        ),
+                    }
+                )
+            return {
+                "pool_size": len(self._clients),
+                "max_pool_size": self._get_max_size(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "closed": self._closed,
+                "retired": len(self._retired),
+                "open_connections": total_open_connections,
+                "active_connections": total_active_connections,
+                "clients": clients,
+            }
+
+
+def _make_hashable(value: Any) -> Hashable:
+    if isinstance(value, httpx.Timeout):
+        return ("httpx.Timeout",) + tuple(sorted(value.as_dict().items()))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _make_hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _get_endpoint(api_base: Optional[str]) -> Optional[str]:
+    """
+    Returns the `scheme://host:port` of `api_base` - requests to different paths on the same host share a client.
+    """
+    if api_base is None:
+        return None
+    try:
+        url = httpx.URL(api_base)
+        if not url.host:
+            return api_base
+        if url.port is None:
+            return "{}://{}".format(url.scheme, url.host)
+        return "{}://{}:{}".format(url.scheme, url.host, url.port)
+    except Exception:
+        return api_base
+
+
+def get_client_pool_key(
+    client_type: str,
+    llm_provider: Optional[str],
+    params: Optional[dict],
+    api_base: Optional[str],
+    ssl_verify: Any,
+    cert: Any,
+) -> tuple:
+    return (
+        client_type,
+        getattr(llm_provider, "value", llm_provider),
+        _get_endpoint(api_base),
+        _make_hashable(ssl_verify),
+        _make_hashable(cert),
+        litellm.force_ipv4,
+        litellm.http2,
+        _make_hashable(params or {}),
+    )
+
+
+GLOBAL_HTTP_CLIENT_POOL = HTTPClientPool()
@@ -1,4 +1,5 @@
 import asyncio
+import importlib.util
 import os
 import traceback
 from typing import TYPE_CHECKING, Any, Callable, List, Mapping, Optional, Union
@@ -7,7 +8,11 @@ import httpx
 from httpx import USE_CLIENT_DEFAULT, AsyncHTTPTransport, HTTPTransport
 
 import litellm
-from litellm.caching import InMemoryCache
+from litellm._logging import verbose_logger
+from litellm.llms.custom_httpx.http_client_pool import (
+    GLOBAL_HTTP_CLIENT_POOL,
+    get_client_pool_key,
+)
 from litellm.types.llms.custom_http import *
 
 if TYPE_CHECKING:
@@ -29,6 +34,22 @@ _DEFAULT_TIMEOUT = httpx.Timeout(timeout=5.0, connect=5.0)
 _DEFAULT_TTL_FOR_HTTPX_CLIENTS = 3600  # 1 hour, re-use the same httpx client for 1 hour
 
 
+def _should_use_http2(http2: Optional[bool]) -> bool:
+    """
+    HTTP/2 is opt-in - via `http2=True` or `litellm.http2 = True`. Requires the `h2` package.
+    """
+    if http2 is None:
+        http2 = litellm.http2
+    if http2 is not True:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        verbose_logger.warning(
+            "HTTP/2 is enabled, but the `h2` package is not installed - using HTTP/1.1. Run `pip install 'httpx[http2]'` to use HTTP/2."
+        )
+        return False
+    return True
+
+
 class AsyncHTTPHandler:
     def __init__(
         self,
@@ -36,9 +57,11 @@ class AsyncHTTPHandler:
         event_hooks: Optional[Mapping[str, List[Callable[..., Any]]]] = None,
         concurrent_limit=1000,
         client_alias: Optional[str] = None,  # name for client in logs
+        http2: Optional[bool] = None,  # defaults to `litellm.http2`
     ):
         self.timeout = timeout
         self.event_hooks = event_hooks
+        self.http2 = http2
         self.client = self.create_client(
             timeout=timeout, concurrent_limit=concurrent_limit, event_hooks=event_hooks
         )
@@ -60,8 +83,9 @@ class AsyncHTTPHandler:
 
         if timeout is None:
             timeout = _DEFAULT_TIMEOUT
+        http2 = _should_use_http2(getattr(self, "http2", None))
         # Create a client with a connection pool
-        transport = self._create_async_transport()
+        transport = self._create_async_transport(http2=http2)
 
         return httpx.AsyncClient(
             transport=transport,
@@ -74,6 +98,7 @@ class AsyncHTTPHandler:
             verify=ssl_verify,
             cert=cert,
             headers=headers,
+            **({"http2": True} if http2 else {}),
         )
 
     async def close(self):
@@ -93,6 +118,7 @@ class AsyncHTTPHandler:
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
         follow_redirects: Optional[bool] = None,
+        timeout: Optional[Union[float, httpx.Timeout]] = None,
     ):
         # Set follow_redirects to UseClientDefault if None
         _follow_redirects = (
@@ -100,7 +126,11 @@ class AsyncHTTPHandler:
         )
 
         response = await self.client.get(
-            url, params=params, headers=headers, follow_redirects=_follow_redirects  # type: ignore
+            url,
+            params=params,
+            headers=headers,
+            follow_redirects=_follow_redirects,  # type: ignore
+            timeout=timeout if timeout is not None else USE_CLIENT_DEFAULT,  # type: ignore
         )
         return response
 
@@ -300,7 +330,9 @@ class AsyncHTTPHandler:
         except Exception:
             pass
 
-    def _create_async_transport(self) -> Optional[AsyncHTTPTransport]:
+    def _create_async_transport(
+        self, http2: bool = False
+    ) -> Optional[AsyncHTTPTransport]:
         """
         Create an async transport with IPv4 only if litellm.force_ipv4 is True.
         Otherwise, return None.
@@ -308,7 +340,7 @@ class AsyncHTTPHandler:
         Some users have seen httpx ConnectionError when using ipv6 - forcing ipv4 resolves the issue for them
         """
         if litellm.force_ipv4:
-            return AsyncHTTPTransport(local_address="0.0.0.0")
+            return AsyncHTTPTransport(local_address="0.0.0.0", http2=http2)
         else:
             return None
 
@@ -319,6 +351,7 @@ class HTTPHandler:
         timeout: Optional[Union[float, httpx.Timeout]] = None,
         concurrent_limit=1000,
         client: Optional[httpx.Client] = None,
+        http2: Optional[bool] = None,  # defaults to `litellm.http2`
     ):
         if timeout is None:
             timeout = _DEFAULT_TIMEOUT
@@ -331,7 +364,8 @@ class HTTPHandler:
         cert = os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate)
 
         if client is None:
-            transport = self._create_sync_transport()
+            _http2 = _should_use_http2(http2)
+            transport = self._create_sync_transport(http2=_http2)
 
             # Create a client with a connection pool
             self.client = httpx.Client(
@@ -344,6 +378,7 @@ class HTTPHandler:
                 verify=ssl_verify,
                 cert=cert,
                 headers=headers,
+                http2=_http2,
             )
         else:
             self.client = client
@@ -358,6 +393,7 @@ class HTTPHandler:
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
         follow_redirects: Optional[bool] = None,
+        timeout: Optional[Union[float, httpx.Timeout]] = None,
     ):
         # Set follow_redirects to UseClientDefault if None
         _follow_redirects = (
@@ -365,7 +401,11 @@ class HTTPHandler:
         )
 
         response = self.client.get(
-            url, params=params, headers=headers, follow_redirects=_follow_redirects  # type: ignore
+            url,
+            params=params,
+            headers=headers,
+            follow_redirects=_follow_redirects,  # type: ignore
+            timeout=timeout if timeout is not None else USE_CLIENT_DEFAULT,  # type: ignore
         )
         return response
 
@@ -445,7 +485,7 @@ class HTTPHandler:
         except Exception:
             pass
 
-    def _create_sync_transport(self) -> Optional[HTTPTransport]:
+    def _create_sync_transport(self, http2: bool = False) -> Optional[HTTPTransport]:
         """
         Create an HTTP transport with IPv4 only if litellm.force_ipv4 is True.
         Otherwise, return None.
@@ -453,76 +493,91 @@ class HTTPHandler:
         Some users have seen httpx ConnectionError when using ipv6 - forcing ipv4 resolves the issue for them
         """
         if litellm.force_ipv4:
-            return HTTPTransport(local_address="0.0.0.0")
+            return HTTPTransport(local_address="0.0.0.0", http2=http2)
         else:
             return None
 
 
+def _get_params_with_per_host_limit(
+    params: Optional[dict], api_base: Optional[str]
+) -> Optional[dict]:
+    """
+    Apply `litellm.httpx_max_connections_per_host` to clients for a specific endpoint.
+    """
+    max_connections_per_host = litellm.httpx_max_connections_per_host
+    if api_base is None or max_connections_per_host is None:
+        return params
+    _params = dict(params or {})
+    _params["concurrent_limit"] = min(
+        _params.get("concurrent_limit", 1000), max_connections_per_host
+    )
+    return _params
+
+
+def _get_ssl_config() -> tuple:
+    return (
+        os.getenv("SSL_VERIFY", litellm.ssl_verify),
+        os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate),
+    )
+
+
 def get_async_httpx_client(
     llm_provider: Union[LlmProviders, httpxSpecialProvider],
     params: Optional[dict] = None,
+    api_base: Optional[str] = None,
 ) -> AsyncHTTPHandler:
     """
-    Retrieves the async HTTP client from the cache
+    Retrieves the async HTTP client from the client pool
     If not present, creates a new client
 
-    Caches the new client and returns it.
+    Pass `api_base` to get a client for that endpoint (scheme + host), with `litellm.httpx_max_connections_per_host` applied.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "async_httpx_client" + _params_key_name + llm_provider
-    _cached_client = litellm.in_memory_llm_clients_cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
-
-    if params is not None:
-        _new_client = AsyncHTTPHandler(**params)
-    else:
-        _new_client = AsyncHTTPHandler(
-            timeout=httpx.Timeout(timeout=600.0, connect=5.0)
-        )
-    litellm.in_memory_llm_clients_cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    ssl_verify, cert = _get_ssl_config()
+    _cache_key = get_client_pool_key(
+        client_type="async_httpx_client",
+        llm_provider=llm_provider,
+        params=params,
+        api_base=api_base,
+        ssl_verify=ssl_verify,
+        cert=cert,
     )
-    return _new_client
 
+    def _create_client() -> AsyncHTTPHandler:
+        _params = _get_params_with_per_host_limit(params=params, api_base=api_base)
+        if _params is not None:
+            return AsyncHTTPHandler(**_params)
+        return AsyncHTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
 
-def _get_httpx_client(params: Optional[dict] = None) -> HTTPHandler:
+    return GLOBAL_HTTP_CLIENT_POOL.get_client(
+        key=_cache_key, create_client=_create_client
+    )
+
+
+def _get_httpx_client(
+    params: Optional[dict] = None, api_base: Optional[str] = None
+) -> HTTPHandler:
     """
-    Retrieves the HTTP client from the cache
+    Retrieves the HTTP client from the client pool
     If not present, creates a new client
 
-    Caches the new client and returns it.
+    Pass `api_base` to get a client for that endpoint (scheme + host), with `litellm.httpx_max_connections_per_host` applied.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "httpx_client" + _params_key_name
-    _cached_client = litellm.in_memory_llm_clients_cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
-
-    if params is not None:
-        _new_client = HTTPHandler(**params)
-    else:
-        _new_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
-
-    litellm.in_memory_llm_clients_cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    ssl_verify, cert = _get_ssl_config()
+    _cache_key = get_client_pool_key(
+        client_type="httpx_client",
+        llm_provider=None,
+        params=params,
+        api_base=api_base,
+        ssl_verify=ssl_verify,
+        cert=cert,
+    )
+
+    def _create_client() -> HTTPHandler:
+        _params = _get_params_with_per_host_limit(params=params, api_base=api_base)
+        if _params is not None:
+            return HTTPHandler(**_params)
+        return HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
+
+    return GLOBAL_HTTP_CLIENT_POOL.get_client(
+        key=_cache_key, create_client=_create_client
     )
-    return _new_client
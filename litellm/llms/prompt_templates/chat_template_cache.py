@@ -0,0 +1,298 @@
+"""
+Compiled chat templates + tokenizer configs used by `hf_chat_template`
+
+`hf_chat_template` renders a model's jinja chat template (from its huggingface `tokenizer_config.json`, or passed in).
+Compiling the template and checking whether it supports a system message are done once per template, not per request.
+
+Tokenizer configs are looked up in the following order:
+1. `known_tokenizer_config` - bundled configs (can be extended at runtime)
+2. In-memory LRU cache
+3. Local json files - `CUSTOM_TOKENIZER_DIR` (if set), named like 'mistralai--Mistral-7B-Instruct-v0.1--tokenizer_config.json'
+4. Huggingface hub - skipped if `HF_HUB_OFFLINE` is set. Configs fetched from the hub are saved to `CUSTOM_TOKENIZER_DIR`
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from jinja2 import Template
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+
+from litellm._logging import verbose_logger
+from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+DEFAULT_CHAT_TEMPLATE_CACHE_SIZE = 256
+DEFAULT_TOKENIZER_CONFIG_CACHE_SIZE = 256
+# hub lookups that raised (e.g. timeouts) are retried after this many seconds - 'not found' responses are cached
+FAILED_TOKENIZER_CONFIG_RETRY_INTERVAL = 600
+# providers whose prompts are built with the model's huggingface chat template (`prompt_factory` -> `hf_chat_template`)
+HF_CHAT_TEMPLATE_PROVIDERS = ("huggingface", "sagemaker", "vllm", "petals", "predibase")
+
+known_tokenizer_config = {
+    "mistralai/Mistral-7B-Instruct-v0.1": {
+        "tokenizer": {
+            "chat_template": "{{ bos_token }}{% for message in messages %}{% if (message['role'] == 'user') != (loop.index0 % 2 == 0) %}{{ raise_exception('Conversation roles must alternate user/assistant/user/assistant/...') }}{% endif %}{% if message['role'] == 'user' %}{{ '[INST] ' + message['content'] + ' [/INST]' }}{% elif message['role'] == 'assistant' %}{{ message['content'] + eos_token + ' ' }}{% else %}{{ raise_exception('Only user and assistant roles are supported!') }}{% endif %}{% endfor %}",
+            "bos_token": "<s>",
+            "eos_token": "</s>",
+        },
+        "status": "success",
+    },
+    "meta-llama/Meta-Llama-3-8B-Instruct": {
+        "tokenizer": {
+            "chat_template": "{% set loop_messages = messages %}{% for message in loop_messages %}{% set content = '<|start_header_id|>' + message['role'] + '<|end_header_id|>\n\n'+ message['content'] | trim + '<|eot_id|>' %}{% if loop.index0 == 0 %}{% set content = bos_token + content %}{% endif %}{{ content }}{% endfor %}{{ '<|start_header_id|>assistant<|end_header_id|>\n\n' }}",
+            "bos_token": "<|begin_of_text|>",
+            "eos_token": "",
+        },
+        "status": "success",
+    },
+}
+
+
+def _raise_exception(message):
+    raise Exception(f"Error message - {message}")
+
+
+# templates are only rendered - 1 sandboxed environment is shared by all of them
+_chat_template_env = ImmutableSandboxedEnvironment()
+_chat_template_env.globals["raise_exception"] = _raise_exception
+
+
+class CompiledChatTemplate:
+    def __init__(self, template: Template, supports_system_message: bool):
+        self.template = template
+        # False if rendering a system message raises - system messages are sent as user messages
+        self.supports_system_message = supports_system_message
+
+
+def compile_chat_template(chat_template: str) -> CompiledChatTemplate:
+    template = _chat_template_env.from_string(chat_template)
+    try:
+        # Try rendering the template with a system message
+        template.render(
+            messages=[{"role": "system", "content": "test"}],
+            eos_token="<eos>",
+            bos_token="<bos>",
+        )
+        supports_system_message = True
+    # This will be raised if Jinja attempts to render the system message and it can't
+    except Exception:
+        supports_system_message = False
+    return CompiledChatTemplate(
+        template=template, supports_system_message=supports_system_message
+    )
+
+
+class ChatTemplateCache:
+    """
+    Thread-safe, bounded LRU of compiled chat templates, keyed by the sha256 of the template
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CHAT_TEMPLATE_CACHE_SIZE):
+        self.max_size = max_size
+        self._templates: "OrderedDict[str, CompiledChatTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_compiled_template(self, chat_template: Any) -> CompiledChatTemplate:
+        if not isinstance(chat_template, str):
+            # e.g. a list of named templates - raises, like `env.from_string`
+            return compile_chat_template(chat_template)
+        key = hashlib.sha256(chat_template.encode("utf-8")).hexdigest()
+        with self._lock:
+            compiled_template = self._templates.get(key)
+            if compiled_template is not None:
+                self._templates.move_to_end(key)
+                return compiled_template
+        # compiling is deterministic - concurrent compiles of the same template are harmless
+        compiled_template = compile_chat_template(chat_template)
+        with self._lock:
+            self._templates[key] = compiled_template
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+        return compiled_template
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+def _local_tokenizer_config_filename(model: str) -> str:
+    """
+    'mistralai/Mistral-7B-Instruct-v0.1' -> 'mistralai--Mistral-7B-Instruct-v0.1--tokenizer_config.json'
+    """
+    return model.replace("/", "--") + "--tokenizer_config.json"
+
+
+class TokenizerConfigStore:
+    """
+    Thread-safe, bounded LRU of huggingface tokenizer configs, keyed by model.
+
+    Values are the `{"status": "success", "tokenizer": <tokenizer_config.json>}` / `{"status": "failure"}` dicts used by
+    `hf_chat_template`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TOKENIZER_CONFIG_CACHE_SIZE,
+        local_tokenizer_config_dir: Optional[str] = None,
+    ):
+        self.max_size = max_size
+        self.local_tokenizer_config_dir = local_tokenizer_config_dir
+        self._configs: "OrderedDict[str, dict]" = OrderedDict()
+        # model -> time of the last hub lookup that raised
+        self._failed_fetches: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._model_locks: Dict[str, threading.Lock] = {}
+
+    def _get_local_tokenizer_config_dir(self) -> Optional[str]:
+        if self.local_tokenizer_config_dir is not None:
+            return self.local_tokenizer_config_dir
+        return os.getenv("CUSTOM_TOKENIZER_DIR")
+
+    def _load_local_tokenizer_config(self, model: str) -> Optional[dict]:
+        local_dir = self._get_local_tokenizer_config_dir()
+        if not local_dir:
+            return None
+        path = os.path.join(local_dir, _local_tokenizer_config_filename(model))
+        if not os.path.isfile(path):
+            return None
+        verbose_logger.debug(
+            "loading tokenizer config of model=%s from %s", model, path
+        )
+        with open(path) as f:
+            return {"status": "success", "tokenizer": json.load(f)}
+
+    def _save_local_tokenizer_config(self, model: str, tokenizer_config: dict):
+        local_dir = self._get_local_tokenizer_config_dir()
+        if not local_dir:
+            return
+        path = os.path.join(local_dir, _local_tokenizer_config_filename(model))
+        try:
+            with open(path, "w") as f:
+                json.dump(tokenizer_config, f)
+        except OSError as e:
+            verbose_logger.debug(
+                "Failed to save tokenizer config of model=%s to %s - %s",
+                model,
+                path,
+                str(e),
+            )
+
+    def _fetch_tokenizer_config(self, model: str) -> dict:
+        url = f"https://huggingface.co/{model}/raw/main/tokenizer_config.json"
+        # Make a GET request to fetch the JSON data
+        client = HTTPHandler(concurrent_limit=1)
+        response = client.get(url)
+        if response.status_code == 200:
+            # Parse the JSON data
+            tokenizer_config = json.loads(response.content)
+            self._save_local_tokenizer_config(
+                model=model, tokenizer_config=tokenizer_config
+            )
+            return {"status": "success", "tokenizer": tokenizer_config}
+        else:
+            return {"status": "failure"}
+
+    def _load_tokenizer_config(self, model: str) -> Optional[dict]:
+        """
+        Returns None if the hub lookup is skipped - offline / recently failed. Not cached, so it's retried later
+        """
+        tokenizer_config = self._load_local_tokenizer_config(model)
+        if tokenizer_config is not None:
+            return tokenizer_config
+        if os.getenv("HF_HUB_OFFLINE", "").lower() in ("1", "true", "yes"):
+            return None
+        failed_at = self._failed_fetches.get(model)
+        if (
+            failed_at is not None
+            and time.time() - failed_at < FAILED_TOKENIZER_CONFIG_RETRY_INTERVAL
+        ):
+            return None
+        try:
+            tokenizer_config = self._fetch_tokenizer_config(model)
+        except Exception:
+            with self._lock:
+                self._failed_fetches[model] = time.time()
+            raise
+        with self._lock:
+            self._failed_fetches.pop(model, None)
+        return tokenizer_config
+
+    def _get_from_cache(self, model: str) -> Optional[dict]:
+        tokenizer_config = known_tokenizer_config.get(model)
+        if tokenizer_config is not None:
+            return tokenizer_config
+        with self._lock:
+            tokenizer_config = self._configs.get(model)
+            if tokenizer_config is not None:
+                self._configs.move_to_end(model)
+            return tokenizer_config
+
+    def get_tokenizer_config(self, model: str) -> dict:
+        tokenizer_config = self._get_from_cache(model)
+        if tokenizer_config is not None:
+            return tokenizer_config
+
+        # only one thread loads a given model's config, others wait on it
+        with self._lock:
+            model_lock = self._model_locks.setdefault(model, threading.Lock())
+        with model_lock:
+            tokenizer_config = self._get_from_cache(model)
+            if tokenizer_config is not None:
+                return tokenizer_config
+            tokenizer_config = self._load_tokenizer_config(model)
+            if tokenizer_config is None:
+                return {"status": "failure"}
+            with self._lock:
+                self._configs[model] = tokenizer_config
+                while len(self._configs) > self.max_size:
+                    evicted_model, _ = self._configs.popitem(last=False)
+                    self._model_locks.pop(evicted_model, None)
+        return tokenizer_config
+
+    def clear(self):
+        with self._lock:
+            self._configs.clear()
+            self._failed_fetches.clear()
+            self._model_locks.clear()
+
+
+chat_template_cache = ChatTemplateCache()
+tokenizer_config_store = TokenizerConfigStore()
+
+
+def preload_chat_templates(
+    models: Iterable[str], background: bool = True
+) -> Optional[threading.Thread]:
+    """
+    Load the tokenizer configs of the given huggingface models + compile their chat templates.
+
+    If `background=True`, loading happens in a daemon thread, which is returned.
+    """
+    _models: List[str] = list(dict.fromkeys(m for m in models if isinstance(m, str)))
+
+    def _preload():
+        for model in _models:
+            try:
+                tokenizer_config = tokenizer_config_store.get_tokenizer_config(model)
+                chat_template = tokenizer_config.get("tokenizer", {}).get(
+                    "chat_template"
+                )
+                if chat_template is not None:
+                    chat_template_cache.get_compiled_template(chat_template)
+            except Exception as e:
+                verbose_logger.debug(
+                    "Failed to preload chat template for model=%s - %s", model, str(e)
+                )
+
+    if background is False:
+        _preload()
+        return None
+    thread = threading.Thread(
+        target=_preload, name="litellm-chat-template-preload", daemon=True
+    )
+    thread.start()
+    return thread
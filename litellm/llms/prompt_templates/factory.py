@@ -8,7 +8,6 @@ from enum import Enum
 from typing import Any, List, Mapping, MutableMapping, Optional, Sequence, Tuple, cast
 
 from jinja2 import BaseLoader, Template, exceptions, meta
-from jinja2.sandbox import ImmutableSandboxedEnvironment
 
 import litellm
 import litellm.types
@@ -41,7 +40,16 @@ from litellm.types.llms.openai import (
 )
 from litellm.types.utils import GenericImageParsingChunk
 
-from .image_handling import async_convert_url_to_base64, convert_url_to_base64
+from .chat_template_cache import (
+    chat_template_cache,
+    known_tokenizer_config,
+    tokenizer_config_store,
+)
+from .image_handling import (
+    async_convert_url_to_base64,
+    convert_url_to_base64,
+    image_cache,
+)
 
 
 def default_pt(messages):
@@ -329,64 +337,14 @@ def phind_codellama_pt(messages):
     return prompt
 
 
-known_tokenizer_config = {
-    "mistralai/Mistral-7B-Instruct-v0.1": {
-        "tokenizer": {
-            "chat_template": "{{ bos_token }}{% for message in messages %}{% if (message['role'] == 'user') != (loop.index0 % 2 == 0) %}{{ raise_exception('Conversation roles must alternate user/assistant/user/assistant/...') }}{% endif %}{% if message['role'] == 'user' %}{{ '[INST] ' + message['content'] + ' [/INST]' }}{% elif message['role'] == 'assistant' %}{{ message['content'] + eos_token + ' ' }}{% else %}{{ raise_exception('Only user and assistant roles are supported!') }}{% endif %}{% endfor %}",
-            "bos_token": "<s>",
-            "eos_token": "</s>",
-        },
-        "status": "success",
-    },
-    "meta-llama/Meta-Llama-3-8B-Instruct": {
-        "tokenizer": {
-            "chat_template": "{% set loop_messages = messages %}{% for message in loop_messages %}{% set content = '<|start_header_id|>' + message['role'] + '<|end_header_id|>\n\n'+ message['content'] | trim + '<|eot_id|>' %}{% if loop.index0 == 0 %}{% set content = bos_token + content %}{% endif %}{{ content }}{% endfor %}{{ '<|start_header_id|>assistant<|end_header_id|>\n\n' }}",
-            "bos_token": "<|begin_of_text|>",
-            "eos_token": "",
-        },
-        "status": "success",
-    },
-}
-
-
 def hf_chat_template(  # noqa: PLR0915
     model: str, messages: list, chat_template: Optional[Any] = None
 ):
-    # Define Jinja2 environment
-    env = ImmutableSandboxedEnvironment()
-
-    def raise_exception(message):
-        raise Exception(f"Error message - {message}")
-
-    # Create a template object from the template text
-    env.globals["raise_exception"] = raise_exception
-
     ## get the tokenizer config from huggingface
     bos_token = ""
     eos_token = ""
     if chat_template is None:
-
-        def _get_tokenizer_config(hf_model_name):
-            try:
-                url = f"https://huggingface.co/{hf_model_name}/raw/main/tokenizer_config.json"
-                # Make a GET request to fetch the JSON data
-                client = HTTPHandler(concurrent_limit=1)
-
-                response = client.get(url)
-            except Exception as e:
-                raise e
-            if response.status_code == 200:
-                # Parse the JSON data
-                tokenizer_config = json.loads(response.content)
-                return {"status": "success", "tokenizer": tokenizer_config}
-            else:
-                return {"status": "failure"}
-
-        if model in known_tokenizer_config:
-            tokenizer_config = known_tokenizer_config[model]
-        else:
-            tokenizer_config = _get_tokenizer_config(model)
-            known_tokenizer_config.update({model: tokenizer_config})
+        tokenizer_config = tokenizer_config_store.get_tokenizer_config(model)
 
         if (
             tokenizer_config["status"] == "failure"
@@ -405,29 +363,14 @@ def hf_chat_template(  # noqa: PLR0915
             if isinstance(eos_token, dict):
                 eos_token = eos_token.get("content", None)
         chat_template = tokenizer_config["chat_template"]  # type: ignore
-    try:
-        template = env.from_string(chat_template)  # type: ignore
-    except Exception as e:
-        raise e
-
-    def _is_system_in_template():
-        try:
-            # Try rendering the template with a system message
-            template.render(
-                messages=[{"role": "system", "content": "test"}],
-                eos_token="<eos>",
-                bos_token="<bos>",
-            )
-            return True
-
-        # This will be raised if Jinja attempts to render the system message and it can't
-        except Exception:
-            return False
+    # compiled + checked for system message support once per template
+    compiled_template = chat_template_cache.get_compiled_template(chat_template)
+    template = compiled_template.template
 
     try:
         rendered_text = ""
         # Render the template with the provided values
-        if _is_system_in_template():
+        if compiled_template.supports_system_message:
             rendered_text = template.render(
                 bos_token=bos_token,
                 eos_token=eos_token,
@@ -1964,20 +1907,18 @@ def _load_image_from_url(image_url):
     from io import BytesIO
 
     try:
-        # Send a GET request to the image URL
-        client = HTTPHandler(concurrent_limit=1)
-        response = client.get(image_url)
-        response.raise_for_status()  # Raise an exception for HTTP errors
+        # downloaded once - shared with the other image helpers
+        image = image_cache.get_image(image_url)
 
         # Check the response's content type to ensure it is an image
-        content_type = response.headers.get("content-type")
+        content_type = image.content_type
         if not content_type or "image" not in content_type:
             raise ValueError(
                 f"URL does not point to a valid image (content-type: {content_type})"
             )
 
         # Load the image from the response content
-        return Image.open(BytesIO(response.content))
+        return Image.open(BytesIO(image.content))
 
     except Exception as e:
         raise e
@@ -2153,22 +2094,18 @@ from litellm.types.llms.bedrock import ToolUseBlock as BedrockToolUseBlock
 
 def get_image_details(image_url) -> Tuple[str, str]:
     try:
-        import base64
-
-        client = HTTPHandler(concurrent_limit=1)
-        # Send a GET request to the image URL
-        response = client.get(image_url)
-        response.raise_for_status()  # Raise an exception for HTTP errors
+        # downloaded once - shared with the other image helpers
+        image = image_cache.get_image(image_url)
 
         # Check the response's content type to ensure it is an image
-        content_type = response.headers.get("content-type")
+        content_type = image.content_type
         if not content_type or "image" not in content_type:
             raise ValueError(
                 f"URL does not point to a valid image (content-type: {content_type})"
             )
 
         # Convert the image content to base64 bytes
-        base64_bytes = base64.b64encode(response.content).decode("utf-8")
+        base64_bytes = image.get_base64()
 
         # Get mime-type
         mime_type = content_type.split("/")[
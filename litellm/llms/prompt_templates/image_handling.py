@@ -1,35 +1,227 @@
 """
 Helper functions to handle images passed in messages
+
+Images passed by url are downloaded once, and kept in a size-bounded LRU (`image_cache`) for `IMAGE_CACHE_TTL_SECONDS` -
+raw bytes + content type, and their base64 encoding once computed.
+- `convert_url_to_base64`, `get_image_details` and `_load_image_from_url` (factory.py) read through it
+- concurrent downloads of the same url (sync or async) share 1 request
+- `async_prefetch_image_urls` downloads all images of a message list concurrently, before the prompt transformation
+  (sync) runs - used by `acompletion`. Urls that failed to prefetch fail fast in the transformation of that request,
+  instead of being downloaded again.
 """
 
+import asyncio
 import base64
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
 from httpx import Response
 
 import litellm
 from litellm import verbose_logger
-from litellm.caching.caching import InMemoryCache
 from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
     get_async_httpx_client,
 )
 
-MAX_IMGS_IN_MEMORY = 10
+MAX_IMAGE_CACHE_SIZE_MB = 100  # raw bytes + base64 encodings of all cached images
+MAX_IMAGE_SIZE_MB = 50  # larger images are rejected
+MAX_CONCURRENT_IMAGE_DOWNLOADS = 8  # per message list
+IMAGE_DOWNLOAD_ATTEMPTS = 3
+IMAGE_DOWNLOAD_TIMEOUT_SECONDS = 10.0  # per attempt
+IMAGE_CACHE_TTL_SECONDS = 600  # images at a url can change
+
+# providers whose prompt transformation downloads image urls, to send them inline (base64)
+# not vertex_ai / gemini - they pass https image urls with a known mime type through as `file_uri`
+IMAGE_URL_INLINING_PROVIDERS = (
+    "anthropic",
+    "bedrock",
+    "ollama",
+    "ollama_chat",
+)
+
+
+# url -> exception, for the image urls that failed to download in `async_prefetch_image_urls` of the current request
+_prefetch_failures: contextvars.ContextVar[Optional[Dict[str, Exception]]] = (
+    contextvars.ContextVar("litellm_image_prefetch_failures", default=None)
+)
+
+
+class CachedImage:
+    __slots__ = ("content", "content_type", "_base64", "expires_at")
+
+    def __init__(self, content: bytes, content_type: Optional[str]):
+        self.content = content
+        self.content_type = content_type
+        self._base64: Optional[str] = None
+        self.expires_at: float = float("inf")  # set by `ImageCache.set`
+
+    @property
+    def size(self) -> int:
+        # raw bytes + base64 encoding (4 chars per 3 bytes)
+        return len(self.content) + 4 * ((len(self.content) + 2) // 3)
+
+    def get_base64(self) -> str:
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.content).decode("utf-8")
+        return self._base64
+
+
+class ImageCache:
+    """
+    Thread-safe LRU of downloaded images, keyed by url - bounded by the total size of the cached images. Images expire after `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        max_size_in_bytes: int = MAX_IMAGE_CACHE_SIZE_MB * 1024 * 1024,
+        ttl: float = IMAGE_CACHE_TTL_SECONDS,
+    ):
+        self.max_size_in_bytes = max_size_in_bytes
+        self.ttl = ttl
+        self.current_size_in_bytes = 0
+        self._images: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        # url -> download in progress, on the event loop that started it
+        self._async_downloads: Dict[str, asyncio.Task] = {}
+
+    def get(self, url: str) -> Optional[CachedImage]:
+        with self._lock:
+            image = self._images.get(url)
+            if image is None:
+                return None
+            if image.expires_at <= time.monotonic():
+                del self._images[url]
+                self.current_size_in_bytes -= image.size
+                return None
+            self._images.move_to_end(url)
+            return image
+
+    def set(self, url: str, image: CachedImage):
+        if image.size > self.max_size_in_bytes:
+            return
+        image.expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            previous_image = self._images.pop(url, None)
+            if previous_image is not None:
+                self.current_size_in_bytes -= previous_image.size
+            self._images[url] = image
+            self.current_size_in_bytes += image.size
+            while self.current_size_in_bytes > self.max_size_in_bytes:
+                evicted_url, evicted_image = self._images.popitem(last=False)
+                self.current_size_in_bytes -= evicted_image.size
+                self._url_locks.pop(evicted_url, None)
+
+    def get_image(self, url: str) -> CachedImage:
+        """
+        Cached image, else downloads it - only one thread downloads a given url, others wait on it
+
+        Raises the prefetch error, if `url` already failed to download in `async_prefetch_image_urls` of this request.
+        """
+        image = self.get(url)
+        if image is not None:
+            return image
+        prefetch_failures = _prefetch_failures.get()
+        if prefetch_failures is not None and url in prefetch_failures:
+            raise prefetch_failures[url]
+        with self._lock:
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+        try:
+            with url_lock:
+                image = self.get(url)
+                if image is not None:
+                    return image
+                image = _download_image(url)
+                self.set(url, image)
+            return image
+        finally:
+            with self._lock:
+                if url not in self._images:  # failed / too large to cache
+                    self._url_locks.pop(url, None)
+
+    async def async_get_image(self, url: str) -> CachedImage:
+        """
+        Cached image, else downloads it - concurrent calls for a given url share 1 download
+        """
+        image = self.get(url)
+        if image is not None:
+            return image
+        download = self._async_downloads.get(url)
+        if download is None or download.get_loop() is not asyncio.get_running_loop():
+            download = asyncio.create_task(self._async_download_image(url))
+            self._async_downloads[url] = download
+        return await asyncio.shield(download)
 
-in_memory_cache = InMemoryCache(max_size_in_memory=MAX_IMGS_IN_MEMORY)
+    async def _async_download_image(self, url: str) -> CachedImage:
+        try:
+            image = await _async_download_image(url)
+            self.set(url, image)
+            return image
+        finally:
+            self._async_downloads.pop(url, None)
 
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._url_locks.clear()
+            self.current_size_in_bytes = 0
 
-def _process_image_response(response: Response, url: str) -> str:
+
+def _process_image_response(response: Response, url: str) -> CachedImage:
     if response.status_code != 200:
         raise Exception(
             f"Error: Unable to fetch image from URL. Status code: {response.status_code}, url={url}"
         )
-
     image_bytes = response.content
-    base64_image = base64.b64encode(image_bytes).decode("utf-8")
+    if len(image_bytes) > MAX_IMAGE_SIZE_MB * 1024 * 1024:
+        raise Exception(
+            f"Error: Image too large. Size={len(image_bytes)} bytes, max size={MAX_IMAGE_SIZE_MB}MB, url={url}"
+        )
+    return CachedImage(
+        content=image_bytes, content_type=response.headers.get("Content-Type")
+    )
+
+
+def _download_image(url: str) -> CachedImage:
+    client = litellm.module_level_client
+    for _ in range(IMAGE_DOWNLOAD_ATTEMPTS):
+        try:
+            response = client.get(
+                url, follow_redirects=True, timeout=IMAGE_DOWNLOAD_TIMEOUT_SECONDS
+            )
+            return _process_image_response(response, url)
+        except Exception as e:
+            verbose_logger.exception(e)
+    raise Exception(
+        f"Error: Unable to fetch image from URL after {IMAGE_DOWNLOAD_ATTEMPTS} attempts. url={url}"
+    )
 
-    image_type = response.headers.get("Content-Type")
-    if image_type is None:
+
+async def _async_download_image(url: str) -> CachedImage:
+    client = litellm.module_level_aclient
+    for _ in range(IMAGE_DOWNLOAD_ATTEMPTS):
+        try:
+            response = await client.get(
+                url, follow_redirects=True, timeout=IMAGE_DOWNLOAD_TIMEOUT_SECONDS
+            )
+            return _process_image_response(response, url)
+        except Exception:
+            pass
+    raise Exception(
+        f"Error: Unable to fetch image from URL after {IMAGE_DOWNLOAD_ATTEMPTS} attempts. url={url}"
+    )
+
+
+image_cache = ImageCache()
+
+
+def _get_base64_data_url(image: CachedImage, url: str) -> str:
+    img_type = image.content_type
+    if img_type is None:
         img_type = url.split(".")[-1].lower()
         _img_type = {
             "jpg": "image/jpeg",
@@ -43,45 +235,64 @@ def _process_image_response(response: Response, url: str) -> str:
                 f"Error: Unsupported image format. Format={_img_type}. Supported types = ['image/jpeg', 'image/png', 'image/gif', 'image/webp']"
             )
         img_type = _img_type
-    else:
-        img_type = image_type
-
-    result = f"data:{img_type};base64,{base64_image}"
-    in_memory_cache.set_cache(url, result)
-    return result
+    return f"data:{img_type};base64,{image.get_base64()}"
 
 
 async def async_convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
-    if cached_result:
-        return cached_result
-
-    client = litellm.module_level_aclient
-    for _ in range(3):
-        try:
-            response = await client.get(url, follow_redirects=True)
-            return _process_image_response(response, url)
-        except Exception:
-            pass
-    raise Exception(
-        f"Error: Unable to fetch image from URL after 3 attempts. url={url}"
-    )
+    image = await image_cache.async_get_image(url)
+    return _get_base64_data_url(image, url)
 
 
 def convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
-    if cached_result:
-        return cached_result
+    image = image_cache.get_image(url)
+    return _get_base64_data_url(image, url)
 
-    client = litellm.module_level_client
-    for _ in range(3):
-        try:
-            response = client.get(url, follow_redirects=True)
-            return _process_image_response(response, url)
-        except Exception as e:
-            verbose_logger.exception(e)
-            # print(e)
-            pass
-    raise Exception(
-        f"Error: Unable to fetch image from URL after 3 attempts. url={url}"
+
+def get_image_urls(messages: Optional[List]) -> List[str]:
+    """
+    Urls of the `image_url` content parts of the messages
+    """
+    urls: List[str] = []
+    if not isinstance(messages, list):
+        return urls
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, list):
+            continue
+        for part in content:
+            if not isinstance(part, dict) or part.get("type") != "image_url":
+                continue
+            image_url = part.get("image_url")
+            if isinstance(image_url, dict):
+                image_url = image_url.get("url")
+            if isinstance(image_url, str) and image_url.startswith("http"):
+                urls.append(image_url)
+    return list(dict.fromkeys(urls))
+
+
+async def async_prefetch_image_urls(messages: Optional[List]):
+    """
+    Download the images of `messages` concurrently, into `image_cache`.
+
+    Failed downloads are not raised here. They're recorded for the current request (context), and raised by the prompt transformation without downloading again.
+    """
+    prefetch_failures: Dict[str, Exception] = {}
+    _prefetch_failures.set(prefetch_failures)
+    urls = [url for url in get_image_urls(messages) if image_cache.get(url) is None]
+    if len(urls) == 0:
+        return
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGE_DOWNLOADS)
+
+    async def _prefetch(url: str):
+        async with semaphore:
+            await image_cache.async_get_image(url)
+
+    results = await asyncio.gather(
+        *[_prefetch(url) for url in urls], return_exceptions=True
     )
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            prefetch_failures[url] = result
+            verbose_logger.debug(
+                "Failed to prefetch image url=%s - %s", url, str(result)
+            )
@@ -1065,6 +1065,7 @@ async def make_call(
     if client is None:
         client = get_async_httpx_client(
             llm_provider=litellm.LlmProviders.VERTEX_AI,
+            api_base=api_base,
         )
 
     try:
@@ -1271,7 +1272,9 @@ class VertexLLM(VertexBase):
             _async_client_params["timeout"] = timeout
         if client is None or not isinstance(client, AsyncHTTPHandler):
             client = get_async_httpx_client(
-                params=_async_client_params, llm_provider=litellm.LlmProviders.VERTEX_AI
+                params=_async_client_params,
+                llm_provider=litellm.LlmProviders.VERTEX_AI,
+                api_base=api_base,
             )
         else:
             client = client  # type: ignore
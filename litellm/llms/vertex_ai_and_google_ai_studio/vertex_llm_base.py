@@ -6,12 +6,16 @@ Handles Authentication and generating request urls for Vertex AI and Google AI S
 
 import json
 import os
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple
 
 from litellm._logging import verbose_logger
-from litellm.litellm_core_utils.asyncify import asyncify
 from litellm.llms.base import BaseLLM
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+from litellm.secret_managers.credential_refresh_manager import (
+    credential_refresh_manager,
+    get_credential_key,
+    get_expiry_timestamp,
+)
 
 from .common_utils import (
     VertexAIError,
@@ -114,6 +118,29 @@ class VertexBase(BaseLLM):
 
         credentials.refresh(Request())
 
+    def _get_credentials_refresh_fn(
+        self, credentials: Optional[str], project_id: Optional[str]
+    ) -> Callable[[Optional[Tuple[Any, str]]], Tuple[Tuple[Any, str], Optional[float]]]:
+        """
+        Loads the credentials (first call), then refreshes them - used by `credential_refresh_manager`
+        """
+
+        def _refresh(
+            current: Optional[Tuple[Any, str]]
+        ) -> Tuple[Tuple[Any, str], Optional[float]]:
+            if current is None:
+                creds, cred_project_id = self.load_auth(
+                    credentials=credentials, project_id=project_id
+                )
+            else:
+                creds, cred_project_id = current
+                self.refresh_auth(creds)
+            return (creds, cred_project_id), get_expiry_timestamp(
+                getattr(creds, "expiry", None)
+            )
+
+        return _refresh
+
     def _ensure_access_token(
         self,
         credentials: Optional[str],
@@ -133,18 +160,15 @@ class VertexBase(BaseLLM):
             elif self.project_id is not None:
                 return self.access_token, self.project_id
 
-        if not self._credentials:
-            self._credentials, cred_project_id = self.load_auth(
+        # refreshed in the background, ahead of expiry
+        self._credentials, cred_project_id = credential_refresh_manager.get_credential(
+            key=get_credential_key("vertex_ai", credentials, project_id),
+            refresh_fn=self._get_credentials_refresh_fn(
                 credentials=credentials, project_id=project_id
-            )
-            if not self.project_id:
-                self.project_id = project_id or cred_project_id
-        else:
-            if self._credentials.expired or not self._credentials.token:
-                self.refresh_auth(self._credentials)
-
-            if not self.project_id:
-                self.project_id = self._credentials.quota_project_id
+            ),
+        )
+        if not self.project_id:
+            self.project_id = project_id or cred_project_id
 
         if not self.project_id:
             raise ValueError("Could not resolve project_id")
@@ -277,24 +301,23 @@ class VertexBase(BaseLLM):
             elif self.project_id is not None:
                 return self.access_token, self.project_id
 
-        if not self._credentials:
-            try:
-                self._credentials, cred_project_id = await asyncify(self.load_auth)(
-                    credentials=credentials, project_id=project_id
-                )
-            except Exception:
-                verbose_logger.exception(
-                    "Failed to load vertex credentials. Check to see if credentials containing partial/invalid information."
+        # refreshed in the background, ahead of expiry
+        try:
+            self._credentials, cred_project_id = (
+                await credential_refresh_manager.async_get_credential(
+                    key=get_credential_key("vertex_ai", credentials, project_id),
+                    refresh_fn=self._get_credentials_refresh_fn(
+                        credentials=credentials, project_id=project_id
+                    ),
                 )
-                raise
-            if not self.project_id:
-                self.project_id = project_id or cred_project_id
-        else:
-            if self._credentials.expired or not self._credentials.token:
-                await asyncify(self.refresh_auth)(self._credentials)
-
-            if not self.project_id:
-                self.project_id = self._credentials.quota_project_id
+            )
+        except Exception:
+            verbose_logger.exception(
+                "Failed to load vertex credentials. Check to see if credentials containing partial/invalid information."
+            )
+            raise
+        if not self.project_id:
+            self.project_id = project_id or cred_project_id
 
         if not self.project_id:
             raise ValueError("Could not resolve project_id")
@@ -52,6 +52,7 @@ from litellm import (  # type: ignore
 )
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.litellm_core_utils.model_registry import GLOBAL_MODEL_REGISTRY
 from litellm.litellm_core_utils.mock_functions import (
     mock_embedding,
     mock_image_generation,
@@ -132,6 +133,10 @@ from .llms.prompt_templates.factory import (
     prompt_factory,
     stringify_json_tool_call_content,
 )
+from .llms.prompt_templates.image_handling import (
+    IMAGE_URL_INLINING_PROVIDERS,
+    async_prefetch_image_urls,
+)
 from .llms.sagemaker.sagemaker import SagemakerLLM
 from .llms.text_completion_codestral import CodestralTextCompletion
 from .llms.together_ai.completion.handler import TogetherAITextCompletion
@@ -424,6 +429,10 @@ async def acompletion(
             model=model, api_base=completion_kwargs.get("base_url", None)
         )
     try:
+        if custom_llm_provider in IMAGE_URL_INLINING_PROVIDERS:
+            # download the message images concurrently - the prompt transformation reads them from the cache
+            await async_prefetch_image_urls(messages)
+
         # Use a partial function to pass your keyword arguments
         func = partial(completion, **completion_kwargs, **kwargs)
 
@@ -1499,7 +1508,7 @@ def completion(  # type: ignore # noqa: PLR0915
                 encoding=encoding,
             )
         elif (
-            model in litellm.open_ai_chat_completion_models
+            GLOBAL_MODEL_REGISTRY.contains(model, "open_ai_chat_completion_models")
             or custom_llm_provider == "custom_openai"
             or custom_llm_provider == "deepinfra"
             or custom_llm_provider == "perplexity"
@@ -3417,7 +3426,7 @@ def embedding(  # noqa: PLR0915
                 aembedding=aembedding,
             )
         elif (
-            model in litellm.open_ai_embedding_models
+            GLOBAL_MODEL_REGISTRY.contains(model, "open_ai_embedding_models")
             or custom_llm_provider == "openai"
             or custom_llm_provider == "together_ai"
             or custom_llm_provider == "nvidia_nim"
@@ -4175,7 +4184,7 @@ def text_completion(  # noqa: PLR0915
     if _model is not None and (
         custom_llm_provider == "openai"
     ):  # for openai compatible endpoints - e.g. vllm, call the native /v1/completions endpoint for text completion calls
-        if _model not in litellm.open_ai_chat_completion_models:
+        if not GLOBAL_MODEL_REGISTRY.contains(_model, "open_ai_chat_completion_models"):
             model = "text-completion-openai/" + _model
             optional_params.pop("custom_llm_provider", None)
 
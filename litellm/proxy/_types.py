@@ -1243,6 +1243,24 @@ class ConfigList(LiteLLMBase):
     )
 
 
+RateLimitType = Literal["key", "key_model", "user", "team", "customer"]
+
+
+class LocalFirstRateLimitConfig(TypedDict, total=False):
+    max_unsynced_requests: (
+        int  # requests an instance can admit for a key, before it must sync with redis
+    )
+
+
+class LocalFirstRateLimitSettings(TypedDict, total=False):
+    """
+    `general_settings.local_first_rate_limits` - track these rate limits in-memory, and sync them with redis in the background
+    """
+
+    sync_interval_ms: int
+    limit_types: Dict[RateLimitType, LocalFirstRateLimitConfig]
+
+
 class ConfigGeneralSettings(LiteLLMBase):
     """
     Documents all the fields supported by `general_settings` in config.yaml
@@ -1296,6 +1314,10 @@ class ConfigGeneralSettings(LiteLLMBase):
     global_max_parallel_requests: Optional[int] = Field(
         None, description="global max parallel requests to allow for a proxy instance."
     )
+    local_first_rate_limits: Optional[LocalFirstRateLimitSettings] = Field(
+        None,
+        description="track tpm/rpm/parallel request limits in-memory per instance, and sync them with redis every `sync_interval_ms`. Limits can be exceeded by up to `max_unsynced_requests` per instance.",
+    )
     max_request_size_mb: Optional[int] = Field(
         None,
         description="max request size in MB, if a request is larger than this size it will be rejected",
@@ -1347,6 +1369,18 @@ class ConfigGeneralSettings(LiteLLMBase):
         default=None,
         description="Set-up pass-through endpoints for provider-specific endpoints. Docs - https://docs.litellm.ai/docs/proxy/pass_through",
     )
+    zero_copy_pass_through_streaming: Optional[bool] = Field(
+        default=False,
+        description="forward pass-through streaming responses without collecting the chunks. Only usage (and cost, for Anthropic / Vertex AI) is logged, not the response content.",
+    )
+    spend_log_queue_max_size: Optional[int] = Field(
+        default=10000,
+        description="max spend logs queued in memory between DB writes. When the queue is full it is written right away - if the DB can't keep up, the oldest spend logs are dropped.",
+    )
+    aggregate_spend_updates_in_redis: Optional[bool] = Field(
+        default=False,
+        description="instances add their spend updates to redis, and only 1 instance at a time writes them to the DB. Requires a redis cache.",
+    )
 
 
 class ConfigYAML(LiteLLMBase):
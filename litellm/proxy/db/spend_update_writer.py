@@ -0,0 +1,415 @@
+"""
+Writes the spend tracked in-memory by the proxy to the DB
+
+`update_database` (proxy_server.py) adds the cost of each request to the `PrismaClient.*_list_transactons` of its
+user / end-user / key / team / team member / org, and its spend log to `PrismaClient.spend_log_transactions`.
+Every `proxy_batch_write_at` seconds, `update_spend` flushes them with `SpendUpdateWriter`:
+
+- all spend increments of a table are written in 1 multi-row `UPDATE ... FROM (VALUES ...)` statement (per
+  `MAX_ROWS_PER_STATEMENT` rows), all tables in 1 transaction - instead of 1 `update_many` per entity
+- `aggregate_spend_updates_in_redis` - each instance adds its increments to redis hashes, and only the instance
+  holding the `SPEND_UPDATE_LOCK_KEY` lock writes them to the DB - 1 writer for all proxy instances
+- the spend log queue is bounded (`spend_log_queue_max_size`) - when it's full it is flushed right away, and the
+  oldest spend logs are dropped if the DB can't keep up
+"""
+
+import asyncio
+import uuid
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict
+
+from litellm._logging import verbose_proxy_logger
+from litellm.caching.redis_cache import RedisCache
+
+if TYPE_CHECKING:
+    from litellm.proxy.utils import PrismaClient
+else:
+    PrismaClient = Any
+
+DEFAULT_SPEND_LOG_QUEUE_MAX_SIZE = 10000
+SPEND_LOGS_BATCH_SIZE = 500  # spend logs per `create_many`
+MAX_ROWS_PER_STATEMENT = (
+    1000  # keeps bind parameters well below postgres' limit (32767)
+)
+SPEND_UPDATE_LOCK_KEY = "litellm_spend_update_writer_lock"
+SPEND_UPDATE_LOCK_TTL = 60  # seconds - released once the write is done
+SPEND_UPDATES_REDIS_KEY_PREFIX = "litellm_spend_updates"
+
+
+class SpendUpdateTable(TypedDict):
+    table_name: str
+    id_columns: List[str]
+    set_updated_at: bool  # prisma sets `@updatedAt` columns, raw queries have to
+    upsert: bool  # create missing rows (end-users)
+
+
+# `PrismaClient` attribute -> table it is written to
+SPEND_UPDATE_TABLES: Dict[str, SpendUpdateTable] = {
+    "user_list_transactons": SpendUpdateTable(
+        table_name="LiteLLM_UserTable",
+        id_columns=["user_id"],
+        set_updated_at=False,
+        upsert=False,
+    ),
+    "end_user_list_transactons": SpendUpdateTable(
+        table_name="LiteLLM_EndUserTable",
+        id_columns=["user_id"],
+        set_updated_at=False,
+        upsert=True,
+    ),
+    "key_list_transactons": SpendUpdateTable(
+        table_name="LiteLLM_VerificationToken",
+        id_columns=["token"],
+        set_updated_at=True,
+        upsert=False,
+    ),
+    "team_list_transactons": SpendUpdateTable(
+        table_name="LiteLLM_TeamTable",
+        id_columns=["team_id"],
+        set_updated_at=True,
+        upsert=False,
+    ),
+    "team_member_list_transactons": SpendUpdateTable(
+        table_name="LiteLLM_TeamMembership",
+        id_columns=[
+            "team_id",
+            "user_id",
+        ],  # key is "team_id::<value>::user_id::<value>"
+        set_updated_at=False,
+        upsert=False,
+    ),
+    "org_list_transactons": SpendUpdateTable(
+        table_name="LiteLLM_OrganizationTable",
+        id_columns=["organization_id"],
+        set_updated_at=True,
+        upsert=False,
+    ),
+}
+
+SpendUpdates = Dict[
+    str, Dict[str, float]
+]  # `PrismaClient` attribute -> {entity id: spend increment}
+
+
+def get_bulk_spend_update_query(table: SpendUpdateTable, num_rows: int) -> str:
+    """
+    Query adding a spend increment to `num_rows` rows
+
+    Parameters are the id column values + the spend increment, of each row
+    """
+    num_columns = len(table["id_columns"]) + 1
+    rows = []
+    for row in range(num_rows):
+        first_param = row * num_columns + 1
+        row_values = [
+            "${}::text".format(first_param + i) for i in range(num_columns - 1)
+        ]
+        row_values.append("${}::double precision".format(first_param + num_columns - 1))
+        if table["upsert"]:
+            row_values.append("false")  # "blocked"
+        rows.append("({})".format(", ".join(row_values)))
+    values = ", ".join(rows)
+
+    table_name = table["table_name"]
+    id_columns = ", ".join('"{}"'.format(c) for c in table["id_columns"])
+    if table["upsert"]:
+        return (
+            f'INSERT INTO "{table_name}" ({id_columns}, "spend", "blocked") VALUES {values} '
+            f'ON CONFLICT ({id_columns}) DO UPDATE SET "spend" = "{table_name}"."spend" + EXCLUDED."spend"'
+        )
+    set_clause = '"spend" = t."spend" + v."spend"'
+    if table["set_updated_at"]:
+        set_clause += ', "updated_at" = now()'
+    where_clause = " AND ".join(
+        't."{0}" = v."{0}"'.format(c) for c in table["id_columns"]
+    )
+    return (
+        f'UPDATE "{table_name}" AS t SET {set_clause} '
+        f'FROM (VALUES {values}) AS v({id_columns}, "spend") '
+        f"WHERE {where_clause}"
+    )
+
+
+def _get_id_values(table: SpendUpdateTable, entity_id: str) -> List[str]:
+    if len(table["id_columns"]) == 1:
+        return [entity_id]
+    # team members - "team_id::<value>::user_id::<value>"
+    parts = entity_id.split("::")
+    return [parts[1], parts[3]]
+
+
+class SpendUpdateWriter:
+    def __init__(self):
+        self.spend_log_queue_max_size = DEFAULT_SPEND_LOG_QUEUE_MAX_SIZE
+        # set if `aggregate_spend_updates_in_redis` - instances write their spend through redis
+        self.redis_cache: Optional[RedisCache] = None
+        self.dropped_spend_logs = 0
+        self._spend_logs_lock: Optional[asyncio.Lock] = None
+        self._spend_logs_flush_task: Optional[asyncio.Task] = None
+
+    def update_settings(
+        self, general_settings: dict, redis_cache: Optional[RedisCache] = None
+    ):
+        self.spend_log_queue_max_size = general_settings.get(
+            "spend_log_queue_max_size", DEFAULT_SPEND_LOG_QUEUE_MAX_SIZE
+        )
+        if general_settings.get("aggregate_spend_updates_in_redis", False) is True:
+            if redis_cache is None:
+                verbose_proxy_logger.warning(
+                    "aggregate_spend_updates_in_redis is set, but no redis cache is configured. Each instance writes its spend to the DB."
+                )
+            self.redis_cache = redis_cache
+        else:
+            self.redis_cache = None
+
+    ### SPEND LOGS ###
+
+    def add_spend_log(
+        self,
+        prisma_client: PrismaClient,
+        payload: Any,
+        spend_logs_url: Optional[str] = None,
+    ):
+        """
+        Queue a spend log - if the queue is full, flush it right away / drop the oldest spend log
+
+        Spend logs sent to a separate server (`SPEND_LOGS_URL`) are only flushed by `update_spend`.
+        """
+        spend_logs = prisma_client.spend_log_transactions
+        if len(spend_logs) >= self.spend_log_queue_max_size:
+            if spend_logs_url is None:
+                self._start_spend_logs_flush(prisma_client=prisma_client)
+            # the flush swaps the queue - only drop if it's still full
+            spend_logs = prisma_client.spend_log_transactions
+            if len(spend_logs) >= self.spend_log_queue_max_size:
+                del spend_logs[0]
+                self._on_dropped_spend_logs(1)
+        spend_logs.append(payload)
+
+    def _on_dropped_spend_logs(self, num_dropped: int):
+        if self.dropped_spend_logs == 0:
+            verbose_proxy_logger.warning(
+                "Spend log queue is full (spend_log_queue_max_size=%s) - dropping the oldest spend logs. The DB can't keep up with the spend logs.",
+                self.spend_log_queue_max_size,
+            )
+        self.dropped_spend_logs += num_dropped
+
+    def _start_spend_logs_flush(self, prisma_client: PrismaClient):
+        """
+        Hand the full queue to a background write - unless the previous one is still running
+        """
+        if (
+            self._spend_logs_flush_task is not None
+            and not self._spend_logs_flush_task.done()
+        ):
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # no running event loop
+            return
+        spend_logs = prisma_client.spend_log_transactions
+        prisma_client.spend_log_transactions = []
+        self._spend_logs_flush_task = asyncio.create_task(
+            self._flush_spend_logs_in_background(
+                prisma_client=prisma_client, spend_logs=spend_logs
+            )
+        )
+
+    async def _flush_spend_logs_in_background(
+        self, prisma_client: PrismaClient, spend_logs: List
+    ):
+        try:
+            async with self._get_spend_logs_lock():
+                await self._write_spend_logs(
+                    prisma_client=prisma_client, spend_logs=spend_logs
+                )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "Error flushing the full spend log queue - {}".format(str(e))
+            )
+
+    async def flush_spend_logs(self, prisma_client: PrismaClient):
+        """
+        Write all queued spend logs to the DB, `SPEND_LOGS_BATCH_SIZE` spend logs per multi-row insert
+
+        Spend logs that couldn't be written are re-queued.
+        """
+        async with self._get_spend_logs_lock():
+            spend_logs = prisma_client.spend_log_transactions
+            if len(spend_logs) == 0:
+                return
+            prisma_client.spend_log_transactions = []
+            await self._write_spend_logs(
+                prisma_client=prisma_client, spend_logs=spend_logs
+            )
+
+    def _get_spend_logs_lock(self) -> asyncio.Lock:
+        if self._spend_logs_lock is None:
+            self._spend_logs_lock = asyncio.Lock()
+        return self._spend_logs_lock
+
+    async def _write_spend_logs(self, prisma_client: PrismaClient, spend_logs: List):
+        for i in range(0, len(spend_logs), SPEND_LOGS_BATCH_SIZE):
+            batch = spend_logs[i : i + SPEND_LOGS_BATCH_SIZE]
+            try:
+                await prisma_client.db.litellm_spendlogs.create_many(
+                    data=[prisma_client.jsonify_object({**entry}) for entry in batch],  # type: ignore
+                    skip_duplicates=True,
+                )
+            except Exception:
+                self._requeue_spend_logs(
+                    prisma_client=prisma_client, spend_logs=spend_logs[i:]
+                )
+                raise
+            verbose_proxy_logger.debug(f"Flushed {len(batch)} logs to the DB.")
+        verbose_proxy_logger.debug(
+            f"{len(spend_logs)} logs processed. Remaining in queue: {len(prisma_client.spend_log_transactions)}"
+        )
+
+    def _requeue_spend_logs(self, prisma_client: PrismaClient, spend_logs: List):
+        spend_logs = spend_logs + prisma_client.spend_log_transactions
+        num_dropped = len(spend_logs) - self.spend_log_queue_max_size
+        if num_dropped > 0:
+            spend_logs = spend_logs[num_dropped:]
+            self._on_dropped_spend_logs(num_dropped)
+        prisma_client.spend_log_transactions = spend_logs
+
+    ### SPEND UPDATES - user / end-user / key / team / team member / org tables ###
+
+    async def update_spend_tables(self, prisma_client: PrismaClient):
+        """
+        Write the spend increments tracked since the last call
+
+        - with `aggregate_spend_updates_in_redis`: add them to redis - written to the DB by the instance holding the writer lock
+        - else (or if redis fails): write them to the DB
+
+        Increments that couldn't be written are re-queued, and the exception is raised.
+        """
+        spend_updates = self._pop_spend_updates(prisma_client=prisma_client)
+        if self.redis_cache is not None:
+            try:
+                await self.redis_cache.async_increment_hash_pipeline(
+                    increments={
+                        self._get_redis_key(attr): increments
+                        for attr, increments in spend_updates.items()
+                    }
+                )
+                spend_updates = {}
+            except Exception as e:
+                verbose_proxy_logger.exception(
+                    "Error adding spend updates to redis, writing them to the DB - {}".format(
+                        str(e)
+                    )
+                )
+            if len(spend_updates) == 0:
+                await self._write_redis_spend_updates_if_leader(
+                    prisma_client=prisma_client, redis_cache=self.redis_cache
+                )
+                return
+
+        try:
+            await self.write_spend_updates_to_db(
+                prisma_client=prisma_client, spend_updates=spend_updates
+            )
+        except Exception:
+            self._requeue_spend_updates(
+                prisma_client=prisma_client, spend_updates=spend_updates
+            )
+            raise
+
+    async def _write_redis_spend_updates_if_leader(
+        self, prisma_client: PrismaClient, redis_cache: RedisCache
+    ):
+        lock_token = str(uuid.uuid4())
+        if not await redis_cache.async_acquire_lock(
+            key=SPEND_UPDATE_LOCK_KEY, token=lock_token, ttl=SPEND_UPDATE_LOCK_TTL
+        ):
+            return  # another instance is writing the spend
+        try:
+            attrs = list(SPEND_UPDATE_TABLES.keys())
+            spend_update_hashes = await redis_cache.async_pop_hashes(
+                keys=[self._get_redis_key(attr) for attr in attrs]
+            )
+            spend_updates: SpendUpdates = {}
+            for attr, spend_update_hash in zip(attrs, spend_update_hashes):
+                if spend_update_hash:
+                    spend_updates[attr] = {
+                        entity_id: float(increment)
+                        for entity_id, increment in spend_update_hash.items()
+                    }
+            try:
+                await self.write_spend_updates_to_db(
+                    prisma_client=prisma_client, spend_updates=spend_updates
+                )
+            except Exception:
+                # put them back - written by the next writer
+                try:
+                    await redis_cache.async_increment_hash_pipeline(
+                        increments={
+                            self._get_redis_key(attr): increments
+                            for attr, increments in spend_updates.items()
+                        }
+                    )
+                except Exception:
+                    self._requeue_spend_updates(
+                        prisma_client=prisma_client, spend_updates=spend_updates
+                    )
+                raise
+        finally:
+            await redis_cache.async_release_lock(
+                key=SPEND_UPDATE_LOCK_KEY, token=lock_token
+            )
+
+    async def write_spend_updates_to_db(
+        self, prisma_client: PrismaClient, spend_updates: SpendUpdates
+    ):
+        """
+        Write `spend_updates` in 1 transaction - 1 statement per table (per `MAX_ROWS_PER_STATEMENT` rows)
+        """
+        if not any(spend_updates.values()):
+            return
+        async with prisma_client.db.tx(timeout=timedelta(seconds=60)) as transaction:
+            for attr, increments in spend_updates.items():
+                table = SPEND_UPDATE_TABLES[attr]
+                rows = list(increments.items())
+                for i in range(0, len(rows), MAX_ROWS_PER_STATEMENT):
+                    batch = rows[i : i + MAX_ROWS_PER_STATEMENT]
+                    params: List[Any] = []
+                    for entity_id, increment in batch:
+                        params.extend(_get_id_values(table, entity_id))
+                        params.append(increment)
+                    await transaction.execute_raw(
+                        get_bulk_spend_update_query(table=table, num_rows=len(batch)),
+                        *params,
+                    )
+                verbose_proxy_logger.debug(
+                    "Updated spend of {} rows in {}".format(
+                        len(rows), table["table_name"]
+                    )
+                )
+
+    @staticmethod
+    def _pop_spend_updates(prisma_client: PrismaClient) -> SpendUpdates:
+        spend_updates: SpendUpdates = {}
+        for attr in SPEND_UPDATE_TABLES:
+            increments = getattr(prisma_client, attr)
+            if len(increments) > 0:
+                spend_updates[attr] = increments
+                # new increments go into a new dict, while these are written
+                setattr(prisma_client, attr, {})
+        return spend_updates
+
+    @staticmethod
+    def _requeue_spend_updates(
+        prisma_client: PrismaClient, spend_updates: SpendUpdates
+    ):
+        for attr, increments in spend_updates.items():
+            pending_increments = getattr(prisma_client, attr)
+            for entity_id, increment in increments.items():
+                pending_increments[entity_id] = (
+                    pending_increments.get(entity_id, 0) + increment
+                )
+
+    @staticmethod
+    def _get_redis_key(attr: str) -> str:
+        return "{}:{}".format(SPEND_UPDATES_REDIS_KEY_PREFIX, attr)
@@ -1,8 +1,18 @@
 import asyncio
 import sys
+import time
 import traceback
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, List, Literal, Optional, Tuple, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+    Union,
+)
 
 from fastapi import HTTPException
 from pydantic import BaseModel
@@ -12,11 +22,18 @@ from litellm import DualCache, ModelResponse
 from litellm._logging import verbose_proxy_logger
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
-from litellm.proxy._types import CurrentItemRateLimit, UserAPIKeyAuth
+from litellm.proxy._types import (
+    CurrentItemRateLimit,
+    LocalFirstRateLimitConfig,
+    LocalFirstRateLimitSettings,
+    RateLimitType,
+    UserAPIKeyAuth,
+)
 from litellm.proxy.auth.auth_utils import (
     get_key_model_rpm_limit,
     get_key_model_tpm_limit,
 )
+from litellm.types.caching import RedisPipelineIncrementOperation
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -29,6 +46,16 @@ else:
     Span = Any
     InternalUsageCache = Any
 
+DEFAULT_LOCAL_FIRST_SYNC_INTERVAL_MS = 100
+DEFAULT_MAX_UNSYNCED_REQUESTS = 10
+RATE_LIMIT_WINDOW_SECONDS = 60
+USAGE_FIELDS = ("current_requests", "current_tpm", "current_rpm")
+REQUEST_STARTED_USAGE_CHANGE = {
+    "current_requests": 1,
+    "current_tpm": 0,
+    "current_rpm": 0,
+}
+
 
 class CacheObject(TypedDict):
     current_global_requests: Optional[dict]
@@ -40,9 +67,26 @@ class CacheObject(TypedDict):
 
 class _PROXY_MaxParallelRequestsHandler(CustomLogger):
     # Class variables or attributes
-    def __init__(self, internal_usage_cache: InternalUsageCache):
+    def __init__(
+        self,
+        internal_usage_cache: InternalUsageCache,
+        local_first_rate_limits: Optional[LocalFirstRateLimitSettings] = None,
+    ):
         self.internal_usage_cache = internal_usage_cache
 
+        # local-first rate limits - tracked in-memory, synced with redis in the background
+        self.local_first_rate_limits: Dict[str, LocalFirstRateLimitConfig] = {}
+        self.sync_interval_ms: int = DEFAULT_LOCAL_FIRST_SYNC_INTERVAL_MS
+        self.redis_increment_queue: Dict[str, Dict[str, int]] = (
+            {}
+        )  # cache key -> usage not yet pushed to redis
+        self.unsynced_request_counts: Dict[str, int] = {}
+        self.local_first_keys: Dict[str, float] = {}  # cache key -> last used
+        self._redis_sync_lock: Optional[asyncio.Lock] = None
+        self._redis_sync_task: Optional[asyncio.Task] = None
+        if local_first_rate_limits is not None:
+            self.update_local_first_rate_limits(local_first_rate_limits)
+
     def print_verbose(self, print_statement):
         try:
             verbose_proxy_logger.debug(print_statement)
@@ -51,6 +95,317 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
         except Exception:
             pass
 
+    def update_local_first_rate_limits(self, settings: LocalFirstRateLimitSettings):
+        """
+        Track the limits in `settings["limit_types"]` in-memory, instead of reading / writing redis on every request.
+
+        Each instance pushes its usage to redis, and pulls the global usage back, every `sync_interval_ms`.
+        An instance syncs before admitting more than `max_unsynced_requests` requests for a key, so a limit is exceeded by at most `max_unsynced_requests` x number of instances.
+        """
+        self.local_first_rate_limits = dict(settings.get("limit_types", None) or {})
+        self.sync_interval_ms = (
+            settings.get("sync_interval_ms", None)
+            or DEFAULT_LOCAL_FIRST_SYNC_INTERVAL_MS
+        )
+
+    def _is_local_first(self, rate_limit_type: Optional[RateLimitType]) -> bool:
+        return (
+            rate_limit_type is not None
+            and rate_limit_type in self.local_first_rate_limits
+        )
+
+    def _get_max_unsynced_requests(self, rate_limit_type: RateLimitType) -> int:
+        config = self.local_first_rate_limits.get(rate_limit_type) or {}
+        return config.get("max_unsynced_requests", DEFAULT_MAX_UNSYNCED_REQUESTS)
+
+    @staticmethod
+    def _get_usage_counter_key(key: str, field: str) -> str:
+        return "{}::{}".format(key, field)
+
+    def _start_redis_sync_task(self):
+        if self.internal_usage_cache.dual_cache.redis_cache is None:
+            return  # single instance - in-memory usage is the global usage
+        if self._redis_sync_task is None or self._redis_sync_task.done():
+            self._redis_sync_task = asyncio.create_task(
+                self.periodic_sync_local_usage_with_redis()
+            )
+
+    async def get_usage(
+        self,
+        keys: List[Optional[str]],
+        rate_limit_types: List[Optional[RateLimitType]],
+        parent_otel_span: Optional[Span] = None,
+    ) -> List[Optional[dict]]:
+        """
+        Batch get the current usage for `keys`.
+
+        Usage is stored as 1 counter per field (see `update_usage`), and returned as a `{"current_requests": .., "current_tpm": .., "current_rpm": ..}` dict per key.
+
+        Usage for local-first limit types is read from the in-memory cache only. If this instance admitted `max_unsynced_requests` for one of these keys since the last sync, it syncs with redis first.
+        """
+        local_keys: List[Optional[str]] = []
+        remote_keys: List[Optional[str]] = []
+        needs_sync = False
+        for key, rate_limit_type in zip(keys, rate_limit_types):
+            if key is not None and self._is_local_first(rate_limit_type):
+                local_keys.append(key)
+                remote_keys.append(None)
+                if self.internal_usage_cache.dual_cache.redis_cache is not None:
+                    self.local_first_keys[key] = time.time()
+                if self.unsynced_request_counts.get(
+                    key, 0
+                ) >= self._get_max_unsynced_requests(
+                    rate_limit_type  # type: ignore
+                ):
+                    needs_sync = True
+            else:
+                local_keys.append(None)
+                remote_keys.append(key)
+
+        results: List[Optional[dict]] = [None] * len(keys)
+        if any(key is not None for key in local_keys):
+            self._start_redis_sync_task()
+            if needs_sync:
+                await self.sync_local_usage_with_redis()
+            local_results = await self.internal_usage_cache.async_batch_get_cache(
+                keys=local_keys,
+                parent_otel_span=parent_otel_span,
+                local_only=True,
+            )
+            for i, key in enumerate(local_keys):
+                if key is not None and local_results is not None:
+                    results[i] = local_results[i]
+
+        counter_keys: List[str] = []
+        for key, rate_limit_type in zip(remote_keys, rate_limit_types):
+            if key is None:
+                continue
+            if rate_limit_type is None:
+                counter_keys.append(key)  # global_max_parallel_requests
+            else:
+                counter_keys.extend(
+                    self._get_usage_counter_key(key, field) for field in USAGE_FIELDS
+                )
+        if len(counter_keys) == 0:
+            return results
+
+        counter_values = iter(
+            await self.internal_usage_cache.async_batch_get_cache(
+                keys=counter_keys,
+                parent_otel_span=parent_otel_span,
+            )
+            or [None] * len(counter_keys)
+        )
+        for i, (key, rate_limit_type) in enumerate(zip(remote_keys, rate_limit_types)):
+            if key is None:
+                continue
+            if rate_limit_type is None:
+                results[i] = next(counter_values)
+                continue
+            values = [next(counter_values) for _ in USAGE_FIELDS]
+            if all(value is None for value in values):
+                continue
+            usage = {
+                field: int(float(value or 0))
+                for field, value in zip(USAGE_FIELDS, values)
+            }
+            # a request that started in the previous minute is released in this one
+            usage["current_requests"] = max(usage["current_requests"], 0)
+            results[i] = usage
+        return results
+
+    async def _get_current_usage(
+        self,
+        key: str,
+        rate_limit_type: RateLimitType,
+        parent_otel_span: Optional[Span] = None,
+    ) -> Optional[dict]:
+        results = await self.get_usage(
+            keys=[key],
+            rate_limit_types=[rate_limit_type],
+            parent_otel_span=parent_otel_span,
+        )
+        return results[0] if results else None
+
+    def update_usage(
+        self,
+        increment_list: List[RedisPipelineIncrementOperation],
+        key: str,
+        usage_change: Dict[str, int],
+        rate_limit_type: RateLimitType,
+    ):
+        """
+        Record a change in usage for `key`.
+
+        - local-first limit types: `usage_change` is applied to the in-memory usage immediately, and queued for the next redis sync
+        - else: 1 increment per changed field is added to `increment_list`, to be written to the dual cache in 1 `async_increment_cache_pipeline` call per request
+        """
+        if self._is_local_first(rate_limit_type):
+            self._increment_local_usage(key=key, usage_change=usage_change)
+            return
+
+        for field in USAGE_FIELDS:
+            if usage_change.get(field, 0) != 0:
+                increment_list.append(
+                    RedisPipelineIncrementOperation(
+                        key=self._get_usage_counter_key(key, field),
+                        increment_value=usage_change[field],
+                        ttl=RATE_LIMIT_WINDOW_SECONDS,
+                    )
+                )
+
+    async def _write_usage(
+        self,
+        increment_list: List[RedisPipelineIncrementOperation],
+        parent_otel_span: Optional[Span] = None,
+    ):
+        if len(increment_list) == 0:
+            return
+        await self.internal_usage_cache.async_increment_cache_pipeline(
+            increment_list=increment_list,
+            litellm_parent_otel_span=parent_otel_span,
+        )
+
+    def _increment_local_usage(self, key: str, usage_change: Dict[str, int]):
+        # the in-memory cache only evicts expired items (unless `evict_least_recently_used` / `max_size_in_bytes` is set), so unsynced usage is kept for the rate limit window
+        in_memory_cache = self.internal_usage_cache.dual_cache.in_memory_cache
+        current = in_memory_cache.get_cache(key=key) or {}
+        new_val = {
+            field: current.get(field, 0) + usage_change.get(field, 0)
+            for field in USAGE_FIELDS
+        }
+        new_val["current_requests"] = max(new_val["current_requests"], 0)
+        in_memory_cache.set_cache(key, new_val, ttl=RATE_LIMIT_WINDOW_SECONDS)
+        if self.internal_usage_cache.dual_cache.redis_cache is None:
+            return  # single instance - nothing to sync
+
+        queued_usage = self.redis_increment_queue.setdefault(
+            key, {field: 0 for field in USAGE_FIELDS}
+        )
+        for field in USAGE_FIELDS:
+            queued_usage[field] += usage_change.get(field, 0)
+        if usage_change.get("current_requests", 0) > 0:
+            self.unsynced_request_counts[key] = (
+                self.unsynced_request_counts.get(key, 0) + 1
+            )
+        self.local_first_keys[key] = time.time()
+
+    async def periodic_sync_local_usage_with_redis(self):
+        """
+        Syncs local-first rate limit usage with redis every `sync_interval_ms`.
+
+        Required for multi-instance environment usage of local-first rate limits
+        """
+        while True:
+            try:
+                await self.sync_local_usage_with_redis()
+            except Exception as e:
+                verbose_proxy_logger.error(
+                    "Parallel Request Limiter: Error in periodic sync task - {}".format(
+                        str(e)
+                    )
+                )
+            await asyncio.sleep(self.sync_interval_ms / 1000)
+
+    async def sync_local_usage_with_redis(self):
+        """
+        1. Push the usage queued since the last sync to redis, in 1 pipeline
+        2. Fetch the global usage for all other local-first keys in use
+        3. Set the in-memory usage to the global usage + any usage queued during the sync
+        """
+        if self._redis_sync_lock is None:
+            self._redis_sync_lock = asyncio.Lock()
+        async with self._redis_sync_lock:
+            current_time = time.time()
+            self.local_first_keys = {
+                key: last_used
+                for key, last_used in self.local_first_keys.items()
+                if current_time - last_used < RATE_LIMIT_WINDOW_SECONDS
+            }
+            redis_cache = self.internal_usage_cache.dual_cache.redis_cache
+            if redis_cache is None:
+                # single instance - in-memory usage is the global usage
+                self.redis_increment_queue = {}
+                self.unsynced_request_counts = {}
+                return
+
+            increment_queue = self.redis_increment_queue
+            self.redis_increment_queue = {}
+            self.unsynced_request_counts = {}
+
+            # 1. Push queued usage to redis
+            increment_list: List[RedisPipelineIncrementOperation] = []
+            for key, queued_usage in increment_queue.items():
+                for field, value in queued_usage.items():
+                    if value != 0:
+                        increment_list.append(
+                            RedisPipelineIncrementOperation(
+                                key=self._get_usage_counter_key(key, field),
+                                increment_value=value,
+                                ttl=RATE_LIMIT_WINDOW_SECONDS,
+                            )
+                        )
+            global_usage: Dict[str, float] = {}
+            try:
+                results = await redis_cache.async_increment_multi(
+                    increment_list=increment_list
+                )
+            except Exception as e:
+                # re-queue, to push on the next sync
+                for key, queued_usage in increment_queue.items():
+                    requeued_usage = self.redis_increment_queue.setdefault(
+                        key, {field: 0 for field in USAGE_FIELDS}
+                    )
+                    for field, value in queued_usage.items():
+                        requeued_usage[field] += value
+                verbose_proxy_logger.error(
+                    "Parallel Request Limiter: Error pushing usage to redis - {}".format(
+                        str(e)
+                    )
+                )
+                return
+            for increment_op, result in zip(increment_list, results):
+                global_usage[increment_op["key"]] = result
+
+            # 2. Fetch global usage for the remaining keys
+            key_list = [
+                self._get_usage_counter_key(key, field)
+                for key in self.local_first_keys
+                for field in USAGE_FIELDS
+                if self._get_usage_counter_key(key, field) not in global_usage
+            ]
+            if len(key_list) > 0:
+                try:
+                    redis_values = await redis_cache.async_batch_get_cache(
+                        key_list=key_list
+                    )
+                    for counter_key, value in redis_values.items():
+                        if value is not None:
+                            global_usage[counter_key] = float(value)
+                except Exception as e:
+                    verbose_proxy_logger.error(
+                        "Parallel Request Limiter: Error fetching usage from redis - {}".format(
+                            str(e)
+                        )
+                    )
+
+            # 3. Update in-memory usage
+            in_memory_cache = self.internal_usage_cache.dual_cache.in_memory_cache
+            for key in self.local_first_keys:
+                counter_values = [
+                    global_usage.get(self._get_usage_counter_key(key, field))
+                    for field in USAGE_FIELDS
+                ]
+                if all(value is None for value in counter_values):
+                    continue
+                queued_usage = self.redis_increment_queue.get(key, {})
+                new_val = {
+                    field: int(value or 0) + queued_usage.get(field, 0)
+                    for field, value in zip(USAGE_FIELDS, counter_values)
+                }
+                new_val["current_requests"] = max(new_val["current_requests"], 0)
+                in_memory_cache.set_cache(key, new_val, ttl=RATE_LIMIT_WINDOW_SECONDS)
+
     async def check_key_in_limits(
         self,
         user_api_key_dict: UserAPIKeyAuth,
@@ -63,7 +418,7 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
         current: Optional[dict],
         request_count_api_key: str,
         rate_limit_type: Literal["user", "customer", "team"],
-        values_to_update_in_cache: List[Tuple[Any, Any]],
+        increment_list: List[RedisPipelineIncrementOperation],
     ):
         # current = await self.internal_usage_cache.async_get_cache(
         #     key=request_count_api_key,
@@ -75,24 +430,24 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 return self.raise_rate_limit_error(
                     additional_details=f"Hit limit for {rate_limit_type}. Current limits: max_parallel_requests: {max_parallel_requests}, tpm_limit: {tpm_limit}, rpm_limit: {rpm_limit}"
                 )
-            new_val = {
-                "current_requests": 1,
-                "current_tpm": 0,
-                "current_rpm": 0,
-            }
-            values_to_update_in_cache.append((request_count_api_key, new_val))
+            self.update_usage(
+                increment_list,
+                key=request_count_api_key,
+                usage_change=REQUEST_STARTED_USAGE_CHANGE,
+                rate_limit_type=rate_limit_type,
+            )
         elif (
             int(current["current_requests"]) < max_parallel_requests
             and current["current_tpm"] < tpm_limit
             and current["current_rpm"] < rpm_limit
         ):
             # Increase count for this token
-            new_val = {
-                "current_requests": current["current_requests"] + 1,
-                "current_tpm": current["current_tpm"],
-                "current_rpm": current["current_rpm"],
-            }
-            values_to_update_in_cache.append((request_count_api_key, new_val))
+            self.update_usage(
+                increment_list,
+                key=request_count_api_key,
+                usage_change=REQUEST_STARTED_USAGE_CHANGE,
+                rate_limit_type=rate_limit_type,
+            )
         else:
             raise HTTPException(
                 status_code=429,
@@ -143,8 +498,9 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
             request_count_team_id,
             request_count_end_user_id,
         ]
-        results = await self.internal_usage_cache.async_batch_get_cache(
+        results = await self.get_usage(
             keys=keys,
+            rate_limit_types=[None, "key", "user", "team", "customer"],
             parent_otel_span=parent_otel_span,
         )
 
@@ -189,9 +545,9 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
         if rpm_limit is None:
             rpm_limit = sys.maxsize
 
-        values_to_update_in_cache: List[Tuple[Any, Any]] = (
+        increment_list: List[RedisPipelineIncrementOperation] = (
             []
-        )  # values that need to get updated in cache, will run a batch_set_cache after this function
+        )  # usage counters to increment, will run 1 async_increment_cache_pipeline after this function
 
         # ------------
         # Setup values
@@ -273,25 +629,18 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 return self.raise_rate_limit_error(
                     additional_details=f"Hit limit for api_key: {api_key}. max_parallel_requests: {max_parallel_requests}, tpm_limit: {tpm_limit}, rpm_limit: {rpm_limit}"
                 )
-            elif current is None:
-                new_val = {
-                    "current_requests": 1,
-                    "current_tpm": 0,
-                    "current_rpm": 0,
-                }
-                values_to_update_in_cache.append((request_count_api_key, new_val))
-            elif (
+            elif current is None or (
                 int(current["current_requests"]) < max_parallel_requests
                 and current["current_tpm"] < tpm_limit
                 and current["current_rpm"] < rpm_limit
             ):
                 # Increase count for this token
-                new_val = {
-                    "current_requests": current["current_requests"] + 1,
-                    "current_tpm": current["current_tpm"],
-                    "current_rpm": current["current_rpm"],
-                }
-                values_to_update_in_cache.append((request_count_api_key, new_val))
+                self.update_usage(
+                    increment_list,
+                    key=request_count_api_key,
+                    usage_change=REQUEST_STARTED_USAGE_CHANGE,
+                    rate_limit_type="key",
+                )
             else:
                 return self.raise_rate_limit_error(
                     additional_details=f"Hit limit for api_key: {api_key}. tpm_limit: {tpm_limit}, current_tpm {current['current_tpm']} , rpm_limit: {rpm_limit} current rpm {current['current_rpm']} "
@@ -307,9 +656,10 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 f"{api_key}::{_model}::{precise_minute}::request_count"
             )
 
-            current = await self.internal_usage_cache.async_get_cache(
+            current = await self._get_current_usage(
                 key=request_count_api_key,
-                litellm_parent_otel_span=user_api_key_dict.parent_otel_span,
+                rate_limit_type="key_model",
+                parent_otel_span=user_api_key_dict.parent_otel_span,
             )  # {"current_requests": 1, "current_tpm": 1, "current_rpm": 10}
 
             tpm_limit_for_model = None
@@ -331,7 +681,12 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                     "current_tpm": 0,
                     "current_rpm": 0,
                 }
-                values_to_update_in_cache.append((request_count_api_key, new_val))
+                self.update_usage(
+                    increment_list,
+                    key=request_count_api_key,
+                    usage_change=REQUEST_STARTED_USAGE_CHANGE,
+                    rate_limit_type="key_model",
+                )
             elif tpm_limit_for_model is not None or rpm_limit_for_model is not None:
                 # Increase count for this token
                 new_val = {
@@ -354,7 +709,12 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                         additional_details=f"Hit RPM limit for model: {_model} on api_key: {api_key}. rpm_limit: {rpm_limit_for_model}, current_rpm {current['current_rpm']} "
                     )
                 else:
-                    values_to_update_in_cache.append((request_count_api_key, new_val))
+                    self.update_usage(
+                        increment_list,
+                        key=request_count_api_key,
+                        usage_change=REQUEST_STARTED_USAGE_CHANGE,
+                        rate_limit_type="key_model",
+                    )
 
             _remaining_tokens = None
             _remaining_requests = None
@@ -397,7 +757,7 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 tpm_limit=user_tpm_limit,
                 rpm_limit=user_rpm_limit,
                 rate_limit_type="user",
-                values_to_update_in_cache=values_to_update_in_cache,
+                increment_list=increment_list,
             )
 
         # TEAM RATE LIMITS
@@ -425,7 +785,7 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 tpm_limit=team_tpm_limit,
                 rpm_limit=team_rpm_limit,
                 rate_limit_type="team",
-                values_to_update_in_cache=values_to_update_in_cache,
+                increment_list=increment_list,
             )
 
         # End-User Rate Limits
@@ -460,22 +820,19 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 tpm_limit=end_user_tpm_limit,
                 rpm_limit=end_user_rpm_limit,
                 rate_limit_type="customer",
-                values_to_update_in_cache=values_to_update_in_cache,
+                increment_list=increment_list,
             )
 
         asyncio.create_task(
-            self.internal_usage_cache.async_batch_set_cache(
-                cache_list=values_to_update_in_cache,
-                ttl=60,
-                litellm_parent_otel_span=user_api_key_dict.parent_otel_span,
+            self._write_usage(
+                increment_list=increment_list,
+                parent_otel_span=user_api_key_dict.parent_otel_span,
             )  # don't block execution for cache updates
         )
 
         return
 
-    async def async_log_success_event(  # noqa: PLR0915
-        self, kwargs, response_obj, start_time, end_time
-    ):
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         from litellm.proxy.common_utils.callback_utils import (
             get_model_group_from_litellm_kwargs,
         )
@@ -531,32 +888,24 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
             # Update usage - API Key
             # ------------
 
-            values_to_update_in_cache = []
+            # the request is done - release it, and count its tokens
+            usage_change = {
+                "current_requests": -1,
+                "current_tpm": total_tokens,
+                "current_rpm": 1,
+            }
+            increment_list: List[RedisPipelineIncrementOperation] = []
 
             if user_api_key is not None:
                 request_count_api_key = (
                     f"{user_api_key}::{precise_minute}::request_count"
                 )
-
-                current = await self.internal_usage_cache.async_get_cache(
+                self.update_usage(
+                    increment_list,
                     key=request_count_api_key,
-                    litellm_parent_otel_span=litellm_parent_otel_span,
-                ) or {
-                    "current_requests": 1,
-                    "current_tpm": 0,
-                    "current_rpm": 0,
-                }
-
-                new_val = {
-                    "current_requests": max(current["current_requests"] - 1, 0),
-                    "current_tpm": current["current_tpm"] + total_tokens,
-                    "current_rpm": current["current_rpm"] + 1,
-                }
-
-                self.print_verbose(
-                    f"updated_value in success call: {new_val}, precise_minute: {precise_minute}"
+                    usage_change=usage_change,
+                    rate_limit_type="key",
                 )
-                values_to_update_in_cache.append((request_count_api_key, new_val))
 
             # ------------
             # Update usage - model group + API Key
@@ -573,130 +922,61 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 request_count_api_key = (
                     f"{user_api_key}::{model_group}::{precise_minute}::request_count"
                 )
-
-                current = await self.internal_usage_cache.async_get_cache(
+                self.update_usage(
+                    increment_list,
                     key=request_count_api_key,
-                    litellm_parent_otel_span=litellm_parent_otel_span,
-                ) or {
-                    "current_requests": 1,
-                    "current_tpm": 0,
-                    "current_rpm": 0,
-                }
-
-                new_val = {
-                    "current_requests": max(current["current_requests"] - 1, 0),
-                    "current_tpm": current["current_tpm"] + total_tokens,
-                    "current_rpm": current["current_rpm"] + 1,
-                }
-
-                self.print_verbose(
-                    f"updated_value in success call: {new_val}, precise_minute: {precise_minute}"
+                    usage_change=usage_change,
+                    rate_limit_type="key_model",
                 )
-                values_to_update_in_cache.append((request_count_api_key, new_val))
 
             # ------------
             # Update usage - User
             # ------------
             if user_api_key_user_id is not None:
-                total_tokens = 0
-
-                if isinstance(response_obj, ModelResponse):
-                    total_tokens = response_obj.usage.total_tokens  # type: ignore
-
                 request_count_api_key = (
                     f"{user_api_key_user_id}::{precise_minute}::request_count"
                 )
-
-                current = await self.internal_usage_cache.async_get_cache(
+                self.update_usage(
+                    increment_list,
                     key=request_count_api_key,
-                    litellm_parent_otel_span=litellm_parent_otel_span,
-                ) or {
-                    "current_requests": 1,
-                    "current_tpm": total_tokens,
-                    "current_rpm": 1,
-                }
-
-                new_val = {
-                    "current_requests": max(current["current_requests"] - 1, 0),
-                    "current_tpm": current["current_tpm"] + total_tokens,
-                    "current_rpm": current["current_rpm"] + 1,
-                }
-
-                self.print_verbose(
-                    f"updated_value in success call: {new_val}, precise_minute: {precise_minute}"
+                    usage_change=usage_change,
+                    rate_limit_type="user",
                 )
-                values_to_update_in_cache.append((request_count_api_key, new_val))
 
             # ------------
             # Update usage - Team
             # ------------
             if user_api_key_team_id is not None:
-                total_tokens = 0
-
-                if isinstance(response_obj, ModelResponse):
-                    total_tokens = response_obj.usage.total_tokens  # type: ignore
-
                 request_count_api_key = (
                     f"{user_api_key_team_id}::{precise_minute}::request_count"
                 )
-
-                current = await self.internal_usage_cache.async_get_cache(
+                self.update_usage(
+                    increment_list,
                     key=request_count_api_key,
-                    litellm_parent_otel_span=litellm_parent_otel_span,
-                ) or {
-                    "current_requests": 1,
-                    "current_tpm": total_tokens,
-                    "current_rpm": 1,
-                }
-
-                new_val = {
-                    "current_requests": max(current["current_requests"] - 1, 0),
-                    "current_tpm": current["current_tpm"] + total_tokens,
-                    "current_rpm": current["current_rpm"] + 1,
-                }
-
-                self.print_verbose(
-                    f"updated_value in success call: {new_val}, precise_minute: {precise_minute}"
+                    usage_change=usage_change,
+                    rate_limit_type="team",
                 )
-                values_to_update_in_cache.append((request_count_api_key, new_val))
 
             # ------------
             # Update usage - End User
             # ------------
             if user_api_key_end_user_id is not None:
-                total_tokens = 0
-
-                if isinstance(response_obj, ModelResponse):
-                    total_tokens = response_obj.usage.total_tokens  # type: ignore
-
                 request_count_api_key = (
                     f"{user_api_key_end_user_id}::{precise_minute}::request_count"
                 )
-
-                current = await self.internal_usage_cache.async_get_cache(
+                self.update_usage(
+                    increment_list,
                     key=request_count_api_key,
-                    litellm_parent_otel_span=litellm_parent_otel_span,
-                ) or {
-                    "current_requests": 1,
-                    "current_tpm": total_tokens,
-                    "current_rpm": 1,
-                }
-
-                new_val = {
-                    "current_requests": max(current["current_requests"] - 1, 0),
-                    "current_tpm": current["current_tpm"] + total_tokens,
-                    "current_rpm": current["current_rpm"] + 1,
-                }
-
-                self.print_verbose(
-                    f"updated_value in success call: {new_val}, precise_minute: {precise_minute}"
+                    usage_change=usage_change,
+                    rate_limit_type="customer",
                 )
-                values_to_update_in_cache.append((request_count_api_key, new_val))
 
-            await self.internal_usage_cache.async_batch_set_cache(
-                cache_list=values_to_update_in_cache,
-                ttl=60,
-                litellm_parent_otel_span=litellm_parent_otel_span,
+            self.print_verbose(
+                f"usage change in success call: {usage_change}, precise_minute: {precise_minute}"
+            )
+            await self._write_usage(
+                increment_list=increment_list,
+                parent_otel_span=litellm_parent_otel_span,
             )
         except Exception as e:
             self.print_verbose(e)  # noqa
@@ -754,28 +1034,24 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
                 # ------------
                 # Update usage
                 # ------------
-                current = await self.internal_usage_cache.async_get_cache(
-                    key=request_count_api_key,
-                    litellm_parent_otel_span=litellm_parent_otel_span,
-                ) or {
-                    "current_requests": 1,
+                usage_change = {
+                    "current_requests": -1,
                     "current_tpm": 0,
                     "current_rpm": 0,
                 }
+                increment_list: List[RedisPipelineIncrementOperation] = []
+                self.update_usage(
+                    increment_list,
+                    key=request_count_api_key,
+                    usage_change=usage_change,
+                    rate_limit_type="key",
+                )
 
-                new_val = {
-                    "current_requests": max(current["current_requests"] - 1, 0),
-                    "current_tpm": current["current_tpm"],
-                    "current_rpm": current["current_rpm"],
-                }
-
-                self.print_verbose(f"updated_value in failure call: {new_val}")
-                await self.internal_usage_cache.async_set_cache(
-                    request_count_api_key,
-                    new_val,
-                    ttl=60,
-                    litellm_parent_otel_span=litellm_parent_otel_span,
-                )  # save in cache for up to 1 min.
+                self.print_verbose(f"usage change in failure call: {usage_change}")
+                await self._write_usage(
+                    increment_list=increment_list,
+                    parent_otel_span=litellm_parent_otel_span,
+                )
         except Exception as e:
             verbose_proxy_logger.exception(
                 "Inside Parallel Request Limiter: An exception occurred - {}".format(
@@ -832,9 +1108,10 @@ class _PROXY_MaxParallelRequestsHandler(CustomLogger):
         precise_minute = f"{current_date}-{current_hour}-{current_minute}"
         request_count_api_key = f"{api_key}::{precise_minute}::request_count"
         current: Optional[CurrentItemRateLimit] = (
-            await self.internal_usage_cache.async_get_cache(
+            await self._get_current_usage(  # type: ignore
                 key=request_count_api_key,
-                litellm_parent_otel_span=user_api_key_dict.parent_otel_span,
+                rate_limit_type="key",
+                parent_otel_span=user_api_key_dict.parent_otel_span,
             )
         )
 
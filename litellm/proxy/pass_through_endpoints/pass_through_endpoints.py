@@ -330,7 +330,7 @@ async def pass_through_request(  # noqa: PLR0915
         import uuid
 
         from litellm.litellm_core_utils.litellm_logging import Logging
-        from litellm.proxy.proxy_server import proxy_logging_obj
+        from litellm.proxy.proxy_server import general_settings, proxy_logging_obj
 
         url = httpx.URL(target)
         headers = custom_headers
@@ -454,7 +454,7 @@ async def pass_through_request(  # noqa: PLR0915
                 )
 
             return StreamingResponse(
-                PassThroughStreamingHandler.chunk_processor(
+                _get_streaming_chunk_processor(general_settings=general_settings)(
                     response=response,
                     request_body=_parsed_body,
                     litellm_logging_obj=logging_obj,
@@ -497,7 +497,7 @@ async def pass_through_request(  # noqa: PLR0915
                 )
 
             return StreamingResponse(
-                PassThroughStreamingHandler.chunk_processor(
+                _get_streaming_chunk_processor(general_settings=general_settings)(
                     response=response,
                     request_body=_parsed_body,
                     litellm_logging_obj=logging_obj,
@@ -679,6 +679,15 @@ def create_pass_through_route(
     return endpoint_func
 
 
+def _get_streaming_chunk_processor(general_settings: dict):
+    """
+    `zero_copy_pass_through_streaming` - forward chunks without collecting them, only usage is logged
+    """
+    if general_settings.get("zero_copy_pass_through_streaming", False) is True:
+        return PassThroughStreamingHandler.zero_copy_chunk_processor
+    return PassThroughStreamingHandler.chunk_processor
+
+
 def _is_streaming_response(response: httpx.Response) -> bool:
     _content_type = response.headers.get("content-type")
     if _content_type is not None and "text/event-stream" in _content_type:
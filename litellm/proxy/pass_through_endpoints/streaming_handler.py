@@ -1,6 +1,5 @@
 import asyncio
 import json
-import threading
 from datetime import datetime
 from enum import Enum
 from typing import AsyncIterable, Dict, List, Optional, Union
@@ -10,6 +9,7 @@ import httpx
 import litellm
 from litellm._logging import verbose_proxy_logger
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
 from litellm.llms.anthropic.chat.handler import (
     ModelResponseIterator as AnthropicIterator,
 )
@@ -29,6 +29,7 @@ from .llm_provider_handlers.anthropic_passthrough_logging_handler import (
 from .llm_provider_handlers.vertex_passthrough_logging_handler import (
     VertexPassthroughLoggingHandler,
 )
+from .streaming_usage_tracker import PassThroughStreamingUsageTracker
 from .success_handler import PassThroughEndpointLogging
 from .types import EndpointType
 
@@ -74,6 +75,47 @@ class PassThroughStreamingHandler:
             verbose_proxy_logger.error(f"Error in chunk_processor: {str(e)}")
             raise
 
+    @staticmethod
+    async def zero_copy_chunk_processor(
+        response: httpx.Response,
+        request_body: Optional[dict],
+        litellm_logging_obj: LiteLLMLoggingObj,
+        endpoint_type: EndpointType,
+        start_time: datetime,
+        passthrough_success_handler_obj: PassThroughEndpointLogging,
+        url_route: str,
+    ):
+        """
+        Used if `general_settings.zero_copy_pass_through_streaming` is set
+
+        - Yields chunks from the response, as received
+        - Extracts usage from the usage-bearing events (for logging + spend tracking) - chunks are not collected
+        """
+        try:
+            usage_tracker = PassThroughStreamingUsageTracker(
+                endpoint_type=endpoint_type
+            )
+            async for chunk in response.aiter_bytes():
+                yield chunk
+                usage_tracker.process_chunk(chunk)
+
+            end_time = datetime.now()
+
+            asyncio.create_task(
+                PassThroughStreamingHandler._route_streaming_usage_logging_to_handler(
+                    litellm_logging_obj=litellm_logging_obj,
+                    url_route=url_route,
+                    request_body=request_body or {},
+                    endpoint_type=endpoint_type,
+                    start_time=start_time,
+                    usage_tracker=usage_tracker,
+                    end_time=end_time,
+                )
+            )
+        except Exception as e:
+            verbose_proxy_logger.error(f"Error in zero_copy_chunk_processor: {str(e)}")
+            raise
+
     @staticmethod
     async def _route_streaming_logging_to_handler(
         litellm_logging_obj: LiteLLMLoggingObj,
@@ -136,15 +178,90 @@ class PassThroughStreamingHandler:
             standard_logging_response_object = StandardPassThroughResponseObject(
                 response=f"cannot parse chunks to standard response object. Chunks={all_chunks}"
             )
-        threading.Thread(
-            target=litellm_logging_obj.success_handler,
-            args=(
-                standard_logging_response_object,
-                start_time,
-                end_time,
-                False,
-            ),
-        ).start()
+        await PassThroughStreamingHandler._log_streaming_response(
+            litellm_logging_obj=litellm_logging_obj,
+            standard_logging_response_object=standard_logging_response_object,
+            start_time=start_time,
+            end_time=end_time,
+            kwargs=kwargs,
+        )
+
+    @staticmethod
+    async def _route_streaming_usage_logging_to_handler(
+        litellm_logging_obj: LiteLLMLoggingObj,
+        url_route: str,
+        request_body: dict,
+        endpoint_type: EndpointType,
+        start_time: datetime,
+        usage_tracker: PassThroughStreamingUsageTracker,
+        end_time: datetime,
+    ):
+        """
+        Log a stream forwarded by `zero_copy_chunk_processor` - the logged response has the usage, not the content
+
+        Cost is calculated for:
+        - Anthropic
+        - Vertex AI
+        """
+        standard_logging_response_object: Optional[
+            PassThroughEndpointLoggingResultValues
+        ] = None
+        kwargs: dict = {}
+        usage = usage_tracker.get_usage()
+        if usage is not None and endpoint_type == EndpointType.ANTHROPIC:
+            model = request_body.get("model", "") or usage_tracker.model or ""
+            litellm_model_response = ModelResponse(model=model)
+            setattr(litellm_model_response, "usage", usage)
+            kwargs = AnthropicPassthroughLoggingHandler._create_anthropic_response_logging_payload(
+                litellm_model_response=litellm_model_response,
+                model=model,
+                kwargs={},
+                start_time=start_time,
+                end_time=end_time,
+                logging_obj=litellm_logging_obj,
+            )
+            standard_logging_response_object = litellm_model_response
+        elif usage is not None and endpoint_type == EndpointType.VERTEX_AI:
+            model = VertexPassthroughLoggingHandler.extract_model_from_url(url_route)
+            litellm_model_response = ModelResponse(model=model)
+            setattr(litellm_model_response, "usage", usage)
+            kwargs = VertexPassthroughLoggingHandler._create_vertex_response_logging_payload_for_generate_content(
+                litellm_model_response=litellm_model_response,
+                model=model,
+                kwargs={},
+                start_time=start_time,
+                end_time=end_time,
+                logging_obj=litellm_logging_obj,
+            )
+            standard_logging_response_object = litellm_model_response
+
+        if standard_logging_response_object is None:
+            standard_logging_response_object = StandardPassThroughResponseObject(
+                response=f"streaming response not collected (zero_copy_pass_through_streaming). Bytes={usage_tracker.bytes_received}, Usage={usage_tracker.usage}"
+            )
+        await PassThroughStreamingHandler._log_streaming_response(
+            litellm_logging_obj=litellm_logging_obj,
+            standard_logging_response_object=standard_logging_response_object,
+            start_time=start_time,
+            end_time=end_time,
+            kwargs=kwargs,
+        )
+
+    @staticmethod
+    async def _log_streaming_response(
+        litellm_logging_obj: LiteLLMLoggingObj,
+        standard_logging_response_object: PassThroughEndpointLoggingResultValues,
+        start_time: datetime,
+        end_time: datetime,
+        kwargs: dict,
+    ):
+        GLOBAL_LOGGING_WORKER.submit(
+            litellm_logging_obj.success_handler,
+            standard_logging_response_object,
+            start_time,
+            end_time,
+            False,
+        )
         await litellm_logging_obj.async_success_handler(
             result=standard_logging_response_object,
             start_time=start_time,
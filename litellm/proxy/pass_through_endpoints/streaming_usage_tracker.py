@@ -0,0 +1,144 @@
+"""
+Extracts usage from a pass-through stream, while the raw bytes are forwarded to the client
+
+Used when `general_settings.zero_copy_pass_through_streaming` is set - chunks are not collected for logging, so only
+the usage-bearing events (e.g. Anthropic `message_start` / `message_delta`, Vertex AI chunks with `usageMetadata`)
+are parsed, as they arrive.
+
+- chunks are never decoded / joined - only lines containing `"usage` are json-parsed
+- only the current incomplete line is kept between chunks (up to `MAX_PENDING_LINE_BYTES`)
+"""
+
+import json
+from typing import Optional
+
+from litellm.types.utils import PromptTokensDetailsWrapper, Usage
+
+from .types import EndpointType
+
+# matches `"usage"` (anthropic / openai) and `"usageMetadata"` (vertex ai / gemini)
+USAGE_MARKER = b'"usage'
+# longer lines are skipped - usage-bearing events are small
+MAX_PENDING_LINE_BYTES = 1024 * 1024
+
+
+class PassThroughStreamingUsageTracker:
+    def __init__(self, endpoint_type: EndpointType):
+        self.endpoint_type = endpoint_type
+        self.model: Optional[str] = None
+        # latest usage values, in the provider's format
+        self.usage: dict = {}
+        self.bytes_received = 0
+        # incomplete line, from the previous chunks
+        self._pending_line = b""
+        # the incomplete line is longer than `MAX_PENDING_LINE_BYTES`
+        self._skip_pending_line = False
+
+    def process_chunk(self, chunk: bytes) -> None:
+        self.bytes_received += len(chunk)
+        last_newline = chunk.rfind(b"\n")
+        if last_newline == -1:
+            self._add_to_pending_line(chunk)
+            return
+
+        start = 0
+        if self._pending_line or self._skip_pending_line:
+            first_newline = chunk.find(b"\n")
+            if self._skip_pending_line is False:
+                self._process_line(self._pending_line + chunk[:first_newline])
+            self._pending_line = b""
+            self._skip_pending_line = False
+            start = first_newline + 1
+
+        # only slice out the lines with usage
+        usage_index = chunk.find(USAGE_MARKER, start, last_newline)
+        while usage_index != -1:
+            line_start = max(chunk.rfind(b"\n", start, usage_index) + 1, start)
+            line_end = chunk.find(b"\n", usage_index, last_newline)
+            if line_end == -1:
+                line_end = last_newline
+            self._process_line(chunk[line_start:line_end])
+            start = line_end + 1
+            usage_index = chunk.find(USAGE_MARKER, start, last_newline)
+
+        if last_newline + 1 < len(chunk):
+            self._add_to_pending_line(chunk[last_newline + 1 :])
+
+    def _add_to_pending_line(self, data: bytes) -> None:
+        if self._skip_pending_line:
+            return
+        if len(self._pending_line) + len(data) > MAX_PENDING_LINE_BYTES:
+            self._pending_line = b""
+            self._skip_pending_line = True
+            return
+        self._pending_line += data
+
+    def _process_line(self, line: bytes) -> None:
+        if USAGE_MARKER not in line:
+            return
+        line = line.strip()
+        if line.startswith(b"data:"):
+            line = line[5:]
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return
+        if isinstance(event, dict):
+            self._process_event(event)
+
+    def _process_event(self, event: dict) -> None:
+        # anthropic `message_start` - model + input tokens are on the message
+        message = event.get("message")
+        if isinstance(message, dict):
+            event = message
+        model = event.get("model") or event.get("modelVersion")
+        if isinstance(model, str) and model:
+            self.model = model
+        usage = event.get("usage") or event.get("usageMetadata")
+        if isinstance(usage, dict):
+            # usage is cumulative - later values replace earlier ones
+            self.usage.update({k: v for k, v in usage.items() if v is not None})
+
+    def get_usage(self) -> Optional[Usage]:
+        """
+        Returns the usage of the stream, in OpenAI format - None if the stream had no usage
+        """
+        if not self.usage:
+            return None
+        if self.endpoint_type == EndpointType.ANTHROPIC:
+            return self._get_anthropic_usage()
+        elif self.endpoint_type == EndpointType.VERTEX_AI:
+            return Usage(
+                prompt_tokens=self.usage.get("promptTokenCount", 0),
+                completion_tokens=self.usage.get("candidatesTokenCount", 0),
+                total_tokens=self.usage.get("totalTokenCount", 0),
+            )
+        prompt_tokens = self.usage.get("prompt_tokens", 0)
+        completion_tokens = self.usage.get("completion_tokens", 0)
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=self.usage.get(
+                "total_tokens", prompt_tokens + completion_tokens
+            ),
+        )
+
+    def _get_anthropic_usage(self) -> Usage:
+        """
+        Same as the usage of non-streaming anthropic responses - `AnthropicConfig._process_response`
+        """
+        prompt_tokens = self.usage.get("input_tokens", 0)
+        completion_tokens = self.usage.get("output_tokens", 0)
+        cache_creation_input_tokens = self.usage.get("cache_creation_input_tokens", 0)
+        cache_read_input_tokens = self.usage.get("cache_read_input_tokens", 0)
+        prompt_tokens += cache_creation_input_tokens + cache_read_input_tokens
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            prompt_tokens_details=PromptTokensDetailsWrapper(
+                cached_tokens=cache_read_input_tokens
+            ),
+            cache_creation_input_tokens=cache_creation_input_tokens,
+            cache_read_input_tokens=cache_read_input_tokens,
+        )
@@ -113,7 +113,7 @@ from litellm import (
     RetrieveBatchRequest,
 )
 from litellm._logging import verbose_proxy_logger, verbose_router_logger
-from litellm.caching.caching import DualCache, RedisCache
+from litellm.caching.caching import DualCache, InMemoryCache, RedisCache
 from litellm.exceptions import RejectedRequestError
 from litellm.integrations.SlackAlerting.slack_alerting import SlackAlerting
 from litellm.litellm_core_utils.core_helpers import (
@@ -400,6 +400,10 @@ class UserAPIKeyCacheTTLEnum(enum.Enum):
     in_memory_cache_ttl = 60  # 1 min ttl ## configure via `general_settings::user_api_key_cache_ttl: <your-value>`
 
 
+USER_API_KEY_CACHE_MAX_SIZE_IN_MEMORY = 10_000  # keys / users / teams / ...
+USER_API_KEY_CACHE_MAX_SIZE_IN_BYTES = 100 * 1024 * 1024
+
+
 @app.exception_handler(ProxyException)
 async def openai_exception_handler(request: Request, exc: ProxyException):
     # NOTE: DO NOT MODIFY THIS, its crucial to map to Openai exceptions
@@ -491,7 +495,13 @@ master_key: Optional[str] = None
 otel_logging = False
 prisma_client: Optional[PrismaClient] = None
 user_api_key_cache = DualCache(
-    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value
+    in_memory_cache=InMemoryCache(
+        max_size_in_memory=USER_API_KEY_CACHE_MAX_SIZE_IN_MEMORY,
+        max_size_in_bytes=USER_API_KEY_CACHE_MAX_SIZE_IN_BYTES,
+        store_decoded_values=True,
+        evict_least_recently_used=True,  # an evicted object is re-read from the db
+    ),
+    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value,
 )
 redis_usage_cache: Optional[RedisCache] = (
     None  # redis cache used for tracking spend, tpm/rpm limits
@@ -813,9 +823,15 @@ def _set_spend_logs_payload(
             payload["startTime"] = payload["startTime"].isoformat()
         if isinstance(payload["endTime"], datetime):
             payload["endTime"] = payload["endTime"].isoformat()
-        prisma_client.spend_log_transactions.append(payload)
+        prisma_client.spend_update_writer.add_spend_log(
+            prisma_client=prisma_client,
+            payload=payload,
+            spend_logs_url=spend_logs_url,
+        )
     elif prisma_client is not None:
-        prisma_client.spend_log_transactions.append(payload)
+        prisma_client.spend_update_writer.add_spend_log(
+            prisma_client=prisma_client, payload=payload
+        )
     return prisma_client
 
 
@@ -1858,6 +1874,14 @@ class ProxyConfig:
                 alerting_args=general_settings.get("alerting_args", None),
                 redis_cache=redis_usage_cache,
             )
+            ### LOCAL-FIRST RATE LIMITS ###
+            local_first_rate_limits = general_settings.get(
+                "local_first_rate_limits", None
+            )
+            if local_first_rate_limits is not None:
+                proxy_logging_obj.max_parallel_request_limiter.update_local_first_rate_limits(
+                    settings=local_first_rate_limits
+                )
             ### CONNECT TO DATABASE ###
             database_url = general_settings.get("database_url", None)
             if database_url and database_url.startswith("os.environ/"):
@@ -2030,7 +2054,8 @@ class ProxyConfig:
             **router_params,
             assistants_config=assistants_config,
             router_general_settings=RouterGeneralSettings(
-                async_only_mode=True  # only init async clients
+                async_only_mode=True,  # only init async clients
+                preload_tokenizers=general_settings.get("preload_tokenizers", False),
             ),
         )  # type:ignore
 
@@ -2226,7 +2251,10 @@ class ProxyConfig:
                     llm_router = litellm.Router(
                         model_list=_model_list,
                         router_general_settings=RouterGeneralSettings(
-                            async_only_mode=True  # only init async clients
+                            async_only_mode=True,  # only init async clients
+                            preload_tokenizers=general_settings.get(
+                                "preload_tokenizers", False
+                            ),
                         ),
                     )
                     verbose_proxy_logger.debug(f"updated llm_router: {llm_router}")
@@ -2946,6 +2974,9 @@ class ProxyStartupEvent:
             )
 
         ### UPDATE SPEND ###
+        prisma_client.spend_update_writer.update_settings(
+            general_settings=general_settings, redis_cache=redis_usage_cache
+        )
         scheduler.add_job(
             update_spend,
             "interval",
@@ -18,7 +18,6 @@ import json
 import logging
 import random
 import re
-import threading
 import time
 import traceback
 import uuid
@@ -54,6 +53,12 @@ from litellm.caching.caching import DualCache, InMemoryCache, RedisCache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
+from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
+from litellm.litellm_core_utils.tokenizer_registry import preload_tokenizers
+from litellm.llms.prompt_templates.chat_template_cache import (
+    HF_CHAT_TEMPLATE_PROVIDERS,
+    preload_chat_templates,
+)
 from litellm.llms.AzureOpenAI.azure import get_azure_ad_token_from_oidc
 from litellm.router_strategy.least_busy import LeastBusyLoggingHandler
 from litellm.router_strategy.lowest_cost import LowestCostLoggingHandler
@@ -77,6 +82,7 @@ from litellm.router_utils.cooldown_handlers import (
     _get_cooldown_deployments,
     _set_cooldown_deployments,
 )
+from litellm.router_utils.deployment_index import DeploymentIndex
 from litellm.router_utils.fallback_event_handlers import (
     log_failure_fallback_event,
     log_success_fallback_event,
@@ -92,6 +98,7 @@ from litellm.router_utils.router_callbacks.track_deployment_metrics import (
     increment_deployment_successes_for_current_minute,
 )
 from litellm.scheduler import FlowItem, Scheduler
+from litellm.types.caching import RedisPipelineIncrementOperation
 from litellm.types.llms.openai import (
     Assistant,
     AssistantToolParam,
@@ -259,7 +266,7 @@ class Router:
             cache_kwargs (dict): Additional kwargs to pass to RedisCache. Defaults to {}.
             caching_groups (Optional[List[tuple]]): List of model groups for caching across model groups. Defaults to None.
             client_ttl (int): Time-to-live for cached clients in seconds. Defaults to 3600.
-            polling_interval: (Optional[float]): frequency of polling queue. Only for '.scheduler_acompletion()'. Default is 3ms.
+            polling_interval: (Optional[float]): min. time between releasing queued requests while no deployments are healthy. Only for '.scheduler_acompletion()'. Default is 30ms.
             default_priority: (Optional[int]): the default priority for a request. Only for '.scheduler_acompletion()'. Default is None.
             num_retries (Optional[int]): Number of retries for failed requests. Defaults to 2.
             timeout (Optional[float]): Timeout for requests. Defaults to None.
@@ -379,6 +386,7 @@ class Router:
         self.default_max_parallel_requests = default_max_parallel_requests
         self.provider_default_deployment_ids: List[str] = []
         self.pattern_router = PatternMatchRouter()
+        self.deployment_index = DeploymentIndex()
 
         if model_list is not None:
             model_list = copy.deepcopy(model_list)
@@ -392,6 +400,9 @@ class Router:
                 []
             )  # initialize an empty list - to allow _add_deployment and delete_deployment to work
 
+        if self.router_general_settings.preload_tokenizers is True:
+            self._preload_tokenizers()
+
         if allowed_fails is not None:
             self.allowed_fails = allowed_fails
         else:
@@ -1309,33 +1320,22 @@ class Router:
         item = FlowItem(
             priority=priority,  # 👈 SET PRIORITY FOR REQUEST
             request_id=_request_id,  # 👈 SET REQUEST ID
-            model_name="gpt-3.5-turbo",  # 👈 SAME as 'Router'
+            model_name=model,  # 👈 SAME as 'Router'
         )
         ### [fin] ###
 
-        ## ADDS REQUEST TO QUEUE ##
-        await self.scheduler.add_request(request=item)
-
-        ## POLL QUEUE
-        end_time = time.time() + self.timeout
-        curr_time = time.time()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
+        async def _has_healthy_deployments() -> bool:
             _healthy_deployments, _ = await self._async_get_healthy_deployments(
                 model=model, parent_otel_span=parent_otel_span
             )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.time()
+            return len(_healthy_deployments) > 0
+
+        ## ADDS REQUEST TO QUEUE + WAITS ## - returns 'True' if there's healthy deployments OR if request is at top of queue
+        make_request = await self.scheduler.wait_for_turn(
+            request=item,
+            has_capacity=_has_healthy_deployments,
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -3315,6 +3315,9 @@ class Router:
 
                 parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
 
+                ## SCHEDULER ## - let queued requests re-check for healthy deployments
+                self.scheduler.notify_capacity_change(model_name=model_group)
+
                 _usage_obj = completion_response.get("usage")
                 total_tokens = _usage_obj.get("total_tokens", 0) if _usage_obj else 0
 
@@ -3329,28 +3332,27 @@ class Router:
                 tpm_key = RouterCacheEnum.TPM.value.format(
                     id=id, current_minute=current_minute, model=deployment_name
                 )
-                # ------------
-                # Update usage
-                # ------------
-                # update cache
-
-                ## TPM
-                await self.cache.async_increment_cache(
-                    key=tpm_key,
-                    value=total_tokens,
-                    parent_otel_span=parent_otel_span,
-                    ttl=RoutingArgs.ttl.value,
-                )
-
-                ## RPM
                 rpm_key = RouterCacheEnum.RPM.value.format(
                     id=id, current_minute=current_minute, model=deployment_name
                 )
-                await self.cache.async_increment_cache(
-                    key=rpm_key,
-                    value=1,
+                # ------------
+                # Update usage
+                # ------------
+                # update cache - TPM + RPM in 1 redis round-trip
+                await self.cache.async_increment_cache_pipeline(
+                    increment_list=[
+                        RedisPipelineIncrementOperation(
+                            key=tpm_key,
+                            increment_value=total_tokens,
+                            ttl=RoutingArgs.ttl.value,
+                        ),
+                        RedisPipelineIncrementOperation(
+                            key=rpm_key,
+                            increment_value=1,
+                            ttl=RoutingArgs.ttl.value,
+                        ),
+                    ],
                     parent_otel_span=parent_otel_span,
-                    ttl=RoutingArgs.ttl.value,
                 )
 
                 increment_deployment_successes_for_current_minute(
@@ -3403,6 +3405,34 @@ class Router:
 
         return None
 
+    def _get_time_to_cooldown(self, kwargs: dict) -> Optional[float]:
+        """
+        Cooldown time for a failed deployment - the `Retry-After` of the exception's response headers if set, else
+        the request's / router's `cooldown_time`
+        """
+        exception = kwargs.get("exception", None)
+        exception_headers = (
+            litellm.litellm_core_utils.exception_mapping_utils._get_response_headers(
+                original_exception=exception
+            )
+        )
+
+        _time_to_cooldown = kwargs.get("litellm_params", {}).get(
+            "cooldown_time", self.cooldown_time
+        )
+
+        if exception_headers is not None:
+
+            _time_to_cooldown = litellm.utils._get_retry_after_from_exception_header(
+                response_headers=exception_headers
+            )
+
+            if _time_to_cooldown is None or _time_to_cooldown < 0:
+                # if the response headers did not read it -> set to default cooldown time
+                _time_to_cooldown = self.cooldown_time
+
+        return _time_to_cooldown
+
     def deployment_callback_on_failure(
         self,
         kwargs,  # kwargs to completion
@@ -3424,25 +3454,7 @@ class Router:
             exception_status = getattr(exception, "status_code", "")
             _model_info = kwargs.get("litellm_params", {}).get("model_info", {})
 
-            exception_headers = litellm.litellm_core_utils.exception_mapping_utils._get_response_headers(
-                original_exception=exception
-            )
-
-            _time_to_cooldown = kwargs.get("litellm_params", {}).get(
-                "cooldown_time", self.cooldown_time
-            )
-
-            if exception_headers is not None:
-
-                _time_to_cooldown = (
-                    litellm.utils._get_retry_after_from_exception_header(
-                        response_headers=exception_headers
-                    )
-                )
-
-                if _time_to_cooldown is None or _time_to_cooldown < 0:
-                    # if the response headers did not read it -> set to default cooldown time
-                    _time_to_cooldown = self.cooldown_time
+            _time_to_cooldown = self._get_time_to_cooldown(kwargs=kwargs)
 
             if isinstance(_model_info, dict):
                 deployment_id = _model_info.get("id", None)
@@ -3483,6 +3495,13 @@ class Router:
             id = str(id)
         parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
 
+        ## SCHEDULER ## - deployment may have entered cooldown, re-check once it ends
+        self.scheduler.notify_capacity_change(model_name=model_group)
+        self.scheduler.schedule_capacity_check(
+            model_name=model_group,
+            delay=self._get_time_to_cooldown(kwargs=kwargs) or self.cooldown_time,
+        )
+
         dt = get_utc_datetime()
         current_minute = dt.strftime(
             "%H-%M"
@@ -3767,10 +3786,9 @@ class Router:
                             )
                         )
                         ## LOGGING
-                        threading.Thread(
-                            target=logging_obj.failure_handler,
-                            args=(e, traceback.format_exc()),
-                        ).start()  # log response
+                        GLOBAL_LOGGING_WORKER.submit(
+                            logging_obj.failure_handler, e, traceback.format_exc()
+                        )  # log response
                     _set_cooldown_deployments(
                         litellm_router_instance=self,
                         exception_status=e.status_code,
@@ -3790,10 +3808,9 @@ class Router:
                             )
                         )
                         ## LOGGING
-                        threading.Thread(
-                            target=logging_obj.failure_handler,
-                            args=(e, traceback.format_exc()),
-                        ).start()  # log response
+                        GLOBAL_LOGGING_WORKER.submit(
+                            logging_obj.failure_handler, e, traceback.format_exc()
+                        )  # log response
                     raise e
 
     def _generate_model_id(self, model_group: str, litellm_params: dict):
@@ -3871,6 +3888,7 @@ class Router:
         model = deployment.to_json(exclude_none=True)
 
         self.model_list.append(model)
+        self.deployment_index.add(model)
         return deployment
 
     def deployment_is_active_for_environment(self, deployment: Deployment) -> bool:
@@ -3916,6 +3934,7 @@ class Router:
     def set_model_list(self, model_list: list):
         original_model_list = copy.deepcopy(model_list)
         self.model_list = []
+        self.deployment_index.clear()
         # we add api_base/api_key each model so load balancing between azure/gpt on api_base1 and api_base2 works
         import os
 
@@ -3959,6 +3978,32 @@ class Router:
         )
         self.model_names = [m["model_name"] for m in model_list]
 
+    def _preload_tokenizers(self):
+        """
+        Warm the tokenizer cache in a background thread, so the first pre-call token count (e.g. `enable_pre_call_checks`, tpm routing) doesn't pay tokenizer load time.
+
+        Also loads the tokenizer configs + compiles the chat templates of huggingface-style deployments, used to build their prompts.
+        """
+        models_to_preload: List[str] = []
+        chat_template_models_to_preload: List[str] = []
+        for deployment in self.model_list:
+            _model = deployment.get("litellm_params", {}).get("model")
+            if not isinstance(_model, str):
+                continue
+            models_to_preload.append(_model)
+            if (
+                "/" in _model
+            ):  # also warm the un-prefixed name, used by /utils/token_counter
+                _provider, _model_name = _model.split("/", 1)
+                models_to_preload.append(_model_name)
+                if _provider in HF_CHAT_TEMPLATE_PROVIDERS:
+                    chat_template_models_to_preload.append(_model_name)
+        preload_tokenizers(models=models_to_preload, background=True)
+        if len(chat_template_models_to_preload) > 0:
+            preload_chat_templates(
+                models=chat_template_models_to_preload, background=True
+            )
+
     def _add_deployment(self, deployment: Deployment) -> Deployment:
         import os
 
@@ -4070,12 +4115,13 @@ class Router:
         """
         # check if deployment already exists
 
-        if deployment.model_info.id in self.get_model_ids():
+        if self.deployment_index.has_model_id(deployment.model_info.id):
             return None
 
         # add to model list
         _deployment = deployment.to_json(exclude_none=True)
         self.model_list.append(_deployment)
+        self.deployment_index.add(_deployment)
 
         # initialize client
         self._add_deployment(deployment=deployment)
@@ -4106,13 +4152,7 @@ class Router:
 
             # if there is a new litellm param -> then update the deployment
             # remove the previous deployment
-            removal_idx: Optional[int] = None
-            for idx, model in enumerate(self.model_list):
-                if model["model_info"]["id"] == deployment.model_info.id:
-                    removal_idx = idx
-
-            if removal_idx is not None:
-                self.model_list.pop(removal_idx)
+            self._remove_deployment_by_id(model_id=_deployment_model_id)
 
         # if the model_id is not in router
         self.add_deployment(deployment=deployment)
@@ -4127,36 +4167,42 @@ class Router:
         - The deleted deployment
         - OR None (if deleted deployment not found)
         """
-        deployment_idx = None
-        for idx, m in enumerate(self.model_list):
-            if m["model_info"]["id"] == id:
-                deployment_idx = idx
-
         try:
-            if deployment_idx is not None:
-                item = self.model_list.pop(deployment_idx)
-                return item
-            else:
-                return None
+            return self._remove_deployment_by_id(model_id=id)
         except Exception:
             return None
 
+    def _remove_deployment_by_id(self, model_id: str) -> Optional[Dict]:
+        """
+        Remove the last deployment with this id from the model list + deployment index
+
+        Returns the removed deployment, or None if not found
+        """
+        item = self.deployment_index.get_last_by_model_id(model_id=model_id)
+        if item is None:
+            return None
+        for idx in range(len(self.model_list) - 1, -1, -1):
+            if self.model_list[idx] is item:
+                self.model_list.pop(idx)
+                break
+        self.deployment_index.remove(item)
+        return item
+
     def get_deployment(self, model_id: str) -> Optional[Deployment]:
         """
         Returns -> Deployment or None
 
         Raise Exception -> if model found in invalid format
         """
-        for model in self.model_list:
-            if "model_info" in model and "id" in model["model_info"]:
-                if model_id == model["model_info"]["id"]:
-                    if isinstance(model, dict):
-                        return Deployment(**model)
-                    elif isinstance(model, Deployment):
-                        return model
-                    else:
-                        raise Exception("Model invalid format - {}".format(type(model)))
-        return None
+        model = self.deployment_index.get_first_by_model_id(model_id=model_id)
+        if model is None:
+            return None
+        if isinstance(model, dict):
+            return Deployment(**model)
+        elif isinstance(model, Deployment):
+            return model
+        else:
+            raise Exception("Model invalid format - {}".format(type(model)))
 
     def get_deployment_by_model_group_name(
         self, model_group_name: str
@@ -4166,15 +4212,18 @@ class Router:
 
         Raise Exception -> if model found in invalid format
         """
-        for model in self.model_list:
-            if model["model_name"] == model_group_name:
-                if isinstance(model, dict):
-                    return Deployment(**model)
-                elif isinstance(model, Deployment):
-                    return model
-                else:
-                    raise Exception("Model Name invalid - {}".format(type(model)))
-        return None
+        deployments = self.deployment_index.get_by_model_name(
+            model_name=model_group_name
+        )
+        if len(deployments) == 0:
+            return None
+        model = deployments[0]
+        if isinstance(model, dict):
+            return Deployment(**model)
+        elif isinstance(model, Deployment):
+            return model
+        else:
+            raise Exception("Model Name invalid - {}".format(type(model)))
 
     @overload
     def get_router_model_info(
@@ -4658,14 +4707,14 @@ class Router:
 
         Returns list of model id's.
         """
+        if model_name is not None:
+            return self.deployment_index.get_model_ids_by_model_name(
+                model_name=model_name
+            )
         ids = []
         for model in self.model_list:
             if "model_info" in model and "id" in model["model_info"]:
-                id = model["model_info"]["id"]
-                if model_name is not None and model["model_name"] == model_name:
-                    ids.append(id)
-                elif model_name is None:
-                    ids.append(id)
+                ids.append(model["model_info"]["id"])
         return ids
 
     def _get_all_deployments(
@@ -4677,14 +4726,15 @@ class Router:
         Used for accurate 'get_model_list'.
         """
         returned_models: List[DeploymentTypedDict] = []
-        for model in self.model_list:
-            if model_name is not None and model["model_name"] == model_name:
-                if model_alias is not None:
-                    alias_model = copy.deepcopy(model)
-                    alias_model["model_name"] = model_alias
-                    returned_models.append(alias_model)
-                else:
-                    returned_models.append(model)
+        if model_name is None:
+            return returned_models
+        for model in self.deployment_index.get_by_model_name(model_name=model_name):
+            if model_alias is not None:
+                alias_model = copy.deepcopy(model)
+                alias_model["model_name"] = model_alias
+                returned_models.append(alias_model)  # type: ignore
+            else:
+                returned_models.append(model)  # type: ignore
 
         return returned_models
 
@@ -4751,12 +4801,7 @@ class Router:
         from collections import defaultdict
 
         access_groups = defaultdict(list)
-
-        if self.model_list:
-            for m in self.model_list:
-                for group in m.get("model_info", {}).get("access_groups", []):
-                    model_name = m["model_name"]
-                    access_groups[group].append(model_name)
+        access_groups.update(self.deployment_index.get_access_groups())
 
         return access_groups
 
@@ -5146,7 +5191,7 @@ class Router:
         """
         Get the deployment by litellm model.
         """
-        return [m for m in self.model_list if m["litellm_params"]["model"] == model]
+        return self.deployment_index.get_by_litellm_model(litellm_model=model)
 
     def _common_checks_available_deployment(
         self,
@@ -5169,7 +5214,7 @@ class Router:
         # check if aliases set on litellm model alias map
         if specific_deployment is True:
             return model, self._get_deployment_by_litellm_model(model=model)
-        elif model in self.get_model_ids():
+        elif self.deployment_index.has_model_id(model):
             deployment = self.get_deployment(model_id=model)
             if deployment is not None:
                 deployment_model = deployment.litellm_params.model
@@ -5183,7 +5228,7 @@ class Router:
         if _model_from_alias is not None:
             model = _model_from_alias
 
-        if model not in self.model_names:
+        if not self.deployment_index.has_model_name(model):
             # check if provider/ specific wildcard routing use pattern matching
             pattern_deployments = self.pattern_router.get_deployments_by_pattern(
                 model=model,
@@ -5404,10 +5449,9 @@ class Router:
 
                 if logging_obj is not None:
                     ## LOGGING
-                    threading.Thread(
-                        target=logging_obj.failure_handler,
-                        args=(e, traceback_exception),
-                    ).start()  # log response
+                    GLOBAL_LOGGING_WORKER.submit(
+                        logging_obj.failure_handler, e, traceback_exception
+                    )  # log response
                     # Handle any exceptions that might occur during streaming
                     asyncio.create_task(
                         logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
@@ -5553,17 +5597,16 @@ class Router:
             List of healthy deployments
         """
         # filter out the deployments currently cooling down
-        deployments_to_remove = []
         verbose_router_logger.debug(f"cooldown deployments: {cooldown_deployments}")
-        # Find deployments in model_list whose model_id is cooling down
-        for deployment in healthy_deployments:
-            deployment_id = deployment["model_info"]["id"]
-            if deployment_id in cooldown_deployments:
-                deployments_to_remove.append(deployment)
-
-        # remove unhealthy deployments from healthy deployments
-        for deployment in deployments_to_remove:
-            healthy_deployments.remove(deployment)
+        if len(cooldown_deployments) == 0:
+            return healthy_deployments
+        _cooldown_deployments = set(cooldown_deployments)
+        # remove unhealthy deployments from healthy deployments (in place)
+        healthy_deployments[:] = [
+            deployment
+            for deployment in healthy_deployments
+            if deployment["model_info"]["id"] not in _cooldown_deployments
+        ]
         return healthy_deployments
 
     def _track_deployment_metrics(
@@ -5725,6 +5768,7 @@ class Router:
     def flush_cache(self):
         litellm.cache = None
         self.cache.flush_cache()
+        self.cooldown_cache.health_map.clear()
 
     def reset(self):
         ## clean up on close
@@ -12,6 +12,7 @@ from litellm._logging import verbose_router_logger
 from litellm.llms.AzureOpenAI.azure import get_azure_ad_token_from_oidc
 from litellm.secret_managers.get_azure_ad_token_provider import (
     get_azure_ad_token_provider,
+    get_managed_azure_ad_token_provider,
 )
 from litellm.utils import calculate_max_parallel_requests
 
@@ -590,8 +591,14 @@ class InitalizeOpenAISDKClient:
 
         verbose_router_logger.debug("credential %s", credential)
 
-        token_provider = get_bearer_token_provider(
-            credential, "https://cognitiveservices.azure.com/.default"
+        # tokens are cached, and refreshed in the background ahead of expiry
+        token_provider = get_managed_azure_ad_token_provider(
+            token_provider=get_bearer_token_provider(
+                credential, "https://cognitiveservices.azure.com/.default"
+            ),
+            tenant_id=_tenant_id,
+            client_id=_client_id,
+            client_secret=_client_secret,
         )
 
         verbose_router_logger.debug("token_provider %s", token_provider)
@@ -1,10 +1,21 @@
 """
 Wrapper around router cache. Meant to handle model cooldown logic
+
+Deployments cooling down are also tracked in an in-process health map (`DeploymentHealthMap`), so routing can check
+cooldowns without reading the cache:
+- cooldowns set by this instance are added to the map directly
+- with Redis, cooldowns set by other instances are received via Redis pub/sub (`COOLDOWN_EVENTS_CHANNEL`)
+
+Until the map is in sync - the pub/sub subscription is active, and the map was seeded from the cache once -
+cooldowns are read from the cache, as before.
 """
 
+import asyncio
 import json
+import math
+import threading
 import time
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, TypedDict
 
 from litellm import verbose_logger
 from litellm.caching.caching import Cache, DualCache
@@ -25,11 +36,109 @@ class CooldownCacheValue(TypedDict):
     cooldown_time: float
 
 
+COOLDOWN_EVENTS_CHANNEL = "litellm:deployment_cooldowns"
+COOLDOWN_EVENTS_RECONNECT_INTERVAL = 5  # seconds
+
+
+class DeploymentHealthMap:
+    """
+    In-process map of the deployments cooling down: model_id -> CooldownCacheValue
+
+    `is_cooling_down` is a dict lookup. Expired entries are removed with a timer wheel - each entry is bucketed by
+    the tick (`tick_seconds`) it expires in, and reads advance the wheel past the elapsed ticks.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0):
+        self.tick_seconds = tick_seconds
+        self._cooldowns: Dict[str, CooldownCacheValue] = {}
+        self._expiry_times: Dict[str, float] = {}
+        # tick -> model_ids expiring in that tick
+        self._wheel: Dict[int, Set[str]] = {}
+        self._current_tick = self._get_tick(time.time())
+        self._lock = threading.Lock()
+
+    def _get_tick(self, timestamp: float) -> int:
+        return math.floor(timestamp / self.tick_seconds)
+
+    def add(self, model_id: str, cooldown_data: CooldownCacheValue):
+        expiry_time = cooldown_data["timestamp"] + cooldown_data["cooldown_time"]
+        with self._lock:
+            if expiry_time <= self._expiry_times.get(model_id, 0):
+                # a longer cooldown is already known - e.g. our own event, received via pub/sub
+                return
+            self._cooldowns[model_id] = cooldown_data
+            self._expiry_times[model_id] = expiry_time
+            self._wheel.setdefault(self._get_tick(expiry_time), set()).add(model_id)
+
+    def _advance(self, current_time: float):
+        """
+        Remove the entries expiring in the ticks elapsed since the last call
+        """
+        tick = self._get_tick(current_time)
+        if tick <= self._current_tick:
+            return
+        with self._lock:
+            if tick - self._current_tick <= len(self._wheel):
+                elapsed_ticks = range(self._current_tick, tick)
+            else:
+                # idle for a long time - only visit the non-empty ticks
+                elapsed_ticks = [t for t in self._wheel if t < tick]  # type: ignore
+            for elapsed_tick in elapsed_ticks:
+                for model_id in self._wheel.pop(elapsed_tick, ()):
+                    if self._expiry_times.get(model_id, math.inf) <= current_time:
+                        self._cooldowns.pop(model_id, None)
+                        self._expiry_times.pop(model_id, None)
+            self._current_tick = tick
+
+    def is_cooling_down(self, model_id: str) -> bool:
+        expiry_time = self._expiry_times.get(model_id)
+        return expiry_time is not None and expiry_time > time.time()
+
+    def get_active_cooldowns(
+        self, model_ids: Optional[List[str]] = None
+    ) -> List[Tuple[str, CooldownCacheValue]]:
+        """
+        Returns (model_id, cooldown) of the deployments cooling down - filtered by `model_ids`, if given
+        """
+        current_time = time.time()
+        self._advance(current_time)
+        if not self._cooldowns:
+            return []
+        _model_ids = set(model_ids) if model_ids is not None else None
+        return [
+            (model_id, cooldown_data)
+            for model_id, cooldown_data in list(self._cooldowns.items())
+            if self._expiry_times.get(model_id, 0) > current_time
+            and (_model_ids is None or model_id in _model_ids)
+        ]
+
+    def clear(self):
+        with self._lock:
+            self._cooldowns.clear()
+            self._expiry_times.clear()
+            self._wheel.clear()
+
+
 class CooldownCache:
     def __init__(self, cache: DualCache, default_cooldown_time: float):
         self.cache = cache
         self.default_cooldown_time = default_cooldown_time
         self.in_memory_cache = InMemoryCache()
+        self.health_map = DeploymentHealthMap()
+
+        ## REDIS PUB/SUB - cooldowns set by other instances
+        self._cooldown_events_task: Optional[asyncio.Task] = None
+        self._subscribed_to_cooldown_events = False
+        self._health_map_seeded = False
+
+    def is_health_map_in_sync(self) -> bool:
+        """
+        True if `health_map` has every active cooldown - i.e. cooldowns don't need to be read from the cache
+        """
+        if self.cache.redis_cache is None:
+            # cooldowns are only set by this instance
+            return True
+        return self._subscribed_to_cooldown_events and self._health_map_seeded
 
     def _common_add_cooldown_logic(
         self, model_id: str, original_exception, exception_status, cooldown_time: float
@@ -77,6 +186,8 @@ class CooldownCache:
                 key=cooldown_key,
                 ttl=_cooldown_time,
             )
+            self.health_map.add(model_id=model_id, cooldown_data=cooldown_data)
+            self._publish_cooldown_event(model_id=model_id, cooldown_data=cooldown_data)
         except Exception as e:
             verbose_logger.error(
                 "CooldownCache::add_deployment_to_cooldown - Exception occurred - {}".format(
@@ -89,9 +200,133 @@ class CooldownCache:
     def get_cooldown_cache_key(model_id: str) -> str:
         return f"deployment:{model_id}:cooldown"
 
+    def _get_cooldown_events_channel(self) -> str:
+        redis_cache = self.cache.redis_cache
+        if redis_cache is None:
+            return COOLDOWN_EVENTS_CHANNEL
+        return redis_cache.check_and_fix_namespace(key=COOLDOWN_EVENTS_CHANNEL)
+
+    def _publish_cooldown_event(self, model_id: str, cooldown_data: CooldownCacheValue):
+        redis_cache = self.cache.redis_cache
+        if redis_cache is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop - other instances pick up the cooldown when they (re-)seed from the cache
+            return
+        loop.create_task(
+            self._async_publish_cooldown_event(
+                model_id=model_id, cooldown_data=cooldown_data
+            )
+        )
+
+    async def _async_publish_cooldown_event(
+        self, model_id: str, cooldown_data: CooldownCacheValue
+    ):
+        redis_cache = self.cache.redis_cache
+        if redis_cache is None:
+            return
+        try:
+            _redis_client = redis_cache.init_async_client()
+            async with _redis_client as redis_client:
+                await redis_client.publish(
+                    self._get_cooldown_events_channel(),
+                    json.dumps({"model_id": model_id, "cooldown": cooldown_data}),
+                )
+        except Exception as e:
+            verbose_logger.debug(
+                "CooldownCache::_async_publish_cooldown_event - Exception occurred - {}".format(
+                    str(e)
+                )
+            )
+
+    def _handle_cooldown_event(self, message: Any):
+        """
+        Add a cooldown received via Redis pub/sub to the health map
+        """
+        try:
+            data = message
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            if isinstance(data, str):
+                data = json.loads(data)
+            cooldown_data = CooldownCacheValue(**data["cooldown"])  # type: ignore
+            self.health_map.add(model_id=data["model_id"], cooldown_data=cooldown_data)
+        except Exception as e:
+            verbose_logger.debug(
+                "CooldownCache::_handle_cooldown_event - invalid event {} - {}".format(
+                    message, str(e)
+                )
+            )
+
+    def _start_cooldown_events_listener(self):
+        if self.cache.redis_cache is None:
+            return
+        if (
+            self._cooldown_events_task is not None
+            and not self._cooldown_events_task.done()
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._cooldown_events_task = loop.create_task(
+            self._listen_for_cooldown_events()
+        )
+
+    async def _listen_for_cooldown_events(self):
+        """
+        Subscribe to cooldowns set by other instances. Re-subscribes on errors - cooldowns are read from the cache
+        until the health map is seeded again.
+        """
+        while True:
+            redis_cache = self.cache.redis_cache
+            if redis_cache is None:
+                return
+            try:
+                redis_client = redis_cache.init_async_client()
+                pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+                try:
+                    await pubsub.subscribe(self._get_cooldown_events_channel())
+                    self._subscribed_to_cooldown_events = True
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._handle_cooldown_event(message.get("data"))
+                finally:
+                    self._subscribed_to_cooldown_events = False
+                    self._health_map_seeded = False
+                    await pubsub.reset()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                verbose_logger.debug(
+                    "CooldownCache::_listen_for_cooldown_events - Exception occurred - {}".format(
+                        str(e)
+                    )
+                )
+            await asyncio.sleep(COOLDOWN_EVENTS_RECONNECT_INTERVAL)
+
+    def _seed_health_map(
+        self,
+        active_cooldowns: List[Tuple[str, CooldownCacheValue]],
+        seeded: bool,
+    ):
+        for model_id, cooldown_data in active_cooldowns:
+            self.health_map.add(model_id=model_id, cooldown_data=cooldown_data)
+        if seeded and self._subscribed_to_cooldown_events:
+            # cooldowns set from now on are received via pub/sub
+            self._health_map_seeded = True
+
     async def async_get_active_cooldowns(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> List[Tuple[str, CooldownCacheValue]]:
+        if self.is_health_map_in_sync():
+            return self.health_map.get_active_cooldowns(model_ids=model_ids)
+        self._start_cooldown_events_listener()
+        subscribed = self._subscribed_to_cooldown_events
+
         # Generate the keys for the deployments
         keys = [
             CooldownCache.get_cooldown_cache_key(model_id) for model_id in model_ids
@@ -116,11 +351,18 @@ class CooldownCache:
                 cooldown_cache_value = CooldownCacheValue(**result)  # type: ignore
                 active_cooldowns.append((model_id, cooldown_cache_value))
 
+        # only a read of all deployments, started after subscribing, seeds the map
+        self._seed_health_map(
+            active_cooldowns=active_cooldowns,
+            seeded=subscribed and len(model_ids) > 0,
+        )
         return active_cooldowns
 
     def get_active_cooldowns(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> List[Tuple[str, CooldownCacheValue]]:
+        if self.is_health_map_in_sync():
+            return self.health_map.get_active_cooldowns(model_ids=model_ids)
         # Generate the keys for the deployments
         keys = [f"deployment:{model_id}:cooldown" for model_id in model_ids]
         # Retrieve the values for the keys using mget
@@ -142,6 +384,14 @@ class CooldownCache:
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> float:
         """Return min cooldown time required for a group of model id's."""
+        if self.is_health_map_in_sync():
+            cooldown_times = [
+                cooldown_data["cooldown_time"]
+                for _, cooldown_data in self.health_map.get_active_cooldowns(
+                    model_ids=model_ids
+                )
+            ]
+            return min(cooldown_times, default=None) or self.default_cooldown_time
 
         # Generate the keys for the deployments
         keys = [f"deployment:{model_id}:cooldown" for model_id in model_ids]
@@ -215,6 +215,10 @@ async def _async_get_cooldown_deployments(
     """
     Async implementation of '_get_cooldown_deployments'
     """
+    if litellm_router_instance.cooldown_cache.is_health_map_in_sync():
+        return _get_cooldown_deployments_from_health_map(
+            litellm_router_instance=litellm_router_instance
+        )
     model_ids = litellm_router_instance.get_model_ids()
     cooldown_models = (
         await litellm_router_instance.cooldown_cache.async_get_active_cooldowns(
@@ -261,6 +265,10 @@ def _get_cooldown_deployments(
     Get the list of models being cooled down for this minute
     """
     # get the current cooldown list for that minute
+    if litellm_router_instance.cooldown_cache.is_health_map_in_sync():
+        return _get_cooldown_deployments_from_health_map(
+            litellm_router_instance=litellm_router_instance
+        )
 
     # ----------------------
     # Return cooldown models
@@ -283,6 +291,19 @@ def _get_cooldown_deployments(
     return cached_value_deployment_ids
 
 
+def _get_cooldown_deployments_from_health_map(
+    litellm_router_instance: LitellmRouter,
+) -> List[str]:
+    """
+    Deployments cooling down, from the in-process health map - no cache reads, and no scan of the model list
+    """
+    return [
+        model_id
+        for model_id, _ in litellm_router_instance.cooldown_cache.health_map.get_active_cooldowns()
+        if litellm_router_instance.deployment_index.has_model_id(model_id)
+    ]
+
+
 def should_cooldown_based_on_allowed_fails_policy(
     litellm_router_instance: LitellmRouter,
     deployment: str,
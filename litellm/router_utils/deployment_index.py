@@ -0,0 +1,124 @@
+"""
+Indexes over `Router.model_list`, so deployment lookups on the request path are O(1) instead of a scan of the full model list.
+
+Kept in sync by `Router.set_model_list`, `_create_deployment`, `add_deployment`, `upsert_deployment` and `delete_deployment`.
+
+The index stores references to the same dicts held in `Router.model_list` - it does not copy them.
+"""
+
+from typing import Dict, List, Optional
+
+
+class DeploymentIndex:
+    def __init__(self):
+        self.model_id_to_deployments: Dict[str, List[Dict]] = {}
+        self.model_name_to_deployments: Dict[str, List[Dict]] = {}
+        self.litellm_model_to_deployments: Dict[str, List[Dict]] = {}
+        self.access_group_to_model_names: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def _get_model_id(deployment: Dict) -> Optional[str]:
+        model_info = deployment.get("model_info") or {}
+        return model_info.get("id")
+
+    @staticmethod
+    def _remove_by_identity(items: List, item) -> None:
+        for idx in range(len(items) - 1, -1, -1):
+            if items[idx] is item:
+                items.pop(idx)
+                return
+
+    def add(self, deployment: Dict) -> None:
+        model_id = self._get_model_id(deployment)
+        if model_id is not None:
+            self.model_id_to_deployments.setdefault(model_id, []).append(deployment)
+
+        model_name = deployment.get("model_name")
+        if model_name is not None:
+            self.model_name_to_deployments.setdefault(model_name, []).append(deployment)
+
+        litellm_model = (deployment.get("litellm_params") or {}).get("model")
+        if litellm_model is not None:
+            self.litellm_model_to_deployments.setdefault(litellm_model, []).append(
+                deployment
+            )
+
+        for group in (deployment.get("model_info") or {}).get("access_groups") or []:
+            self.access_group_to_model_names.setdefault(group, []).append(model_name)
+
+    def remove(self, deployment: Dict) -> None:
+        """
+        Remove a deployment (by object identity) from all indexes.
+        """
+        model_id = self._get_model_id(deployment)
+        model_name = deployment.get("model_name")
+        litellm_model = (deployment.get("litellm_params") or {}).get("model")
+
+        for index, key in (
+            (self.model_id_to_deployments, model_id),
+            (self.model_name_to_deployments, model_name),
+            (self.litellm_model_to_deployments, litellm_model),
+        ):
+            if key is None or key not in index:
+                continue
+            self._remove_by_identity(index[key], deployment)
+            if len(index[key]) == 0:
+                index.pop(key)
+
+        for group in (deployment.get("model_info") or {}).get("access_groups") or []:
+            model_names = self.access_group_to_model_names.get(group)
+            if model_names is None or model_name not in model_names:
+                continue
+            model_names.remove(model_name)
+            if len(model_names) == 0:
+                self.access_group_to_model_names.pop(group)
+
+    def clear(self) -> None:
+        self.model_id_to_deployments.clear()
+        self.model_name_to_deployments.clear()
+        self.litellm_model_to_deployments.clear()
+        self.access_group_to_model_names.clear()
+
+    def has_model_id(self, model_id: str) -> bool:
+        return model_id in self.model_id_to_deployments
+
+    def has_model_name(self, model_name: str) -> bool:
+        return model_name in self.model_name_to_deployments
+
+    def get_first_by_model_id(self, model_id: str) -> Optional[Dict]:
+        deployments = self.model_id_to_deployments.get(model_id)
+        if not deployments:
+            return None
+        return deployments[0]
+
+    def get_last_by_model_id(self, model_id: str) -> Optional[Dict]:
+        deployments = self.model_id_to_deployments.get(model_id)
+        if not deployments:
+            return None
+        return deployments[-1]
+
+    def get_by_model_name(self, model_name: str) -> List[Dict]:
+        """
+        Returns a new list - callers are free to filter it in place.
+        """
+        return list(self.model_name_to_deployments.get(model_name, []))
+
+    def get_by_litellm_model(self, litellm_model: str) -> List[Dict]:
+        """
+        Returns a new list - callers are free to filter it in place.
+        """
+        return list(self.litellm_model_to_deployments.get(litellm_model, []))
+
+    def get_model_ids_by_model_name(self, model_name: str) -> List[str]:
+        model_ids: List[str] = []
+        for deployment in self.model_name_to_deployments.get(model_name, []):
+            model_id = self._get_model_id(deployment)
+            if model_id is not None:
+                model_ids.append(model_id)
+        return model_ids
+
+    def get_access_groups(self) -> Dict[str, List[str]]:
+        return {
+            group: list(model_names)
+            for group, model_names in self.access_group_to_model_names.items()
+        }
@@ -4,13 +4,96 @@ Class to handle llm wildcard routing and regex pattern matching
 
 import copy
 import re
-from re import Match
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from re import Match, Pattern
+from typing import Dict, List, Optional, Tuple
 
 from litellm import get_llm_provider
 from litellm._logging import verbose_router_logger
 
 
+DEFAULT_ROUTE_CACHE_SIZE = 4096
+_MISSING = object()
+
+# characters which end the literal prefix of a regex pattern
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]|()")
+_REGEX_QUANTIFIERS = frozenset("*+?{")
+
+
+def _get_literal_prefix(regex: str) -> str:
+    """
+    Returns the literal text every match of `regex` starts with
+
+    example:
+    regex: openai/fo::(.*)::static::(.*)
+    prefix: openai/fo::
+    """
+    prefix: List[str] = []
+    i = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == "\\":
+            # `re.escape` only escapes non-alphanumeric characters - `\d`, `\w`, ... are character classes
+            if i + 1 >= len(regex) or regex[i + 1].isalnum():
+                break
+            prefix.append(regex[i + 1])
+            i += 2
+            continue
+        if char in _REGEX_SPECIAL_CHARS:
+            if char in _REGEX_QUANTIFIERS and prefix:
+                # e.g. `ab?` - the last character is optional
+                prefix.pop()
+            break
+        prefix.append(char)
+        i += 1
+    return "".join(prefix)
+
+
+class _PatternIndex:
+    """
+    Compiled patterns + a prefix trie over their literal prefixes
+
+    Only the patterns whose literal prefix is a prefix of the requested model are matched against it.
+    """
+
+    def __init__(self, patterns: Dict[str, List]):
+        self.patterns = patterns
+        self.num_patterns = len(patterns)
+        # (registration order, regex, compiled regex) - the first registered pattern wins, as with a linear scan
+        self.compiled: List[Tuple[int, str, Pattern]] = []
+        # trie node: (child nodes by character, indexes into `compiled` of the patterns ending here)
+        self.trie: Tuple[Dict[str, tuple], List[int]] = ({}, [])
+        for position, regex in enumerate(patterns):
+            self.compiled.append((position, regex, re.compile(regex)))
+            node = self.trie
+            for char in _get_literal_prefix(regex):
+                node = node[0].setdefault(char, ({}, []))
+            node[1].append(position)
+
+    def is_stale(self, patterns: Dict[str, List]) -> bool:
+        return patterns is not self.patterns or len(patterns) != self.num_patterns
+
+    def get_candidates(self, request: str) -> List[int]:
+        candidates = list(self.trie[1])
+        node = self.trie
+        for char in request:
+            next_node = node[0].get(char)
+            if next_node is None:
+                break
+            node = next_node
+            candidates.extend(node[1])
+        candidates.sort()
+        return candidates
+
+    def match(self, request: str) -> Optional[Tuple[str, Match]]:
+        for position in self.get_candidates(request):
+            _, regex, compiled_regex = self.compiled[position]
+            pattern_match = compiled_regex.match(request)
+            if pattern_match:
+                return regex, pattern_match
+        return None
+
+
 class PatternMatchRouter:
     """
     Class to handle llm wildcard routing and regex pattern matching
@@ -18,10 +101,19 @@ class PatternMatchRouter:
     doc: https://docs.litellm.ai/docs/proxy/configs#provider-specific-wildcard-routing
 
     This class will store a mapping for regex pattern: List[Deployments]
+
+    Routing uses a precompiled index of the patterns (see `_PatternIndex`) - rebuilt when a pattern is added,
+    and a bounded LRU cache of the matched pattern per requested model.
     """
 
-    def __init__(self):
+    def __init__(self, route_cache_size: int = DEFAULT_ROUTE_CACHE_SIZE):
         self.patterns: Dict[str, List] = {}
+        self.route_cache_size = route_cache_size
+        self._index: Optional[_PatternIndex] = None
+        # requested model -> (matched regex, match) / None if no pattern matched
+        self._route_cache: "OrderedDict[str, Optional[Tuple[str, Match]]]" = (
+            OrderedDict()
+        )
 
     def add_pattern(self, pattern: str, llm_deployment: Dict):
         """
@@ -35,6 +127,7 @@ class PatternMatchRouter:
         regex = self._pattern_to_regex(pattern)
         if regex not in self.patterns:
             self.patterns[regex] = []
+            self._index = None
         self.patterns[regex].append(llm_deployment)
 
     def _pattern_to_regex(self, pattern: str) -> str:
@@ -83,7 +176,7 @@ class PatternMatchRouter:
         """
         Route a requested model to the corresponding llm deployments based on the regex pattern
 
-        loop through all the patterns and find the matching pattern
+        find the first registered pattern matching the request
         if a pattern is found, return the corresponding llm deployments
         if no pattern is found, return None
 
@@ -96,17 +189,47 @@ class PatternMatchRouter:
         try:
             if request is None:
                 return None
-            for pattern, llm_deployments in self.patterns.items():
-                pattern_match = re.match(pattern, request)
-                if pattern_match:
-                    return self._return_pattern_matched_deployments(
-                        matched_pattern=pattern_match, deployments=llm_deployments
-                    )
+            matched = self._match(request)
+            if matched is not None:
+                pattern, pattern_match = matched
+                return self._return_pattern_matched_deployments(
+                    matched_pattern=pattern_match, deployments=self.patterns[pattern]
+                )
         except Exception as e:
             verbose_router_logger.debug(f"Error in PatternMatchRouter.route: {str(e)}")
 
         return None  # No matching pattern found
 
+    def _get_index(self) -> _PatternIndex:
+        index = self._index
+        if index is None or index.is_stale(self.patterns):
+            index = _PatternIndex(self.patterns)
+            self._index = index
+            self._route_cache.clear()
+        return index
+
+    def _match(self, request: str) -> Optional[Tuple[str, Match]]:
+        """
+        Returns (regex, match) of the first registered pattern matching `request`
+        """
+        index = self._get_index()
+        # 1 lookup - the entry can be removed by a concurrent rebuild / eviction between a check and a read
+        cached_match = self._route_cache.get(request, _MISSING)
+        if cached_match is not _MISSING:
+            try:
+                self._route_cache.move_to_end(request)
+            except KeyError:  # removed by a concurrent rebuild / eviction
+                pass
+            return cached_match  # type: ignore
+        matched = index.match(request)
+        if len(self._route_cache) >= self.route_cache_size:
+            try:
+                self._route_cache.popitem(last=False)
+            except KeyError:  # emptied by a concurrent rebuild
+                pass
+        self._route_cache[request] = matched
+        return matched
+
     @staticmethod
     def set_deployment_model_name(
         matched_pattern: Match,
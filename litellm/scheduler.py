@@ -1,16 +1,22 @@
+import asyncio
 import enum
 import heapq
-from typing import Optional
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
 from litellm import print_verbose
-from litellm.caching.caching import DualCache, RedisCache
+from litellm._logging import verbose_router_logger
+from litellm.caching.caching import RedisCache
 
 
 class SchedulerCacheKeys(enum.Enum):
     queue = "scheduler:queue"
     default_in_memory_ttl = 5  # cache queue in-memory for 5s when redis cache available
+    redis_queue_ttl = 3600  # expire abandoned redis queues after 1hr
 
 
 class DefaultPriorities(enum.Enum):
@@ -19,14 +25,45 @@ class DefaultPriorities(enum.Enum):
     Low = 255
 
 
+# waiters re-check capacity at least this often, in case a capacity change wasn't signalled (e.g. a cooldown set by another worker expired)
+MAX_WAIT_BETWEEN_CAPACITY_CHECKS = 1.0
+
+
 class FlowItem(BaseModel):
     priority: int  # Priority between 0 and 255
     request_id: str
     model_name: str
 
 
+class SchedulerQueueMetrics(TypedDict):
+    queue_depth: int  # requests currently waiting in this worker
+    total_enqueued: int
+    total_dequeued: int
+    total_timeouts: int
+    avg_wait_time_seconds: float
+    max_wait_time_seconds: float
+
+
+class _ModelGroupQueueStats:
+    def __init__(self):
+        self.total_enqueued = 0
+        self.total_dequeued = 0
+        self.total_timeouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+
 class Scheduler:
-    cache: DualCache
+    """
+    Event-driven priority scheduler, used by `Router.schedule_acompletion`.
+
+    Each model group has its own priority queue. A request waiting in the queue is only woken up when:
+    - capacity for its model group changes (`notify_capacity_change` - called on deployment success / failure / cooldown expiry)
+    - it reaches the top of the queue
+    - `MAX_WAIT_BETWEEN_CAPACITY_CHECKS` passes without a signal
+
+    If `redis_cache` is set, the queue order is shared across workers via a redis sorted set per model group.
+    """
 
     def __init__(
         self,
@@ -34,31 +71,79 @@ class Scheduler:
         redis_cache: Optional[RedisCache] = None,
     ):
         """
-        polling_interval: float or null - frequency of polling queue. Default is 3ms.
+        polling_interval: float or null - min. time between releasing the top of the queue, while no deployments have capacity. Default is 30ms.
         """
-        self.queue: list = []
-        default_in_memory_ttl: Optional[float] = None
-        if redis_cache is not None:
-            # if redis-cache available frequently poll that instead of using in-memory.
-            default_in_memory_ttl = SchedulerCacheKeys.default_in_memory_ttl.value
-        self.cache = DualCache(
-            redis_cache=redis_cache, default_in_memory_ttl=default_in_memory_ttl
-        )
-        self.polling_interval = polling_interval or 0.03  # default to 3ms
+        self.redis_cache = redis_cache
+        self.polling_interval = polling_interval or 0.03  # default to 30ms
+
+        self.queues: Dict[str, List[Tuple[int, int, str]]] = (
+            {}
+        )  # model_name -> heap of (priority, insertion order, request_id)
+        self._removed_request_ids: Dict[str, Set[str]] = {}  # lazy heap deletes
+        self._waiters: Dict[str, Dict[str, asyncio.Event]] = {}
+        self._counter = itertools.count()
+        self._stats: Dict[str, _ModelGroupQueueStats] = {}
+        self._capacity_checks: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, asyncio.TimerHandle]
+        ] = {}  # model_name -> pending `schedule_capacity_check` timer
+
+    # -----------------
+    # Queue operations
+    # -----------------
+
+    def _get_redis_queue_key(self, model_name: str) -> str:
+        return "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
+
+    @staticmethod
+    def _get_redis_score(priority: int) -> float:
+        """
+        Sort by priority, then arrival time. Priority 0-255 * 1e13 + epoch ms, stays within float precision.
+        """
+        return priority * 1e13 + int(time.time() * 1000)
+
+    def _prune_heap(self, model_name: str) -> List[Tuple[int, int, str]]:
+        heap = self.queues.setdefault(model_name, [])
+        removed = self._removed_request_ids.get(model_name)
+        while heap and removed and heap[0][2] in removed:
+            _, _, request_id = heapq.heappop(heap)
+            removed.discard(request_id)
+        return heap
 
     async def add_request(self, request: FlowItem):
         # We use the priority directly, as lower values indicate higher priority
-        # get the queue
-        queue = await self.get_queue(model_name=request.model_name)
-        # update the queue
-        heapq.heappush(queue, (request.priority, request.request_id))
+        self._stats.setdefault(request.model_name, _ModelGroupQueueStats())
+        self._stats[request.model_name].total_enqueued += 1
+        if self.redis_cache is not None:
+            await self.redis_cache.async_zadd(
+                key=self._get_redis_queue_key(request.model_name),
+                mapping={request.request_id: self._get_redis_score(request.priority)},
+                ttl=SchedulerCacheKeys.redis_queue_ttl.value,
+            )
+            return
+        heapq.heappush(
+            self.queues.setdefault(request.model_name, []),
+            (request.priority, next(self._counter), request.request_id),
+        )
+
+    async def remove_request(self, id: str, model_name: str) -> None:
+        if self.redis_cache is not None:
+            await self.redis_cache.async_zrem(self._get_redis_queue_key(model_name), id)
+            return
+        self._removed_request_ids.setdefault(model_name, set()).add(id)
+        self._prune_heap(model_name=model_name)
 
-        # save the queue
-        await self.save_queue(queue=queue, model_name=request.model_name)
+    async def _get_top_of_queue(self, model_name: str) -> Optional[str]:
+        if self.redis_cache is not None:
+            response = await self.redis_cache.async_zrange(
+                self._get_redis_queue_key(model_name), 0, 0
+            )
+            return response[0] if response else None
+        heap = self._prune_heap(model_name=model_name)
+        return heap[0][2] if heap else None
 
     async def poll(self, id: str, model_name: str, health_deployments: list) -> bool:
         """
-        Return if request can be processed.
+        Return if request can be processed. If True, the request is removed from the queue.
 
         Returns:
         - True:
@@ -68,70 +153,219 @@ class Scheduler:
             * If no healthy deployments available
             * AND request not at the top of queue
         """
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        top_of_queue = await self._get_top_of_queue(model_name=model_name)
+        if top_of_queue is None:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Queue is invalid. Queue={}".format(
+                    await self.get_queue(model_name=model_name)
+                )
             )
 
-        # ------------
-        # Setup values
-        # ------------
-
         print_verbose(f"len(health_deployments): {len(health_deployments)}")
-        if len(health_deployments) == 0:
-            print_verbose(f"queue: {queue}, seeking id={id}")
-            # Check if the id is at the top of the heap
-            if queue[0][1] == id:
-                # Remove the item from the queue
-                heapq.heappop(queue)
-                print_verbose(f"Popped id: {id}")
-                return True
-            else:
-                return False
+        if len(health_deployments) == 0 and top_of_queue != id:
+            return False
 
+        await self.remove_request(id=id, model_name=model_name)
+        print_verbose(f"Popped id: {id}")
         return True
 
     async def peek(self, id: str, model_name: str, health_deployments: list) -> bool:
         """Return if the id is at the top of the queue. Don't pop the value from heap."""
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        top_of_queue = await self._get_top_of_queue(model_name=model_name)
+        if top_of_queue is None:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Queue is invalid. Queue={}".format(
+                    await self.get_queue(model_name=model_name)
+                )
             )
 
-        # ------------
-        # Setup values
-        # ------------
-
-        # Check if the id is at the top of the heap
-        if queue[0][1] == id:
-            return True
-
-        return False
-
-    def get_queue_status(self):
-        """Get the status of items in the queue"""
-        return self.queue
+        return top_of_queue == id
 
     async def get_queue(self, model_name: str) -> list:
         """
-        Return a queue for that specific model group
+        Return the queue for that specific model group, highest priority first.
+
+        In-memory queue items are (priority, request_id). Redis queue items are request_id's.
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            response = await self.cache.async_get_cache(key=_cache_key)
-            if response is None or not isinstance(response, list):
-                return []
-            elif isinstance(response, list):
-                return response
-        return self.queue
+        if self.redis_cache is not None:
+            return await self.redis_cache.async_zrange(
+                self._get_redis_queue_key(model_name), 0, -1
+            )
+        heap = self._prune_heap(model_name=model_name)
+        removed = self._removed_request_ids.get(model_name) or set()
+        return [
+            (priority, request_id)
+            for priority, _, request_id in sorted(heap)
+            if request_id not in removed
+        ]
 
     async def save_queue(self, queue: list, model_name: str) -> None:
         """
-        Save the updated queue of the model group
+        Replace the in-memory queue of the model group with a list of (priority, request_id)
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            await self.cache.async_set_cache(key=_cache_key, value=queue)
+        self.queues[model_name] = [
+            (priority, next(self._counter), request_id)
+            for priority, request_id in queue
+        ]
+        heapq.heapify(self.queues[model_name])
+        self._removed_request_ids.pop(model_name, None)
         return None
+
+    # -----------------
+    # Event-driven waiting
+    # -----------------
+
+    def notify_capacity_change(self, model_name: Optional[str] = None) -> None:
+        """
+        Wake up waiting requests, so they re-check for healthy deployments.
+
+        If `model_name` is None, all model groups are woken up.
+        """
+        if model_name is None:
+            waiter_groups = list(self._waiters.values())
+        else:
+            waiter_groups = [self._waiters.get(model_name) or {}]
+        for waiters in waiter_groups:
+            for event in waiters.values():
+                event.set()
+
+    def schedule_capacity_check(self, model_name: str, delay: float) -> None:
+        """
+        Wake up waiting requests for a model group after `delay` seconds - e.g. when a deployment's cooldown ends.
+
+        Keeps 1 pending timer per model group, at the earliest requested time - a burst of failures doesn't stack 1 timer per failure.
+        Later checks are covered by waiters re-checking every `MAX_WAIT_BETWEEN_CAPACITY_CHECKS`.
+        """
+        if model_name not in self._waiters:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # no running event loop
+            return
+        when = loop.time() + delay
+        pending_check = self._capacity_checks.get(model_name)
+        if pending_check is not None:
+            pending_loop, pending_timer = pending_check
+            if (
+                pending_loop is loop
+                and not pending_timer.cancelled()
+                and pending_timer.when() <= when
+            ):
+                return
+            pending_timer.cancel()
+        self._capacity_checks[model_name] = (
+            loop,
+            loop.call_at(when, self._run_capacity_check, model_name),
+        )
+
+    def _run_capacity_check(self, model_name: str) -> None:
+        self._capacity_checks.pop(model_name, None)
+        self.notify_capacity_change(model_name=model_name)
+
+    async def _wake_top_of_queue(self, model_name: str) -> None:
+        waiters = self._waiters.get(model_name)
+        if not waiters:
+            return
+        top_of_queue = await self._get_top_of_queue(model_name=model_name)
+        if top_of_queue is not None and top_of_queue in waiters:
+            waiters[top_of_queue].set()
+
+    def _record_dequeue(self, model_name: str, wait_time: float, timed_out: bool):
+        stats = self._stats.setdefault(model_name, _ModelGroupQueueStats())
+        if timed_out:
+            stats.total_timeouts += 1
+            return
+        stats.total_dequeued += 1
+        stats.total_wait_time += wait_time
+        stats.max_wait_time = max(stats.max_wait_time, wait_time)
+
+    async def wait_for_turn(
+        self,
+        request: FlowItem,
+        has_capacity: Callable[[], Awaitable[bool]],
+        timeout: float,
+    ) -> bool:
+        """
+        Add the request to its model group's queue, and wait until it can be processed.
+
+        A request can be processed if `has_capacity()` returns True, or if it's at the top of the queue.
+
+        Returns False if the request was still waiting after `timeout` seconds.
+        """
+        model_name = request.model_name
+        event = asyncio.Event()
+        self._waiters.setdefault(model_name, {})[request.request_id] = event
+        await self.add_request(request=request)
+
+        start_time = time.monotonic()
+        end_time = start_time + timeout
+        can_process = False
+        try:
+            while True:
+                top_of_queue = await self._get_top_of_queue(model_name=model_name)
+                if top_of_queue == request.request_id or await has_capacity():
+                    can_process = True
+                    return True
+                remaining_time = end_time - time.monotonic()
+                if remaining_time <= 0:
+                    return False
+                event.clear()
+                try:
+                    await asyncio.wait_for(
+                        event.wait(),
+                        timeout=min(remaining_time, MAX_WAIT_BETWEEN_CAPACITY_CHECKS),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            waiters = self._waiters.get(model_name, {})
+            waiters.pop(request.request_id, None)
+            if not waiters:
+                self._waiters.pop(model_name, None)
+            self._record_dequeue(
+                model_name=model_name,
+                wait_time=time.monotonic() - start_time,
+                timed_out=not can_process,
+            )
+            try:
+                await self.remove_request(id=request.request_id, model_name=model_name)
+                # let the next request in line re-check, after the polling interval
+                if model_name in self._waiters:
+                    asyncio.get_running_loop().call_later(
+                        self.polling_interval,
+                        lambda: asyncio.ensure_future(
+                            self._wake_top_of_queue(model_name=model_name)
+                        ),
+                    )
+            except Exception as e:
+                verbose_router_logger.debug(
+                    "Scheduler - error removing request={} from queue - {}".format(
+                        request.request_id, str(e)
+                    )
+                )
+
+    # -----------------
+    # Metrics
+    # -----------------
+
+    def get_queue_status(
+        self, model_name: Optional[str] = None
+    ) -> Dict[str, SchedulerQueueMetrics]:
+        """Get queue depth + wait time metrics, per model group"""
+        model_names = [model_name] if model_name is not None else list(self._stats)
+        status: Dict[str, SchedulerQueueMetrics] = {}
+        for _model_name in model_names:
+            stats = self._stats.get(_model_name) or _ModelGroupQueueStats()
+            status[_model_name] = SchedulerQueueMetrics(
+                queue_depth=len(self._waiters.get(_model_name) or {}),
+                total_enqueued=stats.total_enqueued,
+                total_dequeued=stats.total_dequeued,
+                total_timeouts=stats.total_timeouts,
+                avg_wait_time_seconds=(
+                    stats.total_wait_time / stats.total_dequeued
+                    if stats.total_dequeued > 0
+                    else 0.0
+                ),
+                max_wait_time_seconds=stats.max_wait_time,
+            )
+        return status
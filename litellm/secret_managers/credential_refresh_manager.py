@@ -0,0 +1,197 @@
+"""
+Refreshes expiring provider credentials (Vertex AI access tokens, Bedrock STS credentials, Azure AD tokens) in the
+background, ahead of their expiry - so requests read a valid cached credential, instead of refreshing it inline.
+
+- each credential is refreshed by 1 thread at a time - concurrent requests for an expired credential wait on it
+- a daemon thread refreshes credentials expiring within `CREDENTIAL_REFRESH_AHEAD_SECONDS`
+- credentials not used for `CREDENTIAL_IDLE_TIMEOUT_SECONDS` are dropped, not refreshed
+- credentials with an unknown expiry are cached for `CREDENTIAL_UNKNOWN_EXPIRY_CACHE_SECONDS`, then refreshed inline
+"""
+
+import calendar
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.asyncify import asyncify
+
+CREDENTIAL_REFRESH_AHEAD_SECONDS = 300
+CREDENTIAL_EXPIRY_MARGIN_SECONDS = (
+    60  # not used past `expires_at - margin` - refreshed inline
+)
+CREDENTIAL_REFRESH_CHECK_INTERVAL_SECONDS = 30
+CREDENTIAL_IDLE_TIMEOUT_SECONDS = 3600
+CREDENTIAL_UNKNOWN_EXPIRY_CACHE_SECONDS = 600
+
+# (current value - None on the first load) -> (new value, expiry as a unix timestamp - None if unknown)
+RefreshFn = Callable[[Optional[Any]], Tuple[Any, Optional[float]]]
+
+
+def get_credential_key(provider: str, *args: Any) -> str:
+    """
+    Key of a credential - hashed, so secrets aren't kept in the key
+    """
+    return "{}:{}".format(
+        provider,
+        hashlib.sha256(
+            json.dumps(args, sort_keys=True, default=str).encode()
+        ).hexdigest(),
+    )
+
+
+def get_expiry_timestamp(expiry: Optional[Any]) -> Optional[float]:
+    """
+    datetime -> unix timestamp. Naive datetimes are UTC (e.g. `google.auth.credentials.Credentials.expiry`)
+    """
+    if not isinstance(expiry, datetime):
+        return None
+    if expiry.tzinfo is None:
+        return float(calendar.timegm(expiry.timetuple()))
+    return expiry.astimezone(timezone.utc).timestamp()
+
+
+class ManagedCredential:
+    def __init__(self, key: str, refresh_fn: RefreshFn):
+        self.key = key
+        self.refresh_fn = refresh_fn
+        self.value: Optional[Any] = None
+        self.expires_at: Optional[float] = None
+        self.expiry_unknown = False
+        self.last_used_at = time.time()
+        self.lock = threading.Lock()
+
+    def is_valid(self, now: float) -> bool:
+        if self.value is None or self.expires_at is None:
+            return False
+        if self.expiry_unknown:
+            return now < self.expires_at
+        return now < self.expires_at - CREDENTIAL_EXPIRY_MARGIN_SECONDS
+
+    def refresh(self):
+        """
+        Call with `self.lock` held
+        """
+        value, expires_at = self.refresh_fn(self.value)
+        self.value = value
+        self.expiry_unknown = expires_at is None
+        if expires_at is None:
+            # e.g. credentials without an expiry - reuse for a fixed interval, instead of reloading on every request
+            expires_at = time.time() + CREDENTIAL_UNKNOWN_EXPIRY_CACHE_SECONDS
+        self.expires_at = expires_at
+
+
+class CredentialRefreshManager:
+    def __init__(
+        self,
+        refresh_ahead_seconds: float = CREDENTIAL_REFRESH_AHEAD_SECONDS,
+        check_interval_seconds: float = CREDENTIAL_REFRESH_CHECK_INTERVAL_SECONDS,
+        idle_timeout_seconds: float = CREDENTIAL_IDLE_TIMEOUT_SECONDS,
+    ):
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._credentials: Dict[str, ManagedCredential] = {}
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def get_credential(self, key: str, refresh_fn: RefreshFn) -> Any:
+        """
+        Returns the cached credential of `key` - loads / refreshes it inline if it's missing or expired
+        """
+        now = time.time()
+        credential = self._credentials.get(key)
+        if credential is not None and credential.is_valid(now):
+            credential.last_used_at = now
+            return credential.value
+
+        if credential is None:
+            with self._lock:
+                credential = self._credentials.setdefault(
+                    key, ManagedCredential(key=key, refresh_fn=refresh_fn)
+                )
+        credential.last_used_at = now
+        with credential.lock:
+            if credential.is_valid(time.time()):
+                return credential.value
+            credential.refresh_fn = refresh_fn
+            credential.refresh()
+            value = credential.value
+        self._start_refresh_thread()
+        return value
+
+    async def async_get_credential(self, key: str, refresh_fn: RefreshFn) -> Any:
+        """
+        Async version of `get_credential` - loads / refreshes in a worker thread
+        """
+        credential = self._credentials.get(key)
+        if credential is not None and credential.is_valid(time.time()):
+            credential.last_used_at = time.time()
+            return credential.value
+        return await asyncify(self.get_credential)(key=key, refresh_fn=refresh_fn)
+
+    def refresh_expiring_credentials(self):
+        """
+        Refresh credentials expiring within `refresh_ahead_seconds`. Drop idle credentials.
+        """
+        now = time.time()
+        with self._lock:
+            credentials = list(self._credentials.values())
+        for credential in credentials:
+            if now - credential.last_used_at > self.idle_timeout_seconds:
+                with self._lock:
+                    self._credentials.pop(credential.key, None)
+                continue
+            if (
+                credential.expires_at is None
+                or credential.expiry_unknown  # refreshed inline, once the cache interval passes
+                or credential.expires_at - now > self.refresh_ahead_seconds
+            ):
+                continue
+            # a request is refreshing it
+            if not credential.lock.acquire(blocking=False):
+                continue
+            try:
+                credential.refresh()
+            except Exception as e:
+                # still used until it expires - retried on the next check
+                verbose_logger.warning(
+                    "Failed to refresh credential %s in the background - %s",
+                    credential.key,
+                    str(e),
+                )
+            finally:
+                credential.lock.release()
+
+    def _start_refresh_thread(self):
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop,
+                name="litellm-credential-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(self.check_interval_seconds)
+            try:
+                self.refresh_expiring_credentials()
+            except Exception as e:
+                verbose_logger.exception(
+                    "Error refreshing credentials - {}".format(str(e))
+                )
+
+    def clear(self):
+        with self._lock:
+            self._credentials.clear()
+
+
+credential_refresh_manager = CredentialRefreshManager()
@@ -1,5 +1,48 @@
+import base64
+import json
 import os
-from typing import Callable
+from typing import Callable, Optional, Tuple
+
+from litellm.secret_managers.credential_refresh_manager import (
+    credential_refresh_manager,
+    get_credential_key,
+)
+
+
+def _get_jwt_expiry(token: str) -> Optional[float]:
+    """
+    `exp` claim of a JWT (Azure AD access tokens are JWTs) - None if it can't be read
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except Exception:
+        return None
+    if isinstance(exp, (int, float)):
+        return float(exp)
+    return None
+
+
+def get_managed_azure_ad_token_provider(
+    token_provider: Callable[[], str],
+    tenant_id: str,
+    client_id: str,
+    client_secret: str,
+) -> Callable[[], str]:
+    """
+    Wraps a bearer token provider - tokens are cached, and refreshed in the background ahead of expiry
+    """
+    key = get_credential_key("azure_ad", tenant_id, client_id, client_secret)
+
+    def _refresh(current: Optional[str]) -> Tuple[str, Optional[float]]:
+        token = token_provider()
+        return token, _get_jwt_expiry(token)
+
+    def _get_token() -> str:
+        return credential_refresh_manager.get_credential(key=key, refresh_fn=_refresh)
+
+    return _get_token
 
 
 def get_azure_ad_token_provider() -> Callable[[], str]:
@@ -17,17 +60,25 @@ def get_azure_ad_token_provider() -> Callable[[], str]:
     from azure.identity import ClientSecretCredential, get_bearer_token_provider
 
     try:
-        credential = ClientSecretCredential(
-            client_id=os.environ["AZURE_CLIENT_ID"],
-            client_secret=os.environ["AZURE_CLIENT_SECRET"],
-            tenant_id=os.environ["AZURE_TENANT_ID"],
-        )
+        client_id = os.environ["AZURE_CLIENT_ID"]
+        client_secret = os.environ["AZURE_CLIENT_SECRET"]
+        tenant_id = os.environ["AZURE_TENANT_ID"]
     except KeyError as e:
         raise ValueError(
             "Missing environment variable required by Azure AD workflow."
         ) from e
+    credential = ClientSecretCredential(
+        client_id=client_id,
+        client_secret=client_secret,
+        tenant_id=tenant_id,
+    )
 
-    return get_bearer_token_provider(
-        credential,
-        "https://cognitiveservices.azure.com/.default",
+    return get_managed_azure_ad_token_provider(
+        token_provider=get_bearer_token_provider(
+            credential,
+            "https://cognitiveservices.azure.com/.default",
+        ),
+        tenant_id=tenant_id,
+        client_id=client_id,
+        client_secret=client_secret,
     )
@@ -25,6 +25,9 @@ CachingSupportedCallTypes = Literal[
 ]
 
 
+CacheKeyHashAlgorithm = Literal["sha256", "blake2b", "xxhash"]
+
+
 class RedisPipelineIncrementOperation(TypedDict):
     """
     TypeDict for 1 Redis Pipeline Increment Operation
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Literal, Optional, TypedDict, Union
+
+from litellm.types.utils import StandardLoggingPayload
+
+S3LogFormat = Literal["json", "ndjson", "ndjson.gz", "parquet"]
+
+
+class S3LogQueueItem(TypedDict):
+    """
+    Internal Type, used for queueing logs to be sent to s3
+    """
+
+    payload: StandardLoggingPayload
+    start_time: datetime
+
+
+class S3UploadObject(TypedDict):
+    """
+    Internal Type, an object to upload to s3
+    """
+
+    key: str
+    body: Union[str, bytes]
+    content_type: str
+    content_disposition: Optional[str]
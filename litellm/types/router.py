@@ -582,6 +582,9 @@ class RouterGeneralSettings(BaseModel):
     pass_through_all_models: bool = Field(
         default=False
     )  # if passed a model not llm_router model list, pass through the request to litellm.acompletion/embedding
+    preload_tokenizers: bool = Field(
+        default=False
+    )  # warm the tokenizer cache (+ huggingface chat templates) for all deployments in a background thread, on router init
 
 
 class RouterRateLimitErrorBasic(ValueError):
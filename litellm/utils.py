@@ -29,13 +29,11 @@ import subprocess
 ## Generic utils.py file. Problem-specific utils (e.g. 'cost calculation), should all be in `litellm_core_utils/`.
 import sys
 import textwrap
-import threading
 import time
 import traceback
 import uuid
 from dataclasses import dataclass, field
 from functools import lru_cache, wraps
-from importlib import resources
 from inspect import iscoroutine
 from os.path import abspath, dirname, join
 
@@ -75,6 +73,9 @@ from litellm.litellm_core_utils.get_llm_provider_logic import (
     _is_non_openai_azure_model,
     get_llm_provider,
 )
+from litellm.litellm_core_utils.llm_cost_calc.cost_table import GLOBAL_MODEL_COST_TABLE
+from litellm.litellm_core_utils.model_info_cache import GLOBAL_MODEL_INFO_CACHE
+from litellm.litellm_core_utils.model_registry import GLOBAL_MODEL_REGISTRY
 from litellm.litellm_core_utils.get_supported_openai_params import (
     get_supported_openai_params,
 )
@@ -89,6 +90,7 @@ from litellm.litellm_core_utils.llm_response_utils.convert_dict_to_response impo
 from litellm.litellm_core_utils.llm_response_utils.get_headers import (
     get_response_headers,
 )
+from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
 from litellm.litellm_core_utils.redact_messages import (
     LiteLLMLoggingObject,
     redact_message_input_output_from_logging,
@@ -96,6 +98,7 @@ from litellm.litellm_core_utils.redact_messages import (
 from litellm.litellm_core_utils.rules import Rules
 from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
 from litellm.litellm_core_utils.token_counter import get_modified_max_tokens
+from litellm.litellm_core_utils.tokenizer_registry import tokenizer_registry
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.secret_managers.main import get_secret
 from litellm.types.llms.openai import (
@@ -131,10 +134,6 @@ from litellm.types.utils import (
     Usage,
 )
 
-with resources.open_text("litellm.llms.tokenizers", "anthropic_tokenizer.json") as f:
-    json_data = json.load(f)
-# Convert to str (if necessary)
-claude_json_str = json.dumps(json_data)
 import importlib.metadata
 from concurrent.futures import ThreadPoolExecutor
 from typing import (
@@ -888,9 +887,9 @@ def client(original_function):  # noqa: PLR0915
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object, remove `handle_success` once it's deprecated
             verbose_logger.info("Wrapper: Completed Call, calling success_handler")
-            threading.Thread(
-                target=logging_obj.success_handler, args=(result, start_time, end_time)
-            ).start()
+            GLOBAL_LOGGING_WORKER.submit(
+                logging_obj.success_handler, result, start_time, end_time
+            )
             # RETURN RESULT
             if hasattr(result, "_hidden_params"):
                 result._hidden_params["model_id"] = kwargs.get("model_info", {}).get(
@@ -1087,6 +1086,7 @@ def client(original_function):  # noqa: PLR0915
                 kwargs=kwargs,
                 args=args,
             )
+            _llm_caching_handler.release_single_flight(result=result)
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object
             print_verbose(
@@ -1096,10 +1096,9 @@ def client(original_function):  # noqa: PLR0915
             asyncio.create_task(
                 logging_obj.async_success_handler(result, start_time, end_time)
             )
-            threading.Thread(
-                target=logging_obj.success_handler,
-                args=(result, start_time, end_time),
-            ).start()
+            GLOBAL_LOGGING_WORKER.submit(
+                logging_obj.success_handler, result, start_time, end_time
+            )
 
             # REBUILD EMBEDDING CACHING
             if (
@@ -1116,6 +1115,7 @@ def client(original_function):  # noqa: PLR0915
 
             return result
         except Exception as e:
+            _llm_caching_handler.release_single_flight(result=None)
             traceback_exception = traceback.format_exc()
             end_time = datetime.datetime.now()
             if logging_obj:
@@ -1173,6 +1173,9 @@ def client(original_function):  # noqa: PLR0915
                         kwargs["model"] = context_window_fallback_dict[model]
                     return await original_function(*args, **kwargs)
             raise e
+        finally:
+            # no-op if already released. Wakes up waiting requests if the leader was cancelled (asyncio.CancelledError is not an `Exception`)
+            _llm_caching_handler.release_single_flight(result=None)
 
     is_coroutine = inspect.iscoroutinefunction(original_function)
 
@@ -1183,41 +1186,13 @@ def client(original_function):  # noqa: PLR0915
         return wrapper
 
 
-@lru_cache(maxsize=128)
 def _select_tokenizer(model: str):
-    if model in litellm.cohere_models and "command-r" in model:
-        # cohere
-        cohere_tokenizer = Tokenizer.from_pretrained(
-            "Xenova/c4ai-command-r-v01-tokenizer"
-        )
-        return {"type": "huggingface_tokenizer", "tokenizer": cohere_tokenizer}
-    # anthropic
-    elif model in litellm.anthropic_models and "claude-3" not in model:
-        claude_tokenizer = Tokenizer.from_str(claude_json_str)
-        return {"type": "huggingface_tokenizer", "tokenizer": claude_tokenizer}
-    # llama2
-    elif "llama-2" in model.lower() or "replicate" in model.lower():
-        tokenizer = Tokenizer.from_pretrained("hf-internal-testing/llama-tokenizer")
-        return {"type": "huggingface_tokenizer", "tokenizer": tokenizer}
-    # llama3
-    elif "llama-3" in model.lower():
-        tokenizer = Tokenizer.from_pretrained("Xenova/llama-3-tokenizer")
-        return {"type": "huggingface_tokenizer", "tokenizer": tokenizer}
-    # default - tiktoken
-    else:
-        tokenizer = None
-        if (
-            model in litellm.open_ai_chat_completion_models
-            or model in litellm.open_ai_text_completion_models
-            or model in litellm.open_ai_embedding_models
-        ):
-            return {"type": "openai_tokenizer", "tokenizer": encoding}
+    """
+    Returns the tokenizer for a given model - `{"type": ..., "tokenizer": ...}`
 
-        try:
-            tokenizer = Tokenizer.from_pretrained(model)
-            return {"type": "huggingface_tokenizer", "tokenizer": tokenizer}
-        except Exception:
-            return {"type": "openai_tokenizer", "tokenizer": encoding}
+    Tokenizers are cached per model family in `litellm.litellm_core_utils.tokenizer_registry`
+    """
+    return tokenizer_registry.get_tokenizer(model=model)
 
 
 def encode(model="", text="", custom_tokenizer: Optional[dict] = None):
@@ -1276,7 +1251,7 @@ def openai_token_counter(  # noqa: PLR0915
             4  # every message follows <|start|>{role/name}\n{content}<|end|>\n
         )
         tokens_per_name = -1  # if there's a name, the role is omitted
-    elif model in litellm.open_ai_chat_completion_models:
+    elif GLOBAL_MODEL_REGISTRY.contains(model, "open_ai_chat_completion_models"):
         tokens_per_message = 3
         tokens_per_name = 1
     elif model in litellm.azure_llms:
@@ -1650,7 +1625,7 @@ def token_counter(
             num_tokens = len(enc.ids)
         elif tokenizer_json["type"] == "openai_tokenizer":
             if (
-                model in litellm.open_ai_chat_completion_models
+                GLOBAL_MODEL_REGISTRY.contains(model, "open_ai_chat_completion_models")
                 or model in litellm.azure_llms
             ):
                 if model in litellm.azure_llms:
@@ -1714,7 +1689,7 @@ def supports_system_messages(model: str, custom_llm_provider: Optional[str]) ->
     Exception: If the given model is not found in model_prices_and_context_window.json.
     """
     try:
-        model_info = litellm.get_model_info(
+        model_info = _get_cached_model_info(
             model=model, custom_llm_provider=custom_llm_provider
         )
         if model_info.get("supports_system_messages", False) is True:
@@ -1749,7 +1724,7 @@ def supports_response_schema(model: str, custom_llm_provider: Optional[str]) ->
 
     try:
         ## GET MODEL INFO
-        model_info = litellm.get_model_info(
+        model_info = _get_cached_model_info(
             model=model, custom_llm_provider=custom_llm_provider
         )
 
@@ -1790,7 +1765,7 @@ def supports_function_calling(
         )
 
         ## CHECK IF MODEL SUPPORTS FUNCTION CALLING ##
-        model_info = litellm.get_model_info(
+        model_info = _get_cached_model_info(
             model=model, custom_llm_provider=custom_llm_provider
         )
 
@@ -1822,7 +1797,7 @@ def _supports_factory(model: str, custom_llm_provider: Optional[str], key: str)
             model=model, custom_llm_provider=custom_llm_provider
         )
 
-        model_info = litellm.get_model_info(
+        model_info = _get_cached_model_info(
             model=model, custom_llm_provider=custom_llm_provider
         )
 
@@ -1879,7 +1854,7 @@ def supports_prompt_caching(
             model=model, custom_llm_provider=custom_llm_provider
         )
 
-        model_info = litellm.get_model_info(
+        model_info = _get_cached_model_info(
             model=model, custom_llm_provider=custom_llm_provider
         )
 
@@ -1908,7 +1883,7 @@ def supports_vision(model: str, custom_llm_provider: Optional[str] = None) -> bo
             model=model, custom_llm_provider=custom_llm_provider
         )
 
-        model_info = litellm.get_model_info(
+        model_info = _get_cached_model_info(
             model=model, custom_llm_provider=custom_llm_provider
         )
 
@@ -2030,6 +2005,11 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
         elif value.get("litellm_provider") == "bedrock":
             if key not in litellm.bedrock_models:
                 litellm.bedrock_models.append(key)
+    # rebuild the model / provider indexes, and drop memoized `get_llm_provider` results
+    GLOBAL_MODEL_REGISTRY.invalidate()
+    # pricing of existing models is updated in place - recompile the cost table, and drop the cached model info
+    GLOBAL_MODEL_COST_TABLE.invalidate()
+    GLOBAL_MODEL_INFO_CACHE.invalidate()
     return model_cost
 
 
@@ -2977,13 +2957,14 @@ def get_optional_params(  # noqa: PLR0915
                 optional_params["stop_sequences"] = stop
         if max_tokens is not None:
             optional_params["max_output_tokens"] = max_tokens
-    elif custom_llm_provider == "vertex_ai" and (
-        model in litellm.vertex_chat_models
-        or model in litellm.vertex_code_chat_models
-        or model in litellm.vertex_text_models
-        or model in litellm.vertex_code_text_models
-        or model in litellm.vertex_language_models
-        or model in litellm.vertex_vision_models
+    elif custom_llm_provider == "vertex_ai" and GLOBAL_MODEL_REGISTRY.contains(
+        model,
+        "vertex_chat_models",
+        "vertex_code_chat_models",
+        "vertex_text_models",
+        "vertex_code_text_models",
+        "vertex_language_models",
+        "vertex_vision_models",
     ):
         ## check if unsupported param passed in
         supported_params = get_supported_openai_params(
@@ -3049,7 +3030,9 @@ def get_optional_params(  # noqa: PLR0915
             non_default_params=non_default_params,
             optional_params=optional_params,
         )
-    elif custom_llm_provider == "vertex_ai" and model in litellm.vertex_llama3_models:
+    elif custom_llm_provider == "vertex_ai" and GLOBAL_MODEL_REGISTRY.contains(
+        model, "vertex_llama3_models"
+    ):
         supported_params = get_supported_openai_params(
             model=model, custom_llm_provider=custom_llm_provider
         )
@@ -3064,7 +3047,9 @@ def get_optional_params(  # noqa: PLR0915
                 else False
             ),
         )
-    elif custom_llm_provider == "vertex_ai" and model in litellm.vertex_mistral_models:
+    elif custom_llm_provider == "vertex_ai" and GLOBAL_MODEL_REGISTRY.contains(
+        model, "vertex_mistral_models"
+    ):
         supported_params = get_supported_openai_params(
             model=model, custom_llm_provider=custom_llm_provider
         )
@@ -3078,7 +3063,9 @@ def get_optional_params(  # noqa: PLR0915
                 non_default_params=non_default_params,
                 optional_params=optional_params,
             )
-    elif custom_llm_provider == "vertex_ai" and model in litellm.vertex_ai_ai21_models:
+    elif custom_llm_provider == "vertex_ai" and GLOBAL_MODEL_REGISTRY.contains(
+        model, "vertex_ai_ai21_models"
+    ):
         supported_params = get_supported_openai_params(
             model=model, custom_llm_provider=custom_llm_provider
         )
@@ -4315,12 +4302,12 @@ def _get_model_info_from_model_cost(key: str) -> dict:
     return litellm.model_cost[key]
 
 
-def get_model_info(  # noqa: PLR0915
-    model: str, custom_llm_provider: Optional[str] = None
-) -> ModelInfo:
+def get_model_info(model: str, custom_llm_provider: Optional[str] = None) -> ModelInfo:
     """
     Get a dict for the maximum tokens (context window), input_cost_per_token, output_cost_per_token  for a given model.
 
+    Results are memoized (`litellm_core_utils/model_info_cache.py`) - call `litellm.register_model` to change a model's info.
+
     Parameters:
     - model (str): The name of the model.
     - custom_llm_provider (str | null): the provider used for the model. If provided, used to check if the litellm model info is for that provider.
@@ -4383,6 +4370,42 @@ def get_model_info(  # noqa: PLR0915
             "supported_openai_params": ["temperature", "max_tokens", "top_p", "frequency_penalty", "presence_penalty"]
         }
     """
+    # a copy - callers may modify it
+    return _get_cached_model_info(
+        model=model, custom_llm_provider=custom_llm_provider
+    ).copy()
+
+
+def _get_cached_model_info(
+    model: str, custom_llm_provider: Optional[str] = None
+) -> ModelInfo:
+    """
+    Same as `get_model_info` - but returns the cached model info, shared by all callers. It's read-only - don't modify it.
+    """
+    if not isinstance(model, str) or not (
+        custom_llm_provider is None or isinstance(custom_llm_provider, str)
+    ):
+        return _get_model_info(model=model, custom_llm_provider=custom_llm_provider)
+    model_info, snapshot = GLOBAL_MODEL_INFO_CACHE.get(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+    if model_info is not None:
+        return model_info  # type: ignore
+    _model_info = _get_model_info(model=model, custom_llm_provider=custom_llm_provider)
+    if _model_info.get("litellm_provider") in ("ollama", "ollama_chat"):
+        # read from the ollama server - may change
+        return _model_info
+    return GLOBAL_MODEL_INFO_CACHE.set(  # type: ignore
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+        model_info=_model_info,
+        snapshot=snapshot,
+    )
+
+
+def _get_model_info(  # noqa: PLR0915
+    model: str, custom_llm_provider: Optional[str] = None
+) -> ModelInfo:
     supported_openai_params: Union[List[str], None] = []
 
     def _get_max_position_embeddings(model_name):
@@ -4412,11 +4435,15 @@ def get_model_info(  # noqa: PLR0915
         if model in azure_llms:
             model = azure_llms[model]
         if custom_llm_provider is not None and custom_llm_provider == "vertex_ai":
-            if "meta/" + model in litellm.vertex_llama3_models:
+            if GLOBAL_MODEL_REGISTRY.contains("meta/" + model, "vertex_llama3_models"):
                 model = "meta/" + model
-            elif model + "@latest" in litellm.vertex_mistral_models:
+            elif GLOBAL_MODEL_REGISTRY.contains(
+                model + "@latest", "vertex_mistral_models"
+            ):
                 model = model + "@latest"
-            elif model + "@latest" in litellm.vertex_ai_ai21_models:
+            elif GLOBAL_MODEL_REGISTRY.contains(
+                model + "@latest", "vertex_ai_ai21_models"
+            ):
                 model = model + "@latest"
         ##########################
         if custom_llm_provider is None:
@@ -4474,7 +4501,6 @@ def get_model_info(  # noqa: PLR0915
             if combined_model_name in litellm.model_cost:
                 key = combined_model_name
                 _model_info = _get_model_info_from_model_cost(key=key)
-                _model_info["supported_openai_params"] = supported_openai_params
                 if (
                     "litellm_provider" in _model_info
                     and _model_info["litellm_provider"] != custom_llm_provider
@@ -4488,7 +4514,6 @@ def get_model_info(  # noqa: PLR0915
             if _model_info is None and model in litellm.model_cost:
                 key = model
                 _model_info = _get_model_info_from_model_cost(key=key)
-                _model_info["supported_openai_params"] = supported_openai_params
                 if (
                     "litellm_provider" in _model_info
                     and _model_info["litellm_provider"] != custom_llm_provider
@@ -4509,7 +4534,6 @@ def get_model_info(  # noqa: PLR0915
             ):
                 key = combined_stripped_model_name
                 _model_info = _get_model_info_from_model_cost(key=key)
-                _model_info["supported_openai_params"] = supported_openai_params
                 if (
                     "litellm_provider" in _model_info
                     and _model_info["litellm_provider"] != custom_llm_provider
@@ -4527,7 +4551,6 @@ def get_model_info(  # noqa: PLR0915
             if _model_info is None and stripped_model_name in litellm.model_cost:
                 key = stripped_model_name
                 _model_info = _get_model_info_from_model_cost(key=key)
-                _model_info["supported_openai_params"] = supported_openai_params
                 if (
                     "litellm_provider" in _model_info
                     and _model_info["litellm_provider"] != custom_llm_provider
@@ -4546,7 +4569,6 @@ def get_model_info(  # noqa: PLR0915
             if _model_info is None and split_model in litellm.model_cost:
                 key = split_model
                 _model_info = _get_model_info_from_model_cost(key=key)
-                _model_info["supported_openai_params"] = supported_openai_params
                 if (
                     "litellm_provider" in _model_info
                     and _model_info["litellm_provider"] != custom_llm_provider
@@ -700,3 +700,230 @@ def test_convert_generic_image_chunk_to_openai_image_obj():
     url_str = convert_generic_image_chunk_to_openai_image_obj(image_obj)
     image_obj = convert_to_anthropic_image_obj(url_str)
     print(image_obj)
+
+
+def _get_mock_image_response(content: bytes = b"image bytes"):
+    from unittest.mock import MagicMock
+
+    response = MagicMock()
+    response.status_code = 200
+    response.content = content
+    response.headers = {"Content-Type": "image/png"}
+    return response
+
+
+def test_image_url_downloaded_once():
+    """
+    The image helpers share 1 download per url
+    """
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates.factory import get_image_details
+    from litellm.llms.prompt_templates.image_handling import image_cache
+
+    image_cache.clear()
+    url = "https://example.com/image.png"
+    with patch.object(
+        litellm.module_level_client,
+        "get",
+        return_value=_get_mock_image_response(),
+    ) as mock_get:
+        data_url = convert_url_to_base64(url)
+        image_chunk = convert_to_anthropic_image_obj(url)
+        image_bytes, image_format = get_image_details(url)
+
+    assert mock_get.call_count == 1
+    assert data_url == "data:image/png;base64,aW1hZ2UgYnl0ZXM="
+    assert image_chunk["data"] == image_bytes == "aW1hZ2UgYnl0ZXM="
+    assert image_format == "png"
+
+
+def test_image_cache_is_bounded_by_size():
+    from litellm.llms.prompt_templates.image_handling import CachedImage, ImageCache
+
+    cache = ImageCache(max_size_in_bytes=100)
+    for i in range(3):
+        cache.set("https://example.com/{}.png".format(i), CachedImage(b"x" * 30, None))
+    # 30 bytes + 40 base64 chars per image
+    assert cache.get("https://example.com/0.png") is None
+    assert cache.get("https://example.com/1.png") is None
+    assert cache.get("https://example.com/2.png") is not None
+    assert cache.current_size_in_bytes == 70
+
+    cache.set("https://example.com/large.png", CachedImage(b"x" * 100, None))
+    assert cache.get("https://example.com/large.png") is None
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch_image_urls():
+    """
+    Images are downloaded concurrently, once per url
+    """
+    import asyncio
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates.image_handling import (
+        async_prefetch_image_urls,
+        image_cache,
+    )
+
+    image_cache.clear()
+    num_concurrent_downloads = 0
+    max_concurrent_downloads = 0
+
+    async def mock_get(url, follow_redirects=None, timeout=None):
+        nonlocal num_concurrent_downloads, max_concurrent_downloads
+        num_concurrent_downloads += 1
+        max_concurrent_downloads = max(
+            max_concurrent_downloads, num_concurrent_downloads
+        )
+        await asyncio.sleep(0.01)
+        num_concurrent_downloads -= 1
+        return _get_mock_image_response(content=url.encode())
+
+    urls = ["https://example.com/{}.png".format(i) for i in range(3)]
+    messages = [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "What's in these images?"}]
+            + [{"type": "image_url", "image_url": {"url": url}} for url in urls]
+            + [{"type": "image_url", "image_url": urls[0]}],
+        }
+    ]
+    with patch.object(
+        litellm.module_level_aclient, "get", side_effect=mock_get
+    ) as mock_aget:
+        await asyncio.gather(
+            async_prefetch_image_urls(messages), async_prefetch_image_urls(messages)
+        )
+    assert mock_aget.call_count == 3
+    assert max_concurrent_downloads == 3
+
+    with patch.object(litellm.module_level_client, "get") as mock_get_sync:
+        assert convert_url_to_base64(urls[1]).startswith("data:image/png;base64,")
+    mock_get_sync.assert_not_called()
+
+
+def test_image_cache_ttl():
+    import time
+
+    from litellm.llms.prompt_templates.image_handling import CachedImage, ImageCache
+
+    cache = ImageCache(ttl=0.05)
+    cache.set("https://example.com/0.png", CachedImage(b"x" * 30, None))
+    assert cache.get("https://example.com/0.png") is not None
+
+    time.sleep(0.1)
+    assert cache.get("https://example.com/0.png") is None
+    assert cache.current_size_in_bytes == 0
+
+
+def test_image_download_timeout():
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates.image_handling import (
+        IMAGE_DOWNLOAD_TIMEOUT_SECONDS,
+        image_cache,
+    )
+
+    image_cache.clear()
+    with patch.object(
+        litellm.module_level_client,
+        "get",
+        return_value=_get_mock_image_response(),
+    ) as mock_get:
+        convert_url_to_base64("https://example.com/image.png")
+
+    assert mock_get.call_args.kwargs["timeout"] == IMAGE_DOWNLOAD_TIMEOUT_SECONDS
+    assert (
+        IMAGE_DOWNLOAD_TIMEOUT_SECONDS < litellm.module_level_client.client.timeout.read
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_image_prefetch_is_not_retried_in_the_request():
+    """
+    If an image url failed to prefetch, the prompt transformation of the same request raises without downloading it again
+    """
+    import contextvars
+    from unittest.mock import AsyncMock, patch
+
+    from litellm.llms.prompt_templates.image_handling import (
+        IMAGE_DOWNLOAD_ATTEMPTS,
+        async_prefetch_image_urls,
+        image_cache,
+    )
+
+    image_cache.clear()
+    url = "https://example.com/missing.png"
+    messages = [
+        {
+            "role": "user",
+            "content": [{"type": "image_url", "image_url": {"url": url}}],
+        }
+    ]
+    with patch.object(
+        litellm.module_level_aclient,
+        "get",
+        new=AsyncMock(side_effect=Exception("connection error")),
+    ) as mock_aget:
+        await async_prefetch_image_urls(messages)
+    assert mock_aget.call_count == IMAGE_DOWNLOAD_ATTEMPTS
+
+    # the transformation runs in a copy of the request context, like in `acompletion`
+    ctx = contextvars.copy_context()
+    with patch.object(litellm.module_level_client, "get") as mock_get:
+        with pytest.raises(Exception, match="Unable to fetch image"):
+            ctx.run(convert_url_to_base64, url)
+    mock_get.assert_not_called()
+
+    # other requests download it again
+    with patch.object(
+        litellm.module_level_client,
+        "get",
+        return_value=_get_mock_image_response(),
+    ) as mock_get:
+        assert (
+            contextvars.Context()
+            .run(convert_url_to_base64, url)
+            .startswith("data:image/png;base64,")
+        )
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "model, should_prefetch",
+    [
+        ("anthropic/claude-3-5-sonnet-20240620", True),
+        ("gemini/gemini-1.5-flash", False),
+        ("vertex_ai/gemini-1.5-flash", False),
+    ],
+)
+async def test_acompletion_prefetches_images_for_inlining_providers(
+    model, should_prefetch
+):
+    """
+    Vertex AI / Gemini send https image urls as `file_uri` - they're not downloaded
+    """
+    from unittest.mock import AsyncMock, patch
+
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "What's in this image?"},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": "https://example.com/image.png"},
+                },
+            ],
+        }
+    ]
+    with patch(
+        "litellm.main.async_prefetch_image_urls", new=AsyncMock()
+    ) as mock_prefetch:
+        await litellm.acompletion(
+            model=model, messages=messages, mock_response="Hello world"
+        )
+    assert mock_prefetch.called is should_prefetch
@@ -0,0 +1,93 @@
+"""
+Cache key benchmark
+
+Builds the cache key of large requests - a 100k token prompt, and a message with 4 x 1MB base64 images - two ways:
+- default: `str()` of each param, joined into one string, then hashed
+- canonical: `cache_key_hash_algorithm="sha256"` - params fed into the hash object incrementally
+
+Reports:
+- ms_per_key_default_<payload>: time per `Cache.get_cache_key` call, default
+- ms_per_key_canonical_<payload>: time per `Cache.get_cache_key` call, canonical
+
+Run `python test_cache_key_benchmark.py` to print the report.
+
+Catch regressions:
+- CACHE_KEY_BENCHMARK_RUNS - `get_cache_key` calls per payload (default 10)
+- CACHE_KEY_BENCHMARK_MIN_SPEEDUP - fail if canonical hashing is less than this many times faster than the default (default 1)
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.caching.caching import Cache
+
+NUM_RUNS = int(os.getenv("CACHE_KEY_BENCHMARK_RUNS", "10"))
+
+
+def _get_payloads() -> dict:
+    image_url = "data:image/png;base64," + base64.b64encode(
+        os.urandom(1_000_000)
+    ).decode("utf-8")
+    return {
+        "100k_token_prompt": {
+            "model": "gpt-4o",
+            "messages": [{"role": "user", "content": " ".join(["token"] * 100_000)}],
+        },
+        "multi_image": {
+            "model": "gpt-4o",
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"type": "text", "text": "describe these images"}]
+                    + [
+                        {"type": "image_url", "image_url": {"url": image_url}}
+                        for _ in range(4)
+                    ],
+                }
+            ],
+        },
+    }
+
+
+def _time_get_cache_key(cache: Cache, kwargs: dict, num_runs: int) -> float:
+    cache.get_cache_key(**kwargs)  # warmup
+    start_time = time.perf_counter()
+    for _ in range(num_runs):
+        cache.get_cache_key(**kwargs)
+    return (time.perf_counter() - start_time) / num_runs
+
+
+def run_benchmark(num_runs: int = NUM_RUNS) -> dict:
+    results = {}
+    for name, kwargs in _get_payloads().items():
+        results["ms_per_key_default_{}".format(name)] = (
+            _time_get_cache_key(Cache(), kwargs, num_runs) * 1e3
+        )
+        results["ms_per_key_canonical_{}".format(name)] = (
+            _time_get_cache_key(
+                Cache(cache_key_hash_algorithm="sha256"), kwargs, num_runs
+            )
+            * 1e3
+        )
+    return results
+
+
+def test_cache_key_benchmark():
+    results = run_benchmark()
+    print(json.dumps(results, indent=2))
+    min_speedup = float(os.getenv("CACHE_KEY_BENCHMARK_MIN_SPEEDUP", "1"))
+    for name in _get_payloads():
+        assert (
+            results["ms_per_key_default_{}".format(name)]
+            / results["ms_per_key_canonical_{}".format(name)]
+            >= min_speedup
+        )
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
@@ -0,0 +1,114 @@
+"""
+Cost calculation benchmark
+
+Prices a mix of usage records (openai, anthropic, gemini, bedrock models) three ways:
+- per request, with `litellm.cost_per_token` - what runs after every successful request
+- per request, with the compiled `ModelCostTable` pricing
+- all records at once, with `litellm.bulk_cost_per_token` (NumPy) - spend log backfills / analytics
+
+Reports:
+- us_per_record_cost_per_token: time per record, `litellm.cost_per_token`
+- us_per_record_compiled_table: time per record, `GLOBAL_MODEL_COST_TABLE.get_pricing` + token math
+- us_per_record_bulk: time per record, `litellm.bulk_cost_per_token`
+
+Run `python test_cost_calculation_benchmark.py` to print the report.
+
+Catch regressions:
+- COST_BENCHMARK_RECORDS - number of usage records (default 100000)
+- COST_BENCHMARK_MIN_SPEEDUP - fail if bulk pricing is less than this many times faster than `litellm.cost_per_token` (default 10)
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.abspath("../.."))
+os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+
+import litellm
+from litellm.litellm_core_utils.llm_cost_calc.cost_table import GLOBAL_MODEL_COST_TABLE
+
+NUM_RECORDS = int(os.getenv("COST_BENCHMARK_RECORDS", "100000"))
+MODELS = [
+    "gpt-4o",
+    "gpt-4o-mini",
+    "claude-3-5-sonnet-20240620",
+    "gemini/gemini-1.5-pro",
+    "bedrock/anthropic.claude-3-sonnet-20240229-v1:0",
+]
+# `litellm.cost_per_token` is slow - time it on a sample
+PER_REQUEST_SAMPLE_SIZE = 2000
+
+
+def _get_records(num_records: int) -> Tuple[List[str], List[int], List[int]]:
+    random_generator = random.Random(42)
+    models = [random_generator.choice(MODELS) for _ in range(num_records)]
+    prompt_tokens = [random_generator.randint(10, 200000) for _ in range(num_records)]
+    completion_tokens = [random_generator.randint(1, 4000) for _ in range(num_records)]
+    return models, prompt_tokens, completion_tokens
+
+
+def run_benchmark(num_records: int = NUM_RECORDS) -> dict:
+    models, prompt_tokens, completion_tokens = _get_records(num_records)
+    sample = range(min(PER_REQUEST_SAMPLE_SIZE, num_records))
+
+    start_time = time.perf_counter()
+    expected_costs = [
+        sum(
+            litellm.cost_per_token(
+                model=models[i],
+                prompt_tokens=prompt_tokens[i],
+                completion_tokens=completion_tokens[i],
+            )
+        )
+        for i in sample
+    ]
+    cost_per_token_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for i in sample:
+        pricing = GLOBAL_MODEL_COST_TABLE.get_pricing(models[i]) or {}
+        above_128k = prompt_tokens[i] > 128000
+        input_cost_per_token = (
+            above_128k and pricing.get("input_cost_per_token_above_128k_tokens")
+        ) or pricing.get("input_cost_per_token", 0)
+        prompt_tokens[i] * input_cost_per_token + completion_tokens[i] * pricing.get(
+            "output_cost_per_token", 0
+        )
+    compiled_table_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    prompt_cost, completion_cost = litellm.bulk_cost_per_token(
+        model=models,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+    )
+    bulk_time = time.perf_counter() - start_time
+
+    bulk_costs = (prompt_cost + completion_cost).tolist()
+    for i, expected_cost in zip(sample, expected_costs):
+        assert abs(bulk_costs[i] - expected_cost) <= 1e-9 * max(1, expected_cost)
+
+    return {
+        "num_records": num_records,
+        "us_per_record_cost_per_token": cost_per_token_time / len(sample) * 1e6,
+        "us_per_record_compiled_table": compiled_table_time / len(sample) * 1e6,
+        "us_per_record_bulk": bulk_time / num_records * 1e6,
+    }
+
+
+def test_cost_calculation_benchmark():
+    results = run_benchmark()
+    print(json.dumps(results, indent=2))
+    min_speedup = float(os.getenv("COST_BENCHMARK_MIN_SPEEDUP", "10"))
+    assert (
+        results["us_per_record_cost_per_token"] / results["us_per_record_bulk"]
+        >= min_speedup
+    )
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
@@ -0,0 +1,138 @@
+"""
+Import time benchmark for `import litellm`
+
+Each measurement runs `import litellm` in a fresh interpreter, so nothing is cached in `sys.modules`.
+
+Run `python test_import_time.py` to print the report.
+
+Catch regressions:
+- IMPORT_TIME_BUDGET_SECONDS - fail if the median import time is above this (default 10)
+- the remote model cost map is never awaited on import - a request that hangs doesn't slow down `import litellm`
+- provider configs are imported on first use, not on `import litellm`
+"""
+
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+NUM_RUNS = 3
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start_time = time.perf_counter()
+import litellm
+import_time = time.perf_counter() - start_time
+print(json.dumps({
+    "import_time": import_time,
+    "litellm_modules": len([m for m in sys.modules if m.startswith("litellm")]),
+    "lazy_modules_loaded": sorted(
+        m for m in set(litellm._lazy_imports.values()) if "litellm" + m in sys.modules
+    ),
+}))
+"""
+
+
+def _measure_import(env: Optional[Dict[str, str]] = None) -> dict:
+    _env = dict(os.environ)
+    _env["PYTHONPATH"] = ROOT_DIR
+    if env is not None:
+        _env.update(env)
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        env=_env,
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _median_import_time(env: Optional[Dict[str, str]] = None) -> float:
+    return statistics.median(
+        _measure_import(env=env)["import_time"] for _ in range(NUM_RUNS)
+    )
+
+
+def test_import_time_budget():
+    budget = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", 10))
+    import_time = _median_import_time(env={"LITELLM_LOCAL_MODEL_COST_MAP": "True"})
+    print(f"import litellm: {import_time:.2f}s (budget {budget}s)")
+    assert import_time < budget
+
+
+def test_import_does_not_wait_for_model_cost_map():
+    """
+    Route the model cost map request through a proxy, which accepts the connection and never responds.
+
+    A blocking fetch would add its full timeout (5s) to the import time.
+    """
+    hanging_proxy = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    hanging_proxy.bind(("127.0.0.1", 0))
+    hanging_proxy.listen(100)
+    proxy_url = "http://127.0.0.1:{}".format(hanging_proxy.getsockname()[1])
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            local_import_time = _median_import_time(
+                env={"LITELLM_LOCAL_MODEL_COST_MAP": "True"}
+            )
+            remote_import_time = _median_import_time(
+                env={
+                    "LITELLM_LOCAL_MODEL_COST_MAP": "False",
+                    "LITELLM_MODEL_COST_MAP_CACHE_DIR": cache_dir,
+                    "HTTPS_PROXY": proxy_url,
+                    "https_proxy": proxy_url,
+                }
+            )
+    finally:
+        hanging_proxy.close()
+    print(
+        f"import litellm: {local_import_time:.2f}s local cost map, {remote_import_time:.2f}s remote cost map"
+    )
+    assert remote_import_time - local_import_time < 2.5
+
+
+def test_provider_configs_imported_on_first_use():
+    script = """
+import sys
+import litellm
+assert "litellm.llms.xai.chat.xai_transformation" not in sys.modules
+assert "litellm.llms.volcengine" not in sys.modules
+assert litellm.XAIChatConfig.__name__ == "XAIChatConfig"
+assert "litellm.llms.xai.chat.xai_transformation" in sys.modules
+assert litellm.openAIGPTConfig is litellm.openAIGPTConfig
+from litellm import VolcEngineConfig
+"""
+    subprocess.run(
+        [sys.executable, "-c", script],
+        env=dict(os.environ, PYTHONPATH=ROOT_DIR, LITELLM_LOCAL_MODEL_COST_MAP="True"),
+        cwd=ROOT_DIR,
+        check=True,
+        timeout=120,
+    )
+
+
+if __name__ == "__main__":
+    results: List[dict] = [
+        _measure_import(env={"LITELLM_LOCAL_MODEL_COST_MAP": "True"})
+        for _ in range(NUM_RUNS)
+    ]
+    print(
+        json.dumps(
+            {
+                "median_import_time": statistics.median(
+                    r["import_time"] for r in results
+                ),
+                "litellm_modules": results[-1]["litellm_modules"],
+                "lazy_modules_loaded": results[-1]["lazy_modules_loaded"],
+            },
+            indent=2,
+        )
+    )
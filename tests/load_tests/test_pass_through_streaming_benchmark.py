@@ -0,0 +1,172 @@
+"""
+Pass-through streaming benchmark
+
+Streams Anthropic SSE responses through the pass-through chunk processors, for many concurrent streams:
+- `PassThroughStreamingHandler.chunk_processor` - collects the chunks, to log the complete response (default)
+- `PassThroughStreamingHandler.zero_copy_chunk_processor` - forwards the chunks, only usage is extracted (`zero_copy_pass_through_streaming`)
+
+Includes the work done for logging once a stream ends (building the complete response / cost from the usage),
+but not the logging callbacks.
+
+Reports (per processor):
+- mb_per_second: bytes forwarded to the clients per second, all streams - until their logging work is done
+- peak_kb_per_stream: peak memory allocated while streaming, per concurrent stream
+
+Run `python test_pass_through_streaming_benchmark.py` to print the report.
+
+Catch regressions:
+- PASS_THROUGH_BENCHMARK_STREAMS - number of concurrent streams (default 20)
+- PASS_THROUGH_BENCHMARK_EVENTS - content events per stream (default 500, ~80KB per stream)
+- PASS_THROUGH_BENCHMARK_MIN_SPEEDUP - fail if zero-copy streaming forwards less than this many times the bytes/sec of the default processor (default 5)
+- PASS_THROUGH_BENCHMARK_MAX_MEMORY_RATIO - fail if zero-copy streaming uses more than this fraction of the peak memory of the default processor (default 0.2)
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.proxy.pass_through_endpoints.streaming_handler import (
+    PassThroughStreamingHandler,
+)
+from litellm.proxy.pass_through_endpoints.types import EndpointType
+
+NUM_STREAMS = int(os.getenv("PASS_THROUGH_BENCHMARK_STREAMS", "20"))
+NUM_EVENTS = int(os.getenv("PASS_THROUGH_BENCHMARK_EVENTS", "500"))
+CHUNK_SIZE = 4096
+
+
+def _get_anthropic_stream(num_events: int) -> bytes:
+    events = [
+        b'event: message_start\ndata: {"type": "message_start", "message": {"id": "msg_1", "type": "message", "role": "assistant", "content": [], "model": "claude-3-5-sonnet-20241022", "usage": {"input_tokens": 25, "output_tokens": 1}}}\n\n'
+    ]
+    for i in range(num_events):
+        events.append(
+            b'event: content_block_delta\ndata: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "token %d of the streamed response "}}\n\n'
+            % i
+        )
+    events.append(
+        b'event: message_delta\ndata: {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": %d}}\n\n'
+        % num_events
+    )
+    events.append(b'event: message_stop\ndata: {"type": "message_stop"}\n\n')
+    return b"".join(events)
+
+
+def _get_mock_response(chunks: List[bytes]):
+    response = MagicMock()
+
+    async def aiter_bytes():
+        for chunk in chunks:
+            # a new bytes object per chunk, like httpx
+            yield bytes(memoryview(chunk))
+            await asyncio.sleep(0)
+
+    response.aiter_bytes = aiter_bytes
+    return response
+
+
+async def _consume_stream(chunk_processor, chunks: List[bytes]) -> int:
+    num_bytes = 0
+    async for chunk in chunk_processor(
+        response=_get_mock_response(chunks),
+        request_body={"model": "claude-3-5-sonnet-20241022"},
+        litellm_logging_obj=LiteLLMLoggingObj(
+            model="unknown",
+            messages=[],
+            stream=False,
+            call_type="pass_through_endpoint",
+            start_time=datetime.now(),
+            litellm_call_id="benchmark",
+            function_id="benchmark",
+        ),
+        endpoint_type=EndpointType.ANTHROPIC,
+        start_time=datetime.now(),
+        passthrough_success_handler_obj=MagicMock(),
+        url_route="https://api.anthropic.com/v1/messages",
+    ):
+        num_bytes += len(chunk)
+    return num_bytes
+
+
+async def _stream_and_log(chunk_processor, chunks: List[bytes]) -> int:
+    num_bytes = sum(
+        await asyncio.gather(
+            *[_consume_stream(chunk_processor, chunks) for _ in range(NUM_STREAMS)]
+        )
+    )
+    # wait for the logging tasks, started when the streams end
+    logging_tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    await asyncio.gather(*logging_tasks)
+    return num_bytes
+
+
+async def _run_streams(chunk_processor, chunks: List[bytes]) -> dict:
+    start_time = time.perf_counter()
+    num_bytes = await _stream_and_log(chunk_processor, chunks)
+    elapsed = time.perf_counter() - start_time
+
+    # tracemalloc slows down allocations - measure memory in a separate run
+    tracemalloc.start()
+    await _stream_and_log(chunk_processor, chunks)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mb_per_second": num_bytes / elapsed / 1e6,
+        "peak_kb_per_stream": peak_memory / NUM_STREAMS / 1024,
+    }
+
+
+async def _run_benchmark() -> dict:
+    stream = _get_anthropic_stream(NUM_EVENTS)
+    chunks = [stream[i : i + CHUNK_SIZE] for i in range(0, len(stream), CHUNK_SIZE)]
+    with patch.object(
+        PassThroughStreamingHandler, "_log_streaming_response", new=AsyncMock()
+    ):
+        default_results = await _run_streams(
+            PassThroughStreamingHandler.chunk_processor, chunks
+        )
+        zero_copy_results = await _run_streams(
+            PassThroughStreamingHandler.zero_copy_chunk_processor, chunks
+        )
+    return {
+        "num_streams": NUM_STREAMS,
+        "kb_per_stream": len(stream) / 1024,
+        "chunk_processor": default_results,
+        "zero_copy_chunk_processor": zero_copy_results,
+    }
+
+
+def run_benchmark() -> dict:
+    return asyncio.run(_run_benchmark())
+
+
+def test_pass_through_streaming_benchmark():
+    results = run_benchmark()
+    print(json.dumps(results, indent=2))
+    min_speedup = float(os.getenv("PASS_THROUGH_BENCHMARK_MIN_SPEEDUP", "5"))
+    max_memory_ratio = float(
+        os.getenv("PASS_THROUGH_BENCHMARK_MAX_MEMORY_RATIO", "0.2")
+    )
+    default_results = results["chunk_processor"]
+    zero_copy_results = results["zero_copy_chunk_processor"]
+    assert (
+        zero_copy_results["mb_per_second"]
+        >= default_results["mb_per_second"] * min_speedup
+    )
+    assert (
+        zero_copy_results["peak_kb_per_stream"]
+        <= default_results["peak_kb_per_stream"] * max_memory_ratio
+    )
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
@@ -0,0 +1,121 @@
+"""
+Wildcard routing benchmark for `PatternMatchRouter`
+
+Registers thousands of wildcard routes - per-team prefixes (`team-<n>/openai/*`), provider routes (`bedrock/*`),
+and a few infix patterns (`*meta.llama3*`) - and routes a mix of requested models through them.
+
+Reports:
+- us_per_route_uncached: time per `route()` call, for models not routed before
+- us_per_route_cached: time per `route()` call, for models routed before
+- us_per_route_linear_scan: time per request, trying every pattern in order with `re.match` (the previous implementation)
+
+Run `python test_pattern_match_router_benchmark.py` to print the report.
+
+Catch regressions:
+- PATTERN_ROUTER_BENCHMARK_PATTERNS - number of per-team patterns (default 5000)
+- PATTERN_ROUTER_BENCHMARK_MIN_SPEEDUP - fail if routing uncached models is less than this many times faster than the linear scan (default 5)
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.router_utils.pattern_match_deployments import PatternMatchRouter
+
+NUM_PATTERNS = int(os.getenv("PATTERN_ROUTER_BENCHMARK_PATTERNS", "5000"))
+PROVIDERS = ["openai", "anthropic", "bedrock", "vertex_ai", "azure"]
+
+
+def _build_router() -> PatternMatchRouter:
+    router = PatternMatchRouter()
+    for i in range(NUM_PATTERNS):
+        provider = PROVIDERS[i % len(PROVIDERS)]
+        router.add_pattern(
+            "team-{}/{}/*".format(i, provider),
+            {"litellm_params": {"model": "{}/*".format(provider)}},
+        )
+    for provider in PROVIDERS:
+        router.add_pattern(
+            "{}/*".format(provider),
+            {"litellm_params": {"model": "{}/*".format(provider)}},
+        )
+    router.add_pattern(
+        "*meta.llama3*", {"litellm_params": {"model": "bedrock/meta.llama3*"}}
+    )
+    return router
+
+
+def _get_requests(num_requests: int) -> List[str]:
+    requests = []
+    for i in range(num_requests):
+        if i % 4 == 0:
+            requests.append("{}/model-{}".format(PROVIDERS[i % len(PROVIDERS)], i))
+        elif i % 4 == 1:
+            requests.append("meta.llama3-{}b".format(i))
+        elif i % 4 == 2:
+            requests.append("unknown-model-{}".format(i))
+        else:
+            team = (i * 7919) % NUM_PATTERNS
+            requests.append(
+                "team-{}/{}/model-{}".format(team, PROVIDERS[team % len(PROVIDERS)], i)
+            )
+    return requests
+
+
+def _linear_scan(router: PatternMatchRouter, request: str) -> Optional[str]:
+    for pattern in router.patterns:
+        if re.match(pattern, request):
+            return pattern
+    return None
+
+
+def run_benchmark(num_requests: int = 2000) -> dict:
+    router = _build_router()
+    requests = _get_requests(num_requests)
+    router.route(requests[0])  # build the index
+
+    start_time = time.perf_counter()
+    for request in requests:
+        router.route(request)
+    uncached_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for request in requests:
+        router.route(request)
+    cached_time = time.perf_counter() - start_time
+
+    # the linear scan is slow - with more patterns than `re`'s cache of compiled patterns, every `re.match` recompiles
+    sample = requests[:20]
+    start_time = time.perf_counter()
+    linear_scan_results = [_linear_scan(router, request) for request in sample]
+    linear_scan_time = time.perf_counter() - start_time
+
+    for request, expected_pattern in zip(sample, linear_scan_results):
+        matched = router._match(request)
+        assert (matched[0] if matched else None) == expected_pattern
+
+    return {
+        "num_patterns": len(router.patterns),
+        "us_per_route_uncached": uncached_time / len(requests) * 1e6,
+        "us_per_route_cached": cached_time / len(requests) * 1e6,
+        "us_per_route_linear_scan": linear_scan_time / len(sample) * 1e6,
+    }
+
+
+def test_pattern_match_router_benchmark():
+    results = run_benchmark()
+    print(json.dumps(results, indent=2))
+    min_speedup = float(os.getenv("PATTERN_ROUTER_BENCHMARK_MIN_SPEEDUP", "5"))
+    assert (
+        results["us_per_route_linear_scan"] / results["us_per_route_uncached"]
+        >= min_speedup
+    )
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2))
@@ -0,0 +1,563 @@
+"""
+Streaming latency benchmark for `CustomStreamWrapper`
+
+Replays recorded OpenAI, Anthropic, Bedrock, Vertex AI and Ollama streams from a local mock server, through each provider's stream parser + `CustomStreamWrapper` - the same path as `litellm.acompletion(..., stream=True)`.
+
+Reports, per provider:
+- cpu_us_per_chunk: CPU time of the event loop thread per streamed event (parser + wrapper)
+- wrapper_cpu_us_per_chunk: the part of it spent in `CustomStreamWrapper` (chunk_creator, logging, ...)
+- chunks_per_cpu_second: chunks 1 core can process per second
+- ttft_overhead_ms: median time from the first chunk received to the first chunk returned to the caller
+- peak_alloc_kib: peak memory allocated while streaming 1 response
+
+Run `python test_streaming_benchmark.py` to print the report.
+
+Catch regressions:
+- STREAMING_BENCHMARK_OUTPUT=<path> - write the results as json
+- STREAMING_BENCHMARK_BASELINE=<path> - fail if cpu_us_per_chunk regressed by more than STREAMING_BENCHMARK_TOLERANCE (default 0.25) vs. a previous output
+"""
+
+import asyncio
+import binascii
+import json
+import os
+import re
+import statistics
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+import litellm
+from litellm.llms.anthropic.chat.handler import (
+    ModelResponseIterator as AnthropicModelResponseIterator,
+)
+from litellm.llms.bedrock.chat.invoke_handler import AWSEventStreamDecoder
+from litellm.llms.vertex_ai_and_google_ai_studio.gemini.vertex_and_google_ai_studio_gemini import (
+    ModelResponseIterator as VertexModelResponseIterator,
+)
+
+PROVIDERS = ["openai", "anthropic", "bedrock", "vertex_ai", "ollama"]
+MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-sonnet-20241022",
+    "bedrock": "anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "vertex_ai": "gemini-1.5-flash-002",
+    "ollama": "llama3",
+}
+CONTENT_TYPES = {
+    "openai": "text/event-stream",
+    "anthropic": "text/event-stream",
+    "bedrock": "application/vnd.amazon.eventstream",
+    "vertex_ai": "text/event-stream",
+    "ollama": "application/x-ndjson",
+}
+MESSAGES = [{"role": "user", "content": "Tell me about the history of streaming."}]
+RESPONSE_TEXT = " ".join(
+    [
+        "Streaming responses lets a client render tokens as soon as the model produces them,"
+        " instead of waiting for the full completion. Each provider frames the stream differently:"
+        " OpenAI and Anthropic use server-sent events, Vertex AI sends server-sent events with JSON"
+        " candidates, Bedrock uses the AWS event stream binary encoding, and Ollama sends newline"
+        " delimited JSON. LiteLLM parses every format into the same OpenAI-compatible chunks, so the"
+        " cost of that translation is paid once per chunk, for every streamed response."
+    ]
+    * 4
+)
+NUM_STREAMS = int(os.getenv("STREAMING_BENCHMARK_STREAMS", "20"))
+
+
+def _get_tokens() -> List[str]:
+    return re.findall(r"\s*\S+", RESPONSE_TEXT)
+
+
+## Recorded streams - wire format of each provider's streaming api
+
+
+def _sse(data: dict, event: str = "") -> bytes:
+    prefix = "event: {}\n".format(event) if event else ""
+    return "{}data: {}\n\n".format(prefix, json.dumps(data)).encode("utf-8")
+
+
+def _record_openai_stream(tokens: List[str]) -> List[bytes]:
+    def chunk(delta: dict, finish_reason=None) -> bytes:
+        return _sse(
+            {
+                "id": "chatcmpl-benchmark",
+                "object": "chat.completion.chunk",
+                "created": 1730000000,
+                "model": MODELS["openai"],
+                "system_fingerprint": "fp_benchmark",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": delta,
+                        "logprobs": None,
+                        "finish_reason": finish_reason,
+                    }
+                ],
+            }
+        )
+
+    recording = [chunk({"role": "assistant", "content": ""})]
+    recording += [chunk({"content": token}) for token in tokens]
+    recording.append(chunk({}, finish_reason="stop"))
+    recording.append(b"data: [DONE]\n\n")
+    return recording
+
+
+def _record_anthropic_stream(tokens: List[str]) -> List[bytes]:
+    recording = [
+        _sse(
+            {
+                "type": "message_start",
+                "message": {
+                    "id": "msg_benchmark",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": MODELS["anthropic"],
+                    "content": [],
+                    "stop_reason": None,
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": 16, "output_tokens": 1},
+                },
+            },
+            event="message_start",
+        ),
+        _sse(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+            event="content_block_start",
+        ),
+    ]
+    recording += [
+        _sse(
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": token},
+            },
+            event="content_block_delta",
+        )
+        for token in tokens
+    ]
+    recording += [
+        _sse({"type": "content_block_stop", "index": 0}, event="content_block_stop"),
+        _sse(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": len(tokens)},
+            },
+            event="message_delta",
+        ),
+        _sse({"type": "message_stop"}, event="message_stop"),
+    ]
+    return recording
+
+
+def _aws_event_stream_message(event_type: str, payload: dict) -> bytes:
+    """
+    Encode 1 message in the AWS event stream format - https://docs.aws.amazon.com/transcribe/latest/dg/streaming-setting-up.html#streaming-event-stream
+    """
+    headers = b""
+    for name, value in (
+        (":event-type", event_type),
+        (":content-type", "application/json"),
+        (":message-type", "event"),
+    ):
+        encoded_name, encoded_value = name.encode("utf-8"), value.encode("utf-8")
+        headers += (
+            struct.pack("!B", len(encoded_name))
+            + encoded_name
+            + struct.pack("!BH", 7, len(encoded_value))  # 7 = string
+            + encoded_value
+        )
+    body = json.dumps(payload).encode("utf-8")
+    total_length = 12 + len(headers) + len(body) + 4
+    prelude = struct.pack("!II", total_length, len(headers))
+    prelude += struct.pack("!I", binascii.crc32(prelude) & 0xFFFFFFFF)
+    message = prelude + headers + body
+    return message + struct.pack("!I", binascii.crc32(message) & 0xFFFFFFFF)
+
+
+def _record_bedrock_stream(tokens: List[str]) -> List[bytes]:
+    recording = [_aws_event_stream_message("messageStart", {"role": "assistant"})]
+    recording += [
+        _aws_event_stream_message(
+            "contentBlockDelta", {"contentBlockIndex": 0, "delta": {"text": token}}
+        )
+        for token in tokens
+    ]
+    recording += [
+        _aws_event_stream_message("contentBlockStop", {"contentBlockIndex": 0}),
+        _aws_event_stream_message("messageStop", {"stopReason": "end_turn"}),
+        _aws_event_stream_message(
+            "metadata",
+            {
+                "usage": {
+                    "inputTokens": 16,
+                    "outputTokens": len(tokens),
+                    "totalTokens": 16 + len(tokens),
+                },
+                "metrics": {"latencyMs": 1000},
+            },
+        ),
+    ]
+    return recording
+
+
+def _record_vertex_ai_stream(tokens: List[str]) -> List[bytes]:
+    recording = []
+    for i, token in enumerate(tokens):
+        candidate: dict = {"content": {"role": "model", "parts": [{"text": token}]}}
+        data: dict = {"candidates": [candidate], "modelVersion": MODELS["vertex_ai"]}
+        if i == len(tokens) - 1:
+            candidate["finishReason"] = "STOP"
+            data["usageMetadata"] = {
+                "promptTokenCount": 16,
+                "candidatesTokenCount": len(tokens),
+                "totalTokenCount": 16 + len(tokens),
+            }
+        recording.append("data: {}\r\n\r\n".format(json.dumps(data)).encode("utf-8"))
+    return recording
+
+
+def _record_ollama_stream(tokens: List[str]) -> List[bytes]:
+    def line(data: dict) -> bytes:
+        return (json.dumps(data) + "\n").encode("utf-8")
+
+    recording = [
+        line(
+            {
+                "model": MODELS["ollama"],
+                "created_at": "2024-11-01T00:00:00.000000Z",
+                "response": token,
+                "done": False,
+            }
+        )
+        for token in tokens
+    ]
+    recording.append(
+        line(
+            {
+                "model": MODELS["ollama"],
+                "created_at": "2024-11-01T00:00:01.000000Z",
+                "response": "",
+                "done": True,
+                "done_reason": "stop",
+                "prompt_eval_count": 16,
+                "eval_count": len(tokens),
+            }
+        )
+    )
+    return recording
+
+
+RECORDINGS: Dict[str, List[bytes]] = {
+    "openai": _record_openai_stream(_get_tokens()),
+    "anthropic": _record_anthropic_stream(_get_tokens()),
+    "bedrock": _record_bedrock_stream(_get_tokens()),
+    "vertex_ai": _record_vertex_ai_stream(_get_tokens()),
+    "ollama": _record_ollama_stream(_get_tokens()),
+}
+
+
+## Local mock server
+
+
+class _MockProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        provider = (
+            "openai"
+            if self.path.endswith("/chat/completions")
+            else self.path.strip("/")
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES[provider])
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in RECORDINGS[provider]:  # 1 write per event - like a live stream
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server() -> Tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockProviderHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:{}".format(server.server_address[1])
+
+
+## Benchmark
+
+
+class _ChunkTimer:
+    """
+    Wraps the raw response stream - records when the first chunk was received.
+    """
+
+    def __init__(self, stream):
+        self.iterator = stream.__aiter__()
+        self.first_chunk_time = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunk = await self.iterator.__anext__()
+        if self.first_chunk_time is None:
+            self.first_chunk_time = time.perf_counter()
+        return chunk
+
+
+async def _open_stream(
+    provider: str,
+    base_url: str,
+    http_client: httpx.AsyncClient,
+    openai_client: AsyncOpenAI,
+) -> Tuple[_ChunkTimer, object, httpx.Response]:
+    """
+    Returns the raw stream timer, the provider's parsed stream (what litellm passes to `CustomStreamWrapper`), and the response to close.
+    """
+    if provider == "openai":
+        openai_stream = await openai_client.chat.completions.create(
+            model=MODELS[provider], messages=MESSAGES, stream=True  # type: ignore
+        )
+        timer = _ChunkTimer(openai_stream)
+        return timer, timer, openai_stream.response
+
+    request = http_client.build_request(
+        "POST",
+        "{}/{}".format(base_url, provider),
+        json={"model": MODELS[provider], "messages": MESSAGES, "stream": True},
+    )
+    response = await http_client.send(request, stream=True)
+    if provider == "bedrock":
+        timer = _ChunkTimer(response.aiter_bytes(chunk_size=1024))
+        return (
+            timer,
+            AWSEventStreamDecoder(model=MODELS[provider]).aiter_bytes(timer),
+            response,
+        )
+    timer = _ChunkTimer(response.aiter_lines())
+    if provider == "anthropic":
+        return (
+            timer,
+            AnthropicModelResponseIterator(streaming_response=timer, sync_stream=False),
+            response,
+        )
+    if provider == "vertex_ai":
+        return (
+            timer,
+            VertexModelResponseIterator(streaming_response=timer, sync_stream=False),
+            response,
+        )
+    return timer, timer, response
+
+
+def _get_stream_wrapper(
+    provider: str, completion_stream
+) -> litellm.CustomStreamWrapper:
+    return litellm.CustomStreamWrapper(
+        completion_stream=completion_stream,
+        model=MODELS[provider],
+        custom_llm_provider=provider,
+        logging_obj=litellm.Logging(
+            model=MODELS[provider],
+            messages=MESSAGES,
+            stream=True,
+            call_type="acompletion",
+            start_time=time.time(),
+            litellm_call_id="streaming-benchmark",
+            function_id="streaming-benchmark",
+        ),
+    )
+
+
+async def _consume_stream(
+    provider: str,
+    base_url: str,
+    http_client: httpx.AsyncClient,
+    openai_client: AsyncOpenAI,
+    use_stream_wrapper: bool,
+) -> dict:
+    timer, completion_stream, response = await _open_stream(
+        provider=provider,
+        base_url=base_url,
+        http_client=http_client,
+        openai_client=openai_client,
+    )
+    content = ""
+    first_output_time = None
+    start_cpu_time = time.thread_time()
+    if use_stream_wrapper:
+        async for chunk in _get_stream_wrapper(provider, completion_stream):
+            if first_output_time is None:
+                first_output_time = time.perf_counter()
+            content += chunk.choices[0].delta.content or ""  # type: ignore
+    else:
+        async for _ in completion_stream:  # type: ignore
+            pass
+    cpu_time = time.thread_time() - start_cpu_time
+    await response.aclose()
+    return {
+        "cpu_time": cpu_time,
+        "ttft_overhead": (
+            first_output_time - timer.first_chunk_time
+            if first_output_time is not None and timer.first_chunk_time is not None
+            else None
+        ),
+        "content": content,
+    }
+
+
+async def run_streaming_benchmark(
+    provider: str, base_url: str, num_streams: int = NUM_STREAMS
+) -> dict:
+    litellm.callbacks = []
+    litellm.success_callback = []
+    litellm._async_success_callback = []
+    async with httpx.AsyncClient() as http_client:
+        openai_client = AsyncOpenAI(
+            api_key="sk-benchmark", base_url=base_url, http_client=http_client
+        )
+        kwargs = dict(
+            provider=provider,
+            base_url=base_url,
+            http_client=http_client,
+            openai_client=openai_client,
+        )
+        # warm up - imports, first-call caches
+        await _consume_stream(use_stream_wrapper=True, **kwargs)  # type: ignore
+
+        raw_runs = [
+            await _consume_stream(use_stream_wrapper=False, **kwargs)  # type: ignore
+            for _ in range(num_streams)
+        ]
+        wrapper_runs = [
+            await _consume_stream(use_stream_wrapper=True, **kwargs)  # type: ignore
+            for _ in range(num_streams)
+        ]
+
+        tracemalloc.start()
+        try:
+            await _consume_stream(use_stream_wrapper=True, **kwargs)  # type: ignore
+            _, peak_alloc = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    # normalized per recorded event - comparable across providers, independent of how the bytes were split
+    num_chunks = len(RECORDINGS[provider]) * num_streams
+    cpu_time = sum(run["cpu_time"] for run in wrapper_runs)
+    raw_cpu_time = sum(run["cpu_time"] for run in raw_runs)
+    return {
+        "num_chunks_per_stream": len(RECORDINGS[provider]),
+        "cpu_us_per_chunk": cpu_time / num_chunks * 1e6,
+        "wrapper_cpu_us_per_chunk": (cpu_time - raw_cpu_time) / num_chunks * 1e6,
+        "chunks_per_cpu_second": num_chunks / cpu_time,
+        "ttft_overhead_ms": statistics.median(
+            run["ttft_overhead"] * 1e3 for run in wrapper_runs
+        ),
+        "peak_alloc_kib": peak_alloc / 1024,
+        "content": wrapper_runs[0]["content"],
+    }
+
+
+def _check_regression(provider: str, result: dict):
+    baseline_path = os.getenv("STREAMING_BENCHMARK_BASELINE")
+    if baseline_path is None:
+        return
+    with open(baseline_path) as f:
+        baseline = json.load(f).get(provider)
+    if baseline is None:
+        return
+    tolerance = float(os.getenv("STREAMING_BENCHMARK_TOLERANCE", "0.25"))
+    assert result["cpu_us_per_chunk"] <= baseline["cpu_us_per_chunk"] * (
+        1 + tolerance
+    ), "{} streaming regressed: {:.1f}us/chunk, baseline {:.1f}us/chunk".format(
+        provider, result["cpu_us_per_chunk"], baseline["cpu_us_per_chunk"]
+    )
+
+
+def _write_output(provider: str, result: dict):
+    output_path = os.getenv("STREAMING_BENCHMARK_OUTPUT")
+    if output_path is None:
+        return
+    results = {}
+    if os.path.exists(output_path):
+        with open(output_path) as f:
+            results = json.load(f)
+    results[provider] = {k: v for k, v in result.items() if k != "content"}
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def _format_result(provider: str, result: dict) -> str:
+    return "{:<10} {:>7} {:>12.1f} {:>12.1f} {:>14.0f} {:>10.3f} {:>10.1f}".format(
+        provider,
+        result["num_chunks_per_stream"],
+        result["cpu_us_per_chunk"],
+        result["wrapper_cpu_us_per_chunk"],
+        result["chunks_per_cpu_second"],
+        result["ttft_overhead_ms"],
+        result["peak_alloc_kib"],
+    )
+
+
+REPORT_HEADER = "{:<10} {:>7} {:>12} {:>12} {:>14} {:>10} {:>10}".format(
+    "provider",
+    "chunks",
+    "cpu_us/chunk",
+    "wrapper_us",
+    "chunks/cpu_s",
+    "ttft_ms",
+    "peak_kib",
+)
+
+
+@pytest.fixture(scope="module")
+def mock_server_url():
+    server, base_url = start_mock_server()
+    yield base_url
+    server.shutdown()
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_streaming_benchmark(provider, mock_server_url):
+    result = asyncio.run(run_streaming_benchmark(provider, base_url=mock_server_url))
+    print("\n" + REPORT_HEADER + "\n" + _format_result(provider, result))
+
+    assert result["content"] == RESPONSE_TEXT
+    assert result["num_chunks_per_stream"] > 0
+    _write_output(provider, result)
+    _check_regression(provider, result)
+
+
+if __name__ == "__main__":
+    server, base_url = start_mock_server()
+    print(REPORT_HEADER)
+    for provider in PROVIDERS:
+        print(
+            _format_result(
+                provider, asyncio.run(run_streaming_benchmark(provider, base_url))
+            )
+        )
+    server.shutdown()
@@ -31,6 +31,7 @@ async def test_basic_s3_logging(sync_mode, streaming):
         "s3_aws_secret_access_key": "os.environ/AWS_SECRET_ACCESS_KEY",
         "s3_aws_access_key_id": "os.environ/AWS_ACCESS_KEY_ID",
         "s3_region_name": "us-west-2",
+        "s3_flush_interval": 1,
     }
     litellm.set_verbose = True
     response_id = None
@@ -341,3 +341,139 @@ def test_combine_cached_embedding_response_multiple_missing_values():
     assert result.data[1].embedding == [0.4, 0.5, 0.6]
     assert result.data[2].embedding == [0.4, 0.5, 0.6]
     assert result.data[3].embedding == [0.7, 0.8, 0.9]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_requests():
+    """
+    Concurrent identical requests -> 1 LLM API call, the rest are served as cache hits
+    """
+    litellm.cache = Cache(type=LiteLLMCacheType.LOCAL, single_flight=True)
+    messages = [{"role": "user", "content": "single flight {}".format(uuid.uuid4())}]
+    try:
+        with patch(
+            "litellm.main.mock_completion", wraps=litellm.main.mock_completion
+        ) as mock_completion:
+            responses = await asyncio.gather(
+                *[
+                    litellm.acompletion(
+                        model="gpt-4o",
+                        messages=messages,
+                        mock_response="Hello world",
+                        mock_delay=0.3,
+                    )
+                    for _ in range(10)
+                ]
+            )
+
+        assert mock_completion.call_count == 1
+        assert len({id(response) for response in responses}) == 10
+        assert (
+            sum(
+                response._hidden_params.get("cache_hit") is True
+                for response in responses
+            )
+            == 9
+        )
+        for response in responses:
+            assert response.choices[0].message.content == "Hello world"
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_single_flight_leader_failure():
+    """
+    If the in-flight request fails, waiting requests make their own call
+    """
+    litellm.cache = Cache(type=LiteLLMCacheType.LOCAL, single_flight=True)
+    messages = [{"role": "user", "content": "single flight {}".format(uuid.uuid4())}]
+    original_mock_completion = litellm.main.mock_completion
+    num_calls = 0
+
+    def _mock_completion(*args, **kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 1:
+            time.sleep(0.3)
+            raise ValueError("leader failed")
+        return original_mock_completion(*args, **kwargs)
+
+    try:
+        with patch("litellm.main.mock_completion", side_effect=_mock_completion):
+            responses = await asyncio.gather(
+                *[
+                    litellm.acompletion(
+                        model="gpt-4o", messages=messages, mock_response="Hello world"
+                    )
+                    for _ in range(3)
+                ],
+                return_exceptions=True,
+            )
+
+        assert num_calls == 3
+        assert sum(isinstance(response, Exception) for response in responses) == 1
+        assert litellm.cache.single_flight._in_flight == {}
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_single_flight_leader_cancelled():
+    """
+    If the in-flight request is cancelled, waiting requests make their own call - without waiting for `single_flight_timeout`
+    """
+    litellm.cache = Cache(
+        type=LiteLLMCacheType.LOCAL, single_flight=True, single_flight_timeout=30
+    )
+    messages = [{"role": "user", "content": "single flight {}".format(uuid.uuid4())}]
+    try:
+        with patch(
+            "litellm.main.mock_completion", wraps=litellm.main.mock_completion
+        ) as mock_completion:
+            leader = asyncio.create_task(
+                litellm.acompletion(
+                    model="gpt-4o",
+                    messages=messages,
+                    mock_response="Hello world",
+                    mock_delay=5,
+                )
+            )
+            await asyncio.sleep(0.1)
+            assert len(litellm.cache.single_flight._in_flight) == 1
+            waiter = asyncio.create_task(
+                litellm.acompletion(
+                    model="gpt-4o", messages=messages, mock_response="Hello world"
+                )
+            )
+            await asyncio.sleep(0.1)
+
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+
+            response = await asyncio.wait_for(waiter, timeout=5)
+
+        assert response.choices[0].message.content == "Hello world"
+        assert response._hidden_params.get("cache_hit") is not True
+        assert mock_completion.call_count == 2
+        assert litellm.cache.single_flight._in_flight == {}
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_single_flight_abandoned_leader():
+    from litellm.caching.single_flight import SingleFlight
+
+    single_flight = SingleFlight(timeout=0.1)
+    assert single_flight.join(key="key") is None  # leader, never releases
+
+    future = single_flight.join(key="key")
+    assert future is not None
+    assert await single_flight.wait(future) is None  # times out
+
+    await asyncio.sleep(0.1)
+    assert single_flight.join(key="key") is None  # new leader
+    single_flight.release(key="key", result={"hello": "world"})
+    assert single_flight.is_in_flight(key="key") is False
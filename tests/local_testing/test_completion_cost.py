@@ -13,6 +13,7 @@ import time
 from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 import base64
+import math
 import pytest
 
 import litellm
@@ -2634,3 +2635,91 @@ def test_completion_cost_azure_ai_meta():
     cost = completion_cost(model_response, custom_llm_provider="azure_ai")
 
     assert cost > 0
+
+
+def test_bulk_cost_per_token_matches_cost_per_token():
+    os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+
+    models = [
+        "gpt-4o",
+        "claude-3-5-sonnet-20240620",
+        "gemini/gemini-1.5-pro",
+        "bedrock/anthropic.claude-3-sonnet-20240229-v1:0",
+    ]
+    prompt_tokens = [1000, 2000, 200000, 100]  # gemini prompt priced above 128k
+    completion_tokens = [100, 50, 10, 5]
+
+    prompt_cost, completion_cost = litellm.bulk_cost_per_token(
+        model=models,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+    )
+    for i, model in enumerate(models):
+        expected_prompt_cost, expected_completion_cost = cost_per_token(
+            model=model,
+            prompt_tokens=prompt_tokens[i],
+            completion_tokens=completion_tokens[i],
+        )
+        assert prompt_cost[i] == pytest.approx(expected_prompt_cost)
+        assert completion_cost[i] == pytest.approx(expected_completion_cost)
+
+
+def test_bulk_cost_per_token_cached_tokens_and_aliases():
+    os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+
+    prompt_cost, completion_cost = litellm.bulk_cost_per_token(
+        model=[
+            "gpt-4o",
+            "ft:gpt-3.5-turbo:my-org:custom_suffix:id",
+            "gpt-35-turbo",
+            "unknown-model",
+        ],
+        prompt_tokens=[1000, 10, 10, 10],
+        completion_tokens=[0, 10, 10, 10],
+        cache_read_input_tokens=[400, 0, 0, 0],
+    )
+    gpt_4o_info = litellm.model_cost["gpt-4o"]
+    assert prompt_cost[0] == pytest.approx(
+        600 * gpt_4o_info["input_cost_per_token"]
+        + 400 * gpt_4o_info["cache_read_input_token_cost"]
+    )
+    assert prompt_cost[1] == pytest.approx(
+        10 * litellm.model_cost["ft:gpt-3.5-turbo"]["input_cost_per_token"]
+    )
+    assert completion_cost[2] == pytest.approx(
+        10 * litellm.model_cost["azure/gpt-35-turbo"]["output_cost_per_token"]
+    )
+    assert math.isnan(prompt_cost[3]) and math.isnan(completion_cost[3])
+
+
+def test_model_cost_table_recompiled_on_register_model():
+    from litellm.litellm_core_utils.llm_cost_calc.cost_table import (
+        GLOBAL_MODEL_COST_TABLE,
+    )
+
+    os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+
+    assert GLOBAL_MODEL_COST_TABLE.resolve_model("my-bulk-cost-model") is None
+    litellm.register_model(
+        {
+            "my-bulk-cost-model": {
+                "input_cost_per_token": 1,
+                "output_cost_per_token": 2,
+                "litellm_provider": "openai",
+            }
+        }
+    )
+    assert GLOBAL_MODEL_COST_TABLE.get_pricing("my-bulk-cost-model") == {
+        "input_cost_per_token": 1.0,
+        "output_cost_per_token": 2.0,
+    }
+
+    # existing model, updated in place
+    litellm.register_model({"my-bulk-cost-model": {"input_cost_per_token": 3}})
+    prompt_cost, _ = litellm.bulk_cost_per_token(
+        model=["my-bulk-cost-model"], prompt_tokens=[10], completion_tokens=[0]
+    )
+    assert prompt_cost[0] == 30
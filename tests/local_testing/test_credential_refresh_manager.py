@@ -0,0 +1,182 @@
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.secret_managers.credential_refresh_manager import (
+    CredentialRefreshManager,
+    get_expiry_timestamp,
+)
+
+
+def _get_refresh_fn(ttl: float = 3600, delay: float = 0):
+    calls = []
+
+    def _refresh(current):
+        calls.append(current)
+        time.sleep(delay)
+        return "token-{}".format(len(calls)), time.time() + ttl
+
+    return _refresh, calls
+
+
+def test_credential_is_cached_until_expiry():
+    manager = CredentialRefreshManager()
+    refresh_fn, calls = _get_refresh_fn()
+
+    assert manager.get_credential(key="key", refresh_fn=refresh_fn) == "token-1"
+    assert manager.get_credential(key="key", refresh_fn=refresh_fn) == "token-1"
+    assert calls == [None]
+
+    # expired - refreshed inline, from the current value
+    manager._credentials["key"].expires_at = time.time()
+    assert manager.get_credential(key="key", refresh_fn=refresh_fn) == "token-2"
+    assert calls == [None, "token-1"]
+
+
+def test_concurrent_requests_refresh_once():
+    manager = CredentialRefreshManager()
+    refresh_fn, calls = _get_refresh_fn(delay=0.1)
+    results = []
+
+    def _get_credential():
+        results.append(manager.get_credential(key="key", refresh_fn=refresh_fn))
+
+    threads = [threading.Thread(target=_get_credential) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["token-1"] * 10
+
+
+def test_expiring_credentials_refreshed_in_the_background():
+    manager = CredentialRefreshManager(refresh_ahead_seconds=300)
+    refresh_fn, calls = _get_refresh_fn(ttl=3600)
+    manager.get_credential(key="key", refresh_fn=refresh_fn)
+    manager.get_credential(key="other-key", refresh_fn=refresh_fn)
+
+    manager._credentials["key"].expires_at = time.time() + 200
+    manager.refresh_expiring_credentials()
+    assert calls == [None, None, "token-1"]
+
+    # requests read the refreshed credential, without refreshing it
+    assert manager.get_credential(key="key", refresh_fn=refresh_fn) == "token-3"
+    assert len(calls) == 3
+
+
+def test_idle_credentials_are_dropped():
+    manager = CredentialRefreshManager(idle_timeout_seconds=60)
+    refresh_fn, calls = _get_refresh_fn()
+    manager.get_credential(key="key", refresh_fn=refresh_fn)
+
+    manager._credentials["key"].last_used_at = time.time() - 120
+    manager._credentials["key"].expires_at = time.time() + 100
+    manager.refresh_expiring_credentials()
+    assert "key" not in manager._credentials
+    assert len(calls) == 1
+
+
+def test_unknown_expiry_is_cached_for_a_fixed_interval():
+    from litellm.secret_managers.credential_refresh_manager import (
+        CREDENTIAL_UNKNOWN_EXPIRY_CACHE_SECONDS,
+    )
+
+    manager = CredentialRefreshManager()
+    refresh_fn = MagicMock(side_effect=lambda current: ("token", None))
+
+    assert manager.get_credential(key="key", refresh_fn=refresh_fn) == "token"
+    assert manager.get_credential(key="key", refresh_fn=refresh_fn) == "token"
+    assert refresh_fn.call_count == 1
+
+    # not refreshed in the background
+    credential = manager._credentials["key"]
+    credential.expires_at = time.time() + 1
+    manager.refresh_expiring_credentials()
+    assert refresh_fn.call_count == 1
+
+    # refreshed inline, once the interval passed
+    credential.expires_at = time.time() - 1
+    assert manager.get_credential(key="key", refresh_fn=refresh_fn) == "token"
+    assert refresh_fn.call_count == 2
+    assert credential.expires_at == pytest.approx(
+        time.time() + CREDENTIAL_UNKNOWN_EXPIRY_CACHE_SECONDS, abs=5
+    )
+
+
+def test_get_expiry_timestamp():
+    expiry = datetime(2024, 1, 1, 12, 0, 0)
+    # naive datetimes are utc - like google-auth credentials
+    assert get_expiry_timestamp(expiry) == get_expiry_timestamp(
+        expiry.replace(tzinfo=timezone.utc)
+    )
+    assert get_expiry_timestamp(None) is None
+
+
+@pytest.mark.parametrize(
+    "expiry",
+    [datetime.utcnow() + timedelta(hours=1), None],
+    ids=["expiry", "no_expiry"],
+)
+def test_vertex_credentials_loaded_once(expiry):
+    from litellm.llms.vertex_ai_and_google_ai_studio.vertex_llm_base import (
+        VertexBase,
+    )
+    from litellm.secret_managers.credential_refresh_manager import (
+        credential_refresh_manager,
+    )
+
+    credential_refresh_manager.clear()
+    creds = MagicMock()
+    creds.token = "vertex-token"
+    creds.expiry = expiry
+    vertex_base = VertexBase()
+    with patch.object(
+        vertex_base, "load_auth", return_value=(creds, "my-project")
+    ) as mock_load_auth, patch.object(vertex_base, "refresh_auth") as mock_refresh:
+        for _ in range(3):
+            token, project_id = vertex_base._ensure_access_token(
+                credentials='{"type": "service_account"}',
+                project_id=None,
+                custom_llm_provider="vertex_ai",
+            )
+            assert token == "vertex-token"
+            assert project_id == "my-project"
+    mock_load_auth.assert_called_once()
+    mock_refresh.assert_not_called()
+
+
+def test_azure_ad_token_cached_until_expiry():
+    from litellm.secret_managers.credential_refresh_manager import (
+        credential_refresh_manager,
+    )
+    from litellm.secret_managers.get_azure_ad_token_provider import (
+        get_managed_azure_ad_token_provider,
+    )
+
+    credential_refresh_manager.clear()
+    payload = base64.urlsafe_b64encode(
+        json.dumps({"exp": int(time.time()) + 3600}).encode()
+    ).decode()
+    jwt = "header.{}.signature".format(payload.rstrip("="))
+    bearer_token_provider = MagicMock(return_value=jwt)
+
+    token_provider = get_managed_azure_ad_token_provider(
+        token_provider=bearer_token_provider,
+        tenant_id="tenant",
+        client_id="client",
+        client_secret="secret",
+    )
+    assert token_provider() == jwt
+    assert token_provider() == jwt
+    bearer_token_provider.assert_called_once()
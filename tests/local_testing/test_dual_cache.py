@@ -245,3 +245,42 @@ async def test_dual_cache_delete(is_async):
         result = dual_cache.get_cache(test_key)
 
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_increment_cache_pipeline():
+    """Test all counters are incremented in 1 redis call, and ttl is only set if the key has none"""
+    in_memory = InMemoryCache()
+    redis_cache = RedisCache(host=os.getenv("REDIS_HOST"), port=os.getenv("REDIS_PORT"))
+    dual_cache = DualCache(in_memory_cache=in_memory, redis_cache=redis_cache)
+
+    tpm_key = f"tpm_{str(uuid.uuid4())}"
+    rpm_key = f"rpm_{str(uuid.uuid4())}"
+
+    results = await dual_cache.async_increment_cache_pipeline(
+        increment_list=[
+            {"key": tpm_key, "increment_value": 100, "ttl": 60},
+            {"key": rpm_key, "increment_value": 1, "ttl": 60},
+        ]
+    )
+    assert results == [100, 1]
+    assert in_memory.get_cache(tpm_key) == 100
+
+    results = await dual_cache.async_increment_cache_pipeline(
+        increment_list=[
+            {"key": tpm_key, "increment_value": 50, "ttl": 600},
+            {"key": rpm_key, "increment_value": 1, "ttl": 600},
+        ]
+    )
+    assert results == [150, 2]
+
+    # existing ttl is not reset
+    assert 0 < redis_cache.redis_client.ttl(tpm_key) <= 60
+
+    with patch.object(redis_cache, "async_increment_multi") as mock_redis_increment:
+        results = await dual_cache.async_increment_cache_pipeline(
+            increment_list=[{"key": tpm_key, "increment_value": 1, "ttl": 60}],
+            local_only=True,
+        )
+        assert results == [151]
+        mock_redis_increment.assert_not_called()
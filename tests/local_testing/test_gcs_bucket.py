@@ -683,3 +683,109 @@ async def test_basic_gcs_logger_with_folder_in_bucket_name():
     # clean up
     if old_bucket_name is not None:
         os.environ["GCS_BUCKET_NAME"] = old_bucket_name
+
+
+def _get_mock_gcs_logger(monkeypatch, **env) -> GCSBucketLogger:
+    from unittest.mock import AsyncMock, MagicMock
+
+    import litellm.proxy.proxy_server
+
+    monkeypatch.setattr(litellm.proxy.proxy_server, "premium_user", True)
+    monkeypatch.setenv("GCS_BUCKET_NAME", "default-bucket")
+    monkeypatch.delenv("GCS_PATH_SERVICE_ACCOUNT", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    gcs_logger = GCSBucketLogger()
+    gcs_logger.get_or_create_vertex_instance = AsyncMock(return_value=MagicMock())
+    gcs_logger.construct_request_headers = AsyncMock(
+        return_value={"Authorization": "Bearer token"}
+    )
+    gcs_logger.async_httpx_client = MagicMock()
+    gcs_logger.async_httpx_client.post = AsyncMock(
+        return_value=MagicMock(status_code=200)
+    )
+    return gcs_logger
+
+
+def _queue_gcs_logs(gcs_logger: GCSBucketLogger, bucket_names: list):
+    for i, bucket_name in enumerate(bucket_names):
+        kwargs = {}
+        if bucket_name is not None:
+            kwargs["standard_callback_dynamic_params"] = StandardCallbackDynamicParams(
+                gcs_bucket_name=bucket_name
+            )
+        gcs_logger.log_queue.append(
+            {
+                "payload": {"id": "log-{}".format(i)},
+                "kwargs": kwargs,
+                "response_obj": {"id": "log-{}".format(i)},
+            }
+        )
+
+
+@pytest.mark.asyncio
+async def test_gcs_logger_resolves_headers_once_per_bucket(monkeypatch):
+    gcs_logger = _get_mock_gcs_logger(monkeypatch)
+    _queue_gcs_logs(gcs_logger, [None, "team-bucket", None, "team-bucket", None])
+
+    await gcs_logger.flush_queue()
+
+    assert gcs_logger.construct_request_headers.call_count == 2
+    urls = [
+        call.kwargs["url"] for call in gcs_logger.async_httpx_client.post.call_args_list
+    ]
+    assert len(urls) == 5
+    assert sum("/b/default-bucket/" in url for url in urls) == 3
+    assert sum("/b/team-bucket/" in url for url in urls) == 2
+    assert gcs_logger.log_queue == []
+
+
+@pytest.mark.asyncio
+async def test_gcs_logger_bulk_upload(monkeypatch):
+    import gzip
+
+    gcs_logger = _get_mock_gcs_logger(
+        monkeypatch, GCS_BULK_UPLOAD="true", GCS_BULK_UPLOAD_GZIP="true"
+    )
+    _queue_gcs_logs(gcs_logger, [None, "team-bucket", None])
+
+    await gcs_logger.flush_queue()
+
+    post_calls = gcs_logger.async_httpx_client.post.call_args_list
+    assert len(post_calls) == 2
+    uploads = {
+        call.kwargs["url"].split("/b/")[1].split("/")[0]: call.kwargs
+        for call in post_calls
+    }
+    default_upload = uploads["default-bucket"]
+    assert default_upload["url"].endswith(".ndjson.gz")
+    assert default_upload["headers"]["Content-Type"] == "application/gzip"
+    lines = gzip.decompress(default_upload["data"]).decode("utf-8").split("\n")
+    assert [json.loads(line)["id"] for line in lines] == ["log-0", "log-2"]
+
+
+@pytest.mark.asyncio
+async def test_gcs_logger_uploads_are_concurrent_and_bounded(monkeypatch):
+    gcs_logger = _get_mock_gcs_logger(monkeypatch, GCS_MAX_CONCURRENT_UPLOADS="3")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _post(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "log-1" in kwargs["url"]:
+            raise Exception("upload failed")
+        return None
+
+    gcs_logger.async_httpx_client.post.side_effect = _post
+    _queue_gcs_logs(gcs_logger, [None] * 10)
+
+    await gcs_logger.flush_queue()
+
+    # a failed upload doesn't stop the others
+    assert gcs_logger.async_httpx_client.post.call_count == 10
+    assert max_in_flight == 3
@@ -177,3 +177,64 @@ def test_get_llm_provider_watson_text():
     )
     assert custom_llm_provider == "watsonx_text"
     assert model == "watson-text-to-speech"
+
+
+def test_get_llm_provider_known_model_order():
+    """
+    the model -> provider map resolves models in the same order as the if / elif chain it replaced
+    """
+    from litellm.litellm_core_utils.model_registry import (
+        GLOBAL_MODEL_REGISTRY,
+        MODEL_PROVIDER_LISTS,
+    )
+
+    for provider, list_names in MODEL_PROVIDER_LISTS:
+        for list_name in list_names:
+            for model in getattr(litellm, list_name):
+                expected_provider = None
+                for _provider, _list_names in MODEL_PROVIDER_LISTS:
+                    if any(model in getattr(litellm, name) for name in _list_names):
+                        expected_provider = _provider
+                        break
+                assert GLOBAL_MODEL_REGISTRY.get_model_provider(model) == (
+                    expected_provider
+                )
+
+
+def test_get_llm_provider_memoized_invalidation(monkeypatch):
+    with pytest.raises(litellm.exceptions.BadRequestError):
+        litellm.get_llm_provider(model="my-unregistered-model")
+
+    # lists changed in place / replaced -> memoized results are dropped
+    monkeypatch.setattr(
+        litellm, "anthropic_models", litellm.anthropic_models + ["my-new-model"]
+    )
+    assert litellm.get_llm_provider(model="my-new-model")[1] == "anthropic"
+    litellm.anthropic_models.append("my-unregistered-model")
+    assert litellm.get_llm_provider(model="my-unregistered-model")[1] == "anthropic"
+
+    litellm.register_model(
+        {
+            "my-registered-model": {
+                "max_tokens": 8192,
+                "input_cost_per_token": 0.00003,
+                "output_cost_per_token": 0.00006,
+                "litellm_provider": "bedrock",
+                "mode": "chat",
+            }
+        }
+    )
+    assert litellm.get_llm_provider(model="my-registered-model")[1] == "bedrock"
+
+
+def test_get_llm_provider_env_not_memoized(monkeypatch):
+    monkeypatch.delenv("GROQ_API_BASE", raising=False)
+    assert (
+        litellm.get_llm_provider(model="groq/llama3-8b-8192")[3]
+        == "https://api.groq.com/openai/v1"
+    )
+    monkeypatch.setenv("GROQ_API_BASE", "https://my-groq-proxy.com/v1")
+    assert (
+        litellm.get_llm_provider(model="groq/llama3-8b-8192")[3]
+        == "https://my-groq-proxy.com/v1"
+    )
@@ -23,3 +23,97 @@ def test_get_backup_model_cost_map():
         print("inside backup")
         content = json.load(f)
         print("content", content)
+
+
+def _mock_model_cost_map_url(monkeypatch, model_cost: dict, etag: str):
+    """
+    Serve `model_cost` for any url, with `etag`. Returns the If-None-Match header of each request.
+    """
+    import httpx
+
+    requests = []
+
+    def _mock_get(url, timeout=None, headers=None):
+        headers = headers or {}
+        requests.append(headers.get("If-None-Match"))
+        request = httpx.Request("GET", url)
+        if headers.get("If-None-Match") == etag:
+            return httpx.Response(304, request=request)
+        return httpx.Response(
+            200, json=model_cost, headers={"etag": etag}, request=request
+        )
+
+    monkeypatch.setattr("httpx.get", _mock_get)
+    return requests
+
+
+def test_get_model_cost_map_etag_cache(monkeypatch, tmp_path):
+    from litellm.litellm_core_utils import get_model_cost_map as cost_map_utils
+
+    monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP", raising=False)
+    monkeypatch.setenv("LITELLM_MODEL_COST_MAP_CACHE_DIR", str(tmp_path))
+    model_cost = {"my-model": {"litellm_provider": "openai", "mode": "chat"}}
+    requests = _mock_model_cost_map_url(monkeypatch, model_cost, etag='"v1"')
+
+    assert litellm.get_model_cost_map(url="https://example.com/map.json") == model_cost
+    # cached copy is sent with its etag, and returned on 304 Not Modified
+    assert litellm.get_model_cost_map(url="https://example.com/map.json") == model_cost
+    assert requests == [None, '"v1"']
+
+    # fresh cache - loaded on import, without a request
+    loaded_model_cost, needs_refresh = cost_map_utils.load_model_cost_map(
+        url="https://example.com/map.json"
+    )
+    assert loaded_model_cost == model_cost
+    assert needs_refresh is False
+    assert len(requests) == 2
+
+    # no cached copy - use the backup map, and fetch the remote map in the background
+    loaded_model_cost, needs_refresh = cost_map_utils.load_model_cost_map(
+        url="https://example.com/other-map.json"
+    )
+    assert "gpt-4" in loaded_model_cost
+    assert needs_refresh is True
+
+
+def test_refresh_model_cost_map_keeps_registered_models(monkeypatch, tmp_path):
+    from litellm.litellm_core_utils import get_model_cost_map as cost_map_utils
+
+    monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP", raising=False)
+    monkeypatch.setenv("LITELLM_MODEL_COST_MAP_CACHE_DIR", str(tmp_path))
+    backup_model_cost = cost_map_utils.get_backup_model_cost_map()
+    remote_model_cost = dict(backup_model_cost)
+    remote_model_cost["gpt-4"] = dict(
+        backup_model_cost["gpt-4"], input_cost_per_token=0.1
+    )
+    remote_model_cost["gpt-4o"] = dict(
+        backup_model_cost["gpt-4o"], input_cost_per_token=0.1
+    )
+    remote_model_cost["my-new-remote-model"] = {
+        "litellm_provider": "anthropic",
+        "mode": "chat",
+    }
+    _mock_model_cost_map_url(monkeypatch, remote_model_cost, etag='"v1"')
+
+    original_model_cost = litellm.model_cost
+    loaded_model_cost, _ = cost_map_utils.load_model_cost_map(
+        url="https://example.com/map.json"
+    )
+    litellm.model_cost = loaded_model_cost
+    try:
+        litellm.register_model({"gpt-4o": {"input_cost_per_token": 0.5}})
+        assert litellm.get_model_info("gpt-4")["input_cost_per_token"] != 0.1
+        cost_map_utils._refresh_model_cost_map(
+            "https://example.com/map.json", loaded_model_cost
+        )
+
+        assert litellm.model_cost is not loaded_model_cost
+        assert litellm.model_cost["gpt-4"]["input_cost_per_token"] == 0.1
+        assert litellm.get_model_info("gpt-4")["input_cost_per_token"] == 0.1
+        # registered after import - not overwritten
+        assert litellm.model_cost["gpt-4o"]["input_cost_per_token"] == 0.5
+        assert "my-new-remote-model" in litellm.model_cost
+        assert "my-new-remote-model" in litellm.anthropic_models
+    finally:
+        litellm.model_cost = original_model_cost
+        litellm.anthropic_models.remove("my-new-remote-model")
@@ -116,3 +116,44 @@ def test_get_model_info_gemini():
         if model.startswith("gemini/") and not "gemma" in model:
             assert info.get("tpm") is not None, f"{model} does not have tpm"
             assert info.get("rpm") is not None, f"{model} does not have rpm"
+
+
+def test_get_model_info_memoized():
+    from litellm.utils import _get_cached_model_info
+
+    os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+
+    with patch.object(
+        litellm.utils, "_get_model_info", wraps=litellm.utils._get_model_info
+    ) as mock_get_model_info:
+        info = get_model_info("gpt-4o")
+        assert get_model_info("gpt-4o") == info
+        assert mock_get_model_info.call_count == 1
+
+        # callers get a copy - modifying it doesn't change the cached model info
+        info["max_tokens"] = 1
+        assert get_model_info("gpt-4o")["max_tokens"] != 1
+
+        # the shared model info is read-only
+        with pytest.raises(TypeError):
+            _get_cached_model_info("gpt-4o")["max_tokens"] = 1  # type: ignore
+
+        # unmapped models aren't cached - raise every time
+        for _ in range(2):
+            with pytest.raises(Exception):
+                get_model_info("my-unmapped-model-for-memoization")
+        assert mock_get_model_info.call_count == 3
+
+
+def test_get_model_info_invalidated_on_register_model():
+    os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+
+    max_tokens = get_model_info("gpt-4o")["max_tokens"]
+    litellm.register_model({"gpt-4o": {"max_tokens": max_tokens + 1}})
+    assert get_model_info("gpt-4o")["max_tokens"] == max_tokens + 1
+
+    # replacing the model cost map drops the cached model info
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+    assert get_model_info("gpt-4o")["max_tokens"] == max_tokens
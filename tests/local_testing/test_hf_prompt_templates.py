@@ -43,6 +43,102 @@ def test_prompt_formatting_custom_model():
         pytest.fail(f"An exception occurred: {str(e)}")
 
 
+def test_hf_chat_template_compiled_once():
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates import chat_template_cache
+    from litellm.llms.prompt_templates.factory import hf_chat_template
+
+    chat_template = "{% for message in messages %}{{ message['role'] }}: {{ message['content'] }}\n{% endfor %}"
+    chat_template_cache.chat_template_cache.clear()
+    with patch.object(
+        chat_template_cache,
+        "compile_chat_template",
+        wraps=chat_template_cache.compile_chat_template,
+    ) as mock_compile:
+        for _ in range(3):
+            prompt = hf_chat_template(
+                model="my-model",
+                messages=[{"role": "user", "content": "Hello world"}],
+                chat_template=chat_template,
+            )
+            assert prompt == "user: Hello world\n"
+    assert mock_compile.call_count == 1
+
+
+def test_hf_chat_template_without_system_message_support():
+    from litellm.llms.prompt_templates.chat_template_cache import (
+        chat_template_cache,
+        known_tokenizer_config,
+    )
+
+    compiled_template = chat_template_cache.get_compiled_template(
+        known_tokenizer_config["mistralai/Mistral-7B-Instruct-v0.1"]["tokenizer"][
+            "chat_template"
+        ]
+    )
+    assert compiled_template.supports_system_message is False
+    compiled_template = chat_template_cache.get_compiled_template(
+        known_tokenizer_config["meta-llama/Meta-Llama-3-8B-Instruct"]["tokenizer"][
+            "chat_template"
+        ]
+    )
+    assert compiled_template.supports_system_message is True
+
+
+def test_tokenizer_config_store_local_dir(tmp_path, monkeypatch):
+    import json
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates.chat_template_cache import TokenizerConfigStore
+
+    tokenizer_config = {
+        "chat_template": "{{ bos_token }}{% for message in messages %}{{ message['content'] }}{% endfor %}",
+        "bos_token": "<s>",
+        "eos_token": "</s>",
+    }
+    with open(tmp_path / "my-org--my-model--tokenizer_config.json", "w") as f:
+        json.dump(tokenizer_config, f)
+
+    monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+    store = TokenizerConfigStore(local_tokenizer_config_dir=str(tmp_path))
+    with patch.object(store, "_fetch_tokenizer_config") as mock_fetch:
+        assert store.get_tokenizer_config("my-org/my-model") == {
+            "status": "success",
+            "tokenizer": tokenizer_config,
+        }
+        # offline - not fetched from the hub, not cached
+        assert store.get_tokenizer_config("my-org/other-model") == {"status": "failure"}
+        mock_fetch.assert_not_called()
+    monkeypatch.delenv("HF_HUB_OFFLINE")
+
+    # fetched once, then served from memory
+    with patch.object(
+        store,
+        "_fetch_tokenizer_config",
+        side_effect=lambda model: {"status": "success", "tokenizer": tokenizer_config},
+    ) as mock_fetch:
+        store.get_tokenizer_config("my-org/other-model")
+        store.get_tokenizer_config("my-org/other-model")
+        assert mock_fetch.call_count == 1
+
+
+def test_tokenizer_config_store_failed_fetch_not_retried():
+    from unittest.mock import patch
+
+    from litellm.llms.prompt_templates.chat_template_cache import TokenizerConfigStore
+
+    store = TokenizerConfigStore(local_tokenizer_config_dir="")
+    with patch.object(
+        store, "_fetch_tokenizer_config", side_effect=Exception("timeout")
+    ) as mock_fetch:
+        with pytest.raises(Exception):
+            store.get_tokenizer_config("my-org/my-model")
+        # failed recently - not fetched again
+        assert store.get_tokenizer_config("my-org/my-model") == {"status": "failure"}
+        assert mock_fetch.call_count == 1
+
+
 # test_prompt_formatting_custom_model()
 # def logger_fn(user_model_dict):
 #     return
@@ -0,0 +1,140 @@
+#### What this tests ####
+#    This tests the pool of shared httpx clients, used by get_async_httpx_client / _get_httpx_client
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.llms.custom_httpx.http_client_pool import HTTPClientPool
+from litellm.llms.custom_httpx.http_handler import (
+    AsyncHTTPHandler,
+    HTTPHandler,
+    _get_httpx_client,
+    get_async_httpx_client,
+)
+
+
+def test_get_async_httpx_client_key():
+    params = {"timeout": httpx.Timeout(timeout=600.0, connect=5.0)}
+    client = get_async_httpx_client(llm_provider="anthropic", params=params)
+
+    # equal params -> same client
+    assert client is get_async_httpx_client(
+        llm_provider="anthropic",
+        params={"timeout": httpx.Timeout(timeout=600.0, connect=5.0)},
+    )
+    assert client is not get_async_httpx_client(llm_provider="bedrock", params=params)
+    assert client is not get_async_httpx_client(
+        llm_provider="anthropic", params={"timeout": 10}
+    )
+
+    # same endpoint -> same client, for any path
+    endpoint_client = get_async_httpx_client(
+        llm_provider="anthropic", api_base="https://api.anthropic.com/v1/messages"
+    )
+    assert endpoint_client is not get_async_httpx_client(llm_provider="anthropic")
+    assert endpoint_client is get_async_httpx_client(
+        llm_provider="anthropic", api_base="https://api.anthropic.com/v1/complete"
+    )
+
+
+def test_get_httpx_client_ssl_config_change():
+    client = _get_httpx_client()
+    assert isinstance(client, HTTPHandler)
+    assert client is _get_httpx_client()
+
+    original_ssl_verify = litellm.ssl_verify
+    litellm.ssl_verify = False
+    try:
+        # a change to the ssl config creates a new client
+        assert client is not _get_httpx_client()
+    finally:
+        litellm.ssl_verify = original_ssl_verify
+    assert client is _get_httpx_client()
+
+
+def test_max_connections_per_host():
+    original_limit = litellm.httpx_max_connections_per_host
+    litellm.httpx_max_connections_per_host = 10
+    try:
+        client = get_async_httpx_client(
+            llm_provider="bedrock",
+            api_base="https://bedrock-runtime.us-west-2.amazonaws.com/model/abc/invoke",
+        )
+        assert client.client._transport._pool._max_connections == 10
+
+        # clients without an endpoint are not limited
+        client = get_async_httpx_client(llm_provider="bedrock")
+        assert client.client._transport._pool._max_connections == 1000
+    finally:
+        litellm.httpx_max_connections_per_host = original_limit
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_closes_evicted_clients():
+    pool = HTTPClientPool(max_size=1)
+    client = pool.get_client(key=("a",), create_client=AsyncHTTPHandler)
+    httpx_client = client.client
+
+    pool.get_client(key=("b",), create_client=AsyncHTTPHandler)
+    metrics = pool.get_metrics()
+    assert metrics["pool_size"] == 1
+    assert metrics["evictions"] == 1
+    # still referenced by `client` - not closed yet
+    assert metrics["retired"] == 1
+    assert metrics["closed"] == 0
+
+    del client
+    metrics = pool.get_metrics()
+    assert metrics["retired"] == 0
+    assert metrics["closed"] == 1
+
+    await asyncio.sleep(0)
+    assert httpx_client.is_closed
+
+
+def test_http_client_pool_ttl():
+    pool = HTTPClientPool(max_size=10, ttl=0)
+    client = pool.get_client(key=("a",), create_client=HTTPHandler)
+    httpx_client = client.client
+    del client
+
+    pool.get_client(key=("a",), create_client=HTTPHandler)
+    metrics = pool.get_metrics()
+    assert metrics["misses"] == 2
+    assert metrics["evictions"] == 1
+    assert metrics["closed"] == 1
+    assert httpx_client.is_closed
+
+
+def test_http_client_pool_metrics():
+    pool = HTTPClientPool(max_size=10)
+    for _ in range(3):
+        pool.get_client(
+            key=("httpx_client", "openai", "https://api.openai.com"),
+            create_client=lambda: HTTPHandler(concurrent_limit=5),
+        )
+
+    metrics = pool.get_metrics()
+    assert metrics["hits"] == 2
+    assert metrics["misses"] == 1
+    assert metrics["pool_size"] == 1
+    assert metrics["clients"][0]["llm_provider"] == "openai"
+    assert metrics["clients"][0]["endpoint"] == "https://api.openai.com"
+    assert metrics["clients"][0]["max_connections"] == 5
+    assert metrics["clients"][0]["utilization"] == 0.0
+
+
+def test_http2_without_h2_installed(monkeypatch):
+    import importlib.util
+
+    monkeypatch.setattr(litellm, "http2", True)
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    client = AsyncHTTPHandler()
+    assert client.client._transport._pool._http2 is False
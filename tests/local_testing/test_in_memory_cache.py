@@ -0,0 +1,280 @@
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+from litellm.caching.in_memory_cache import InMemoryCache
+
+
+class _LegacyInMemoryCache:
+    """
+    Previous InMemoryCache implementation (full scan on eviction, json.loads on every read) - used as the benchmark baseline.
+    """
+
+    def __init__(self, max_size_in_memory=200, default_ttl=600):
+        self.max_size_in_memory = max_size_in_memory
+        self.default_ttl = default_ttl
+        self.cache_dict: dict = {}
+        self.ttl_dict: dict = {}
+
+    def evict_cache(self):
+        for key in list(self.ttl_dict.keys()):
+            if time.time() > self.ttl_dict[key]:
+                self.cache_dict.pop(key, None)
+                self.ttl_dict.pop(key, None)
+
+    def set_cache(self, key, value, **kwargs):
+        if len(self.cache_dict) >= self.max_size_in_memory:
+            self.evict_cache()
+        self.cache_dict[key] = value
+        self.ttl_dict[key] = time.time() + kwargs.get("ttl", self.default_ttl)
+
+    def get_cache(self, key, **kwargs):
+        if key in self.cache_dict:
+            if key in self.ttl_dict:
+                if time.time() > self.ttl_dict[key]:
+                    self.cache_dict.pop(key, None)
+                    return None
+            original_cached_response = self.cache_dict[key]
+            try:
+                cached_response = json.loads(original_cached_response)
+            except Exception:
+                cached_response = original_cached_response
+            return cached_response
+        return None
+
+
+def test_in_memory_cache_lru_eviction():
+    cache = InMemoryCache(max_size_in_memory=3, evict_least_recently_used=True)
+    cache.set_cache("a", 1)
+    cache.set_cache("b", 2)
+    cache.set_cache("c", 3)
+
+    assert cache.get_cache("a") == 1  # "b" is now least recently used
+    cache.set_cache("d", 4)
+
+    assert cache.get_cache("b") is None
+    assert cache.get_cache("a") == 1
+    assert cache.get_cache("c") == 3
+    assert cache.get_cache("d") == 4
+    assert len(cache.cache_dict) == 3
+    assert len(cache.ttl_dict) == 3
+    assert cache.evictions == 1
+
+
+def test_in_memory_cache_ttl_expiry():
+    cache = InMemoryCache(max_size_in_memory=2, evict_least_recently_used=True)
+    cache.set_cache("short", "value", ttl=0.01)
+    cache.set_cache("long", "value", ttl=60)
+    time.sleep(0.02)
+
+    assert cache.get_cache("short") is None
+    assert "short" not in cache.ttl_dict
+
+    # expired items are removed before any LRU eviction
+    cache.set_cache("expiring", "value", ttl=0.01)
+    time.sleep(0.02)
+    cache.set_cache("new", "value")
+    assert cache.get_cache("long") == "value"
+    assert cache.get_cache("new") == "value"
+    assert cache.evictions == 0
+    assert cache.expirations == 2
+
+
+def test_in_memory_cache_reset_ttl():
+    """
+    Re-setting a key with a longer ttl must not expire it at the old ttl
+    """
+    cache = InMemoryCache(max_size_in_memory=2)
+    cache.set_cache("key", "value", ttl=0.01)
+    cache.set_cache("key", "value", ttl=60)
+    time.sleep(0.02)
+    cache.evict_cache()
+
+    assert cache.get_cache("key") == "value"
+
+
+def test_in_memory_cache_max_size_in_bytes():
+    """
+    The byte limit is enforced without `evict_least_recently_used`
+    """
+    cache = InMemoryCache(max_size_in_memory=100, max_size_in_bytes=10)
+    cache.set_cache("a", "12345")
+    cache.set_cache("b", "12345")
+    assert cache.current_size_in_bytes == 10
+
+    cache.set_cache("c", "123")
+    assert cache.get_cache("a") is None
+    assert cache.get_cache("b") == 12345
+    assert cache.current_size_in_bytes == 8
+
+    # larger than the whole cache - not stored, nothing evicted
+    cache.set_cache("too_big", "12345678901")
+    assert cache.get_cache("too_big") is None
+    assert cache.get_cache("b") == 12345
+
+    cache.delete_cache("b")
+    assert cache.current_size_in_bytes == 3
+
+    # objects are sized by their json encoding
+    cache.set_cache("dict", {"a": 1})
+    assert cache.get_cache("c") is None
+    assert cache.current_size_in_bytes == len('{"a": 1}')
+
+    cache.flush_cache()
+    assert cache.current_size_in_bytes == 0
+
+
+def test_in_memory_cache_store_decoded_values():
+    value = json.dumps({"key": "value"})
+
+    cache = InMemoryCache()
+    cache.set_cache("json", value)
+    assert cache.cache_dict["json"] == value
+    assert cache.get_cache("json") == {"key": "value"}
+
+    decoded_cache = InMemoryCache(store_decoded_values=True)
+    decoded_cache.set_cache("json", value)
+    decoded_cache.set_cache("text", "not json")
+    assert decoded_cache.cache_dict["json"] == {"key": "value"}
+    assert decoded_cache.get_cache("json") == {"key": "value"}
+    assert decoded_cache.get_cache("text") == "not json"
+
+
+def test_in_memory_cache_stats():
+    cache = InMemoryCache(max_size_in_memory=1, evict_least_recently_used=True)
+    cache.set_cache("a", 1)
+    cache.get_cache("a")
+    cache.get_cache("missing")
+    cache.set_cache("b", 2)
+
+    assert cache.get_stats() == {
+        "size": 1,
+        "size_in_bytes": None,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+    }
+
+
+def test_in_memory_cache_dict_assignment():
+    """
+    Callers (e.g. tests) reset the cache by assigning a plain dict
+    """
+    cache = InMemoryCache(max_size_in_memory=2, evict_least_recently_used=True)
+    cache.cache_dict = {"a": 1}
+    cache.set_cache("b", 2)
+    cache.set_cache("c", 3)
+
+    assert cache.get_cache("a") is None
+    assert cache.get_cache("c") == 3
+
+
+def test_in_memory_cache_keeps_unexpired_items_by_default():
+    """
+    Without `evict_least_recently_used`, only expired items are evicted - live rate limit counters survive key churn
+    """
+    cache = InMemoryCache()  # default max_size_in_memory=200
+    cache.set_cache("counter", 1, ttl=60)
+    for i in range(300):
+        cache.set_cache("k{}".format(i), i, ttl=60)
+        cache.increment_cache("counter", 1, ttl=60)
+
+    assert len(cache.cache_dict) == 301
+    assert cache.get_cache("k0") == 0
+    assert cache.get_cache("counter") == 301
+    assert cache.evictions == 0
+
+    # expired items are still evicted once over max_size_in_memory
+    cache.set_cache("expiring", "value", ttl=0.01)
+    time.sleep(0.02)
+    cache.set_cache("new", "value")
+    assert "expiring" not in cache.cache_dict
+    assert cache.expirations == 1
+
+
+def test_dual_cache_rate_limit_counter_survives_key_churn():
+    from litellm.caching.dual_cache import DualCache
+
+    cache = DualCache()
+    cache.increment_cache(key="rpm:key-1", value=5, ttl=60)
+    for i in range(1_000):
+        cache.set_cache(key="other-key-{}".format(i), value=i, ttl=60)
+
+    assert cache.get_cache(key="rpm:key-1") == 5
+
+
+def test_in_memory_cache_expiration_heap_is_bounded():
+    cache = InMemoryCache(max_size_in_memory=10)
+    for _ in range(10_000):
+        cache.set_cache("key", "value")
+
+    assert len(cache.expiration_heap) < 200
+
+
+def _time_set_get(cache, num_keys: int, num_ops: int, value) -> float:
+    for i in range(num_keys):
+        cache.set_cache("key-{}".format(i), value)
+    start_time = time.perf_counter()
+    for i in range(num_ops):
+        cache.set_cache("new-key-{}".format(i), value)
+        cache.get_cache("key-{}".format(i % num_keys))
+    return time.perf_counter() - start_time
+
+
+@pytest.mark.parametrize("num_keys", [1_000, 10_000])
+def test_in_memory_cache_benchmark_at_capacity(num_keys):
+    """
+    Writes to a full cache should not scan every key.
+    """
+    num_ops = 2_000
+    value = json.dumps({"id": "chatcmpl-123", "choices": [{"text": "hello"}] * 5})
+
+    legacy_time = _time_set_get(
+        _LegacyInMemoryCache(max_size_in_memory=num_keys),
+        num_keys=num_keys,
+        num_ops=num_ops,
+        value=value,
+    )
+    new_time = _time_set_get(
+        InMemoryCache(max_size_in_memory=num_keys),
+        num_keys=num_keys,
+        num_ops=num_ops,
+        value=value,
+    )
+    print(
+        "{} keys, {} set+get ops: legacy={:.1f}ms, lru={:.1f}ms".format(
+            num_keys, num_ops, legacy_time * 1e3, new_time * 1e3
+        )
+    )
+    assert new_time < legacy_time
+
+
+def test_in_memory_cache_benchmark_decoded_reads():
+    num_ops = 10_000
+    value = json.dumps({"id": "chatcmpl-123", "choices": [{"text": "hello"}] * 20})
+
+    caches = {
+        "legacy": _LegacyInMemoryCache(),
+        "decoded": InMemoryCache(store_decoded_values=True),
+    }
+    timings = {}
+    for name, cache in caches.items():
+        cache.set_cache("key", value)
+        start_time = time.perf_counter()
+        for _ in range(num_ops):
+            cache.get_cache("key")
+        timings[name] = time.perf_counter() - start_time
+
+    print(
+        "{} cache hits: legacy={:.1f}ms, decoded={:.1f}ms".format(
+            num_ops, timings["legacy"] * 1e3, timings["decoded"] * 1e3
+        )
+    )
+    assert timings["decoded"] < timings["legacy"]
@@ -0,0 +1,215 @@
+#### What this tests ####
+#    This tests the bounded worker pool running sync logging callbacks
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.logging_worker import (
+    GLOBAL_LOGGING_WORKER,
+    LoggingWorker,
+)
+
+
+def _block_worker(worker: LoggingWorker) -> threading.Event:
+    """
+    Occupy the (single) worker until the returned event is set.
+    """
+    started = threading.Event()
+    release = threading.Event()
+
+    def _wait():
+        started.set()
+        release.wait(timeout=10)
+
+    worker.submit(_wait)
+    assert started.wait(timeout=5)
+    return release
+
+
+def test_logging_worker_runs_callbacks():
+    worker = LoggingWorker(max_workers=2, max_queue_size=100)
+    thread_names = []
+    results = []
+
+    def _callback(value, multiplier=1):
+        thread_names.append(threading.current_thread().name)
+        results.append(value * multiplier)
+
+    for i in range(10):
+        assert worker.submit(_callback, i, multiplier=2) is True
+
+    assert worker.flush(timeout=5) is True
+    assert sorted(results) == [i * 2 for i in range(10)]
+    assert all(name.startswith("litellm-logging-worker-") for name in thread_names)
+
+    metrics = worker.get_metrics()
+    assert metrics["workers"] == 2
+    assert metrics["submitted"] == 10
+    assert metrics["processed"] == 10
+    assert metrics["queue_depth"] == 0
+    assert metrics["dropped"] == 0
+
+
+def test_logging_worker_drops_events_when_queue_is_full():
+    worker = LoggingWorker(max_workers=1, max_queue_size=2, overflow_policy="drop")
+    release = _block_worker(worker)
+
+    results = []
+    assert worker.submit(results.append, 1) is True
+    assert worker.submit(results.append, 2) is True
+    assert worker.submit(results.append, 3) is False  # queue full
+    assert worker.get_metrics()["queue_depth"] == 2
+
+    release.set()
+    assert worker.flush(timeout=5) is True
+    assert results == [1, 2]
+    assert worker.get_metrics()["dropped"] == 1
+
+
+def test_logging_worker_blocks_when_queue_is_full():
+    worker = LoggingWorker(
+        max_workers=1, max_queue_size=1, overflow_policy="block", block_timeout=0.2
+    )
+    release = _block_worker(worker)
+
+    results = []
+    assert worker.submit(results.append, 1) is True
+
+    start_time = time.monotonic()
+    assert worker.submit(results.append, 2) is False  # no space within block_timeout
+    assert time.monotonic() - start_time >= 0.2
+
+    threading.Timer(0.1, release.set).start()
+    assert worker.submit(results.append, 3) is True  # space freed up while blocking
+    assert worker.flush(timeout=5) is True
+    assert results == [1, 3]
+
+
+def test_logging_worker_runs_events_in_parallel():
+    """
+    A burst of slow callbacks is spread over all workers
+    """
+    worker = LoggingWorker(max_workers=4, max_queue_size=100)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def _slow_callback():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.1)
+        with lock:
+            running -= 1
+
+    for _ in range(8):
+        worker.submit(_slow_callback)
+
+    assert worker.flush(timeout=5) is True
+    assert max_running == 4
+    assert worker.get_metrics()["processed"] == 8
+
+
+def test_logging_worker_callback_exceptions():
+    worker = LoggingWorker(max_workers=1, max_queue_size=100)
+    results = []
+
+    def _raise():
+        raise ValueError("bad callback")
+
+    worker.submit(_raise)
+    worker.submit(results.append, "still running")
+    assert worker.flush(timeout=5) is True
+
+    assert results == ["still running"]
+    metrics = worker.get_metrics()
+    assert metrics["failed"] == 1
+    assert metrics["processed"] == 2
+    assert metrics["max_callback_latency_ms"] >= metrics["avg_callback_latency_ms"]
+
+
+def test_logging_worker_flush_timeout():
+    worker = LoggingWorker(max_workers=1, max_queue_size=100)
+    release = _block_worker(worker)
+    assert worker.flush(timeout=0.1) is False
+    release.set()
+    assert worker.flush(timeout=5) is True
+
+
+def test_logging_worker_exit_flush_timeout():
+    """
+    A stuck logging callback must not hang interpreter exit
+    """
+    from litellm.litellm_core_utils import logging_worker
+
+    worker = LoggingWorker(max_workers=1, max_queue_size=100)
+    release = _block_worker(worker)
+    try:
+        with patch.object(
+            logging_worker, "GLOBAL_LOGGING_WORKER", worker
+        ), patch.object(litellm, "logging_worker_exit_flush_timeout", 0.1):
+            start_time = time.monotonic()
+            logging_worker._flush_on_exit()
+            assert time.monotonic() - start_time < 2
+    finally:
+        release.set()
+    assert worker.flush(timeout=5) is True
+
+
+@pytest.mark.asyncio
+async def test_pass_through_streaming_success_runs_on_logging_worker():
+    from litellm.proxy.pass_through_endpoints.streaming_handler import (
+        PassThroughStreamingHandler,
+    )
+
+    logging_obj = MagicMock()
+    logging_obj.async_success_handler = AsyncMock()
+    start_time = datetime.now()
+    with patch.object(GLOBAL_LOGGING_WORKER, "submit") as mock_submit:
+        await PassThroughStreamingHandler._log_streaming_response(
+            litellm_logging_obj=logging_obj,
+            standard_logging_response_object={"response": "hi"},
+            start_time=start_time,
+            end_time=start_time,
+            kwargs={},
+        )
+
+    mock_submit.assert_called_once_with(
+        logging_obj.success_handler, {"response": "hi"}, start_time, start_time, False
+    )
+    logging_obj.async_success_handler.assert_awaited_once()
+
+
+def test_completion_success_callback_runs_on_logging_worker():
+    class SyncLogger(CustomLogger):
+        def __init__(self):
+            self.thread_names = []
+
+        def log_success_event(self, kwargs, response_obj, start_time, end_time):
+            self.thread_names.append(threading.current_thread().name)
+
+    customHandler = SyncLogger()
+    litellm.callbacks = [customHandler]
+    try:
+        litellm.completion(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hey, how's it going?"}],
+            mock_response="Hi!",
+        )
+        assert GLOBAL_LOGGING_WORKER.flush(timeout=5) is True
+    finally:
+        litellm.callbacks = []
+
+    assert len(customHandler.thread_names) == 1
+    assert customHandler.thread_names[0].startswith("litellm-logging-worker-")
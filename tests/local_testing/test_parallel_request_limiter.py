@@ -7,6 +7,7 @@ import random
 import sys
 import time
 import traceback
+import uuid
 from datetime import datetime
 
 from dotenv import load_dotenv
@@ -18,6 +19,7 @@ sys.path.insert(
     0, os.path.abspath("../..")
 )  # Adds the parent directory to the system path
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -35,6 +37,16 @@ from litellm.proxy.utils import InternalUsageCache, ProxyLogging, hash_token
 ## On Request failure
 
 
+async def get_current_usage(
+    parallel_request_handler: MaxParallelRequestsHandler, request_count_api_key: str
+):
+    # usage is stored as 1 counter per field - read it back the way the limiter does
+    results = await parallel_request_handler.get_usage(
+        keys=[request_count_api_key], rate_limit_types=["key"]
+    )
+    return results[0]
+
+
 @pytest.mark.asyncio
 async def test_global_max_parallel_requests():
     """
@@ -91,18 +103,11 @@ async def test_pre_call_hook():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
 
-    print(
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )
-    )
+    print((await get_current_usage(parallel_request_handler, request_count_api_key)))
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
 
 @pytest.mark.asyncio
@@ -378,12 +383,9 @@ async def test_success_call_hook():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     kwargs = {"litellm_params": {"metadata": {"user_api_key": _api_key}}}
 
@@ -391,12 +393,9 @@ async def test_success_call_hook():
         kwargs=kwargs, response_obj="", start_time="", end_time=""
     )
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 0
 
 
 @pytest.mark.asyncio
@@ -422,12 +421,9 @@ async def test_failure_call_hook():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     kwargs = {
         "litellm_params": {"metadata": {"user_api_key": _api_key}},
@@ -438,12 +434,9 @@ async def test_failure_call_hook():
         kwargs=kwargs, response_obj="", start_time="", end_time=""
     )
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 0
 
 
 """
@@ -503,12 +496,9 @@ async def test_normal_router_call():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     # normal call
     response = await router.acompletion(
@@ -520,12 +510,9 @@ async def test_normal_router_call():
     await asyncio.sleep(1)  # success is done in a separate thread
     print(f"response: {response}")
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 0
 
 
 @pytest.mark.asyncio
@@ -585,12 +572,9 @@ async def test_normal_router_tpm_limit():
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     print("Test: Checking current_requests for precise_minute=", precise_minute)
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     # normal call
     response = await router.acompletion(
@@ -604,11 +588,8 @@ async def test_normal_router_tpm_limit():
 
     try:
         assert (
-            parallel_request_handler.internal_usage_cache.get_cache(
-                key=request_count_api_key
-            )["current_tpm"]
-            > 0
-        )
+            await get_current_usage(parallel_request_handler, request_count_api_key)
+        )["current_tpm"] > 0
 
     except Exception as e:
         print("Exception on test_normal_router_tpm_limit", e)
@@ -664,12 +645,9 @@ async def test_streaming_router_call():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     # streaming call
     response = await router.acompletion(
@@ -682,12 +660,9 @@ async def test_streaming_router_call():
     async for chunk in response:
         continue
     await asyncio.sleep(1)  # success is done in a separate thread
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 0
 
 
 @pytest.mark.asyncio
@@ -742,12 +717,9 @@ async def test_streaming_router_tpm_limit():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     # normal call
     response = await router.acompletion(
@@ -761,12 +733,9 @@ async def test_streaming_router_tpm_limit():
         continue
     await asyncio.sleep(5)  # success is done in a separate thread
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_tpm"]
-        > 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_tpm"
+    ] > 0
 
 
 @pytest.mark.asyncio
@@ -820,12 +789,9 @@ async def test_bad_router_call():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(  # type: ignore
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     # bad streaming call
     try:
@@ -837,12 +803,9 @@ async def test_bad_router_call():
         )
     except Exception:
         pass
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(  # type: ignore
-            key=request_count_api_key
-        )["current_requests"]
-        == 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 0
 
 
 @pytest.mark.asyncio
@@ -896,12 +859,9 @@ async def test_bad_router_tpm_limit():
     precise_minute = f"{current_date}-{current_hour}-{current_minute}"
     request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
     await asyncio.sleep(1)
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     # bad call
     try:
@@ -915,12 +875,9 @@ async def test_bad_router_tpm_limit():
         pass
     await asyncio.sleep(1)  # success is done in a separate thread
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_tpm"]
-        == 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_tpm"
+    ] == 0
 
 
 @pytest.mark.asyncio
@@ -990,12 +947,9 @@ async def test_bad_router_tpm_limit_per_model():
         parallel_request_handler.internal_usage_cache.dual_cache.in_memory_cache.cache_dict,
     )
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_requests"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_requests"
+    ] == 1
 
     # bad call
     try:
@@ -1015,12 +969,9 @@ async def test_bad_router_tpm_limit_per_model():
         pass
     await asyncio.sleep(1)  # success is done in a separate thread
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_tpm"]
-        == 0
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_tpm"
+    ] == 0
 
 
 @pytest.mark.asyncio
@@ -1176,19 +1127,13 @@ async def test_pre_call_hook_tpm_limits_per_model():
         parallel_request_handler.internal_usage_cache.dual_cache.in_memory_cache.cache_dict,
     )
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_tpm"]
-        == 11
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_tpm"
+    ] == 11
 
-    assert (
-        parallel_request_handler.internal_usage_cache.get_cache(
-            key=request_count_api_key
-        )["current_rpm"]
-        == 1
-    )
+    assert (await get_current_usage(parallel_request_handler, request_count_api_key))[
+        "current_rpm"
+    ] == 1
 
     ## Expected cache val: {"current_requests": 0, "current_tpm": 11, "current_rpm": "1"}
 
@@ -1283,8 +1228,8 @@ async def test_post_call_success_hook_rpm_limits_per_model():
     request_count_api_key = f"{_api_key}::{model}::{precise_minute}::request_count"
 
     print(f"request_count_api_key: {request_count_api_key}")
-    current_cache = parallel_request_handler.internal_usage_cache.get_cache(
-        key=request_count_api_key
+    current_cache = await get_current_usage(
+        parallel_request_handler, request_count_api_key
     )
     print("current cache: ", current_cache)
 
@@ -1300,3 +1245,255 @@ async def test_post_call_success_hook_rpm_limits_per_model():
     assert "x-ratelimit-remaining-requests" in hidden_params["additional_headers"]
     assert "x-ratelimit-limit-tokens" in hidden_params["additional_headers"]
     assert "x-ratelimit-remaining-tokens" in hidden_params["additional_headers"]
+
+
+@pytest.mark.asyncio
+async def test_usage_updated_in_one_increment_pipeline_per_request():
+    """
+    All of a request's counters are incremented in 1 pipeline call - concurrent requests don't overwrite each other's usage
+    """
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(
+        api_key=_api_key,
+        max_parallel_requests=10,
+        user_id="test-user",
+        team_id="test-team",
+        end_user_id="test-end-user",
+    )
+    local_cache = DualCache()
+    internal_usage_cache = InternalUsageCache(dual_cache=local_cache)
+    parallel_request_handler = MaxParallelRequestsHandler(
+        internal_usage_cache=internal_usage_cache
+    )
+
+    with patch.object(
+        internal_usage_cache,
+        "async_increment_cache_pipeline",
+        wraps=internal_usage_cache.async_increment_cache_pipeline,
+    ) as mock_increment_pipeline, patch.object(
+        internal_usage_cache, "async_batch_set_cache"
+    ) as mock_batch_set_cache:
+        await asyncio.gather(
+            *[
+                parallel_request_handler.async_pre_call_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    cache=local_cache,
+                    data={},
+                    call_type="",
+                )
+                for _ in range(5)
+            ]
+        )
+        await asyncio.sleep(0.1)
+        assert mock_increment_pipeline.call_count == 5
+        # key, user, team, end-user
+        assert all(
+            len(call.kwargs["increment_list"]) == 4
+            for call in mock_increment_pipeline.call_args_list
+        )
+
+        mock_increment_pipeline.reset_mock()
+        await parallel_request_handler.async_log_success_event(
+            kwargs={
+                "litellm_params": {
+                    "metadata": {
+                        "user_api_key": _api_key,
+                        "user_api_key_user_id": "test-user",
+                        "user_api_key_team_id": "test-team",
+                    }
+                },
+                "user": "test-end-user",
+            },
+            response_obj=litellm.ModelResponse(usage=litellm.Usage(total_tokens=10)),
+            start_time="",
+            end_time="",
+        )
+        mock_increment_pipeline.assert_called_once()
+        # requests, tpm, rpm - for key, user, team, end-user
+        assert len(mock_increment_pipeline.call_args.kwargs["increment_list"]) == 12
+        mock_batch_set_cache.assert_not_called()
+
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    current_hour = datetime.now().strftime("%H")
+    current_minute = datetime.now().strftime("%M")
+    precise_minute = f"{current_date}-{current_hour}-{current_minute}"
+    for _id in [_api_key, "test-user", "test-team", "test-end-user"]:
+        request_count_api_key = f"{_id}::{precise_minute}::request_count"
+        assert await get_current_usage(
+            parallel_request_handler, request_count_api_key
+        ) == {
+            "current_requests": 4,
+            "current_tpm": 10,
+            "current_rpm": 1,
+        }
+
+
+@pytest.mark.asyncio
+async def test_local_first_rate_limits():
+    """
+    Local-first limits are tracked in-memory. Without redis, nothing is queued for a sync, and no sync task is started
+    """
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(
+        api_key=_api_key, max_parallel_requests=10, tpm_limit=100, rpm_limit=1
+    )
+    local_cache = DualCache()
+    parallel_request_handler = MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(dual_cache=local_cache),
+        local_first_rate_limits={
+            "sync_interval_ms": 60_000,
+            "limit_types": {"key": {"max_unsynced_requests": 5}},
+        },
+    )
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    current_hour = datetime.now().strftime("%H")
+    current_minute = datetime.now().strftime("%M")
+    precise_minute = f"{current_date}-{current_hour}-{current_minute}"
+    request_count_api_key = f"{_api_key}::{precise_minute}::request_count"
+
+    # written immediately - not via a background cache write
+    assert local_cache.in_memory_cache.get_cache(key=request_count_api_key) == {
+        "current_requests": 1,
+        "current_tpm": 0,
+        "current_rpm": 0,
+    }
+    assert parallel_request_handler.unsynced_request_counts == {}
+    assert parallel_request_handler._redis_sync_task is None
+
+    await parallel_request_handler.async_log_success_event(
+        kwargs={"litellm_params": {"metadata": {"user_api_key": _api_key}}},
+        response_obj=litellm.ModelResponse(usage=litellm.Usage(total_tokens=10)),
+        start_time="",
+        end_time="",
+    )
+
+    assert local_cache.in_memory_cache.get_cache(key=request_count_api_key) == {
+        "current_requests": 0,
+        "current_tpm": 10,
+        "current_rpm": 1,
+    }
+    assert parallel_request_handler.redis_increment_queue == {}
+    assert parallel_request_handler.local_first_keys == {}
+
+    with pytest.raises(Exception) as e:
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=local_cache,
+            data={},
+            call_type="",
+        )
+    assert e.value.status_code == 429
+    assert parallel_request_handler._redis_sync_task is None
+
+
+@pytest.mark.asyncio
+async def test_local_first_rate_limits_survive_key_churn():
+    """
+    Local-first usage is only held in-memory - writes for other keys must not evict it
+    """
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(
+        api_key=_api_key, max_parallel_requests=10, tpm_limit=100, rpm_limit=1
+    )
+    local_cache = DualCache(default_in_memory_ttl=1)  # same as ProxyLogging
+    parallel_request_handler = MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(dual_cache=local_cache),
+        local_first_rate_limits={
+            "sync_interval_ms": 60_000,
+            "limit_types": {"key": {"max_unsynced_requests": 5}},
+        },
+    )
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+    await parallel_request_handler.async_log_success_event(
+        kwargs={"litellm_params": {"metadata": {"user_api_key": _api_key}}},
+        response_obj=litellm.ModelResponse(usage=litellm.Usage(total_tokens=10)),
+        start_time="",
+        end_time="",
+    )
+
+    for i in range(1_000):
+        await parallel_request_handler.internal_usage_cache.async_set_cache(
+            key="other-key-{}".format(i),
+            value={"current_requests": 0, "current_tpm": 0, "current_rpm": 0},
+            ttl=60,
+            litellm_parent_otel_span=None,
+        )
+
+    with pytest.raises(Exception) as e:
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=local_cache,
+            data={},
+            call_type="",
+        )
+    assert e.value.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_local_first_rate_limits_sync_with_redis():
+    """
+    Usage on 1 instance is visible to the other instance after a sync.
+
+    An instance syncs before admitting more than `max_unsynced_requests`.
+    """
+    from litellm.caching.redis_cache import RedisCache
+
+    _api_key = hash_token("sk-{}".format(uuid.uuid4()))
+    user_api_key_dict = UserAPIKeyAuth(
+        api_key=_api_key, max_parallel_requests=100, tpm_limit=1000, rpm_limit=2
+    )
+    handlers = []
+    for _ in range(2):
+        dual_cache = DualCache(
+            redis_cache=RedisCache()  # get credentials from environment
+        )
+        handlers.append(
+            MaxParallelRequestsHandler(
+                internal_usage_cache=InternalUsageCache(dual_cache=dual_cache),
+                local_first_rate_limits={
+                    "sync_interval_ms": 60_000,
+                    "limit_types": {"key": {"max_unsynced_requests": 1}},
+                },
+            )
+        )
+    instance_1, instance_2 = handlers
+
+    kwargs = {"litellm_params": {"metadata": {"user_api_key": _api_key}}}
+    for _ in range(2):
+        await instance_1.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=instance_1.internal_usage_cache.dual_cache,
+            data={},
+            call_type="",
+        )
+        await instance_1.async_log_success_event(
+            kwargs=kwargs,
+            response_obj=litellm.ModelResponse(usage=litellm.Usage(total_tokens=10)),
+            start_time="",
+            end_time="",
+        )
+    await instance_1.sync_local_usage_with_redis()
+
+    # instance 2 has admitted 1 request - it syncs before admitting the next
+    await instance_2.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict,
+        cache=instance_2.internal_usage_cache.dual_cache,
+        data={},
+        call_type="",
+    )
+    with pytest.raises(Exception) as e:
+        await instance_2.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=instance_2.internal_usage_cache.dual_cache,
+            data={},
+            call_type="",
+        )
+    assert e.value.status_code == 429
@@ -137,6 +137,96 @@ def test_route_with_multiple_matching_patterns():
     ]
 
 
+def test_get_literal_prefix():
+    from litellm.router_utils.pattern_match_deployments import _get_literal_prefix
+
+    router = PatternMatchRouter()
+    assert _get_literal_prefix(router._pattern_to_regex("openai/*")) == "openai/"
+    assert (
+        _get_literal_prefix(router._pattern_to_regex("openai/fo::*::static::*"))
+        == "openai/fo::"
+    )
+    assert _get_literal_prefix(router._pattern_to_regex("*meta.llama3*")) == ""
+    assert _get_literal_prefix(router._pattern_to_regex("gpt-4.1")) == "gpt-4.1"
+    assert _get_literal_prefix("ab?c") == "a"
+    assert _get_literal_prefix(r"a\d+") == "a"
+
+
+def test_route_matches_linear_scan():
+    """
+    Tests that the routing index returns the same pattern as trying every pattern in order
+    """
+    import re
+
+    router = PatternMatchRouter()
+    patterns = [
+        "openai/*",
+        "openai/gpt-*",
+        "team-a/openai/*",
+        "*meta.llama3*",
+        "bedrock/*",
+        "bedrock/anthropic.*",
+        "gpt-4",
+        "llmengine/fo::*::static::*",
+    ]
+    for pattern in patterns:
+        router.add_pattern(
+            pattern, {"model_name": pattern, "litellm_params": {"model": pattern}}
+        )
+
+    requests = [
+        "openai/gpt-4o",
+        "team-a/openai/gpt-4o",
+        "team-b/openai/gpt-4o",
+        "bedrock/anthropic.claude-3",
+        "bedrock/meta.llama3-70b",
+        "meta.llama3-8b",
+        "gpt-4",
+        "gpt-4o",
+        "llmengine/foo::bar::static::baz",
+        "llmengine/foo",
+        "unknown-model",
+        "",
+    ]
+    for request in requests:
+        expected = None
+        for pattern, deployments in router.patterns.items():
+            if re.match(pattern, request):
+                expected = deployments[0]["model_name"]
+                break
+        for _ in range(2):  # uncached + cached
+            deployments = router.route(request)
+            assert (
+                deployments[0]["model_name"] if deployments else None
+            ) == expected, request
+
+
+def test_route_cache_invalidated_on_add_pattern():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", {"litellm_params": {"model": "openai/*"}})
+    assert router.route("azure/gpt-4o") is None
+
+    router.add_pattern("azure/*", {"litellm_params": {"model": "azure/*"}})
+    assert router.route("azure/gpt-4o") == [
+        {"litellm_params": {"model": "azure/gpt-4o"}}
+    ]
+
+    # deployments added to an existing pattern
+    router.add_pattern("azure/*", {"litellm_params": {"model": "azure/my-*"}})
+    assert len(router.route("azure/gpt-4o")) == 2
+
+
+def test_route_cache_evicts_least_recently_used():
+    router = PatternMatchRouter(route_cache_size=2)
+    router.add_pattern("openai/*", {"litellm_params": {"model": "openai/*"}})
+    router.route("openai/gpt-4o")
+    router.route("openai/gpt-4o-mini")
+    router.route("openai/gpt-4o")  # now most recently used
+    router.route("openai/o1")
+
+    assert list(router._route_cache.keys()) == ["openai/gpt-4o", "openai/o1"]
+
+
 # Add this test to check for exception handling
 def test_route_with_exception():
     """
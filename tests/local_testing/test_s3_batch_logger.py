@@ -0,0 +1,344 @@
+import gzip
+import io
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.integrations.s3 import S3Logger
+from litellm.types.integrations.s3 import S3LogQueueItem
+
+
+_s3_loggers: List[S3Logger] = []
+
+
+@pytest.fixture(autouse=True)
+def reset_s3_callback_params():
+    litellm.s3_callback_params = None
+    yield
+    litellm.s3_callback_params = None
+
+
+@pytest.fixture(autouse=True)
+def stop_s3_flush_loops():
+    yield
+    # don't leak a flush loop thread + exit handler per test
+    while _s3_loggers:
+        _s3_loggers.pop().stop_flush_loop()
+
+
+def _get_s3_logger(**kwargs) -> S3Logger:
+    s3_logger = S3Logger(
+        s3_bucket_name="litellm-logs",
+        s3_region_name="us-east-1",
+        s3_aws_access_key_id="testing",
+        s3_aws_secret_access_key="testing",
+        **kwargs,
+    )
+    s3_logger.s3_client = MagicMock()
+    _s3_loggers.append(s3_logger)
+    return s3_logger
+
+
+def _get_logging_kwargs(id: str, start_time: datetime) -> dict:
+    return {
+        "standard_logging_object": {
+            "id": id,
+            "model": "gpt-3.5-turbo",
+            "response_cost": 0.1,
+            "messages": [{"role": "user", "content": "hi"}],
+        },
+        "start_time": start_time,
+    }
+
+
+def _log_events(s3_logger: S3Logger, ids: list, start_time: datetime):
+    for id in ids:
+        s3_logger.log_event(
+            kwargs=_get_logging_kwargs(id, start_time),
+            response_obj=None,
+            start_time=start_time,
+            end_time=start_time,
+            print_verbose=print,
+        )
+
+
+def _queue_logs(s3_logger: S3Logger, ids: list, start_time: datetime):
+    for id in ids:
+        s3_logger.log_queue.append(
+            S3LogQueueItem(
+                payload=_get_logging_kwargs(id, start_time)["standard_logging_object"],
+                start_time=start_time,
+            )
+        )
+
+
+def _get_put_object_calls(s3_logger: S3Logger) -> list:
+    return [call.kwargs for call in s3_logger.s3_client.put_object.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_s3_logger_json_format_uploads_one_object_per_log():
+    s3_logger = _get_s3_logger(s3_path="team-logs/")
+    start_time = datetime(2024, 10, 17, 13, 5, 0)
+    _queue_logs(s3_logger, ["log-1", "log-2"], start_time=start_time)
+
+    await s3_logger.flush_queue()
+
+    put_object_calls = _get_put_object_calls(s3_logger)
+    assert sorted(call["Key"] for call in put_object_calls) == [
+        "team-logs/2024-10-17/time-13-05-00-000000_log-1.json",
+        "team-logs/2024-10-17/time-13-05-00-000000_log-2.json",
+    ]
+    assert put_object_calls[0]["ContentType"] == "application/json"
+    assert s3_logger.log_queue == []
+
+
+@pytest.mark.asyncio
+async def test_s3_logger_ndjson_gz_objects_are_partitioned_by_hour():
+    s3_logger = _get_s3_logger(s3_log_format="ndjson.gz", s3_batch_size=2)
+    _queue_logs(
+        s3_logger, ["log-1", "log-2", "log-3"], datetime(2024, 10, 17, 13, 5, 0)
+    )
+    _queue_logs(s3_logger, ["log-4"], datetime(2024, 10, 17, 14, 5, 0))
+
+    await s3_logger.flush_queue()
+
+    logged_ids = {}
+    for call in _get_put_object_calls(s3_logger):
+        assert call["Key"].endswith(".ndjson.gz")
+        assert call["ContentType"] == "application/gzip"
+        partition = call["Key"].rsplit("/", 1)[0]
+        lines = gzip.decompress(call["Body"]).decode("utf-8").splitlines()
+        logged_ids.setdefault(partition, []).append(
+            [json.loads(line)["id"] for line in lines]
+        )
+    # at most `s3_batch_size` logs per object
+    assert sorted(logged_ids["2024-10-17/13"]) == [["log-1", "log-2"], ["log-3"]]
+    assert logged_ids["2024-10-17/14"] == [["log-4"]]
+
+
+@pytest.mark.asyncio
+async def test_s3_logger_retries_failed_uploads():
+    s3_logger = _get_s3_logger(s3_log_format="ndjson")
+    s3_logger.s3_client.put_object.side_effect = [
+        Exception("SlowDown"),
+        Exception("SlowDown"),
+        {"ResponseMetadata": {"HTTPStatusCode": 200}},
+    ]
+    _queue_logs(s3_logger, ["log-1"], datetime(2024, 10, 17, 13, 5, 0))
+
+    with patch("litellm.integrations.s3.S3_UPLOAD_RETRY_BACKOFF_SECONDS", 0):
+        await s3_logger.flush_queue()
+
+    assert s3_logger.s3_client.put_object.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_s3_logger_uploads_are_concurrent_and_bounded():
+    s3_logger = _get_s3_logger(s3_max_concurrent_uploads=3)
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def _put_object(**kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+
+    s3_logger.s3_client.put_object.side_effect = _put_object
+    _queue_logs(
+        s3_logger,
+        [f"log-{i}" for i in range(10)],
+        datetime(2024, 10, 17, 13, 5, 0),
+    )
+
+    await s3_logger.flush_queue()
+
+    assert s3_logger.s3_client.put_object.call_count == 10
+    assert max_in_flight == 3
+
+
+def test_s3_logger_sync_logging_flushes_in_the_background():
+    """
+    `log_event` (called on the sync logging thread) only queues the log - a full batch is uploaded by the flush loop
+    """
+    s3_logger = _get_s3_logger(s3_log_format="ndjson", s3_batch_size=3)
+    uploaded = threading.Event()
+    s3_logger.s3_client.put_object.side_effect = lambda **kwargs: uploaded.set()
+
+    _log_events(
+        s3_logger, ["log-1", "log-2"], start_time=datetime(2024, 10, 17, 13, 5, 0)
+    )
+    assert len(s3_logger.log_queue) == 2
+    s3_logger.s3_client.put_object.assert_not_called()
+
+    _log_events(s3_logger, ["log-3"], start_time=datetime(2024, 10, 17, 13, 5, 0))
+    assert uploaded.wait(timeout=5)
+    body = s3_logger.s3_client.put_object.call_args.kwargs["Body"]
+    assert [json.loads(line)["id"] for line in body.splitlines()] == [
+        "log-1",
+        "log-2",
+        "log-3",
+    ]
+
+
+def test_s3_logger_flush_on_exit_waits_for_running_flush():
+    """
+    Logs swapped out of the queue by a running flush are uploaded before exit
+    """
+    s3_logger = _get_s3_logger(s3_log_format="ndjson", s3_batch_size=1)
+    upload_started = threading.Event()
+    uploaded_ids = []
+
+    def _put_object(**kwargs):
+        if not upload_started.is_set():
+            upload_started.set()
+            time.sleep(0.5)
+        uploaded_ids.append(json.loads(kwargs["Body"])["id"])
+
+    s3_logger.s3_client.put_object.side_effect = _put_object
+    start_time = datetime(2024, 10, 17, 13, 5, 0)
+
+    _log_events(s3_logger, ["log-1"], start_time=start_time)  # full batch
+    assert upload_started.wait(timeout=5)
+    _queue_logs(s3_logger, ["log-2"], start_time=start_time)
+
+    s3_logger._flush_on_exit()
+
+    assert uploaded_ids == ["log-1", "log-2"]
+
+
+def test_s3_logger_stop_flush_loop():
+    import atexit
+
+    s3_logger = _get_s3_logger(s3_log_format="ndjson")
+    with patch.object(atexit, "register") as mock_register, patch.object(
+        atexit, "unregister"
+    ) as mock_unregister:
+        _log_events(s3_logger, ["log-1"], datetime(2024, 10, 17, 13, 5, 0))
+        flush_loop = s3_logger._flush_loop
+        flush_thread = s3_logger._flush_thread
+        assert flush_thread is not None and flush_thread.is_alive()
+
+        s3_logger.stop_flush_loop()
+
+    mock_register.assert_called_once_with(s3_logger._flush_on_exit)
+    mock_unregister.assert_called_once_with(s3_logger._flush_on_exit)
+    assert not flush_thread.is_alive()
+    assert flush_loop.is_closed()
+    assert s3_logger._flush_loop is None
+    # queued logs are kept
+    assert len(s3_logger.log_queue) == 1
+
+
+def test_s3_logger_reads_s3_callback_params():
+    litellm.s3_callback_params = {
+        "s3_bucket_name": "litellm-logs",
+        "s3_region_name": "us-east-1",
+        "s3_log_format": "ndjson",
+        "s3_batch_size": 100,
+        "s3_flush_interval": 1,
+    }
+    s3_logger = S3Logger()
+    assert s3_logger.s3_log_format == "ndjson"
+    assert s3_logger.batch_size == 100
+    assert s3_logger.flush_interval == 1
+
+    litellm.s3_callback_params["s3_log_format"] = "csv"
+    with pytest.raises(ValueError, match="Invalid s3_log_format"):
+        S3Logger()
+
+
+#### Local s3 stand-in (moto) ####
+
+
+@pytest.fixture
+def moto_s3(monkeypatch):
+    moto = pytest.importorskip("moto")
+    import boto3
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="litellm-logs")
+        yield s3_client
+
+
+def _get_moto_s3_logger(**kwargs) -> S3Logger:
+    s3_logger = S3Logger(
+        s3_bucket_name="litellm-logs", s3_region_name="us-east-1", **kwargs
+    )
+    _s3_loggers.append(s3_logger)
+    return s3_logger
+
+
+def _list_s3_keys(s3_client) -> list:
+    response = s3_client.list_objects_v2(Bucket="litellm-logs")
+    return sorted(obj["Key"] for obj in response.get("Contents", []))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("s3_log_format", ["json", "ndjson", "ndjson.gz", "parquet"])
+async def test_s3_logger_moto(moto_s3, s3_log_format):
+    if s3_log_format == "parquet":
+        pytest.importorskip("pyarrow")
+    s3_logger = _get_moto_s3_logger(s3_log_format=s3_log_format, s3_path="logs")
+    _queue_logs(
+        s3_logger, ["log-1", "log-2", "log-3"], datetime(2024, 10, 17, 13, 5, 0)
+    )
+
+    await s3_logger.flush_queue()
+
+    keys = _list_s3_keys(moto_s3)
+    if s3_log_format == "json":
+        assert len(keys) == 3
+        body = moto_s3.get_object(Bucket="litellm-logs", Key=keys[0])["Body"].read()
+        assert json.loads(body)["id"] == "log-1"
+        return
+
+    assert len(keys) == 1
+    assert keys[0].startswith("logs/2024-10-17/13/batch-")
+    assert keys[0].endswith("." + s3_log_format)
+    body = moto_s3.get_object(Bucket="litellm-logs", Key=keys[0])["Body"].read()
+    if s3_log_format == "parquet":
+        import pyarrow.parquet as pq
+
+        rows = pq.read_table(io.BytesIO(body)).to_pylist()
+        assert [row["id"] for row in rows] == ["log-1", "log-2", "log-3"]
+        assert json.loads(rows[0]["messages"]) == [{"role": "user", "content": "hi"}]
+        return
+    if s3_log_format == "ndjson.gz":
+        body = gzip.decompress(body)
+    ids = [json.loads(line)["id"] for line in body.decode("utf-8").splitlines()]
+    assert ids == ["log-1", "log-2", "log-3"]
+
+
+def test_s3_logger_moto_flushes_on_exit(moto_s3):
+    s3_logger = _get_moto_s3_logger(s3_log_format="ndjson.gz", s3_flush_interval=60)
+    _log_events(
+        s3_logger, ["log-1", "log-2"], start_time=datetime(2024, 10, 17, 13, 5, 0)
+    )
+    assert _list_s3_keys(moto_s3) == []
+
+    s3_logger._flush_on_exit()
+
+    keys = _list_s3_keys(moto_s3)
+    assert len(keys) == 1
+    body = moto_s3.get_object(Bucket="litellm-logs", Key=keys[0])["Body"].read()
+    assert len(gzip.decompress(body).decode("utf-8").splitlines()) == 2
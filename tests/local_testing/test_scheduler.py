@@ -88,3 +88,249 @@ async def test_scheduler_prioritized_requests(p0, p1, healthy_deployments):
             )
             == False
         )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wait_for_turn_with_capacity():
+    scheduler = Scheduler()
+
+    async def has_capacity():
+        return True
+
+    for i in range(3):
+        assert (
+            await scheduler.wait_for_turn(
+                request=FlowItem(
+                    priority=1, request_id=str(i), model_name="gpt-3.5-turbo"
+                ),
+                has_capacity=has_capacity,
+                timeout=1,
+            )
+            is True
+        )
+
+    assert await scheduler.get_queue(model_name="gpt-3.5-turbo") == []
+    status = scheduler.get_queue_status()["gpt-3.5-turbo"]
+    assert status["total_enqueued"] == 3
+    assert status["total_dequeued"] == 3
+    assert status["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wait_for_turn_priority_order_without_capacity():
+    """
+    No healthy deployments -> requests are released one at a time, highest priority first.
+
+    Waiting requests should not busy-poll for capacity.
+    """
+    scheduler = Scheduler(polling_interval=0.01)
+    capacity_checks = 0
+    release_order = []
+
+    async def has_capacity():
+        nonlocal capacity_checks
+        capacity_checks += 1
+        return False
+
+    async def _make_request(request_id: str, priority: int):
+        result = await scheduler.wait_for_turn(
+            request=FlowItem(
+                priority=priority, request_id=request_id, model_name="gpt-4"
+            ),
+            has_capacity=has_capacity,
+            timeout=5,
+        )
+        release_order.append(request_id)
+        await asyncio.sleep(0.05)  # 'make' the request
+        return result
+
+    # hold the top of the queue, while the other requests queue up
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="head", model_name="gpt-4")
+    )
+    tasks = [
+        asyncio.create_task(_make_request("low", 200)),
+        asyncio.create_task(_make_request("high", 0)),
+        asyncio.create_task(_make_request("medium", 100)),
+    ]
+    await asyncio.sleep(0.1)
+    assert release_order == []
+
+    await scheduler.remove_request(id="head", model_name="gpt-4")
+    scheduler.notify_capacity_change(model_name="gpt-4")
+    results = await asyncio.gather(*tasks)
+
+    assert all(results)
+    assert release_order == ["high", "medium", "low"]
+    # 30ms polling over the same period would've made ~40+ capacity checks
+    assert capacity_checks < 15
+
+
+@pytest.mark.asyncio
+async def test_scheduler_notify_capacity_change():
+    scheduler = Scheduler()
+    has_healthy_deployments = False
+
+    async def has_capacity():
+        return has_healthy_deployments
+
+    async def _blocked_head():
+        # hold the top of the queue
+        await scheduler.add_request(
+            FlowItem(priority=0, request_id="head", model_name="gpt-4")
+        )
+
+    await _blocked_head()
+    waiter = asyncio.create_task(
+        scheduler.wait_for_turn(
+            request=FlowItem(priority=10, request_id="waiter", model_name="gpt-4"),
+            has_capacity=has_capacity,
+            timeout=5,
+        )
+    )
+    await asyncio.sleep(0.1)
+    assert not waiter.done()
+    assert scheduler.get_queue_status()["gpt-4"]["queue_depth"] == 1
+
+    has_healthy_deployments = True
+    scheduler.notify_capacity_change(model_name="gpt-4")
+
+    assert await asyncio.wait_for(waiter, timeout=0.5) is True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_schedule_capacity_check_keeps_one_timer():
+    """
+    A burst of failures keeps 1 pending capacity check per model group - at the earliest requested time
+    """
+    scheduler = Scheduler()
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="head", model_name="gpt-4")
+    )
+    has_healthy_deployments = False
+
+    async def has_capacity():
+        return has_healthy_deployments
+
+    waiter = asyncio.create_task(
+        scheduler.wait_for_turn(
+            request=FlowItem(priority=10, request_id="waiter", model_name="gpt-4"),
+            has_capacity=has_capacity,
+            timeout=5,
+        )
+    )
+    await asyncio.sleep(0.05)
+
+    for _ in range(100):
+        scheduler.schedule_capacity_check(model_name="gpt-4", delay=60)
+    _, first_timer = scheduler._capacity_checks["gpt-4"]
+    assert len(scheduler._capacity_checks) == 1
+
+    # a sooner check replaces the pending timer
+    scheduler.schedule_capacity_check(model_name="gpt-4", delay=0.1)
+    _, timer = scheduler._capacity_checks["gpt-4"]
+    assert timer is not first_timer
+    assert first_timer.cancelled()
+
+    has_healthy_deployments = True
+    assert await asyncio.wait_for(waiter, timeout=0.5) is True
+    assert scheduler._capacity_checks == {}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wait_for_turn_timeout():
+    scheduler = Scheduler()
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="head", model_name="gpt-4")
+    )
+
+    async def has_capacity():
+        return False
+
+    result = await scheduler.wait_for_turn(
+        request=FlowItem(priority=10, request_id="waiter", model_name="gpt-4"),
+        has_capacity=has_capacity,
+        timeout=0.1,
+    )
+
+    assert result is False
+    assert await scheduler.get_queue(model_name="gpt-4") == [(0, "head")]
+    assert scheduler.get_queue_status()["gpt-4"]["total_timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_router_schedule_acompletion_uses_model_group_queue():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "my-model-group",
+                "litellm_params": {
+                    "model": "gpt-3.5-turbo",
+                    "api_key": "fake-key",
+                    "mock_response": "Hello world!",
+                },
+            }
+        ],
+        timeout=2,
+    )
+
+    response = await router.schedule_acompletion(
+        model="my-model-group",
+        messages=[{"role": "user", "content": "Hey!"}],
+        priority=0,
+    )
+
+    assert response._hidden_params["additional_headers"][
+        "x-litellm-request-prioritization-used"
+    ]
+    assert (
+        router.scheduler.get_queue_status("my-model-group")["my-model-group"][
+            "total_dequeued"
+        ]
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("retry_after, expected_delay", [("17", 17), (None, 5)])
+async def test_router_failure_schedules_capacity_check_after_retry_after(
+    retry_after, expected_delay
+):
+    """
+    Queued requests re-check capacity once the failed deployment's cooldown ends - its `Retry-After` if set
+    """
+    from unittest.mock import MagicMock
+
+    import httpx
+
+    router = Router(
+        model_list=[
+            {
+                "model_name": "my-model-group",
+                "litellm_params": {"model": "gpt-3.5-turbo", "api_key": "fake-key"},
+                "model_info": {"id": "1"},
+            }
+        ],
+        cooldown_time=5,
+    )
+    router.scheduler.schedule_capacity_check = MagicMock()
+
+    exception = Exception("rate limited")
+    if retry_after is not None:
+        exception.headers = httpx.Headers({"retry-after": retry_after})
+    await router.async_deployment_callback_on_failure(
+        kwargs={
+            "exception": exception,
+            "litellm_params": {
+                "metadata": {"model_group": "my-model-group"},
+                "model_info": {"id": "1"},
+            },
+        },
+        completion_response=None,
+        start_time=time.time(),
+        end_time=time.time(),
+    )
+
+    router.scheduler.schedule_capacity_check.assert_called_once_with(
+        model_name="my-model-group", delay=expected_delay
+    )
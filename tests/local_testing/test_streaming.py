@@ -4102,3 +4102,209 @@ def test_streaming_tool_calls_valid_json_str(model):
     for k, v in tool_call_id_arg_map.items():
         print("k={}, v={}".format(k, v))
         json.loads(v)  # valid json str
+
+
+def _get_openai_stream_chunks(texts: List[str]) -> list:
+    from openai.types.chat import ChatCompletionChunk
+
+    chunk = {
+        "id": "chatcmpl-fast-path",
+        "object": "chat.completion.chunk",
+        "created": 1721353246,
+        "model": "gpt-4o-mini-2024-07-18",
+        "system_fingerprint": "fp_123",
+    }
+    chunks = [
+        ChatCompletionChunk(
+            **chunk,
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {"role": "assistant", "content": ""},
+                    "finish_reason": None,
+                }
+            ],
+        )
+    ]
+    for text in texts:
+        chunks.append(
+            ChatCompletionChunk(
+                **chunk,
+                choices=[
+                    {"index": 0, "delta": {"content": text}, "finish_reason": None}
+                ],
+            )
+        )
+    chunks.append(
+        ChatCompletionChunk(
+            **chunk,
+            choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        )
+    )
+    return chunks
+
+
+def _get_generic_stream_chunks(texts: List[str]) -> list:
+    chunks = []
+    for text in texts:
+        chunks.append(
+            {
+                "text": text,
+                "tool_use": None,
+                "is_finished": False,
+                "finish_reason": "",
+                "usage": None,
+                "index": 0,
+            }
+        )
+    chunks.append(
+        {
+            "text": "",
+            "tool_use": None,
+            "is_finished": True,
+            "finish_reason": "end_turn",
+            "usage": {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13},
+            "index": 0,
+        }
+    )
+    return chunks
+
+
+def _stream_with_custom_stream_wrapper(
+    chunks: list, model: str, custom_llm_provider: str, use_chunk_decoder: bool
+) -> List[dict]:
+    response = litellm.CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=chunks),
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+        logging_obj=litellm.Logging(
+            model=model,
+            messages=[{"role": "user", "content": "Hey"}],
+            stream=True,
+            call_type="completion",
+            start_time=time.time(),
+            litellm_call_id="12345",
+            function_id="1245",
+        ),
+    )
+    if use_chunk_decoder is False:
+        response.chunk_decoder = None
+    returned_chunks = []
+    for chunk in response:
+        chunk_dict = chunk.model_dump()
+        chunk_dict.pop("created")
+        returned_chunks.append(chunk_dict)
+    return returned_chunks
+
+
+@pytest.mark.parametrize(
+    "custom_llm_provider, model, chunks",
+    [
+        ("openai", "gpt-4o-mini", _get_openai_stream_chunks(["Hi", " there", "!"])),
+        ("azure", "gpt-4o-mini", _get_openai_stream_chunks(["Hi", " there", "!"])),
+        (
+            "anthropic",
+            "claude-3-5-sonnet-20240620",
+            _get_generic_stream_chunks(["Hi", " there", "!"]),
+        ),
+    ],
+)
+def test_unit_test_custom_stream_wrapper_chunk_decoder(
+    custom_llm_provider, model, chunks
+):
+    """
+    Test if the fast path for plain text chunks returns the same chunks as `chunk_creator`
+    """
+    import copy
+
+    litellm.set_verbose = False
+    fast_path_chunks = _stream_with_custom_stream_wrapper(
+        chunks=copy.deepcopy(chunks),
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+        use_chunk_decoder=True,
+    )
+    chunk_creator_chunks = _stream_with_custom_stream_wrapper(
+        chunks=copy.deepcopy(chunks),
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+        use_chunk_decoder=False,
+    )
+    if custom_llm_provider == "anthropic":  # generated per stream
+        for chunk in fast_path_chunks + chunk_creator_chunks:
+            chunk.pop("id")
+
+    assert fast_path_chunks == chunk_creator_chunks
+    assert (
+        "".join(
+            chunk["choices"][0]["delta"]["content"] or "" for chunk in fast_path_chunks
+        )
+        == "Hi there!"
+    )
+
+
+def test_unit_test_custom_stream_wrapper_chunk_decoder_skips_non_text_chunks():
+    from litellm.litellm_core_utils.streaming_chunk_decoders import (
+        get_stream_chunk_decoder,
+    )
+
+    openai_chunks = _get_openai_stream_chunks(["Hi"])
+    decoder = get_stream_chunk_decoder(custom_llm_provider="openai")
+    assert decoder is not None
+    assert decoder.decode(openai_chunks[0]) is None  # empty content
+    assert decoder.decode(openai_chunks[1]).text == "Hi"
+    assert decoder.decode(openai_chunks[-1]) is None  # finish reason
+
+    generic_chunks = _get_generic_stream_chunks(["Hi"])
+    decoder = get_stream_chunk_decoder(custom_llm_provider="bedrock")
+    assert decoder is not None
+    assert decoder.decode(generic_chunks[0]).text == "Hi"
+    assert decoder.decode(generic_chunks[-1]) is None  # usage + finish reason
+    assert decoder.decode({**generic_chunks[0], "unknown_field": True}) is None
+
+    assert get_stream_chunk_decoder(custom_llm_provider="huggingface") is None
+
+
+def test_unit_test_custom_stream_wrapper_register_chunk_decoder():
+    from litellm.litellm_core_utils.streaming_chunk_decoders import (
+        BaseStreamChunkDecoder,
+        StreamChunk,
+        register_stream_chunk_decoder,
+    )
+
+    class UpperCaseDecoder(BaseStreamChunkDecoder):
+        def decode(self, chunk):
+            if isinstance(chunk, dict) and chunk["text"] and not chunk["usage"]:
+                return StreamChunk(text=chunk["text"].upper())
+            return None
+
+    register_stream_chunk_decoder("anthropic", UpperCaseDecoder())
+    try:
+        returned_chunks = _stream_with_custom_stream_wrapper(
+            chunks=_get_generic_stream_chunks(["Hi", " there", "!"]),
+            model="claude-3-5-sonnet-20240620",
+            custom_llm_provider="anthropic",
+            use_chunk_decoder=True,
+        )
+    finally:
+        register_stream_chunk_decoder("anthropic", None)
+    # first chunk always goes through `chunk_creator` - it sets the role
+    assert (
+        "".join(
+            chunk["choices"][0]["delta"]["content"] or "" for chunk in returned_chunks
+        )
+        == "Hi THERE!"
+    )
+
+
+def test_unit_test_custom_stream_wrapper_chunk_decoder_repeating_chunk():
+    litellm.set_verbose = False
+    with pytest.raises(litellm.InternalServerError):
+        _stream_with_custom_stream_wrapper(
+            chunks=_get_openai_stream_chunks(
+                ["How are you?"] * (litellm.REPEATED_STREAMING_CHUNK_LIMIT + 1)
+            ),
+            model="gpt-4o-mini",
+            custom_llm_provider="openai",
+            use_chunk_decoder=True,
+        )
@@ -382,3 +382,92 @@ def test_img_url_token_counter(img_url):
 
 def test_token_encode_disallowed_special():
     encode(model="gpt-3.5-turbo", text="Hello, world! <|endoftext|>")
+
+
+def test_tokenizer_registry_caches_per_model_family():
+    """
+    claude-2 models share one tokenizer - it should only be loaded once.
+    """
+    from litellm.litellm_core_utils.tokenizer_registry import TokenizerRegistry
+
+    registry = TokenizerRegistry()
+    with patch.object(
+        registry, "_load_tokenizer", wraps=registry._load_tokenizer
+    ) as mock_load:
+        tokenizer_1 = registry.get_tokenizer(model="claude-2")
+        tokenizer_2 = registry.get_tokenizer(model="claude-2.1")
+        tokenizer_3 = registry.get_tokenizer(model="claude-instant-1")
+
+    assert mock_load.call_count == 1
+    assert tokenizer_1 is tokenizer_2 is tokenizer_3
+    assert tokenizer_1["type"] == "huggingface_tokenizer"
+
+
+def test_tokenizer_registry_lru_eviction():
+    from litellm.litellm_core_utils.tokenizer_registry import TokenizerRegistry
+
+    registry = TokenizerRegistry(max_size=1)
+    registry.get_tokenizer(model="gpt-3.5-turbo")
+    registry.get_tokenizer(model="claude-2")
+
+    assert registry.cached_families() == ["anthropic"]
+
+
+def test_tokenizer_registry_unknown_models_share_openai_fallback():
+    """
+    Unknown models that aren't on the huggingface hub use the openai tokenizer - without a cache entry per model, evicting real tokenizers
+    """
+    from litellm.litellm_core_utils.tokenizer_registry import TokenizerRegistry
+
+    registry = TokenizerRegistry(max_size=2)
+    registry.get_tokenizer(model="claude-2")
+    with patch(
+        "litellm.litellm_core_utils.tokenizer_registry.Tokenizer.from_pretrained",
+        side_effect=Exception("not on the hub"),
+    ) as mock_from_pretrained:
+        for i in range(5):
+            tokenizer_json = registry.get_tokenizer(
+                model="my-custom-model-{}".format(i)
+            )
+            assert tokenizer_json["type"] == "openai_tokenizer"
+        # remembered per model - no second hub lookup
+        registry.get_tokenizer(model="my-custom-model-0")
+
+    assert mock_from_pretrained.call_count == 5
+    assert registry.cached_families() == ["anthropic", "openai"]
+
+
+def test_tokenizer_registry_offline_load(tmp_path):
+    """
+    If a tokenizer file exists locally, don't call the huggingface hub.
+    """
+    import shutil
+
+    from litellm.litellm_core_utils.tokenizer_registry import (
+        _BUNDLED_TOKENIZER_DIR,
+        TokenizerRegistry,
+    )
+
+    shutil.copy(
+        os.path.join(_BUNDLED_TOKENIZER_DIR, "anthropic_tokenizer.json"),
+        tmp_path / "Xenova--llama-3-tokenizer.json",
+    )
+    registry = TokenizerRegistry(local_tokenizer_dirs=[str(tmp_path)])
+    with patch(
+        "litellm.litellm_core_utils.tokenizer_registry.Tokenizer.from_pretrained",
+        side_effect=Exception("network disabled"),
+    ):
+        tokenizer_json = registry.get_tokenizer(model="meta-llama/llama-3-8b")
+
+    assert tokenizer_json["type"] == "huggingface_tokenizer"
+    assert len(tokenizer_json["tokenizer"].encode("hello world").ids) > 0
+
+
+def test_tokenizer_registry_preload():
+    from litellm.litellm_core_utils.tokenizer_registry import TokenizerRegistry
+
+    registry = TokenizerRegistry()
+    thread = registry.preload(models=["gpt-4o", "claude-2"], background=True)
+    thread.join(timeout=30)
+
+    assert set(registry.cached_families()) == {"openai", "anthropic"}
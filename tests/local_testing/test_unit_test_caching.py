@@ -243,3 +243,84 @@ def test_generate_streaming_content():
     assert chunk_count > 1
 
     print(f"Number of chunks: {chunk_count}")
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake2b"])
+def test_canonical_cache_key(algorithm):
+    cache = Cache(cache_key_hash_algorithm=algorithm)
+    kwargs = {
+        "model": "gpt-4o",
+        "messages": [
+            {"role": "user", "content": [{"type": "text", "text": "Hello, world!"}]}
+        ],
+        "temperature": 1,
+    }
+    cache_key_1 = cache.get_cache_key(**kwargs)
+    assert len(cache_key_1) == 64
+
+    # same request, different param + dict key order
+    kwargs_2 = {
+        "temperature": 1.0,
+        "messages": [
+            {"content": [{"text": "Hello, world!", "type": "text"}], "role": "user"}
+        ],
+        "model": "gpt-4o",
+    }
+    assert cache.get_cache_key(**kwargs_2) == cache_key_1
+
+    kwargs_3 = {**kwargs, "temperature": 0.5}
+    assert cache.get_cache_key(**kwargs_3) != cache_key_1
+
+    kwargs_4 = {**kwargs, "messages": [{"role": "user", "content": "Hello, world!"}]}
+    assert cache.get_cache_key(**kwargs_4) != cache_key_1
+
+    # default key format is unchanged
+    assert Cache().get_cache_key(**kwargs) != cache_key_1
+
+
+def test_canonical_cache_key_no_ambiguous_encoding():
+    from litellm.caching.cache_key_hasher import get_canonical_cache_key_hash
+
+    assert get_canonical_cache_key_hash(
+        params=[("input", ["ab", "c"])]
+    ) != get_canonical_cache_key_hash(params=[("input", ["a", "bc"])])
+    assert get_canonical_cache_key_hash(
+        params=[("input", "1")]
+    ) != get_canonical_cache_key_hash(params=[("input", 1)])
+    assert get_canonical_cache_key_hash(
+        params=[("input", None)]
+    ) != get_canonical_cache_key_hash(params=[("input", "None")])
+
+
+def test_canonical_cache_key_invalid_algorithm():
+    with pytest.raises(ValueError):
+        Cache(cache_key_hash_algorithm="md5")
+
+
+def test_canonical_cache_key_hashes_params_once():
+    """
+    Canonical hashing feeds each param value into 1 hash object - no `str()` of the params, no joined cache key string to hash again
+
+    Timings: tests/load_tests/test_cache_key_benchmark.py
+    """
+    prompt = " ".join(["token"] * 100_000)
+    kwargs = {"model": "gpt-4o", "messages": [{"role": "user", "content": prompt}]}
+    hash_object = MagicMock()
+    hash_object.hexdigest.return_value = "0" * 64
+
+    with patch(
+        "litellm.caching.cache_key_hasher.get_hash_object", return_value=hash_object
+    ) as mock_get_hash_object, patch.object(
+        Cache, "_get_hashed_cache_key"
+    ) as mock_get_hashed_cache_key:
+        Cache(cache_key_hash_algorithm="sha256").get_cache_key(**kwargs)
+
+    mock_get_hash_object.assert_called_once()
+    mock_get_hashed_cache_key.assert_not_called()
+    prompt_updates = [
+        call
+        for call in hash_object.update.call_args_list
+        if prompt.encode() in bytes(call.args[0])
+    ]
+    assert len(prompt_updates) == 1
+    assert bytes(prompt_updates[0].args[0]) == prompt.encode()
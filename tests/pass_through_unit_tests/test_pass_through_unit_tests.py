@@ -31,6 +31,7 @@ from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
 from fastapi import Request
 from litellm.proxy._types import UserAPIKeyAuth
 from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
+    _get_streaming_chunk_processor,
     _init_kwargs_for_pass_through_endpoint,
     _update_metadata_with_tags_in_header,
 )
@@ -355,3 +356,19 @@ def test_pass_through_routes_support_all_methods():
     # Check both routers
     check_router_methods(llm_router)
     check_router_methods(vertex_router)
+
+
+def test_get_streaming_chunk_processor():
+    """
+    Chunks are only forwarded without being collected if `zero_copy_pass_through_streaming` is set
+    """
+    assert (
+        _get_streaming_chunk_processor(general_settings={})
+        == PassThroughStreamingHandler.chunk_processor
+    )
+    assert (
+        _get_streaming_chunk_processor(
+            general_settings={"zero_copy_pass_through_streaming": True}
+        )
+        == PassThroughStreamingHandler.zero_copy_chunk_processor
+    )
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import sys
@@ -20,6 +21,9 @@ from litellm.proxy.pass_through_endpoints.success_handler import (
 from litellm.proxy.pass_through_endpoints.streaming_handler import (
     PassThroughStreamingHandler,
 )
+from litellm.proxy.pass_through_endpoints.streaming_usage_tracker import (
+    PassThroughStreamingUsageTracker,
+)
 
 
 # Helper function to mock async iteration
@@ -117,3 +121,134 @@ def test_convert_raw_bytes_to_str_lines():
     raw_bytes = [b'data: {"content": "Hello"}\n\n', b'\ndata: {"content": "World"}\n']
     result = PassThroughStreamingHandler._convert_raw_bytes_to_str_lines(raw_bytes)
     assert result == ['data: {"content": "Hello"}', 'data: {"content": "World"}']
+
+
+anthropic_sse_stream = (
+    b"event: message_start\n"
+    b'data: {"type": "message_start", "message": {"id": "msg_1", "type": "message", "role": "assistant", "content": [], "model": "claude-3-5-sonnet-20241022", "usage": {"input_tokens": 25, "cache_read_input_tokens": 100, "output_tokens": 1}}}\n\n'
+    b"event: content_block_delta\n"
+    b'data: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hello world"}}\n\n'
+    b"event: message_delta\n"
+    b'data: {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": 15}}\n\n'
+    b"event: message_stop\n"
+    b'data: {"type": "message_stop"}\n\n'
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, len(anthropic_sse_stream)])
+def test_streaming_usage_tracker_anthropic(chunk_size):
+    """
+    Usage is extracted from the anthropic events, however the stream is split into chunks
+    """
+    usage_tracker = PassThroughStreamingUsageTracker(
+        endpoint_type=EndpointType.ANTHROPIC
+    )
+    for i in range(0, len(anthropic_sse_stream), chunk_size):
+        usage_tracker.process_chunk(anthropic_sse_stream[i : i + chunk_size])
+
+    assert usage_tracker.bytes_received == len(anthropic_sse_stream)
+    assert usage_tracker.model == "claude-3-5-sonnet-20241022"
+    usage = usage_tracker.get_usage()
+    assert usage.prompt_tokens == 125
+    assert usage.completion_tokens == 15
+    assert usage.total_tokens == 140
+    assert usage.prompt_tokens_details.cached_tokens == 100
+
+
+def test_streaming_usage_tracker_vertex_ai():
+    usage_tracker = PassThroughStreamingUsageTracker(
+        endpoint_type=EndpointType.VERTEX_AI
+    )
+    usage_tracker.process_chunk(
+        b'data: {"candidates": [{"content": {"role": "model", "parts": [{"text": "Hi"}]}}], "usageMetadata": {"promptTokenCount": 8, "candidatesTokenCount": 1, "totalTokenCount": 9}}\r\n\r\n'
+        b'data: {"candidates": [{"content": {"role": "model", "parts": [{"text": " there"}]}, "finishReason": "STOP"}], "usageMetadata": {"promptTokenCount": 8,'
+    )
+    usage_tracker.process_chunk(
+        b' "candidatesTokenCount": 2, "totalTokenCount": 10}, "modelVersion": "gemini-1.5-pro-002"}\r\n\r\n'
+    )
+
+    assert usage_tracker.model == "gemini-1.5-pro-002"
+    usage = usage_tracker.get_usage()
+    assert usage.prompt_tokens == 8
+    assert usage.completion_tokens == 2
+    assert usage.total_tokens == 10
+
+
+def test_streaming_usage_tracker_skips_long_lines():
+    """
+    Only the current incomplete line is kept - longer lines than MAX_PENDING_LINE_BYTES are skipped
+    """
+    from litellm.proxy.pass_through_endpoints import streaming_usage_tracker
+
+    usage_tracker = PassThroughStreamingUsageTracker(endpoint_type=EndpointType.GENERIC)
+    with patch.object(streaming_usage_tracker, "MAX_PENDING_LINE_BYTES", 100):
+        usage_tracker.process_chunk(b'data: {"usage": {"prompt_tokens": 1000, ')
+        usage_tracker.process_chunk(b"x" * 200)
+        assert usage_tracker._pending_line == b""
+        usage_tracker.process_chunk(
+            b'}\ndata: {"model": "gpt-4o", "usage": {"prompt_tokens": 10, "completion_tokens": 5}}\n'
+        )
+
+    assert usage_tracker.model == "gpt-4o"
+    usage = usage_tracker.get_usage()
+    assert usage.prompt_tokens == 10
+    assert usage.completion_tokens == 5
+    assert usage.total_tokens == 15
+
+
+@pytest.mark.asyncio
+async def test_zero_copy_chunk_processor():
+    """
+    Chunks are forwarded as received (same objects), and the usage is logged with its cost
+    """
+    raw_chunks = [
+        anthropic_sse_stream[:50],
+        anthropic_sse_stream[50:300],
+        anthropic_sse_stream[300:],
+    ]
+    response = AsyncMock(spec=httpx.Response)
+
+    async def mock_aiter_bytes():
+        for chunk in raw_chunks:
+            yield chunk
+
+    response.aiter_bytes = mock_aiter_bytes
+
+    litellm_logging_obj = LiteLLMLoggingObj(
+        model="unknown",
+        messages=[],
+        stream=False,
+        call_type="pass_through_endpoint",
+        start_time=datetime.now(),
+        litellm_call_id="123",
+        function_id="456",
+    )
+    litellm_logging_obj.success_handler = MagicMock()
+    litellm_logging_obj.async_success_handler = AsyncMock()
+
+    received_chunks = []
+    async for chunk in PassThroughStreamingHandler.zero_copy_chunk_processor(
+        response=response,
+        request_body={"model": "claude-3-5-sonnet-20241022"},
+        litellm_logging_obj=litellm_logging_obj,
+        endpoint_type=EndpointType.ANTHROPIC,
+        start_time=datetime.now(),
+        passthrough_success_handler_obj=MagicMock(),
+        url_route="https://api.anthropic.com/v1/messages",
+    ):
+        received_chunks.append(chunk)
+
+    assert len(received_chunks) == len(raw_chunks)
+    for received_chunk, raw_chunk in zip(received_chunks, raw_chunks):
+        assert received_chunk is raw_chunk
+
+    await asyncio.sleep(0.1)  # logging runs in a background task
+    litellm_logging_obj.async_success_handler.assert_called_once()
+    call_kwargs = litellm_logging_obj.async_success_handler.call_args.kwargs
+    assert call_kwargs["result"].usage.prompt_tokens == 125
+    assert call_kwargs["result"].usage.completion_tokens == 15
+    assert call_kwargs["response_cost"] == litellm.completion_cost(
+        completion_response=call_kwargs["result"],
+        model="claude-3-5-sonnet-20241022",
+    )
+    assert call_kwargs["response_cost"] > 0
@@ -0,0 +1,194 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.proxy.db.spend_update_writer import (
+    SPEND_UPDATE_TABLES,
+    SpendUpdateWriter,
+    get_bulk_spend_update_query,
+)
+
+
+def _get_mock_prisma_client():
+    prisma_client = MagicMock()
+    prisma_client.spend_log_transactions = []
+    for attr in SPEND_UPDATE_TABLES:
+        setattr(prisma_client, attr, {})
+    prisma_client.jsonify_object = lambda data: data
+
+    transaction = MagicMock()
+    transaction.execute_raw = AsyncMock(return_value=1)
+    tx = MagicMock()
+    tx.__aenter__ = AsyncMock(return_value=transaction)
+    tx.__aexit__ = AsyncMock(return_value=None)
+    prisma_client.db.tx = MagicMock(return_value=tx)
+    prisma_client.db.litellm_spendlogs.create_many = AsyncMock()
+    return prisma_client, transaction
+
+
+def _get_mock_redis_cache(acquire_lock: bool = True):
+    redis_cache = MagicMock()
+    redis_cache.hashes = {}
+
+    async def async_increment_hash_pipeline(increments):
+        for key, values in increments.items():
+            redis_hash = redis_cache.hashes.setdefault(key, {})
+            for field, value in values.items():
+                redis_hash[field] = str(float(redis_hash.get(field, 0)) + value)
+
+    async def async_pop_hashes(keys):
+        return [redis_cache.hashes.pop(key, {}) for key in keys]
+
+    redis_cache.async_increment_hash_pipeline = AsyncMock(
+        side_effect=async_increment_hash_pipeline
+    )
+    redis_cache.async_pop_hashes = AsyncMock(side_effect=async_pop_hashes)
+    redis_cache.async_acquire_lock = AsyncMock(return_value=acquire_lock)
+    redis_cache.async_release_lock = AsyncMock()
+    return redis_cache
+
+
+def test_get_bulk_spend_update_query():
+    query = get_bulk_spend_update_query(
+        table=SPEND_UPDATE_TABLES["key_list_transactons"], num_rows=2
+    )
+    assert query == (
+        'UPDATE "LiteLLM_VerificationToken" AS t SET "spend" = t."spend" + v."spend", "updated_at" = now() '
+        'FROM (VALUES ($1::text, $2::double precision), ($3::text, $4::double precision)) AS v("token", "spend") '
+        'WHERE t."token" = v."token"'
+    )
+
+    query = get_bulk_spend_update_query(
+        table=SPEND_UPDATE_TABLES["team_member_list_transactons"], num_rows=1
+    )
+    assert (
+        'FROM (VALUES ($1::text, $2::text, $3::double precision)) AS v("team_id", "user_id", "spend")'
+        in query
+    )
+    assert 'WHERE t."team_id" = v."team_id" AND t."user_id" = v."user_id"' in query
+
+    query = get_bulk_spend_update_query(
+        table=SPEND_UPDATE_TABLES["end_user_list_transactons"], num_rows=1
+    )
+    assert query.startswith(
+        'INSERT INTO "LiteLLM_EndUserTable" ("user_id", "spend", "blocked") VALUES ($1::text, $2::double precision, false)'
+    )
+    assert "ON CONFLICT" in query
+
+
+@pytest.mark.asyncio
+async def test_update_spend_tables_one_statement_per_table():
+    prisma_client, transaction = _get_mock_prisma_client()
+    prisma_client.key_list_transactons = {"key-1": 0.1, "key-2": 0.2}
+    prisma_client.team_member_list_transactons = {
+        "team_id::team-1::user_id::user-1": 0.3
+    }
+
+    writer = SpendUpdateWriter()
+    await writer.update_spend_tables(prisma_client=prisma_client)
+
+    prisma_client.db.tx.assert_called_once()
+    assert transaction.execute_raw.call_count == 2
+    key_call, team_member_call = transaction.execute_raw.call_args_list
+    assert key_call.args[1:] == ("key-1", 0.1, "key-2", 0.2)
+    assert team_member_call.args[1:] == ("team-1", "user-1", 0.3)
+    assert prisma_client.key_list_transactons == {}
+    assert prisma_client.team_member_list_transactons == {}
+
+
+@pytest.mark.asyncio
+async def test_update_spend_tables_requeues_on_failure():
+    prisma_client, transaction = _get_mock_prisma_client()
+    prisma_client.user_list_transactons = {"user-1": 0.1}
+    transaction.execute_raw.side_effect = Exception("db is down")
+
+    writer = SpendUpdateWriter()
+    with pytest.raises(Exception):
+        await writer.update_spend_tables(prisma_client=prisma_client)
+    # new spend, tracked while the write failed
+    prisma_client.user_list_transactons["user-1"] = (
+        prisma_client.user_list_transactons.get("user-1", 0) + 0.2
+    )
+
+    transaction.execute_raw.side_effect = None
+    await writer.update_spend_tables(prisma_client=prisma_client)
+    assert transaction.execute_raw.call_args.args[1:] == ("user-1", 0.1 + 0.2)
+
+
+@pytest.mark.asyncio
+async def test_update_spend_tables_through_redis():
+    """
+    Only the instance holding the lock writes the spend of all instances
+    """
+    redis_cache = _get_mock_redis_cache()
+    leader_prisma_client, leader_transaction = _get_mock_prisma_client()
+    follower_prisma_client, follower_transaction = _get_mock_prisma_client()
+
+    leader = SpendUpdateWriter()
+    leader.update_settings(
+        general_settings={"aggregate_spend_updates_in_redis": True},
+        redis_cache=redis_cache,
+    )
+    follower = SpendUpdateWriter()
+    follower.update_settings(
+        general_settings={"aggregate_spend_updates_in_redis": True},
+        redis_cache=redis_cache,
+    )
+
+    follower_prisma_client.key_list_transactons = {"key-1": 0.5}
+    redis_cache.async_acquire_lock.return_value = False
+    await follower.update_spend_tables(prisma_client=follower_prisma_client)
+    follower_transaction.execute_raw.assert_not_called()
+    assert follower_prisma_client.key_list_transactons == {}
+
+    leader_prisma_client.key_list_transactons = {"key-1": 0.25}
+    redis_cache.async_acquire_lock.return_value = True
+    await leader.update_spend_tables(prisma_client=leader_prisma_client)
+    assert leader_transaction.execute_raw.call_count == 1
+    assert leader_transaction.execute_raw.call_args.args[1:] == ("key-1", 0.75)
+    redis_cache.async_release_lock.assert_called_once()
+    assert redis_cache.hashes == {}
+
+
+@pytest.mark.asyncio
+async def test_spend_log_queue_is_bounded():
+    prisma_client, _ = _get_mock_prisma_client()
+    prisma_client.db.litellm_spendlogs.create_many.side_effect = Exception("db is down")
+    writer = SpendUpdateWriter()
+    writer.update_settings(general_settings={"spend_log_queue_max_size": 3})
+
+    for i in range(5):
+        writer.add_spend_log(prisma_client=prisma_client, payload={"request_id": i})
+        await asyncio.sleep(0)  # let the flush of the full queue run
+
+    assert [log["request_id"] for log in prisma_client.spend_log_transactions] == [
+        2,
+        3,
+        4,
+    ]
+    assert writer.dropped_spend_logs == 2
+
+
+@pytest.mark.asyncio
+async def test_full_spend_log_queue_is_flushed():
+    prisma_client, _ = _get_mock_prisma_client()
+    writer = SpendUpdateWriter()
+    writer.update_settings(general_settings={"spend_log_queue_max_size": 2})
+
+    for i in range(3):
+        writer.add_spend_log(prisma_client=prisma_client, payload={"request_id": i})
+    await writer._spend_logs_flush_task
+
+    create_many = prisma_client.db.litellm_spendlogs.create_many
+    create_many.assert_called_once()
+    assert [log["request_id"] for log in create_many.call_args.kwargs["data"]] == [
+        0,
+        1,
+    ]
+    assert [log["request_id"] for log in prisma_client.spend_log_transactions] == [2]
+    assert writer.dropped_spend_logs == 0
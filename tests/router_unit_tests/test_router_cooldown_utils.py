@@ -1,4 +1,4 @@
-import sys, os, time
+import sys, os, time, json
 import traceback, asyncio
 import pytest
 
@@ -15,6 +15,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from litellm.integrations.prometheus import PrometheusLogger
 from litellm.router_utils.cooldown_callbacks import router_cooldown_event_callback
 from litellm.router_utils.cooldown_handlers import (
+    _async_get_cooldown_deployments,
+    _get_cooldown_deployments,
     _should_run_cooldown_logic,
     _should_cooldown_deployment,
     cast_exception_status_to_int,
@@ -394,3 +396,186 @@ def test_cast_exception_status_to_int():
     assert cast_exception_status_to_int(200) == 200
     assert cast_exception_status_to_int("404") == 404
     assert cast_exception_status_to_int("invalid") == 500
+
+
+def test_deployment_health_map_expiry():
+    from litellm.router_utils.cooldown_cache import (
+        CooldownCacheValue,
+        DeploymentHealthMap,
+    )
+
+    health_map = DeploymentHealthMap(tick_seconds=0.1)
+    current_time = time.time()
+    health_map.add(
+        model_id="short",
+        cooldown_data=CooldownCacheValue(
+            exception_received="",
+            status_code="429",
+            timestamp=current_time,
+            cooldown_time=0.2,
+        ),
+    )
+    health_map.add(
+        model_id="long",
+        cooldown_data=CooldownCacheValue(
+            exception_received="",
+            status_code="429",
+            timestamp=current_time,
+            cooldown_time=60,
+        ),
+    )
+    # a shorter cooldown doesn't replace a longer one
+    health_map.add(
+        model_id="long",
+        cooldown_data=CooldownCacheValue(
+            exception_received="",
+            status_code="429",
+            timestamp=current_time,
+            cooldown_time=0.1,
+        ),
+    )
+    assert health_map.is_cooling_down("short")
+    assert sorted(m for m, _ in health_map.get_active_cooldowns()) == ["long", "short"]
+    assert [m for m, _ in health_map.get_active_cooldowns(model_ids=["short"])] == [
+        "short"
+    ]
+
+    time.sleep(0.4)
+
+    assert not health_map.is_cooling_down("short")
+    assert health_map.is_cooling_down("long")
+    assert [m for m, _ in health_map.get_active_cooldowns()] == ["long"]
+    # expired entries are removed from the wheel
+    assert "short" not in health_map._cooldowns
+    assert health_map.get_active_cooldowns()[0][1]["cooldown_time"] == 60
+
+
+@pytest.mark.asyncio
+async def test_cooldowns_read_from_health_map_without_redis():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {"model": "gpt-3.5-turbo"},
+                "model_info": {"id": "deployment-1"},
+            },
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {"model": "gpt-3.5-turbo"},
+                "model_info": {"id": "deployment-2"},
+            },
+        ],
+    )
+    router.cooldown_cache.add_deployment_to_cooldown(
+        model_id="deployment-1",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=60,
+    )
+    assert router.cooldown_cache.is_health_map_in_sync()
+
+    with patch.object(
+        router.cache, "async_batch_get_cache", new=AsyncMock()
+    ) as mock_async_batch_get_cache, patch.object(
+        router.cache, "batch_get_cache"
+    ) as mock_batch_get_cache:
+        cooldown_deployments = await _async_get_cooldown_deployments(
+            litellm_router_instance=router, parent_otel_span=None
+        )
+        assert (
+            _get_cooldown_deployments(
+                litellm_router_instance=router, parent_otel_span=None
+            )
+            == cooldown_deployments
+        )
+        mock_async_batch_get_cache.assert_not_called()
+        mock_batch_get_cache.assert_not_called()
+    assert cooldown_deployments == ["deployment-1"]
+
+    healthy_deployments = router.get_model_list(model_name="gpt-3.5-turbo")
+    router._filter_cooldown_deployments(
+        healthy_deployments=healthy_deployments,
+        cooldown_deployments=cooldown_deployments,
+    )
+    assert [d["model_info"]["id"] for d in healthy_deployments] == ["deployment-2"]
+
+    router.flush_cache()
+    assert (
+        await _async_get_cooldown_deployments(
+            litellm_router_instance=router, parent_otel_span=None
+        )
+        == []
+    )
+
+
+def test_cooldown_event_from_other_instance():
+    from litellm.caching.caching import DualCache
+    from litellm.router_utils.cooldown_cache import CooldownCache
+
+    cooldown_cache = CooldownCache(cache=DualCache(), default_cooldown_time=5)
+    event = {
+        "model_id": "deployment-1",
+        "cooldown": {
+            "exception_received": "rate limited",
+            "status_code": "429",
+            "timestamp": time.time(),
+            "cooldown_time": 60,
+        },
+    }
+    cooldown_cache._handle_cooldown_event(json.dumps(event).encode("utf-8"))
+    cooldown_cache._handle_cooldown_event(b"not json")  # ignored
+
+    assert cooldown_cache.get_active_cooldowns(
+        model_ids=["deployment-1", "deployment-2"], parent_otel_span=None
+    ) == [("deployment-1", event["cooldown"])]
+    assert (
+        cooldown_cache.get_min_cooldown(
+            model_ids=["deployment-1"], parent_otel_span=None
+        )
+        == 60
+    )
+
+
+@pytest.mark.asyncio
+async def test_health_map_not_used_until_seeded_with_redis():
+    from litellm.caching.caching import DualCache
+    from litellm.router_utils.cooldown_cache import CooldownCache
+
+    cooldown_cache = CooldownCache(
+        cache=DualCache(redis_cache=MagicMock()), default_cooldown_time=5
+    )
+    cooldown_cache._start_cooldown_events_listener = MagicMock()
+    assert not cooldown_cache.is_health_map_in_sync()
+
+    cached_cooldown = {
+        "exception_received": "rate limited",
+        "status_code": "429",
+        "timestamp": time.time(),
+        "cooldown_time": 60,
+    }
+    with patch.object(
+        cooldown_cache.cache,
+        "async_batch_get_cache",
+        new=AsyncMock(return_value=[cached_cooldown, None]),
+    ) as mock_async_batch_get_cache:
+        # not subscribed yet - read from the cache, the map isn't seeded
+        await cooldown_cache.async_get_active_cooldowns(
+            model_ids=["deployment-1", "deployment-2"], parent_otel_span=None
+        )
+        assert not cooldown_cache.is_health_map_in_sync()
+
+        cooldown_cache._subscribed_to_cooldown_events = True
+        active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+            model_ids=["deployment-1", "deployment-2"], parent_otel_span=None
+        )
+        assert active_cooldowns == [("deployment-1", cached_cooldown)]
+        assert cooldown_cache.is_health_map_in_sync()
+        assert mock_async_batch_get_cache.call_count == 2
+
+        assert (
+            await cooldown_cache.async_get_active_cooldowns(
+                model_ids=["deployment-1", "deployment-2"], parent_otel_span=None
+            )
+            == active_cooldowns
+        )
+        assert mock_async_batch_get_cache.call_count == 2
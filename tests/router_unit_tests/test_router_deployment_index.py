@@ -0,0 +1,190 @@
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm import Router
+from litellm.types.router import Deployment, LiteLLM_Params, ModelInfo
+
+
+@pytest.fixture
+def model_list():
+    return [
+        {
+            "model_name": "gpt-3.5-turbo",
+            "litellm_params": {"model": "gpt-3.5-turbo", "api_key": "sk-1234"},
+            "model_info": {"id": "1", "access_groups": ["group1", "group2"]},
+        },
+        {
+            "model_name": "gpt-3.5-turbo",
+            "litellm_params": {"model": "openai/gpt-4o-mini", "api_key": "sk-1234"},
+            "model_info": {"id": "2", "access_groups": ["group1"]},
+        },
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "gpt-4o", "api_key": "sk-1234"},
+            "model_info": {"id": "3"},
+        },
+    ]
+
+
+def test_router_deployment_index_lookups(model_list):
+    router = Router(model_list=model_list)
+
+    assert router.get_deployment(model_id="2").litellm_params.model == (
+        "openai/gpt-4o-mini"
+    )
+    assert router.get_deployment(model_id="does-not-exist") is None
+    assert (
+        router.get_deployment_by_model_group_name(
+            model_group_name="gpt-4o"
+        ).model_info.id
+        == "3"
+    )
+    assert router.get_model_ids(model_name="gpt-3.5-turbo") == ["1", "2"]
+    assert router.get_model_ids() == ["1", "2", "3"]
+    assert [
+        m["model_info"]["id"]
+        for m in router._get_deployment_by_litellm_model(model="gpt-4o")
+    ] == ["3"]
+    assert router.get_model_access_groups() == {
+        "group1": ["gpt-3.5-turbo", "gpt-3.5-turbo"],
+        "group2": ["gpt-3.5-turbo"],
+    }
+
+
+def test_router_deployment_index_returns_copy(model_list):
+    """
+    Filtering the returned deployments (e.g. cooldowns) must not mutate the index
+    """
+    router = Router(model_list=model_list)
+
+    _, healthy_deployments = router._common_checks_available_deployment(
+        model="gpt-3.5-turbo"
+    )
+    healthy_deployments.pop()
+
+    assert len(router._get_all_deployments(model_name="gpt-3.5-turbo")) == 2
+
+
+def test_router_deployment_index_add_upsert_delete(model_list):
+    router = Router(model_list=model_list)
+
+    router.add_deployment(
+        deployment=Deployment(
+            model_name="gpt-4o",
+            litellm_params=LiteLLM_Params(model="gpt-4o-mini", api_key="sk-1234"),
+            model_info=ModelInfo(id="4", access_groups=["group2"]),
+        )
+    )
+    assert router.get_model_ids(model_name="gpt-4o") == ["3", "4"]
+    assert router.get_model_access_groups()["group2"] == ["gpt-3.5-turbo", "gpt-4o"]
+
+    router.upsert_deployment(
+        deployment=Deployment(
+            model_name="gpt-4o",
+            litellm_params=LiteLLM_Params(model="gpt-4o-2024-08-06", api_key="sk-1234"),
+            model_info=ModelInfo(id="4"),
+        )
+    )
+    assert router.get_deployment(model_id="4").litellm_params.model == (
+        "gpt-4o-2024-08-06"
+    )
+    assert router._get_deployment_by_litellm_model(model="gpt-4o-mini") == []
+    assert "gpt-4o" not in router.get_model_access_groups()["group2"]
+    assert len(router.model_list) == 4
+
+    deleted = router.delete_deployment(id="1")
+    assert deleted["model_info"]["id"] == "1"
+    assert router.get_deployment(model_id="1") is None
+    assert router.get_model_ids(model_name="gpt-3.5-turbo") == ["2"]
+    assert "group2" not in router.get_model_access_groups()
+    assert len(router.model_list) == 3
+    assert router.delete_deployment(id="1") is None
+
+    router.set_model_list(model_list=model_list[2:])
+    assert router.get_model_ids() == ["3"]
+    assert router.get_deployment(model_id="2") is None
+
+
+def _build_router(num_deployments: int) -> Router:
+    deployments_per_group = 10
+    model_list = [
+        {
+            "model_name": "model-group-{}".format(i // deployments_per_group),
+            "litellm_params": {"model": "openai/gpt-{}".format(i), "api_key": "sk-1"},
+            "model_info": {"id": "deployment-{}".format(i)},
+        }
+        for i in range(num_deployments)
+    ]
+    with patch("litellm.router.InitalizeOpenAISDKClient.set_client"):
+        return Router(model_list=model_list)
+
+
+class _ScanCountingList(list):
+    """
+    model_list that counts full scans
+    """
+
+    num_scans = 0
+
+    def __iter__(self):
+        self.num_scans += 1
+        return super().__iter__()
+
+
+def _run_routing_lookups(router: Router, num_requests: int = 500):
+    for i in range(num_requests):
+        router._common_checks_available_deployment(model="model-group-7")
+        router.get_deployment(model_id="deployment-{}".format(i % 10))
+        router.get_model_ids(model_name="model-group-3")
+
+
+def _time_routing_lookups(router: Router, num_requests: int = 500) -> float:
+    start_time = time.perf_counter()
+    _run_routing_lookups(router, num_requests=num_requests)
+    return (time.perf_counter() - start_time) / num_requests
+
+
+@pytest.mark.parametrize("num_deployments", [100, 10_000])
+def test_router_deployment_lookups_do_not_scan_model_list(num_deployments):
+    """
+    Per-request routing lookups should not grow with the size of model_list - they're served by the index.
+    """
+    router = _build_router(num_deployments=num_deployments)
+    router.model_list = _ScanCountingList(router.model_list)
+
+    _run_routing_lookups(router, num_requests=50)
+
+    assert router.model_list.num_scans == 0
+    deployment = router.get_deployment(
+        model_id="deployment-{}".format(num_deployments - 1)
+    )
+    assert deployment is not None
+    assert router.get_model_ids(model_name="model-group-3") == [
+        "deployment-{}".format(i) for i in range(30, 40)
+    ]
+
+
+def test_router_deployment_lookup_benchmark():
+    """
+    Reports the per-request routing lookup cost - timings are printed, not asserted, as they depend on the machine.
+    """
+    small_router = _build_router(num_deployments=100)
+    large_router = _build_router(num_deployments=10_000)
+
+    _time_routing_lookups(small_router, num_requests=50)  # warmup
+    small_per_request = _time_routing_lookups(small_router)
+    large_per_request = _time_routing_lookups(large_router)
+
+    print(
+        "per-request routing lookup cost: 100 deployments={:.1f}us, 10k deployments={:.1f}us".format(
+            small_per_request * 1e6, large_per_request * 1e6
+        )
+    )